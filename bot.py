@@ -2,6 +2,7 @@ import os
 import nextcord
 from nextcord.ext import commands
 from dotenv import load_dotenv, find_dotenv
+from utils.static_data import save_snapshot
 
 # Load environment variables from .env file
 env_path = find_dotenv()
@@ -36,6 +37,7 @@ initial_extensions = [
     "cogs.strongholds",
     "cogs.npc",
     "cogs.rpxp",
+    "cogs.gamedata",
 ]
 
 # Event when the bot is ready
@@ -51,5 +53,11 @@ for ext in initial_extensions:
     except Exception as e:
         print(f"Failed to load {ext}: {e}")
 
+# Persist anything the cogs had to re-parse, so the next start loads it
+# from the snapshot instead.
+try:
+    save_snapshot()
+except Exception as e:
+    print(f"Static snapshot not saved: {e}")
 
 bot.run(TOKEN)
@@ -21,10 +21,18 @@ from cogs.initiative import (
     _life_bar, _slot, _save_battles,
     _group_init_enabled,
     _add_oil_burn, _apply_stoneskin_absorb, _choose_slot_for_effects,
-    _find_ci_or_partial_name
+    _find_ci_or_partial_name, _set_x_effect, _set_timer, _cancel_timer,
 )
 from utils.players import get_active
-from utils.ini import read_cfg, get_compat, getint_compat, write_cfg
+from utils.ini import read_cfg, get_compat, getint_compat, write_cfg, remove_cfg
+from utils.names import ci_matches, coe_exists
+from utils.battle import load_battles, save_battles, abegin_session, aend_session
+from utils.storage import HOT_COMMANDS, prefetch_active_char, defer_char_writes, achar_writes_done
+from utils.monsters import combatant_cfg, is_pending, monster_catalog
+from utils.static_data import class_table, classes_ab, item_table, static_cfg, derived, on_static_reload
+from utils.items import item_search
+from utils.battle_model import battle_view
+from utils.tracker import post_tracker
 
 
 def _safe_monster_ini_path(mtype: str) -> str | None:
@@ -35,8 +43,10 @@ def _safe_monster_ini_path(mtype: str) -> str | None:
     base = re.sub(r'[^a-z0-9_-]+', '', str(mtype or '').lower()).strip('._-')
     if not base:
         return None
+    tpl = monster_catalog().get(base)
+    if tpl is not None:
+        return os.path.abspath(tpl.path)
     candidates = [
-        os.path.join("monsters", f"{base}.ini"),
         os.path.join("mon",       f"{base}.ini"),
         f"{base}.ini",
     ]
@@ -49,7 +59,14 @@ def _safe_monster_ini_path(mtype: str) -> str | None:
     return None
 
 
-BATTLE_FILE = "battle.lst"
+def _monster_ini_cfg(path: str):
+    """Parsed template at `path` (from _safe_monster_ini_path); read-only."""
+    tpl = monster_catalog().get(os.path.basename(path)[:-4])
+    if tpl is not None and os.path.abspath(tpl.path) == path:
+        return tpl.cfg
+    return read_cfg(path)
+
+
 
                                                                                                        
 _TURN_UNDEAD_TABLE = {
@@ -443,8 +460,7 @@ def _find_ci_name(names, q):
     return None
 
 def _save_battles(cfg):
-    with open(BATTLE_FILE, "w", encoding="utf-8") as f:
-        cfg.write(f)
+    save_battles(cfg)
 
 
 SAVE_KEYS = ("poi", "wand", "para", "breath", "spell")
@@ -454,10 +470,10 @@ def load_class_saves(path: str = "class.lst") -> dict[str, dict[str, list[int]]]
     Parse save tables from class.lst.
     Returns: { "Fighter": {"poi":[...], "wand":[...], ...}, ... }
     """
-    cp = configparser.ConfigParser()
-    cp.optionxform = str
-    cp.read(path)
+    return derived(path, "class_saves", _build_class_saves)
 
+
+def _build_class_saves(cp) -> dict[str, dict[str, list[int]]]:
     out: dict[str, dict[str, list[int]]] = {}
     for section in cp.sections():
         saves_for_class: dict[str, list[int]] = {}
@@ -552,7 +568,7 @@ def _apply_queued_blind_after_paralysis(cfg, chan_id: str, slot: str) -> tuple[i
                          
     cur_bl = cfg.getint(chan_id, f"{slot}.blind", fallback=0)
     new_bl = max(cur_bl, pend)
-    cfg.set(chan_id, f"{slot}.blind", str(new_bl))
+    _set_timer(cfg, chan_id, slot, "blind", str(new_bl))
     cfg.set(chan_id, f"{slot}.blind_src", src)
     if by:
         cfg.set(chan_id, f"{slot}.blind_by", by)
@@ -596,29 +612,10 @@ def load_classes_ab(path="class.lst"):
     """
     Returns { 'fighter': {'ab':[...], ...}, ... } with AB parsed to list[int].
     """
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-
-    out = {}
-    for section in cfg.sections():
-        sec = section.lower()
-        out[sec] = {}
-        for k, v in cfg.items(section):
-            if k.lower() == "ab":
-                try:
-                    out[sec]["ab"] = [int(x) for x in v.split()]
-                except Exception:
-                    out[sec]["ab"] = []
-            else:
-                out[sec][k.lower()] = v
-    return out
+    return classes_ab(path)
 
 def _load_battles():
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(BATTLE_FILE)
-    return cfg
+    return load_battles()
 
 def normalize_name(s) -> str:
     if not isinstance(s, str):
@@ -756,43 +753,13 @@ def _item_lookup(self, name: str):
     """
     Return (canon_name, item_dict) or (None, None) from item.lst.
 
-    Resolution order:
+    Resolution order (all dict lookups in the shared utils.items index):
       1) Exact section name (case-sensitive)
       2) Section name, case-insensitive
       3) Normalized name through item_index (loose match)
-      4) Last-chance normalized scan over items
+      4) Normalized section name
     """
-    if not name:
-        return None, None
-
-    k = str(name).strip()
-
-    # 1) Exact section name match (e.g. "Longsword+1")
-    if k in self.items:
-        return k, self.items[k]
-
-    # 2) Case-insensitive section name match
-    kl = k.lower()
-    for nm, data in self.items.items():
-        if nm.lower() == kl:
-            return nm, data
-
-    # 3) Normalized lookup via the index (handles aliases etc.)
-    norm = normalize_name(k)
-    canon = (
-        self.item_index.get(k)
-        or self.item_index.get(kl)
-        or self.item_index.get(norm)
-    )
-    if canon and canon in self.items:
-        return canon, self.items[canon]
-
-    # 4) Final fallback: normalize every item name and compare
-    for nm, data in self.items.items():
-        if normalize_name(nm) == norm:
-            return nm, data
-
-    return None, None
+    return item_search().lookup(name)
 
 
 def _item_ac(self, item: dict) -> int | None:
@@ -1022,27 +989,7 @@ async def _controller_user_for_monster(ctx, cfg, chan_id: str, name: str):
         return None
 
 def _load_class_cache(path: str = "class.lst"):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-
-    cache = {}
-    for section in cfg.sections():
-        cache[section] = {}
-        for k, v in cfg.items(section):
-            v = v.strip()
-            if v and " " in v:
-                parts = v.split()
-                if all(p.lstrip("-").isdigit() for p in parts):
-                    cache[section][k] = [int(p) for p in parts]
-                else:
-                    cache[section][k] = v
-            else:
-                if v.lstrip("-").isdigit():
-                    cache[section][k] = int(v)
-                else:
-                    cache[section][k] = v
-    return cache
+    return class_table(path)
 
 
 _CLASS_CACHE = _load_class_cache()
@@ -1479,28 +1426,9 @@ def load_items(file_path: str):
     """
     Load item.lst and return (items_by_canon, index_by_normalized).
     Optional 'aliases' key per item may contain comma/space-separated synonyms.
+    Shared with the other cogs via utils.static_data; do not modify.
     """
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(file_path)
-
-    items = {}                                 
-    index = {}                                                                          
-
-    for section in cfg.sections():
-        data = dict(cfg.items(section))
-                                                                                                 
-        items[section] = data
-
-                                          
-        index[normalize_name(section)] = section
-
-                                                                    
-        aliases = re.split(r'[,\s]+', data.get("aliases", "").strip())
-        for alias in filter(None, aliases):
-            index[normalize_name(alias)] = section
-
-    return items, index
+    return item_table(file_path)
     
 def _norm_type_token(t: str | None) -> str:
     t = (t or "").strip().lower()
@@ -1529,7 +1457,7 @@ def _collect_absorb_types(t_cfg) -> set[str]:
                  or get_compat(t_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            base_cfg = read_cfg(p)
+            base_cfg = _monster_ini_cfg(p)
             absorb |= (_merge_keys(base_cfg,"base","absorb","absorb_types")
                     |  _merge_keys(base_cfg,"stats","absorb","absorb_types")
                     |  _merge_keys(base_cfg,"info","absorb","absorb_types"))
@@ -1541,6 +1469,8 @@ def _collect_absorb_types(t_cfg) -> set[str]:
 
     
 def _is_monster_file(path: str) -> bool:
+    if is_pending(path):
+        return True   # spawned from a template, not written out yet
     if not os.path.exists(path):
         return False
     cfg = read_cfg(path)
@@ -1567,9 +1497,10 @@ def load_monster_ab(path: str = "class.lst") -> dict[int, int]:
     """
     Parse [monster] hdN=AB from class.lst -> {N: AB}.
     """
-    cp = configparser.ConfigParser()
-    cp.optionxform = str
-    cp.read(path)
+    return derived(path, "monster_ab", _build_monster_ab)
+
+
+def _build_monster_ab(cp) -> dict[int, int]:
     sec = None
     if cp.has_section("monster"):
         sec = "monster"
@@ -1596,7 +1527,7 @@ def _resolve_char_ci(name: str) -> tuple[str | None, str | None]:
     """
     base = name.replace(" ", "_")
     target = f"{base}.coe".lower()
-    for fn in os.listdir("."):
+    for fn in ci_matches(target):
         if fn.lower() == target:
                                                                     
             path = fn
@@ -1658,8 +1589,8 @@ def _get_defense_sets(t_cfg) -> tuple[set[str], set[str], set[str]]:
 
 def _resolve_effect_slot(bcfg, chan_id, name):
     try:
-        names, _ = _parse_combatants(bcfg, chan_id)
-        key = _find_ci_name(names, name) or name
+        view = battle_view(bcfg, chan_id)
+        key = (view.lookup(name) if view is not None else None) or name
         return _slot(key) if '_slot' in globals() else key.replace(" ", "_"), key
     except Exception:
         return name.replace(" ", "_"), name
@@ -1675,7 +1606,7 @@ def _apply_sickened(self, bcfg, chan_id, target_disp: str, by: str, rounds: int,
 
 def _start_maggots(self, bcfg, chan_id, target_disp: str, by: str, rounds: int, dmg_spec: str = "1d4"):
     slotT, _ = _resolve_effect_slot(bcfg, chan_id, target_disp)
-    bcfg.set(chan_id, f"{slotT}.x_maggots",        str(max(0, int(rounds))))
+    _set_timer(bcfg, chan_id, slotT, "x_maggots", str(max(0, int(rounds))))
     bcfg.set(chan_id, f"{slotT}.x_maggots_code",   "MS")
     bcfg.set(chan_id, f"{slotT}.x_maggots_label",  "Maggots (1d4/rd)")
     bcfg.set(chan_id, f"{slotT}.x_maggots_emoji",  "🪱")
@@ -1743,7 +1674,7 @@ def _monster_has_harpysong(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1770,7 +1701,7 @@ def _monster_has_deathtouch(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1800,7 +1731,7 @@ def _monster_has_enslave(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1830,7 +1761,7 @@ def _monster_has_spore(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1858,7 +1789,7 @@ def _monster_has_gibbering(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1886,7 +1817,7 @@ def _monster_has_hex(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1927,7 +1858,7 @@ def _monster_has_lightning_throw(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1958,7 +1889,7 @@ def _monster_has_golemslow(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -1984,7 +1915,7 @@ def _monster_has_gaze(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -2008,7 +1939,7 @@ def _monster_has_spit(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -2043,7 +1974,7 @@ def _monster_has_goo(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -2067,7 +1998,7 @@ def _monster_has_spray(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -2092,7 +2023,7 @@ def _monster_has_breath(att_cfg, att_path):
                  or get_compat(att_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             s2 = " ".join([
                 (get_compat(mcfg, "base", "special", fallback="") or ""),
                 (get_compat(mcfg, "info", "special", fallback="") or "")
@@ -2122,7 +2053,7 @@ def _read_monster_breath_spec(att_cfg, att_path: str) -> tuple[str, str]:
     p = _safe_monster_ini_path(mtype)
     if p:
         try:
-            mcfg = read_cfg(p)
+            mcfg = _monster_ini_cfg(p)
             for sec in ("base", "stats", "info"):
                 v = (get_compat(mcfg, sec, "breath", fallback="") or "").strip()
                 if v:
@@ -2201,7 +2132,7 @@ def _apply_mitigation(raw, weapon_name="", weapon_type="", t_cfg=None, is_magica
                  or get_compat(t_cfg, "info", "type", fallback="")).strip().lower()
         p = _safe_monster_ini_path(mtype)
         if p:
-            base_cfg = read_cfg(p)
+            base_cfg = _monster_ini_cfg(p)
             imm   |= (_merge_keys(base_cfg,"base","immune","immunity","immune_types")
                    |  _merge_keys(base_cfg,"stats","immune","immunity","immune_types"))
             res   |= (_merge_keys(base_cfg,"base","resist","resistance","resist_types")
@@ -2539,7 +2470,7 @@ def _attacker_invis_bonus_and_clear(bcfg, chan_id: str, attacker_display: str, a
                             or ("perm" if inv_perm > 0 else "norm"))
 
             def _clear_inv(slot: str):
-                bcfg.set(chan_id, f"{slot}.inv", "0")
+                _set_timer(bcfg, chan_id, slot, "inv", "0")
                 for suf in ("inv_by", "inv_type", "inv_gid", "inv_leader", "inv_perm"):
                     opt = f"{slot}.{suf}"
                     if bcfg.has_option(chan_id, opt):
@@ -2551,15 +2482,9 @@ def _attacker_invis_bonus_and_clear(bcfg, chan_id: str, attacker_display: str, a
                 gid = bcfg.get(chan_id, f"{attacker_slot}.inv_gid", fallback="")
                 is_leader = bcfg.getint(chan_id, f"{attacker_slot}.inv_leader", fallback=0) > 0
                 if is_leader and gid:
-                    names_all, _ = _parse_combatants(bcfg, chan_id)
-                    for nm in names_all:
-                        try:
-                            s = _slot(nm)
-                        except Exception:
-                            s = nm.replace(" ", "_")
-                        if bcfg.getint(chan_id, f"{s}.inv", fallback=0) > 0 and\
-                           bcfg.get(chan_id, f"{s}.inv_gid", fallback="") == gid:
-                            _clear_inv(s)
+                    for c in battle_view(bcfg, chan_id).inv_group(gid):
+                        if c.inv > 0:
+                            _clear_inv(c.slot)
                     inv_group_note = "**Leader** of Invisible10 — this attack ends invisibility for the **entire group**."
                     _save_battles(bcfg)
                 else:
@@ -2889,6 +2814,31 @@ class Combat(commands.Cog):
         self.mon_ab = load_monster_ab("class.lst")
                                         
         self.class_saves = load_class_saves("class.lst")
+        on_static_reload("combat", self._on_static_reload)
+
+    def _on_static_reload(self, changed):
+        """Rebind the class/item tables after utils.static_data reloaded a file."""
+        global _CLASS_CACHE
+        _CLASS_CACHE = _load_class_cache()
+        if isinstance(self._class_cp, configparser.ConfigParser):
+            self._class_cp = static_cfg("class.lst")
+        self.classes = load_classes_ab("class.lst")
+        self.items, self.item_index = load_items("item.lst")
+        self._index = dict(self.item_index)
+        self.mon_ab = load_monster_ab("class.lst")
+        self.class_saves = load_class_saves("class.lst")
+
+    async def cog_before_invoke(self, ctx):
+        # One battle.lst load/save per command, both done on the storage pool;
+        # helpers share the parsed state in between.
+        ctx.battle_session = await abegin_session()
+        if ctx.command and ctx.command.qualified_name in HOT_COMMANDS:
+            await prefetch_active_char(ctx.author.id)
+            defer_char_writes(ctx)
+
+    async def cog_after_invoke(self, ctx):
+        await achar_writes_done(ctx)
+        await aend_session(getattr(ctx, "battle_session", None))
 
 
               
@@ -2909,7 +2859,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` f""irst.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -3096,7 +3046,7 @@ class Combat(commands.Cog):
         weapons = []
         if char_name:
             path = f"{char_name.replace(' ', '_')}.coe"
-            if os.path.exists(path):
+            if coe_exists(path):
                 cfg = read_cfg(path)
                 class_lc = (get_compat(cfg, "info", "class", fallback="") or "").strip().lower()
                 race_lc  = (get_compat(cfg, "info", "race",  fallback="") or "").strip().lower()
@@ -3797,7 +3747,7 @@ class Combat(commands.Cog):
             return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4103,8 +4053,7 @@ class Combat(commands.Cog):
                         msg_id = bcfg_q.getint(ch_q, "message_id", fallback=0)
                         if msg_id:
                             block = _format_tracker_block(bcfg_q, ch_q)
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                            await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -4650,7 +4599,7 @@ class Combat(commands.Cog):
                                     or ("perm" if inv_perm > 0 else "norm"))
 
                     def _clear_inv(slot: str):
-                        bcfg.set(chan_id, f"{slot}.inv", "0")
+                        _set_timer(bcfg, chan_id, slot, "inv", "0")
                         for suf in ("inv_by", "inv_type", "inv_gid", "inv_leader", "inv_perm"):
                             opt = f"{slot}.{suf}"
                             if bcfg.has_option(chan_id, opt):
@@ -4663,12 +4612,9 @@ class Combat(commands.Cog):
                         gid = bcfg.get(chan_id, f"{s_att}.inv_gid", fallback="")
                         is_leader = bcfg.getint(chan_id, f"{s_att}.inv_leader", fallback=0) > 0
                         if is_leader and gid:
-                            names_all, _ = _parse_combatants(bcfg, chan_id)
-                            for nm in names_all:
-                                s = _slot(nm) if '_slot' in globals() else nm.replace(" ", "_")
-                                if bcfg.getint(chan_id, f"{s}.inv", fallback=0) > 0 and\
-                                   bcfg.get(chan_id, f"{s}.inv_gid", fallback="") == gid:
-                                    _clear_inv(s)
+                            for c in battle_view(bcfg, chan_id).inv_group(gid):
+                                if c.inv > 0:
+                                    _clear_inv(c.slot)
                             inv_group_note = "**Leader** of Invisible10 — this attack ends invisibility for the **entire group**."
                             _save_battles(bcfg)
                         else:
@@ -5125,7 +5071,7 @@ class Combat(commands.Cog):
                                     ents = _sorted_entries(bcfg, chan_id)
                                     bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                                 _save_battles(bcfg)
-                        try: os.remove(os.path.abspath(tgt_path))
+                        try: remove_cfg(tgt_path)
                         except Exception: pass
                     except Exception: pass
 
@@ -5183,7 +5129,7 @@ class Combat(commands.Cog):
                                             ents = _sorted_entries(bcfg, chan_id)
                                             bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                                         _save_battles(bcfg)
-                                try: os.remove(os.path.abspath(spath))
+                                try: remove_cfg(spath)
                                 except Exception: pass
                             except Exception:
                                 pass
@@ -5200,8 +5146,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -5310,7 +5255,7 @@ class Combat(commands.Cog):
                                         ents = _sorted_entries(bcfg, chan_id)
                                         bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                                     _save_battles(bcfg)
-                            try: os.remove(os.path.abspath(prim_path))
+                            try: remove_cfg(prim_path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -5369,7 +5314,7 @@ class Combat(commands.Cog):
                                         ents = _sorted_entries(bcfg, chan_id)
                                         bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                                     _save_battles(bcfg)
-                            try: os.remove(os.path.abspath(spath))
+                            try: remove_cfg(spath)
                             except Exception: pass
                         except Exception:
                             pass
@@ -5385,8 +5330,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -5927,7 +5871,7 @@ class Combat(commands.Cog):
 
                     if _is_monster_file(tgt_path):
                         try:
-                            os.remove(os.path.abspath(tgt_path))
+                            remove_cfg(tgt_path)
                         except Exception:
                             pass
 
@@ -5937,8 +5881,7 @@ class Combat(commands.Cog):
                             msg_id = bcfg2.getint(str(ctx.channel.id), "message_id", fallback=0)
                             if msg_id:
                                 block = _format_tracker_block(bcfg2, str(ctx.channel.id))
-                                msg = await ctx.channel.fetch_message(msg_id)
-                                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                     except Exception:
                         pass
                 except Exception:
@@ -5986,7 +5929,7 @@ class Combat(commands.Cog):
 
                     if _is_monster_file(tgt_path):
                         try:
-                            os.remove(os.path.abspath(tgt_path))
+                            remove_cfg(tgt_path)
                         except Exception:
                             pass
                 except Exception:
@@ -5998,8 +5941,7 @@ class Combat(commands.Cog):
                         msg_id = bcfg2.getint(str(ctx.channel.id), "message_id", fallback=0)
                         if msg_id:
                             block = _format_tracker_block(bcfg2, str(ctx.channel.id))
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                            await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -6050,8 +5992,7 @@ class Combat(commands.Cog):
                             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                             if msg_id:
                                 block = _format_tracker_block(bcfg, chan_id)
-                                msg = await ctx.channel.fetch_message(msg_id)
-                                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                         except Exception:
                             pass
                         await ctx.send(embed=embed); return
@@ -6142,8 +6083,7 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -6231,8 +6171,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
                 except Exception:
                     pass
 
@@ -6654,7 +6593,7 @@ class Combat(commands.Cog):
                         cur_sleep = bcfg.getint(chan_id, f"{tgt_slot_for_sub}.sleep", fallback=0)
                         cur_para  = bcfg.getint(chan_id, f"{tgt_slot_for_sub}.paralyzed", fallback=0)
                         bcfg.set(chan_id, f"{tgt_slot_for_sub}.sleep",     str(max(cur_sleep, ko_rounds)))
-                        bcfg.set(chan_id, f"{tgt_slot_for_sub}.paralyzed", str(max(cur_para,  ko_rounds)))
+                        _set_timer(bcfg, chan_id, tgt_slot_for_sub, "paralyzed", str(max(cur_para,  ko_rounds)))
                         _save_battles(bcfg)
 
                         ko_applied = True
@@ -6759,7 +6698,7 @@ class Combat(commands.Cog):
 
                                                                                                      
                                 die = (pc_extra_eff.get("holdbite_dice") or "1d4").strip()
-                                bcfg_h.set(chan_h, f"{s_def}.x_holdbite", "-1")                         
+                                _set_timer(bcfg_h, chan_h, s_def, "x_holdbite", "-1")                         
                                 bcfg_h.set(chan_h, f"{s_def}.x_holdbite_label", "WORRY")
                                 bcfg_h.set(chan_h, f"{s_def}.x_holdbite_code", "perm")
                                 bcfg_h.set(chan_h, f"{s_def}.x_holdbite_dice", die)
@@ -6780,8 +6719,7 @@ class Combat(commands.Cog):
                                     msg_id = bcfg_h.getint(chan_h, "message_id", fallback=0)
                                     if msg_id:
                                         block = _format_tracker_block(bcfg_h, chan_h)
-                                        msg = await ctx.channel.fetch_message(msg_id)
-                                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                                 except Exception:
                                     pass
                     except Exception:
@@ -6960,7 +6898,7 @@ class Combat(commands.Cog):
                                                 key = _find_ci_name(names, (display_target or primary_target)) or (display_target or primary_target)
                                                 s_tgt = _slot(key) if '_slot' in globals() else key.replace(" ", "_")
                                                 cur_left = bcfg.getint(ch, f"{s_tgt}.paralyzed", fallback=0)
-                                                bcfg.set(ch, f"{s_tgt}.paralyzed", str(max(cur_left, rounds)))
+                                                _set_timer(bcfg, ch, s_tgt, "paralyzed", str(max(cur_left, rounds)))
                                                                                   
                                                 if bcfg.has_option(ch, f"{s_tgt}.para"):
                                                     bcfg.remove_option(ch, f"{s_tgt}.para")
@@ -7181,14 +7119,13 @@ class Combat(commands.Cog):
                                     bcfg = _load_battles() 
                                     block = _format_tracker_block(bcfg, chan_id)
                                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                                    msg = await ctx.channel.fetch_message(msg_id)
-                                    await msg.edit(content=content)
+                                    await post_tracker(ctx.channel, msg_id, content)
                             except Exception:
                                 pass
                 except Exception as e:
                     await ctx.send(f"⚠️ couldn’t update initiative for **{pretty_name}**: `{e}`")
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception as e:
                     await ctx.send(f"⚠️ couldn’t delete `{os.path.basename(tgt_path)}`: `{e}`")
 
@@ -7224,7 +7161,7 @@ class Combat(commands.Cog):
                 embed.add_field(name="Repeat", value="⛔ Target was slain by the first attack. Stopping repeats.", inline=False)
             else:
                 for shot_idx in range(2, repeat_times + 1):
-                    if not os.path.exists(tgt_path):
+                    if not coe_exists(tgt_path):
                         embed.add_field(name="Repeat", value=f"⛔ Target file missing before attack #{shot_idx}.", inline=False)
                         break
 
@@ -7497,7 +7434,7 @@ class Combat(commands.Cog):
                         except Exception:
                             post_drain_hp_pure = pre_drain_hp_pure
 
-                        if (pre_drain_hp_pure > 0 and post_drain_hp_pure <= 0) or (pre_drain_hp_pure > 0 and not os.path.exists(tgt_path)):
+                        if (pre_drain_hp_pure > 0 and post_drain_hp_pure <= 0) or (pre_drain_hp_pure > 0 and not coe_exists(tgt_path)):
                             killed_by_drain_b = True
 
                         if killed_by_drain_b:
@@ -7522,7 +7459,7 @@ class Combat(commands.Cog):
                                                 ents2 = _sorted_entries(bcfg2, str(ctx.channel.id))
                                                 bcfg2.set(str(ctx.channel.id), "turn", ents2[0]["name"] if ents2 else "")
                                             _save_battles(bcfg2)
-                                    try: os.remove(os.path.abspath(tgt_path))
+                                    try: remove_cfg(tgt_path)
                                     except Exception: pass
                                 except Exception:
                                     pass
@@ -7846,7 +7783,7 @@ class Combat(commands.Cog):
                                 except Exception:
                                     post_drain_hp_b = pre_drain_hp_b
 
-                                if (pre_drain_hp_b > 0 and post_drain_hp_b <= 0) or (pre_drain_hp_b > 0 and not os.path.exists(tgt_path)):
+                                if (pre_drain_hp_b > 0 and post_drain_hp_b <= 0) or (pre_drain_hp_b > 0 and not coe_exists(tgt_path)):
                                     killed_by_drain_b = True
                         except Exception:
                             pass
@@ -7979,7 +7916,7 @@ class Combat(commands.Cog):
                                         ents2 = _sorted_entries(bcfg2, str(ctx.channel.id))
                                         bcfg2.set(str(ctx.channel.id), "turn", ents2[0]["name"] if ents2 else "")
                                     _save_battles(bcfg2)
-                            try: os.remove(os.path.abspath(tgt_path))
+                            try: remove_cfg(tgt_path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -7995,8 +7932,7 @@ class Combat(commands.Cog):
                     bcfg = _load_battles() 
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -8531,7 +8467,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id); await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -9321,7 +9257,7 @@ class Combat(commands.Cog):
                         bcfg.set(chan_id, f"{s_def}.heldby", att_key)
 
                                                                                              
-                        bcfg.set(chan_id, f"{s_def}.x_constrict", "-1")                                           
+                        _set_timer(bcfg, chan_id, s_def, "x_constrict", "-1")                                           
                         bcfg.set(chan_id, f"{s_def}.x_constrict_label", "COIL")                                        
                         bcfg.set(chan_id, f"{s_def}.x_constrict_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_constrict_dice", cons_die)
@@ -9367,7 +9303,7 @@ class Combat(commands.Cog):
 
                                                                                          
                         die = (extra_eff.get("holdbite_dice") or "1d4").strip()
-                        bcfg.set(chan_id, f"{s_def}.x_holdbite", "-1")
+                        _set_timer(bcfg, chan_id, s_def, "x_holdbite", "-1")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_label", "WORRY")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_dice", die)
@@ -9414,7 +9350,7 @@ class Combat(commands.Cog):
 
                                                                                                            
                         die = (extra_eff.get("leech_dice") or "1d6").strip()
-                        bcfg.set(chan_id, f"{s_def}.x_leech", "-1")
+                        _set_timer(bcfg, chan_id, s_def, "x_leech", "-1")
                         bcfg.set(chan_id, f"{s_def}.x_leech_label", "LEECH")
                         bcfg.set(chan_id, f"{s_def}.x_leech_code",  "perm")
                         bcfg.set(chan_id, f"{s_def}.x_leech_dice",  die)
@@ -9465,7 +9401,7 @@ class Combat(commands.Cog):
                         bcfg.set(chan_id, f"{s_def}.heldby", att_key)
 
                                                                    
-                        bcfg.set(chan_id, f"{s_def}.x_entangle", "-1")                                       
+                        _set_timer(bcfg, chan_id, s_def, "x_entangle", "-1")                                       
                         bcfg.set(chan_id, f"{s_def}.x_entangle_label", "VINE")                                    
                         bcfg.set(chan_id, f"{s_def}.x_entangle_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_entangle_dice", vine_die)
@@ -9533,13 +9469,13 @@ class Combat(commands.Cog):
                 chan_id = _section_id(ctx.channel)
                 slot_def = _slot(tgt_name)
 
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub", str(death_in_rounds))
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub_burn", str(burn_window))
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub", str(death_in_rounds))
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub_burn", str(burn_window))
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_label", "Rot Grubs")
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_emoji", "🪱")
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_code", "DIS")                                 
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_by",   atk_name if atk_name else (atk_name or "Unknown"))
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub_notice", "1" if noticed else "0")
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub_notice", "1" if noticed else "0")
                 _save_battles(bcfg)
 
                                      
@@ -9602,7 +9538,7 @@ class Combat(commands.Cog):
                                 bcfg.set(chan_id, f"{s_att}.holds", def_key)
                                 bcfg.set(chan_id, f"{s_def}.heldby", att_key)
                                 die = (extra_eff.get("swallow_dice") or "1d8").strip()
-                                bcfg.set(chan_id, f"{s_def}.x_swallow", "-1")                            
+                                _set_timer(bcfg, chan_id, s_def, "x_swallow", "-1")                            
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_label", "GULLET")
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_code", "perm")
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_dice", die)
@@ -9795,12 +9731,12 @@ class Combat(commands.Cog):
                                                                                         
                         label = "FV" if kind == "fast" else "SV"
                         if kind == "fast":
-                            bcfg.set(chan_id, f"{s_def}.x_fastvenom", str(max(1, dur_n)))                              
+                            _set_timer(bcfg, chan_id, s_def, "x_fastvenom", str(max(1, dur_n)))                              
                             bcfg.set(chan_id, f"{s_def}.x_fastvenom_dice", die)
                             bcfg.set(chan_id, f"{s_def}.x_fastvenom_label", label)
                         else:
                                                                         
-                            bcfg.set(chan_id, f"{s_def}.x_slowvenom", str(max(60, dur_n * 60)))
+                            _set_timer(bcfg, chan_id, s_def, "x_slowvenom", str(max(60, dur_n * 60)))
                             bcfg.set(chan_id, f"{s_def}.x_slowvenom_dice", die)
                             bcfg.set(chan_id, f"{s_def}.x_slowvenom_label", label)
                         _save_battles(bcfg)
@@ -9860,12 +9796,12 @@ class Combat(commands.Cog):
                     existing = bcfg2.getint(ch2, f"{s_def2}.x_transform", fallback=0)
                     new_left = max(existing, rounds)
 
-                    bcfg2.set(ch2, f"{s_def2}.x_transform", str(new_left))
+                    _set_timer(bcfg2, ch2, s_def2, "x_transform", str(new_left))
                     bcfg2.set(ch2, f"{s_def2}.x_transform_label", "JELLY")
                     bcfg2.set(ch2, f"{s_def2}.x_transform_code", "timer")                                     
                     bcfg2.set(ch2, f"{s_def2}.x_transform_by", atk_name)
                     bcfg2.set(ch2, f"{s_def2}.x_transform_type", "greenjelly")
-                    bcfg2.set(ch2, f"{s_def2}.x_transform_grace", "1")                                
+                    _set_timer(bcfg2, ch2, s_def2, "x_transform_grace", "1")                                
                     _save_battles(bcfg2)
 
                     rolls_txt = f" [{', '.join(str(r) for r in (rolls4 if rounds and not override else []))}]" if not override else ""
@@ -9890,7 +9826,7 @@ class Combat(commands.Cog):
                     try: s_def2 = _slot(def_key)
                     except Exception: s_def2 = def_key.replace(" ", "_")
                     die = (extra_eff.get("dissolve_dice") or "2d8").strip()
-                    bcfg2.set(ch2, f"{s_def2}.x_dissolve", "-1")                                      
+                    _set_timer(bcfg2, ch2, s_def2, "x_dissolve", "-1")                                      
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_label", "ACID")                         
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_code", "perm")
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_dice", die)
@@ -10109,7 +10045,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -10121,8 +10057,7 @@ class Combat(commands.Cog):
                     bcfg = _load_battles()
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -10722,7 +10657,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id); await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -11473,7 +11408,7 @@ class Combat(commands.Cog):
                         bcfg.set(chan_id, f"{s_def}.heldby", att_key)
 
                                                                                              
-                        bcfg.set(chan_id, f"{s_def}.x_constrict", "-1")                                           
+                        _set_timer(bcfg, chan_id, s_def, "x_constrict", "-1")                                           
                         bcfg.set(chan_id, f"{s_def}.x_constrict_label", "COIL")                                        
                         bcfg.set(chan_id, f"{s_def}.x_constrict_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_constrict_dice", cons_die)
@@ -11520,7 +11455,7 @@ class Combat(commands.Cog):
 
                                                                                          
                         die = (extra_eff.get("holdbite_dice") or "1d4").strip()
-                        bcfg.set(chan_id, f"{s_def}.x_holdbite", "-1")
+                        _set_timer(bcfg, chan_id, s_def, "x_holdbite", "-1")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_label", "WORRY")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_holdbite_dice", die)
@@ -11567,7 +11502,7 @@ class Combat(commands.Cog):
 
                                                                                                            
                         die = (extra_eff.get("leech_dice") or "1d6").strip()
-                        bcfg.set(chan_id, f"{s_def}.x_leech", "-1")
+                        _set_timer(bcfg, chan_id, s_def, "x_leech", "-1")
                         bcfg.set(chan_id, f"{s_def}.x_leech_label", "LEECH")
                         bcfg.set(chan_id, f"{s_def}.x_leech_code",  "perm")
                         bcfg.set(chan_id, f"{s_def}.x_leech_dice",  die)
@@ -11617,7 +11552,7 @@ class Combat(commands.Cog):
                         bcfg.set(chan_id, f"{s_def}.heldby", att_key)
 
                                                                    
-                        bcfg.set(chan_id, f"{s_def}.x_entangle", "-1")                                       
+                        _set_timer(bcfg, chan_id, s_def, "x_entangle", "-1")                                       
                         bcfg.set(chan_id, f"{s_def}.x_entangle_label", "VINE")                                    
                         bcfg.set(chan_id, f"{s_def}.x_entangle_code", "perm")
                         bcfg.set(chan_id, f"{s_def}.x_entangle_dice", vine_die)
@@ -11684,13 +11619,13 @@ class Combat(commands.Cog):
                 chan_id = _section_id(ctx.channel)
                 slot_def = _slot(tgt_name)
 
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub", str(death_in_rounds))
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub_burn", str(burn_window))
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub", str(death_in_rounds))
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub_burn", str(burn_window))
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_label", "Rot Grubs")
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_emoji", "🪱")
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_code", "DIS")                                 
                 bcfg.set(chan_id, f"{slot_def}.x_rotgrub_by",   atk_name if atk_name else (attacker or "Unknown"))
-                bcfg.set(chan_id, f"{slot_def}.x_rotgrub_notice", "1" if noticed else "0")
+                _set_timer(bcfg, chan_id, slot_def, "x_rotgrub_notice", "1" if noticed else "0")
                 _save_battles(bcfg)
 
                                      
@@ -11752,7 +11687,7 @@ class Combat(commands.Cog):
                                 bcfg.set(chan_id, f"{s_att}.holds", def_key)
                                 bcfg.set(chan_id, f"{s_def}.heldby", att_key)
                                 die = (extra_eff.get("swallow_dice") or "1d8").strip()
-                                bcfg.set(chan_id, f"{s_def}.x_swallow", "-1")                            
+                                _set_timer(bcfg, chan_id, s_def, "x_swallow", "-1")                            
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_label", "GULLET")
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_code", "perm")
                                 bcfg.set(chan_id, f"{s_def}.x_swallow_dice", die)
@@ -11947,12 +11882,12 @@ class Combat(commands.Cog):
                                                                                         
                         label = "FV" if kind == "fast" else "SV"
                         if kind == "fast":
-                            bcfg.set(chan_id, f"{s_def}.x_fastvenom", str(max(1, dur_n)))                              
+                            _set_timer(bcfg, chan_id, s_def, "x_fastvenom", str(max(1, dur_n)))                              
                             bcfg.set(chan_id, f"{s_def}.x_fastvenom_dice", die)
                             bcfg.set(chan_id, f"{s_def}.x_fastvenom_label", label)
                         else:
                                                                         
-                            bcfg.set(chan_id, f"{s_def}.x_slowvenom", str(max(60, dur_n * 60)))
+                            _set_timer(bcfg, chan_id, s_def, "x_slowvenom", str(max(60, dur_n * 60)))
                             bcfg.set(chan_id, f"{s_def}.x_slowvenom_dice", die)
                             bcfg.set(chan_id, f"{s_def}.x_slowvenom_label", label)
                         _save_battles(bcfg)
@@ -12013,12 +11948,12 @@ class Combat(commands.Cog):
                     existing = bcfg2.getint(ch2, f"{s_def2}.x_transform", fallback=0)
                     new_left = max(existing, rounds)
 
-                    bcfg2.set(ch2, f"{s_def2}.x_transform", str(new_left))
+                    _set_timer(bcfg2, ch2, s_def2, "x_transform", str(new_left))
                     bcfg2.set(ch2, f"{s_def2}.x_transform_label", "JELLY")
                     bcfg2.set(ch2, f"{s_def2}.x_transform_code", "timer")                                     
                     bcfg2.set(ch2, f"{s_def2}.x_transform_by", atk_name)
                     bcfg2.set(ch2, f"{s_def2}.x_transform_type", "greenjelly")
-                    bcfg2.set(ch2, f"{s_def2}.x_transform_grace", "1")                                
+                    _set_timer(bcfg2, ch2, s_def2, "x_transform_grace", "1")                                
                     _save_battles(bcfg2)
 
                     rolls_txt = f" [{', '.join(str(r) for r in (rolls4 if rounds and not override else []))}]" if not override else ""
@@ -12043,7 +11978,7 @@ class Combat(commands.Cog):
                     try: s_def2 = _slot(def_key)
                     except Exception: s_def2 = def_key.replace(" ", "_")
                     die = (extra_eff.get("dissolve_dice") or "2d8").strip()
-                    bcfg2.set(ch2, f"{s_def2}.x_dissolve", "-1")                                      
+                    _set_timer(bcfg2, ch2, s_def2, "x_dissolve", "-1")                                      
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_label", "ACID")                         
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_code", "perm")
                     bcfg2.set(ch2, f"{s_def2}.x_dissolve_dice", die)
@@ -12207,7 +12142,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -12219,8 +12154,7 @@ class Combat(commands.Cog):
                     bcfg = _load_battles()
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -12271,7 +12205,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -12469,8 +12403,7 @@ class Combat(commands.Cog):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -12544,8 +12477,7 @@ class Combat(commands.Cog):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -12597,8 +12529,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -12650,7 +12581,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -12761,8 +12692,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -12829,7 +12759,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -12923,9 +12853,9 @@ class Combat(commands.Cog):
             return it if isinstance(it, dict) else None
 
         def _resolve(raw: str):
+            # Exact/normalized index lookup only: spans are tried greedily, so
+            # fuzzy suggestions are left for the error message.
             canon, it = self._item_lookup(raw)
-            if canon is None or not it:
-                canon, it = self.find_item(raw.strip())
             it = _normalize_item(it)
             return canon, it
 
@@ -13056,7 +12986,9 @@ class Combat(commands.Cog):
                         break
 
                 if not found:
-                    errors.append(f"⚠️ Unknown item near: **{' '.join(tokens[i:i+2])}**")
+                    sug = item_search().suggest(" ".join(tokens[i:i+2]), limit=3)
+                    hint = f" (did you mean: {', '.join(sug)}?)" if sug else ""
+                    errors.append(f"⚠️ Unknown item near: **{' '.join(tokens[i:i+2])}**{hint}")
                     i += 1
                     continue
 
@@ -13125,8 +13057,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -13180,7 +13111,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -13319,8 +13250,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -13365,7 +13295,7 @@ class Combat(commands.Cog):
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     path = fn
                     try:
@@ -13389,7 +13319,7 @@ class Combat(commands.Cog):
             if not char_name:
                 await ctx.send("❌ No active character. Use `!char <name>` first."); return
             path = f"{char_name.replace(' ', '_')}.coe"
-            if not os.path.exists(path):
+            if not coe_exists(path):
                 await ctx.send(f"❌ Character file not found for **{char_name}**."); return
             cfg = read_cfg(path)
 
@@ -13655,7 +13585,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -13899,7 +13829,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -13972,11 +13902,8 @@ class Combat(commands.Cog):
         # --- set tracker effect (x_torch) ---
         slot = _slot(resolved)
         tag = "torch"
-        bcfg.set(chan_id, f"{slot}.x_{tag}", str(rounds))
-        bcfg.set(chan_id, f"{slot}.x_{tag}_label", "Torch")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_code", "TOR")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_emoji", "🔥")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_by", char_name)
+        _set_x_effect(bcfg, chan_id, slot, tag, rounds,
+                      label="Torch", code="TOR", emoji="🔥", by=char_name)
         _save_battles(bcfg)
 
         # best-effort: update the pinned tracker message immediately
@@ -14026,7 +13953,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -14106,11 +14033,8 @@ class Combat(commands.Cog):
 
         slot = _slot(resolved)
         tag = "lantern"
-        bcfg.set(chan_id, f"{slot}.x_{tag}", str(rounds))
-        bcfg.set(chan_id, f"{slot}.x_{tag}_label", "Lantern")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_code", "LAN")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_emoji", "🏮")
-        bcfg.set(chan_id, f"{slot}.x_{tag}_by", char_name)
+        _set_x_effect(bcfg, chan_id, slot, tag, rounds,
+                      label="Lantern", code="LAN", emoji="🏮", by=char_name)
         _save_battles(bcfg)
 
         try:
@@ -14151,7 +14075,7 @@ class Combat(commands.Cog):
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target and fn.lower().endswith(".coe"):
                     path = fn
                     try:
@@ -14216,7 +14140,7 @@ class Combat(commands.Cog):
         if not src_name:
             await ctx.send("❌ No active character. Use `!char <name>` first."); return
         src_path = f"{src_name.replace(' ', '_')}.coe"
-        if not os.path.exists(src_path):
+        if not coe_exists(src_path):
             await ctx.send(f"❌ Character file not found for **{src_name}**."); return
 
         dst_name, dst_path = _resolve_char_ci(who)
@@ -14331,7 +14255,9 @@ class Combat(commands.Cog):
 
         canon, it = self._item_lookup(raw_name)
         if not canon:
-            await ctx.send(f"❌ Unknown item **{raw_name}**."); return
+            sug = item_search().suggest(raw_name)
+            hint = f" Did you mean: {', '.join(sug)}?" if sug else ""
+            await ctx.send(f"❌ Unknown item **{raw_name}**.{hint}"); return
 
         if _norm(canon) == "spellscroll":
             await ctx.send(
@@ -14565,7 +14491,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -14662,14 +14588,14 @@ class Combat(commands.Cog):
                     gear, tool, food, other
         """
         from collections import defaultdict
-        import random, re, os, nextcord, configparser
+        import random, re, nextcord, configparser
 
         char_name = get_active(ctx.author.id)
         if not char_name:
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(path)
@@ -14885,7 +14811,7 @@ class Combat(commands.Cog):
         if not char_name:
             await ctx.send("❌ No active character. Use `!char <name>` first."); return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**."); return
 
         m = re.fullmatch(r'\s*(?:"([^"]+)"|\'([^\']+)\'|(.+?))(?:\s+(\d+))?\s*', item_and_qty)
@@ -14897,6 +14823,12 @@ class Combat(commands.Cog):
             await ctx.send("❌ Quantity must be a positive integer."); return
 
         canon = self._canon(item_name)
+        if canon not in self.items:
+            canon = item_search().canon(item_name) or canon
+        if canon not in self.items:
+            sug = item_search().suggest(item_name)
+            hint = f" Did you mean: {', '.join(sug)}?" if sug else ""
+            await ctx.send(f"❌ Unknown item **{item_name}**.{hint}"); return
         data = self.items.get(canon, {})
         price_raw = (data.get("price", "") or "").strip()
         if not price_raw:
@@ -15000,7 +14932,7 @@ class Combat(commands.Cog):
         if not char_name:
             await ctx.send("❌ No active character. Use `!char <name>` first."); return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**."); return
 
         cfg = read_cfg(path)
@@ -15429,8 +15361,7 @@ class Combat(commands.Cog):
                             if msg_id:
                                 block = _format_tracker_block(bcfg, chan_id)
                                 content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                                msg = await ctx.channel.fetch_message(msg_id)
-                                await msg.edit(content=content)
+                                await post_tracker(ctx.channel, msg_id, content)
                         except Exception:
                             pass
 
@@ -15469,8 +15400,7 @@ class Combat(commands.Cog):
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
                     try:
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -15607,7 +15537,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ','_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         ccfg = read_cfg(path)
@@ -15651,7 +15581,7 @@ class Combat(commands.Cog):
         for name in targets:
             disp, tpath = _resolve_char_ci(name)
             pretty = disp or name
-            if not tpath or not os.path.exists(tpath):
+            if not tpath or not coe_exists(tpath):
                 not_found.append(pretty); continue
             tcfg = read_cfg(tpath)
             col, label, is_und, hd = _pick_col_for_target(tcfg, pretty)
@@ -15787,7 +15717,7 @@ class Combat(commands.Cog):
                                     bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                                 _save_battles(bcfg)
                         try:
-                            os.remove(os.path.abspath(r["path"]))
+                            remove_cfg(r["path"])
                         except Exception:
                             pass
                         killed_any.append(pretty)
@@ -15814,8 +15744,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -15851,7 +15780,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ','_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         ccfg = read_cfg(path)
@@ -15950,7 +15879,7 @@ class Combat(commands.Cog):
         for name in target_names:
             disp, tpath = _resolve_char_ci(name)
             pretty = disp or name
-            if not tpath or not os.path.exists(tpath):
+            if not tpath or not coe_exists(tpath):
                 not_found.append(pretty); continue
             tcfg = read_cfg(tpath)
             if not _is_animal_cfg(tcfg):
@@ -16096,7 +16025,7 @@ class Combat(commands.Cog):
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     path = fn
                     try:
@@ -16145,9 +16074,7 @@ class Combat(commands.Cog):
                 try:
                     cp = getattr(self, "_race_cp", None)
                     if cp is None:
-                        cp = configparser.ConfigParser()
-                        cp.optionxform = str
-                        cp.read("race.lst")
+                        cp = static_cfg("race.lst")
                         self._race_cp = cp
 
                     sec = None
@@ -16411,7 +16338,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -16514,7 +16441,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(path)
@@ -16574,12 +16501,9 @@ class Combat(commands.Cog):
             except Exception:
                 pass
 
-            # 2) Fallback: read race.lst from disk (same as !s)
+            # 2) Fallback: the shared race.lst parse (same as !s)
             try:
-                import configparser
-                rp = configparser.ConfigParser()
-                rp.optionxform = str
-                rp.read("race.lst")
+                rp = static_cfg("race.lst")
 
                 for sec in rp.sections():
                     if sec.lower() == race_lc:
@@ -16780,8 +16704,7 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
                 return
@@ -16799,8 +16722,7 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -16880,8 +16802,7 @@ class Combat(commands.Cog):
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
                 content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content=content)
+                await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -16900,7 +16821,7 @@ class Combat(commands.Cog):
           • Any phase:   `!defend <name>` -> defend that combatant (GM or owner/controller only)
             Example: `!defend gn1`
         """
-        import os, random, nextcord
+        import random, nextcord
 
         # Load battle + current turn
         cfg_b = _load_battles()
@@ -16975,7 +16896,7 @@ class Combat(commands.Cog):
         except Exception:
             disp_name, path = chosen_key, f"{chosen_key.replace(' ', '_')}.coe"
 
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{disp_name}**.")
             return
 
@@ -17040,8 +16961,7 @@ class Combat(commands.Cog):
             if msg_id:
                 block = _format_tracker_block(cfg_b, chan_id)
                 content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content=content)
+                await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -17724,7 +17644,7 @@ class Combat(commands.Cog):
         d4 = random.randint(1, 4)
         new = min(cur_sleep, d4)
         bcfg.set(chan_id, f"{slot}.sleep", str(new))
-        bcfg.set(chan_id, f"{slot}.paralyzed", str(new))
+        _set_timer(bcfg, chan_id, slot, "paralyzed", str(new))
         _save_battles(bcfg)
         await ctx.send(f"• **{tgt_disp}** is being roused. They will awaken in **{new} rounds** (1d4 → {d4}).")
 
@@ -17762,7 +17682,7 @@ class Combat(commands.Cog):
                                         
             base = target.replace(" ", "_") + ".coe"
             try:
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn; disp = target; break
             except Exception:
@@ -17793,8 +17713,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -17911,7 +17830,7 @@ class Combat(commands.Cog):
                 except Exception:
                     s_tgt = key.replace(" ", "_")
                 base, label = "x_deaf", "Deafened"
-                bcfg.set(chan_id, f"{s_tgt}.{base}",       str(rounds))
+                _set_timer(bcfg, chan_id, s_tgt, base, str(rounds))
                 bcfg.set(chan_id, f"{s_tgt}.{base}_label", label)
                 bcfg.set(chan_id, f"{s_tgt}.{base}_code",  "DEAF")
                 bcfg.set(chan_id, f"{s_tgt}.{base}_emoji", "🔇")
@@ -18129,8 +18048,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -18255,7 +18173,7 @@ class Combat(commands.Cog):
                         if bcfg.has_option(chan_id, opt):
                             bcfg.remove_option(chan_id, opt)
 
-                    bcfg.set(chan_id, f"{slot}.blind",       str(PERM_ROUNDS))
+                    _set_timer(bcfg, chan_id, slot, "blind", str(PERM_ROUNDS))
                     bcfg.set(chan_id, f"{slot}.blind_perm",  "1")
                     bcfg.set(chan_id, f"{slot}.blind_src",   "spit")
                     bcfg.set(chan_id, f"{slot}.blind_by",    att_name)
@@ -18289,8 +18207,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -18583,8 +18500,7 @@ class Combat(commands.Cog):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -18665,7 +18581,7 @@ class Combat(commands.Cog):
             except Exception:
                                                                                   
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -18724,7 +18640,7 @@ class Combat(commands.Cog):
         try:
             bcfg.set(chan_id, uses_key, str(used + 1))
                                                                       
-            bcfg.set(chan_id, f"{slot}.x_spraycd",         "3")
+            _set_timer(bcfg, chan_id, slot, "x_spraycd", "3")
             bcfg.set(chan_id, f"{slot}.x_spraycd_code",    "BS")                                     
             bcfg.set(chan_id, f"{slot}.x_spraycd_label",   "Bombardier Spray (CD)")                
             bcfg.set(chan_id, f"{slot}.x_spraycd_emoji",   "⏱️")
@@ -18771,7 +18687,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
                                                             
@@ -18781,8 +18697,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -18855,7 +18770,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -19077,7 +18992,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -19121,7 +19036,7 @@ class Combat(commands.Cog):
                     return _resolve_char_ci(name)
                 except Exception:
                     base = name.replace(" ", "_").lower() + ".coe"
-                    for fn in os.listdir("."):
+                    for fn in ci_matches(base):
                         if fn.lower() == base:
                             path = fn
                             try:
@@ -19178,7 +19093,7 @@ class Combat(commands.Cog):
                                                                                   
                 if bcfg and bcfg.has_section(chan_id):
                     t_slot = self._effect_slot_for(bcfg, chan_id, pretty)
-                    bcfg.set(chan_id, f"{t_slot}.x_pet",        "999")                                         
+                    _set_timer(bcfg, chan_id, t_slot, "x_pet", "999")                                         
                     bcfg.set(chan_id, f"{t_slot}.x_pet_label",  "Petrified")
                     bcfg.set(chan_id, f"{t_slot}.pet_perm", "1")
                     bcfg.set(chan_id, f"{t_slot}.x_pet_code",   "PET")
@@ -19429,7 +19344,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
         if any_hp_changes:
@@ -19440,8 +19355,7 @@ class Combat(commands.Cog):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -19602,7 +19516,7 @@ class Combat(commands.Cog):
                 except Exception:
                     prev = 0
 
-                bcfg.set(chan_id, f"{s}.cn", str(max(prev, cn_dur)))
+                _set_timer(bcfg, chan_id, s, "cn", str(max(prev, cn_dur)))
                 bcfg.set(chan_id, f"{s}.cn_by", pretty_hag)
                 _save_battles(bcfg)
                 applied = True
@@ -19693,7 +19607,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -19770,7 +19684,7 @@ class Combat(commands.Cog):
                     prev = bcfg.getint(chan_id, f"{s}.cn", fallback=0)
                 except Exception:
                     prev = 0
-                bcfg.set(chan_id, f"{s}.cn", str(max(prev, dur_rounds)))
+                _set_timer(bcfg, chan_id, s, "cn", str(max(prev, dur_rounds)))
                 bcfg.set(chan_id, f"{s}.cn_by", att_name)
                 _save_battles(bcfg)
                 any_changes = True
@@ -19878,7 +19792,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -19927,7 +19841,7 @@ class Combat(commands.Cog):
                                                              
             cur = bcfg.getint(chan_id, f"{t_slot}.x_spore", fallback=0)
             newv = max(cur, 6)
-            bcfg.set(chan_id, f"{t_slot}.x_spore",       str(newv))
+            _set_timer(bcfg, chan_id, t_slot, "x_spore", str(newv))
             bcfg.set(chan_id, f"{t_slot}.x_spore_dice",  "1d8")
             bcfg.set(chan_id, f"{t_slot}.x_spore_label", "Toxic Spores")
             bcfg.set(chan_id, f"{t_slot}.x_spore_code",  "YS")
@@ -19948,7 +19862,7 @@ class Combat(commands.Cog):
 
                                                               
         try:
-            bcfg.set(chan_id, f"{slot}.x_spore_used", "1")
+            _set_timer(bcfg, chan_id, slot, "x_spore_used", "1")
             bcfg.set(chan_id, f"{slot}.x_spore_used_label", "Spores (used)")
             bcfg.set(chan_id, f"{slot}.x_spore_used_code",  "SP")
             _save_battles(bcfg)
@@ -20070,7 +19984,7 @@ class Combat(commands.Cog):
                                 bcfg_rm.set(chan_id, "turn", ents[0]["name"] if ents else "")
                             _save_battles(bcfg_rm)
                     try:
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
                 except Exception:
@@ -20086,8 +20000,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\\n```text\\n" + block + "\\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -20179,7 +20092,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -20347,7 +20260,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -20407,7 +20320,7 @@ class Combat(commands.Cog):
                     )
                 else:
                                                            
-                    bcfg.set(chan_id, f"{t_slot}.x_slw",       str(slow_rounds))
+                    _set_timer(bcfg, chan_id, t_slot, "x_slw", str(slow_rounds))
                     bcfg.set(chan_id, f"{t_slot}.x_slw_label", "Slow")
                     bcfg.set(chan_id, f"{t_slot}.x_slw_code",  "SLO")
                     bcfg.set(chan_id, f"{t_slot}.x_slw_by",    att_name)
@@ -20437,7 +20350,7 @@ class Combat(commands.Cog):
 
                                                                                          
         try:
-            bcfg.set(chan_id, f"{slot}.x_gslwcd",       "2")
+            _set_timer(bcfg, chan_id, slot, "x_gslwcd", "2")
             bcfg.set(chan_id, f"{slot}.x_gslwcd_code",  "SG")
             bcfg.set(chan_id, f"{slot}.x_gslwcd_label", "Golem Slow (CD)")
             bcfg.set(chan_id, f"{slot}.x_gslwcd_emoji", "⏱️")
@@ -20493,7 +20406,7 @@ class Combat(commands.Cog):
         any_applied = False
         for raw in names:
             disp, path = _resolve_char_ci(raw)
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 emb.add_field(name=raw, value="Not found.", inline=False)
                 continue
 
@@ -20524,8 +20437,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -20618,7 +20530,7 @@ class Combat(commands.Cog):
                 return _resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -20709,7 +20621,7 @@ class Combat(commands.Cog):
 
                                                                     
         try:
-            bcfg.set(chan_id, f"{slot}.x_lightcd",       "5")
+            _set_timer(bcfg, chan_id, slot, "x_lightcd", "5")
             bcfg.set(chan_id, f"{slot}.x_lightcd_code",  "LT")                                           
             bcfg.set(chan_id, f"{slot}.x_lightcd_label", "Lightning Throw (CD)")             
             bcfg.set(chan_id, f"{slot}.x_lightcd_emoji", "⏱️")
@@ -20744,7 +20656,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
         try:
@@ -20753,8 +20665,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -20849,8 +20760,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
             return
@@ -20864,7 +20774,7 @@ class Combat(commands.Cog):
                 rounds = 8640                                           
 
                   
-        bcfg.set(chan_id, f"{slot}.inv",    str(rounds))
+        _set_timer(bcfg, chan_id, slot, "inv", str(rounds))
         bcfg.set(chan_id, f"{slot}.inv_by", pretty)
         if want_imp or is_pixie:
             bcfg.set(chan_id, f"{slot}.inv_type", "imp")
@@ -20897,8 +20807,7 @@ class Combat(commands.Cog):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -20911,7 +20820,7 @@ class Combat(commands.Cog):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ','_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -20928,7 +20837,7 @@ class Combat(commands.Cog):
 
                                                                       
         await self._tick_maggots_start_of_turn(ctx, bcfg, chan_id, char_name, path)
-        bcfg.set(chan_id, f"{slotT}.x_maggots", "0")
+        _set_timer(bcfg, chan_id, slotT, "x_maggots", "0")
         _save_battles(bcfg)
         await ctx.send(f"🧹 **{disp}** spends the round brushing off the maggots. Ongoing damage **ended**. (Sickened, if any, remains.)")
 
@@ -21005,7 +20914,7 @@ class Combat(commands.Cog):
                 except Exception:
                     slot = pretty.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{slot}.stench", str(dur))
+            _set_timer(bcfg, chan_id, slot, "stench", str(dur))
             bcfg.set(chan_id, f"{slot}.stench_by", stink_name)
             _save_battles(bcfg)
 
@@ -21066,7 +20975,7 @@ class Combat(commands.Cog):
             except Exception:
                 tgt_disp, tgt_path = target, None
 
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             await ctx.send(f"❌ Target `{target}` not found.")
             return
 
@@ -21256,9 +21165,8 @@ class Combat(commands.Cog):
         names, _ = _parse_combatants(bcfg, chan_id)
         swarm_names = []
         for n in names:
-            fn = f"{n}.coe"
-            if not os.path.exists(fn): continue
-            c = read_cfg(fn)
+            c = combatant_cfg(n)
+            if c is None: continue
             if str(get_compat(c, "info", "class", fallback="")).strip().lower() != "monster":
                 continue
             if str(get_compat(c, "info", "monster_type", fallback="")).strip().lower() == "insectswarm":
@@ -21289,7 +21197,7 @@ class Combat(commands.Cog):
                                         
         for t in targets:
             s = _slot(t)
-            bcfg.set(chan_id, f"{s}.x_swarm_torch", "1")
+            _set_timer(bcfg, chan_id, s, "x_swarm_torch", "1")
             bcfg.set(chan_id, f"{s}.x_swarm_torch_code", "WARD")
             bcfg.set(chan_id, f"{s}.x_swarm_torch_label", f"Warded by Torch ({pc_name})")
             bcfg.set(chan_id, f"{s}.x_swarm_torch_emoji", "🕯️")
@@ -21319,7 +21227,7 @@ class Combat(commands.Cog):
         if not char_name:
             await ctx.send("❌ No active character. Use `!char <name>` first."); return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**."); return
         cfg = read_cfg(path)
 
@@ -21450,7 +21358,7 @@ class Combat(commands.Cog):
 
         disp, path = _resolve_char_ci(target)
         pretty = disp or target
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             await ctx.send(f"❌ Target **{pretty}** not found."); return
 
         try:
@@ -21584,16 +21492,8 @@ class Combat(commands.Cog):
         if canon:
             return canon, self.items[canon]
 
-                               
-        close_norm = difflib.get_close_matches(key, self.item_index.keys(), n=5, cutoff=0.6)
-        suggestions = []
-        seen = set()
-        for n in close_norm:
-            c = self.item_index[n]
-            if c not in seen:
-                seen.add(c)
-                suggestions.append(c)
-        return None, suggestions
+        # Ranked prefix/typo suggestions from the prebuilt index.
+        return None, item_search().suggest(query, limit=5, cutoff=0.6)
 
 
     
@@ -21733,9 +21633,7 @@ class Combat(commands.Cog):
         try:
             cp = getattr(self, "_race_cp", None)
             if cp is None:
-                cp = configparser.ConfigParser()
-                cp.optionxform = str
-                cp.read("race.lst")
+                cp = static_cfg("race.lst")
                 self._race_cp = cp
 
                                    
@@ -21871,6 +21769,7 @@ class Combat(commands.Cog):
         if left > 0:
             left -= 1
             if left <= 0:
+                _cancel_timer(chan_id, slot, key)
                                            
                 if cfg_b.has_option(chan_id, f"{slot}.{key}"):
                     cfg_b.remove_option(chan_id, f"{slot}.{key}")
@@ -21879,7 +21778,7 @@ class Combat(commands.Cog):
                     if cfg_b.has_option(chan_id, f"{slot}.{k}"):
                         cfg_b.remove_option(chan_id, f"{slot}.{k}")
             else:
-                cfg_b.set(chan_id, f"{slot}.{key}", str(left))
+                _set_timer(cfg_b, chan_id, slot, key, str(left))
 
         
     def _class_can_wear_armor(self, class_lc: str, armor_weight: float, is_shield: bool, channel=None) -> tuple[bool,str|None]:
@@ -22401,43 +22300,13 @@ class Combat(commands.Cog):
         """
         Return (canon_name, item_dict) or (None, None) from item.lst.
 
-        Resolution order:
+        Resolution order (all dict lookups in the shared utils.items index):
           1) Exact section name (case-sensitive)
           2) Section name, case-insensitive
           3) Normalized name through item_index (loose match)
-          4) Last-chance normalized scan over items
+          4) Normalized section name
         """
-        if not name:
-            return None, None
-
-        k = str(name).strip()
-
-        # 1) Exact section name match (e.g. "Longsword+1")
-        if k in self.items:
-            return k, self.items[k]
-
-        # 2) Case-insensitive section name match
-        kl = k.lower()
-        for nm, data in self.items.items():
-            if nm.lower() == kl:
-                return nm, data
-
-        # 3) Normalized lookup via the index (handles aliases etc.)
-        norm = normalize_name(k)
-        canon = (
-            self.item_index.get(k)
-            or self.item_index.get(kl)
-            or self.item_index.get(norm)
-        )
-        if canon and canon in self.items:
-            return canon, self.items[canon]
-
-        # 4) Final fallback: normalize every item name and compare
-        for nm, data in self.items.items():
-            if normalize_name(nm) == norm:
-                return nm, data
-
-        return None, None
+        return item_search().lookup(name)
 
 
 
@@ -22696,7 +22565,7 @@ class Combat(commands.Cog):
             except Exception:
                 slot_tgt = key_disp.replace(" ", "_")
             cur_left = bcfg.getint(chan_id, f"{slot_tgt}.paralyzed", fallback=0)
-            bcfg.set(chan_id, f"{slot_tgt}.paralyzed", str(max(cur_left, max(0, rounds))))
+            _set_timer(bcfg, chan_id, slot_tgt, "paralyzed", str(max(cur_left, max(0, rounds))))
             _save_battles(bcfg)
         except Exception:
                                                                                            
@@ -22735,8 +22604,7 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
                 return True
@@ -22956,7 +22824,7 @@ class Combat(commands.Cog):
                 if bcfg.has_option(chan_id, f"{slot}.{key}"):
                     bcfg.remove_option(chan_id, f"{slot}.{key}")
             else:
-                bcfg.set(chan_id, f"{slot}.{key}", str(left))
+                _set_timer(bcfg, chan_id, slot, key, str(left))
 
 
     def _mi_consume_if_present(self, ctx, target_display: str) -> tuple[bool, int]:
@@ -23055,14 +22923,13 @@ class Combat(commands.Cog):
                         if msg_id:
                             block = _format_tracker_block(cfg_b, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(actor_path))
+                remove_cfg(actor_path)
             except Exception:
                 pass
 
@@ -23430,15 +23297,14 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(ch, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, ch)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
                                                            
         try:
             if tgt_path:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
         except Exception:
             pass
 
@@ -23474,7 +23340,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -23632,7 +23498,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -23641,8 +23507,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -23675,7 +23540,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -23809,7 +23674,7 @@ class Combat(commands.Cog):
                             t_key = _find_ci_name(names, tgt_disp) or tgt_disp
                             s_tgt = _slot(t_key)
                             cur = bcfg.getint(chan_id, f"{s_tgt}.paralyzed", fallback=0)
-                            bcfg.set(chan_id, f"{s_tgt}.paralyzed", str(max(cur, rounds)))                                              
+                            _set_timer(bcfg, chan_id, s_tgt, "paralyzed", str(max(cur, rounds)))                                              
                             _save_battles(bcfg)
                     except Exception:
                         pass
@@ -23878,7 +23743,7 @@ class Combat(commands.Cog):
                         _save_battles(bcfg)
             except Exception:
                 pass
-            try: os.remove(os.path.abspath(tgt_path))
+            try: remove_cfg(tgt_path)
             except Exception: pass
 
                                                               
@@ -23887,8 +23752,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -23925,7 +23789,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -24092,7 +23956,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -24102,8 +23966,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -24216,7 +24079,7 @@ class Combat(commands.Cog):
                     prev = bcfg.getint(chan_id, f"{s_tgt}.paralyzed", fallback=0)
                     newv = max(prev, u_rounds)                  
                     if newv > 0:
-                        bcfg.set(chan_id, f"{s_tgt}.paralyzed", str(newv))
+                        _set_timer(bcfg, chan_id, s_tgt, "paralyzed", str(newv))
                         bcfg.set(chan_id, f"{s_tgt}.paralyzed_by", "colorcloud")
                     if b_rounds > 0:
                         bcfg.set(chan_id, f"{s_tgt}.cc_blind_pending", str(b_rounds))
@@ -24235,7 +24098,7 @@ class Combat(commands.Cog):
                 if bcfg and bcfg.has_section(chan_id) and s_tgt and b_rounds > 0:
                     prev_bl = bcfg.getint(chan_id, f"{s_tgt}.blind", fallback=0)
                     new_bl  = max(prev_bl, b_rounds)
-                    bcfg.set(chan_id, f"{s_tgt}.blind", str(new_bl))
+                    _set_timer(bcfg, chan_id, s_tgt, "blind", str(new_bl))
                     bcfg.set(chan_id, f"{s_tgt}.blind_src", "colorcloud")
                     bcfg.set(chan_id, f"{s_tgt}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -24249,7 +24112,7 @@ class Combat(commands.Cog):
                 if bcfg and bcfg.has_section(chan_id) and s_tgt:
                     prev_bl = bcfg.getint(chan_id, f"{s_tgt}.blind", fallback=0)
                     new_bl  = max(prev_bl, 1)
-                    bcfg.set(chan_id, f"{s_tgt}.blind", str(new_bl))
+                    _set_timer(bcfg, chan_id, s_tgt, "blind", str(new_bl))
                     bcfg.set(chan_id, f"{s_tgt}.blind_src", "colorcloud")
                     bcfg.set(chan_id, f"{s_tgt}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -24399,8 +24262,7 @@ class Combat(commands.Cog):
 
                                                  
                     try:
-                        import os
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
 
@@ -24460,8 +24322,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -24479,7 +24340,7 @@ class Combat(commands.Cog):
 
             base = (name or "").replace(" ", "_")
             want = {f"{base}.coe".lower(), f"{base}.ini".lower()}
-            for fn in os.listdir("."):
+            for fn in ci_matches(*want):
                 if fn.lower() in want:
                     path = fn
                     try:
@@ -24651,8 +24512,7 @@ class Combat(commands.Cog):
 
                                                  
                     try:
-                        import os
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
 
@@ -25433,8 +25293,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -25840,7 +25699,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -25940,7 +25799,7 @@ class Combat(commands.Cog):
 
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -26013,7 +25872,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -26207,7 +26066,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -26216,8 +26075,7 @@ class Combat(commands.Cog):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -26322,7 +26180,7 @@ class Combat(commands.Cog):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -26349,7 +26207,7 @@ class Combat(commands.Cog):
         lines = []
         for raw in tokens:
             tgt_disp, tgt_path = _resolve_char_ci_local(raw)
-            if not (tgt_path and os.path.exists(tgt_path)):
+            if not (tgt_path and coe_exists(tgt_path)):
                 lines.append(f"• **{raw}**: ❌ *(not found)*"); continue
 
             t_cfg = read_cfg(tgt_path)
@@ -26395,7 +26253,7 @@ class Combat(commands.Cog):
 
                 cur_left = bcfg.getint(chan_id, f"{slot}.x_nauseated", fallback=0)
                 new_left = max(cur_left, int(add_rounds))
-                bcfg.set(chan_id, f"{slot}.x_nauseated", str(new_left))
+                _set_timer(bcfg, chan_id, slot, "x_nauseated", str(new_left))
                 bcfg.set(chan_id, f"{slot}.x_nauseated_code", "NA")
                 bcfg.set(chan_id, f"{slot}.x_nauseated_label", "NA")
                 bcfg.set(chan_id, f"{slot}.x_nauseated_by", caster_name)
@@ -26455,8 +26313,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -26701,7 +26558,7 @@ class Combat(commands.Cog):
                 slotT = _choose_slot_for_effects(bcfg, chan_id, tgt_disp)
             except Exception:
                 slotT = tgt_disp.replace(" ", "_")
-            bcfg.set(chan_id, f"{slotT}.x_chilldebuff",       str(rounds))
+            _set_timer(bcfg, chan_id, slotT, "x_chilldebuff", str(rounds))
             bcfg.set(chan_id, f"{slotT}.x_chilldebuff_code",  "CH")
             bcfg.set(chan_id, f"{slotT}.x_chilldebuff_label", "Chilled (melee -1)")
             bcfg.set(chan_id, f"{slotT}.x_chilldebuff_emoji", "🥶")
@@ -26711,7 +26568,7 @@ class Combat(commands.Cog):
         if bcfg and bcfg.has_section(chan_id) and s_self:
             try:
                 bcfg.set(chan_id, f"{s_self}.chl_charges", "0")
-                bcfg.set(chan_id, f"{s_self}.chl", "0")
+                _set_timer(bcfg, chan_id, s_self, "chl", "0")
                 _save_battles(bcfg)
             except Exception:
                 pass
@@ -26775,7 +26632,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -26785,8 +26642,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -26846,7 +26702,7 @@ class Combat(commands.Cog):
                     slotT = _choose_slot_for_effects(bcfg, chan_id, tgt_disp) if '_choose_slot_for_effects' in globals() else _slot(tgt_disp)
                 except Exception:
                     slotT = tgt_disp.replace(" ", "_")
-                bcfg.set(chan_id, f"{slotT}.x_chilldebuff",       str(rounds))
+                _set_timer(bcfg, chan_id, slotT, "x_chilldebuff", str(rounds))
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_code",  "CH")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_label", "Chilled (melee -1)")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_emoji", "🥶")
@@ -26890,7 +26746,7 @@ class Combat(commands.Cog):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -26945,8 +26801,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -27053,8 +26908,7 @@ class Combat(commands.Cog):
                 msg_id = bcfg2.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -27096,7 +26950,7 @@ class Combat(commands.Cog):
                                                                 
                                                                            
                 cur_tail = bcfg.getint(chan_id, f"{s_tgt}.x_pain_n", fallback=0)
-                bcfg.set(chan_id, f"{s_tgt}.x_pain_n", str(max(cur_tail, tail_rounds)))
+                _set_timer(bcfg, chan_id, s_tgt, "x_pain_n", str(max(cur_tail, tail_rounds)))
                 bcfg.set(chan_id, f"{s_tgt}.x_pain_by", caster_name)
 
                 _save_battles(bcfg)
@@ -27149,7 +27003,7 @@ class Combat(commands.Cog):
             bcfg.set(chan_id, f"{s_me}.x_sp_code",  "SP")
             bcfg.set(chan_id, f"{s_me}.x_sp_label", "Symbol of Pain")
             bcfg.set(chan_id, f"{s_me}.x_sp_emoji", "🪡")
-            bcfg.set(chan_id, f"{s_me}.x_sp_n",     str(sop_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sp_n", str(sop_left))
             _save_battles(bcfg)
             just_triggered = True
 
@@ -27162,7 +27016,7 @@ class Combat(commands.Cog):
             embed.add_field(name="Symbol", value=f"Rounds remaining: **{sop_left}**", inline=True)
 
                                                           
-            bcfg.set(chan_id, f"{s_me}.x_sp_n", str(sop_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sp_n", str(sop_left))
             _save_battles(bcfg)
 
             if tokens:
@@ -27212,7 +27066,7 @@ class Combat(commands.Cog):
                                                                                              
                 slot = self._effect_slot_for(bcfg, chan_id, pretty)
                                                                                        
-                bcfg.set(chan_id, f"{slot}.x_shk_n",     "1")
+                _set_timer(bcfg, chan_id, slot, "x_shk_n", "1")
                 bcfg.set(chan_id, f"{slot}.x_shk_code",  "SHK")
                 bcfg.set(chan_id, f"{slot}.x_shk_label", "Shaken")
                 bcfg.set(chan_id, f"{slot}.x_shk_by",    caster_name)
@@ -27225,12 +27079,12 @@ class Combat(commands.Cog):
             slot = self._effect_slot_for(bcfg, chan_id, pretty)
 
                                                                
-            bcfg.set(chan_id, f"{slot}.fear",     str(rounds))
+            _set_timer(bcfg, chan_id, slot, "fear", str(rounds))
             bcfg.set(chan_id, f"{slot}.fear_src", "symboloffear")
             bcfg.set(chan_id, f"{slot}.fear_by",  caster_name)
 
                                                                                         
-            bcfg.set(chan_id, f"{slot}.x_pnc_n",     str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_pnc_n", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_pnc_code",  "PNC")
             bcfg.set(chan_id, f"{slot}.x_pnc_label", "Panic")
             bcfg.set(chan_id, f"{slot}.x_pnc_by",    caster_name)
@@ -27286,7 +27140,7 @@ class Combat(commands.Cog):
             bcfg.set(chan_id, f"{s_me}.x_sf_code",  "SF")
             bcfg.set(chan_id, f"{s_me}.x_sf_label", "Symbol of Fear")
             bcfg.set(chan_id, f"{s_me}.x_sf_emoji", "😱")
-            bcfg.set(chan_id, f"{s_me}.x_sf_n",     str(sof_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sf_n", str(sof_left))
             _save_battles(bcfg)
             just_triggered = True
 
@@ -27299,7 +27153,7 @@ class Combat(commands.Cog):
             embed.add_field(name="Symbol", value=f"Rounds remaining: **{sof_left}**", inline=True)
 
                                                           
-            bcfg.set(chan_id, f"{s_me}.x_sf_n", str(sof_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sf_n", str(sof_left))
             _save_battles(bcfg)
 
             if tokens:
@@ -27379,7 +27233,7 @@ class Combat(commands.Cog):
                 
                 s_tgt = self._effect_slot_for(bcfg, chan_id, pretty)
                 if sod_left > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.x_sdok_n",     str(sod_left))
+                    _set_timer(bcfg, chan_id, s_tgt, "x_sdok_n", str(sod_left))
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_code",  "SDOK")
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_label", "Saved vs Symbol (Death)")
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_by",    caster_name)
@@ -27393,7 +27247,7 @@ class Combat(commands.Cog):
                 try:
                     s_tgt = self._effect_slot_for(bcfg, chan_id, pretty)
                     if sod_left > 0:
-                        bcfg.set(chan_id, f"{s_tgt}.x_sdok_n",     str(sod_left))
+                        _set_timer(bcfg, chan_id, s_tgt, "x_sdok_n", str(sod_left))
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_code",  "SDOK")
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_label", "Saved vs Symbol (Death)")
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_by",    caster_name)
@@ -27455,7 +27309,7 @@ class Combat(commands.Cog):
                     except Exception:
                         pass
                     try:
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
 
@@ -27499,7 +27353,7 @@ class Combat(commands.Cog):
             bcfg.set(chan_id, f"{s_me}.x_sd_code",  "SD")
             bcfg.set(chan_id, f"{s_me}.x_sd_label", "Symbol of Death")
             bcfg.set(chan_id, f"{s_me}.x_sd_emoji", "💀")
-            bcfg.set(chan_id, f"{s_me}.x_sd_n",     str(sod_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sd_n", str(sod_left))
             _save_battles(bcfg)
 
         active = sod_left > 0
@@ -27511,7 +27365,7 @@ class Combat(commands.Cog):
             embed.add_field(name="Symbol", value=f"Rounds remaining: **{sod_left}**", inline=True)
 
                                             
-            bcfg.set(chan_id, f"{s_me}.x_sd_n", str(sod_left))
+            _set_timer(bcfg, chan_id, s_me, "x_sd_n", str(sod_left))
             _save_battles(bcfg)
 
             if tokens:
@@ -27534,8 +27388,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -27632,7 +27485,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -27674,7 +27527,7 @@ class Combat(commands.Cog):
         for raw in tokens or []:
             tgt_disp, tgt_path = _resolve_char_ci_local(raw)
             pretty = tgt_disp or raw
-            if not tgt_path or not os.path.exists(tgt_path):
+            if not tgt_path or not coe_exists(tgt_path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -27737,7 +27590,7 @@ class Combat(commands.Cog):
                 prev = bcfg.getint(chan_id, f"{s_tgt}.paralyzed", fallback=0)
                 newv = max(prev, int(coma_rounds))
                 if newv > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.paralyzed", str(newv))
+                    _set_timer(bcfg, chan_id, s_tgt, "paralyzed", str(newv))
                     bcfg.set(chan_id, f"{s_tgt}.paralyzed_by", "eyebite")
                                   
                 self._clear_code_badges(bcfg, chan_id, s_tgt, "COMA")
@@ -27753,7 +27606,7 @@ class Combat(commands.Cog):
                 s, rolls, _ = roll_dice("1d4")
                 fr = max(0, int(s))
                 if fr > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.fear",     str(fr))
+                    _set_timer(bcfg, chan_id, s_tgt, "fear", str(fr))
                     bcfg.set(chan_id, f"{s_tgt}.fear_src", "eyebite")
                     bcfg.set(chan_id, f"{s_tgt}.fear_by",  caster_name)
                     notes.append(f"😱 **PANICKED** for **{fr} rounds** ({', '.join(str(r) for r in rolls)}).")
@@ -28045,7 +27898,7 @@ class Combat(commands.Cog):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -28212,7 +28065,7 @@ class Combat(commands.Cog):
                 except Exception: pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -28330,7 +28183,7 @@ class Combat(commands.Cog):
                 except Exception: pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -28437,7 +28290,7 @@ class Combat(commands.Cog):
                 except Exception: pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -28544,7 +28397,7 @@ class Combat(commands.Cog):
                 except Exception: pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -28652,7 +28505,7 @@ class Combat(commands.Cog):
                 except Exception: pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -29092,7 +28945,7 @@ class Combat(commands.Cog):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -29105,7 +28958,7 @@ class Combat(commands.Cog):
 
                         
         tgt_disp, tgt_path = _resolve_ci(target_raw)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"• **{target_raw}**: ❌ *(not found)*"]
 
         t_cfg = read_cfg(tgt_path)
@@ -29214,7 +29067,7 @@ class Combat(commands.Cog):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -29320,8 +29173,7 @@ class Combat(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -29572,7 +29424,7 @@ class Combat(commands.Cog):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -29677,7 +29529,7 @@ class Combat(commands.Cog):
             if consumed:
                                                                              
                 rounds_left_after = max(0, rounds_left - 10)
-                bcfg.set(chan_id, f"{s_me}.x_pfc", str(rounds_left_after))
+                _set_timer(bcfg, chan_id, s_me, "x_pfc", str(rounds_left_after))
                 bcfg.set(chan_id, f"{s_me}.pfc_last_round", str(cur_round))
 
                                                                     
@@ -29688,7 +29540,7 @@ class Combat(commands.Cog):
                             if bcfg.has_option(chan_id, opt):
                                 bcfg.remove_option(chan_id, opt)
                     else:
-                        bcfg.set(chan_id, f"{s_me}.light", str(new_light))
+                        _set_timer(bcfg, chan_id, s_me, "light", str(new_light))
 
                                                             
                 if rounds_left_after <= 0:
@@ -29708,8 +29560,7 @@ class Combat(commands.Cog):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)                      
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -29774,7 +29625,7 @@ class Combat(commands.Cog):
 
                                       
                     try:
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
                 except Exception:
@@ -29783,7 +29634,7 @@ class Combat(commands.Cog):
 
                                                               
         rounds_left_after = max(0, rounds_left - 10)
-        bcfg.set(chan_id, f"{s_me}.x_pfc", str(rounds_left_after))
+        _set_timer(bcfg, chan_id, s_me, "x_pfc", str(rounds_left_after))
         bcfg.set(chan_id, f"{s_me}.pfc_last_round", str(cur_round))
 
                                                                      
@@ -29794,7 +29645,7 @@ class Combat(commands.Cog):
                     if bcfg.has_option(chan_id, opt):
                         bcfg.remove_option(chan_id, opt)
             else:
-                bcfg.set(chan_id, f"{s_me}.light", str(new_light))
+                _set_timer(bcfg, chan_id, s_me, "light", str(new_light))
 
                                                  
         if rounds_left_after <= 0:
@@ -29815,8 +29666,7 @@ class Combat(commands.Cog):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)                      
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -29846,7 +29696,7 @@ class Combat(commands.Cog):
 
                       
         disp, path = self._resolve_char_ci(key)
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             return
 
         cfg = read_cfg(path)
@@ -30152,7 +30002,7 @@ class Combat(commands.Cog):
         new_pen = -1 if cur_pen == 0 else max(-5, cur_pen - 1)
 
                       
-        bcfg.set(chan_id, f"{slot}.x_burn", str(max(0, new_left)))
+        _set_timer(bcfg, chan_id, slot, "x_burn", str(max(0, new_left)))
         bcfg.set(chan_id, f"{slot}.x_burn_label", "BURN")
         bcfg.set(chan_id, f"{slot}.x_burn_code", "burn")
         bcfg.set(chan_id, f"{slot}.burn_pen", str(new_pen))
@@ -30244,7 +30094,7 @@ class Combat(commands.Cog):
             slot = target_name.replace(" ", "_")
 
                                 
-        bcfg.set(chan_id, f"{slot}.x_dance",        str(max(0, dur)))
+        _set_timer(bcfg, chan_id, slot, "x_dance", str(max(0, dur)))
         bcfg.set(chan_id, f"{slot}.x_dance_label",  "DANCE")
         bcfg.set(chan_id, f"{slot}.x_dance_code",   code)                                                                         
         bcfg.set(chan_id, f"{slot}.x_dance_kind",   kind)                            
@@ -30384,7 +30234,7 @@ class Combat(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4,10 +4,14 @@ from typing import Any, Dict, List, Optional, Tuple
 from collections import OrderedDict
 from datetime import datetime, timezone
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 
+from utils.craft_index import ProjectIndex, ready_ts
 from utils.ini import read_cfg, write_cfg, get_compat, getint_compat
+from utils.names import ci_matches
 from utils.players import get_active
+from utils.static_data import cached_load, on_static_reload
+from utils.storage import asave_json
 
 
 HERE = os.path.dirname(__file__)
@@ -16,6 +20,17 @@ RECIPES_PATH = os.path.abspath(os.path.join(HERE, "..", "data", "recipes.json"))
 SPELL_LIST_CANDIDATES = ["data/spell.lst", "spell.lst"]
 
 CRAFT_DATA_DIR = os.path.join("data", "crafting")
+_projects = ProjectIndex(CRAFT_DATA_DIR)
+
+# What happens when a project's downtime elapses, per guild (`!craft auto`):
+# "notify" pings the owner where the project was started, "resolve" rolls it
+# and posts the result, "off" waits for `!craft resolve`.
+CRAFT_SETTINGS_PATH = os.path.join("data", "craft_settings.json")
+AUTO_MODES = ("off", "notify", "resolve")
+AUTO_DEFAULT = "notify"
+# How often (seconds) the ready-time heap is checked.
+CRAFT_TICK_S = float(os.getenv("SEER_CRAFT_TICK_S", "60") or 60)
+CRAFT_RETRY_S = 300  # ready project whose guild/channel is unavailable: try again after this
 
 
 PAGE_SIZE_DEFAULT = 50
@@ -127,12 +142,16 @@ def _load_json(path: str) -> dict:
         return {}
 
 
-def _save_json(path: str, data: dict) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, path)
+def _load_craft_settings() -> dict:
+    if not os.path.exists(CRAFT_SETTINGS_PATH):
+        return {}
+    return _load_json(CRAFT_SETTINGS_PATH)
+
+async def _asave_projects(uid, path: str, projects: dict, errors=()) -> None:
+    """Write a user's project file and keep the project index in step."""
+    await asave_json(path, projects)
+    _projects.sync_user(uid, projects, errors, save=False)
+    await _projects.asave()
 
 def _format_eta(started_ts: int, days: int) -> Tuple[str, str]:
     """
@@ -166,7 +185,7 @@ def _format_eta(started_ts: int, days: int) -> Tuple[str, str]:
 def _resolve_char_ci(name: str) -> Tuple[Optional[str], Optional[str]]:
     base = name.replace(" ", "_")
     target = f"{base}.coe".lower()
-    for fn in os.listdir("."):
+    for fn in ci_matches(target):
         if fn.lower() == target:
             path = fn
             try:
@@ -321,6 +340,64 @@ def _clean_recipe_key_for_display(name: str) -> str:
     return s
 
 
+def _trigrams(s: str) -> set:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+class RecipeCatalog:
+    """
+    Rows from Crafting._build_catalog_rows(), indexed once: by type, scrolls
+    by spell level, a trigram index over lowercase names for `!craft list`
+    text filters, and the exact / normalized name maps `!craft quote` uses.
+    Dynamic recipes are added in place (add()); rebuilt only on a reload or
+    when the Spells cog appears.
+    """
+
+    def __init__(self, rows: list, recipes: dict):
+        self.rows = []
+        self.by_type = {}
+        self.scrolls_by_level = {}
+        self._names = []
+        self._grams = {}
+        for r in rows:
+            self._index(r)
+        # Later keys win, as the per-call dict comprehensions did.
+        self._lower = {k.lower(): k for k in recipes}
+        self._norm = {re.sub(r"[\s:_]+", "", k).lower(): k for k in recipes}
+
+    def _index(self, r: dict) -> None:
+        i = len(self.rows)
+        self.rows.append(r)
+        self.by_type.setdefault(r["type"], []).append(r)
+        if r["type"] == "spell_scroll":
+            self.scrolls_by_level.setdefault(int(r.get("spell_level", -1)), []).append(r)
+        name = r["name"].lower()
+        self._names.append(name)
+        for g in _trigrams(name):
+            self._grams.setdefault(g, []).append(i)
+
+    def add(self, key: str, row) -> None:
+        """Index a recipe added after the build (a dynamic recipe)."""
+        if row is not None and key.lower() not in self._lower:
+            self._index(row)
+        self._lower[key.lower()] = key
+        self._norm[re.sub(r"[\s:_]+", "", key).lower()] = key
+
+    def of_type(self, want_type: str = "") -> list:
+        return self.by_type.get(want_type, []) if want_type else self.rows
+
+    def matching(self, flt: str) -> set:
+        """ids of rows whose name contains `flt` (lowercase)."""
+        if len(flt) < 3:
+            return {id(self.rows[i]) for i, n in enumerate(self._names) if flt in n}
+        lists = sorted((self._grams.get(g, ()) for g in _trigrams(flt)), key=len)
+        return {id(self.rows[i]) for i in lists[0] if flt in self._names[i]}
+
+    def key_for(self, item: str):
+        """recipes.json key for a typed name: case-insensitive, then ignoring spaces/colons/underscores."""
+        return self._lower.get(item.lower()) or self._norm.get(re.sub(r"[\s:_]+", "", item).lower())
+
+
 @dataclass
 class Quote:
     item_key: str
@@ -342,11 +419,87 @@ class Crafting(commands.Cog):
     !craft cancel <project_id>
     !craft resolve                             # resolve ALL ready projects for yourself
     !craft resolve <project_id>                # GM-only: perform the roll & finish any project by id
+    !craft ready                               # GM-only: every crafter's ready projects
+    !craft auto [off|notify|resolve] [here]    # GM-only: what happens when a project is ready
     """
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.recipes = _load_json(RECIPES_PATH)
+        # Shallow copy: the snapshot's dict is shared and dynamic recipes get added here.
+        self.recipes = dict(cached_load(RECIPES_PATH, _load_json))
         self.spell_lists = _load_spell_lists()
+        self._cat = None            # RecipeCatalog, built on first use
+        self._cat_spells = False    # whether the Spells cog was loaded when _cat was built
+        self._spell_classes = None  # normalized spell name -> [(class, level)]
+        self._quotes = {}           # see _price
+        self._power_levels = None   # (mtime, levels) of weapon_powers.json
+        on_static_reload("crafting", self._on_static_reload)
+        self.settings = _load_craft_settings()
+        self.ready_watch.start()
+
+    def cog_unload(self):
+        self.ready_watch.cancel()
+
+    def _auto_for(self, guild_id) -> dict:
+        g = self.settings.get(str(guild_id)) or {}
+        mode = g.get("mode") if g.get("mode") in AUTO_MODES else AUTO_DEFAULT
+        return {"mode": mode, "channel_id": int(g.get("channel_id") or 0)}
+
+    @tasks.loop(seconds=CRAFT_TICK_S)
+    async def ready_watch(self):
+        try:
+            ready = _projects.pop_ready()
+        except Exception as ex:
+            print(f"[crafting] ready watcher error: {ex}")
+            return
+        for pid, e in ready:
+            try:
+                await self._on_project_ready(pid, e)
+            except Exception as ex:
+                print(f"[crafting] ready watcher error on {pid}: {ex}")
+                _projects.retry(pid, int(time.time() + CRAFT_RETRY_S))
+
+    @ready_watch.before_loop
+    async def _before_ready_watch(self):
+        await self.bot.wait_until_ready()
+
+    async def _on_project_ready(self, pid: str, e: dict) -> None:
+        if not e.get("guild"):
+            return  # started before projects recorded their guild
+        guild = self.bot.get_guild(int(e["guild"]))
+        if guild is None:
+            _projects.retry(pid, int(time.time() + CRAFT_RETRY_S))
+            return
+        auto = self._auto_for(guild.id)
+        if auto["mode"] == "off":
+            return  # `!craft auto` queues these again when the mode changes
+        channel = guild.get_channel(auto["channel_id"] or int(e.get("channel") or 0))
+        found = _projects.find(pid)
+        if channel is None or not found:
+            _projects.retry(pid, int(time.time() + CRAFT_RETRY_S))
+            return
+        uid, fp, projects = found
+        proj = projects.get(pid) or {}
+        if auto["mode"] == "resolve":
+            consumed, line = await self._resolve_project(pid, proj, show_roll=True)
+            if consumed:
+                del projects[pid]
+            await _asave_projects(uid, fp, projects, errors=() if consumed else (pid,))
+            await channel.send(f"<@{uid}> 🧪 Crafting finished: {line}")
+            return
+        proj["notified"] = True
+        await _asave_projects(uid, fp, projects)
+        await channel.send(
+            f"<@{uid}> 🧪 Project `{pid}` (**{proj.get('item', '?')}** for {proj.get('owner_char', '?')}) is ready. "
+            f"Use `!craft resolve` to finish it."
+        )
+
+    def _on_static_reload(self, changed):
+        """Re-read spell.lst when it is among the reloaded files; drop derived indexes."""
+        if any(os.path.basename(p) == "spell.lst" for p in changed):
+            self.spell_lists = _load_spell_lists()
+        self._cat = None
+        self._spell_classes = None
+        self._quotes.clear()
 
 
     def _iter_recipes_filtered(self, *, mode: str = "", text_filter: str = ""):
@@ -692,7 +845,6 @@ class Crafting(commands.Cog):
 
         t = (rec.get("type") or "").strip().lower()
         effects = rec.get("effects", []) or []
-        spell_levels = [int(e.get("level", 0)) for e in effects] or []
 
         is_sc = _is_spellcrafter(cls_lc)
 
@@ -763,6 +915,38 @@ class Crafting(commands.Cog):
             raise PermissionError(f"Requires level {min_lvl}+ for {rec.get('type','item')}.")
 
 
+        crafter_canon = self._canon_class_name(get_compat(who_cfg["cfg"], "info", "class", fallback="Fighter"))
+        minus, plus, days, cost, notes = self._price(
+            recipe_key, rec, cls_lc, crafter_canon, lvl,
+            doses=doses, safe_boost=safe_boost, scroll_class_forced=scroll_class_forced,
+        )
+
+        final = max(1, min(99, base - minus + plus))
+        return Quote(recipe_key, t, base, minus, plus, final, int(days), float(cost), notes)
+
+    def _price(self, recipe_key: str, rec: dict, cls_lc: str, crafter_canon: str, lvl: int, *,
+               doses: int, safe_boost: bool, scroll_class_forced: Optional[str]):
+        """
+        (minus, plus, days, cost, notes) for a recipe. Depends only on the
+        crafter's class and level and the options, so it is cached on those;
+        the per-character checks stay in _quote_for.
+        """
+        key = (recipe_key, cls_lc, crafter_canon, lvl, doses, safe_boost, scroll_class_forced)
+        hit = self._quotes.get(key)
+        if hit is None:
+            hit = self._quotes[key] = self._price_uncached(
+                recipe_key, rec, cls_lc, crafter_canon, lvl,
+                doses=doses, safe_boost=safe_boost, scroll_class_forced=scroll_class_forced,
+            )
+        minus, plus, days, cost, notes = hit
+        return minus, plus, days, cost, list(notes)
+
+    def _price_uncached(self, recipe_key: str, rec: dict, cls_lc: str, crafter_canon: str, lvl: int, *,
+                        doses: int, safe_boost: bool, scroll_class_forced: Optional[str]):
+        t = (rec.get("type") or "").strip().lower()
+        effects = rec.get("effects", []) or []
+        spell_levels = [int(e.get("level", 0)) for e in effects] or []
+
         notes, days, cost, minus, plus = [], 0, 0.0, 0, 0
 
 
@@ -773,7 +957,6 @@ class Crafting(commands.Cog):
             if not spell:
                 raise ValueError("Scroll recipe is missing a spell name.")
 
-            crafter_canon = self._canon_class_name(get_compat(who_cfg["cfg"], "info", "class", fallback="Fighter"))
             is_sc = _is_spellcrafter(cls_lc)
 
 
@@ -978,8 +1161,124 @@ class Crafting(commands.Cog):
                 cost = round(cost * 0.75, 2)
                 notes.append("Spellcrafter 9+: cost −25%.")
 
-        final = max(1, min(99, base - minus + plus))
-        return Quote(recipe_key, t, base, minus, plus, final, int(days), float(cost), notes)
+        return minus, plus, days, cost, tuple(notes)
+
+    def _recipe_for(self, item_key: str) -> dict:
+        rec = self.recipes.get(item_key) if self.recipes else None
+        if rec:
+            return rec or {}
+        dyn = (
+            self._build_dynamic_weapon_or_armor_recipe(item_key)
+            or self._build_dynamic_staff_recipe(item_key)
+            or self._build_dynamic_scroll_recipe(item_key)
+        )
+        if dyn is not None:
+            try:
+                self._add_recipe(item_key, dyn)
+            except Exception:
+                pass
+            return dyn or {}
+        return {}
+
+    async def _resolve_project(self, pid: str, proj: dict, *, show_roll: bool, actor_uid: str = "", is_gm: bool = False) -> tuple[bool, str]:
+        """
+        Returns (consumed, summary_line)
+        consumed=False means "didn't resolve (kept project)"
+        """
+        # Owner-safety: if this project points at a character file owned by someone else, skip (unless GM).
+        if actor_uid and (not is_gm):
+            try:
+                cfg_chk = read_cfg(proj.get("char_file", ""))
+                owner_id = (get_compat(cfg_chk, "info", "owner_id", fallback="") or "").strip()
+                if owner_id and owner_id != str(actor_uid):
+                    return (False, f"⏭️ `{pid}` • {proj.get('item','?')} — skipped (character not owned by you).")
+            except Exception:
+                pass
+
+        roll = random.randint(1, 100)
+        chance = int(proj.get("final_chance", 0) or 0)
+        success = (roll <= chance)
+
+        roll_txt = f" • roll {roll}" if show_roll else ""
+        head = f"`{pid}` • {proj.get('item','?')} • chance {chance}%{roll_txt} → " + ("✅ SUCCESS" if success else "❌ FAIL")
+
+        if not success:
+            return (True, head)
+
+        # SUCCESS: grant the result
+        try:
+            ptype = (proj.get("type") or "").strip().lower()
+            item_key = proj.get("item", "")
+            char_file = proj.get("char_file", "")
+            owner_char = proj.get("owner_char", "character")
+            qty = int(proj.get("doses", 1) or 1)
+
+            if ptype == "spell_scroll":
+                rec = self._recipe_for(item_key)
+                effects = rec.get("effects", []) or []
+                spells = [e.get("spell") for e in effects if e.get("spell")] or [item_key]
+
+                stored = (proj.get("scroll_class") or "").strip()
+                rec_cls_raw = ((effects[0].get("class") if effects else "") or "").strip()
+
+                if stored and stored.lower() not in {"arcane", "divine"}:
+                    scroll_class = self._canon_class_name(stored)
+                elif rec_cls_raw and rec_cls_raw.lower() not in {"arcane", "divine"}:
+                    scroll_class = self._canon_class_name(rec_cls_raw)
+                else:
+                    scroll_class, _L = self._pick_scroll_class_for_spell(
+                        spells[0], read_cfg(char_file), override=(stored or None)
+                    )
+
+                token = self._create_spell_scroll_instance(
+                    char_file, scroll_class, spells, label=f"Crafted {item_key}", carry=False
+                )
+                return (True, head + f" • added **{token}** to **{owner_char}** ({', '.join(spells)}; class: {scroll_class})")
+
+            # Non-scrolls
+            item_token = self._result_item_token(item_key)
+            looks_charged = str(item_token).lower().startswith(("wandof", "staffof"))
+
+            rec = self._recipe_for(item_key)
+            recipe_charges_max = None
+            try:
+                recipe_charges_max = int((rec.get("charges") or {}).get("max") or 0) or None
+            except Exception:
+                recipe_charges_max = None
+
+            spells_cog = self.bot.get_cog("Spells")
+            if spells_cog:
+                canon, it = spells_cog._item_lookup(item_token)
+                is_charged = spells_cog._item_has_charges(canon, it) or looks_charged
+
+                if is_charged:
+                    cfg2 = read_cfg(char_file)
+                    made = []
+                    for _ in range(max(1, qty)):
+                        tok = spells_cog._add_charged_item_instance(cfg2, char_file, canon, it)
+                        if recipe_charges_max is not None:
+                            ch_key = spells_cog._charges_key(tok, it)
+                            spells_cog._set_item_charges(cfg2, char_file, ch_key, recipe_charges_max, recipe_charges_max)
+                        made.append(tok)
+                    return (True, head + f" • added **{len(made)}× {canon}** to **{owner_char}** (charges tracked)")
+                else:
+                    _add_inventory_items(char_file, canon or item_token, max(1, qty))
+                    return (True, head + f" • added **{max(1, qty)}× {canon or item_token}** to **{owner_char}**")
+
+            # No Spells cog fallback
+            if looks_charged:
+                made = []
+                for _ in range(max(1, qty)):
+                    tok = self._add_charged_instance_local(char_file, item_token, charges_max=recipe_charges_max)
+                    made.append(tok)
+                return (True, head + f" • added **{len(made)}× {item_token}** to **{owner_char}** (charges tracked)")
+            else:
+                _add_inventory_items(char_file, item_token, max(1, qty))
+                return (True, head + f" • added **{max(1, qty)}× {item_token}** to **{owner_char}**")
+
+        except Exception as e:
+            # Keep the project so it can be re-tried after fixing data.
+            return (False, head + f" • ⚠️ error granting item: `{type(e).__name__}: {e}`")
 
 
     @commands.command(name="craft")
@@ -996,6 +1295,8 @@ class Crafting(commands.Cog):
                 "• `!craft cancel <project_id>`\n"
                 "• `!craft resolve` (resolve all ready for you)\n"
                 "• `!craft resolve <project_id>` (GM-only)\n"
+                "• `!craft ready` (GM-only: all ready projects)\n"
+                "• `!craft auto [off|notify|resolve] [here]` (GM-only)\n"
             )
             return
 
@@ -1058,7 +1359,8 @@ class Crafting(commands.Cog):
 
 
 
-            catalog = self._recipes_catalog()
+            cat = self._catalog()
+            catalog = cat.rows
             if not catalog:
                 tried = "\n".join("• " + p for p in _candidate_paths(RECIPES_PATH))
                 return await ctx.send("⚠️ No recipes found. I looked for **recipes.json** at:\n" + tried)
@@ -1119,13 +1421,13 @@ class Crafting(commands.Cog):
                 return await ctx.send(embed=emb)
 
 
-            rows = [r for r in catalog if not want_type or r["type"] == want_type]
+            rows = cat.of_type(want_type)
 
 
             if want_type == "spell_scroll":
                 # L# filter
                 if want_scroll_level is not None:
-                    rows = [r for r in rows if int(r.get("spell_level", -1)) == want_scroll_level]
+                    rows = cat.scrolls_by_level.get(want_scroll_level, [])
 
                 # broad side: arcane / divine
                 if want_scroll_side:
@@ -1177,7 +1479,8 @@ class Crafting(commands.Cog):
 
 
             if flt:
-                rows = [r for r in rows if flt in r["name"].lower()]
+                hit = cat.matching(flt)
+                rows = [r for r in rows if id(r) in hit]
 
 
             def _fmt_scroll(r):
@@ -1306,6 +1609,8 @@ class Crafting(commands.Cog):
 
                 lines.append(f"↳ ready ~ **{when_str}** ({rel})")
 
+            if ctx.guild and self._auto_for(ctx.guild.id)["mode"] != "off":
+                lines.append("*You'll be pinged when a project is ready.*")
             await self._send_large(ctx, ["**Your crafting projects:**"] + lines)
             return
 
@@ -1394,13 +1699,7 @@ class Crafting(commands.Cog):
             who = _read_char_snapshot(path)
 
 
-            key = None
-            lower = {k.lower(): k for k in self.recipes.keys()}
-            key = lower.get(item.lower())
-            if not key:
-                norm = lambda s: re.sub(r"[\s:_]+","", s).lower()
-                idx = {norm(k): k for k in self.recipes.keys()}
-                key = idx.get(norm(item))
+            key = self._catalog().key_for(item)
             dyn_rec = None
             if not key:
                 dyn_rec = (
@@ -1409,7 +1708,7 @@ class Crafting(commands.Cog):
                     or self._build_dynamic_scroll_recipe(item)
                 )
                 if dyn_rec:
-                    self.recipes[item] = dyn_rec
+                    self._add_recipe(item, dyn_rec)
                     key = item
 
 
@@ -1489,9 +1788,10 @@ class Crafting(commands.Cog):
                 "notes": q.notes,
                 "finish": finish_note,
                 "scroll_class": (resolved_cls or as_class or ""),
-
+                "guild_id": getattr(ctx.guild, "id", 0),
+                "channel_id": ctx.channel.id,
             }
-            _save_json(ufile, projects)
+            await _asave_projects(ctx.author.id, ufile, projects)
 
 
             before_xp = getint_compat(who["cfg"], "cur", "xp", fallback=0)
@@ -1500,16 +1800,9 @@ class Crafting(commands.Cog):
 
 
             try:
-                import json, datetime
-                from pathlib import Path
-                logdir = Path("data/xp")
-                logdir.mkdir(parents=True, exist_ok=True)
-                p = logdir / f"{who['name'].replace(' ', '_')}.json"
-                try:
-                    log = json.loads(p.read_text(encoding="utf-8")) if p.exists() else []
-                except Exception:
-                    log = []
-                log.append({
+                import datetime
+                from utils import xp_ledger
+                xp_ledger.append(who["name"], {
                     "ts": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z",
                     "amount": int(xp or 0),
                     "by": str(ctx.author.id),
@@ -1519,7 +1812,6 @@ class Crafting(commands.Cog):
                     "before_lvl": int(who["level"]),
                     "after_lvl": int(who["level"]),
                 })
-                p.write_text(json.dumps(log, indent=2), encoding="utf-8")
             except Exception:
                 pass
 
@@ -1562,25 +1854,16 @@ class Crafting(commands.Cog):
                 return await ctx.send("Usage: `!craft due <project_id> <finish-note>`  (ex: `!craft due 1760717145 Month 3, Day 12`)")
             pid, finish_note = args[0], " ".join(args[1:])
 
-            found = None
-            for fn in os.listdir(CRAFT_DATA_DIR):
-                if not fn.endswith(".json"):
-                    continue
-                fp = os.path.join(CRAFT_DATA_DIR, fn)
-                data = _load_json(fp)
-                if pid in data:
-                    found = (fp, data, fn)
-                    break
+            found = _projects.find(pid)
             if not found:
                 return await ctx.send("❌ Project not found.")
 
-            fp, data, fn = found
-            owner_uid = fn[:-5]
+            owner_uid, fp, data = found
             if str(ctx.author.id) != owner_uid and not getattr(ctx.author.guild_permissions, "manage_guild", False):
                 return await ctx.send("❌ Only the project owner or GM may set the finish note.")
 
             data[pid]["finish"] = finish_note.strip()
-            _save_json(fp, data)
+            await _asave_projects(owner_uid, fp, data)
             return await ctx.send(f"📅 Project `{pid}` finish set to: **{finish_note.strip()}**")
 
         if sub == "cancel":
@@ -1594,10 +1877,43 @@ class Crafting(commands.Cog):
                 await ctx.send("❌ Unknown project id.")
                 return
             proj = projects.pop(pid)
-            _save_json(ufile, projects)
+            await _asave_projects(ctx.author.id, ufile, projects)
             await ctx.send(f"🗑️ Canceled project `{pid}` (**{proj['item']}**). *Costs are not refunded.*")
             return
 
+        if sub == "auto":
+            if not ctx.guild or not getattr(ctx.author.guild_permissions, "manage_guild", False):
+                return await ctx.send("❌ GM only.")
+            opts = [str(a).strip().lower() for a in args]
+            if not opts:
+                auto = self._auto_for(ctx.guild.id)
+                where = f"<#{auto['channel_id']}>" if auto["channel_id"] else "the channel each project was started in"
+                return await ctx.send(f"Ready projects: **{auto['mode']}** • posts to {where}.\nUsage: `!craft auto <off|notify|resolve> [here]`")
+            if opts[0] not in AUTO_MODES:
+                return await ctx.send("Usage: `!craft auto <off|notify|resolve> [here]`")
+            g = self.settings.setdefault(str(ctx.guild.id), {})
+            g["mode"] = opts[0]
+            if "here" in opts[1:]:
+                g["channel_id"] = ctx.channel.id
+            await asave_json(CRAFT_SETTINGS_PATH, self.settings)
+            if opts[0] != "off":
+                _projects.requeue_guild(ctx.guild.id)
+            where = f" in <#{g['channel_id']}>" if g.get("channel_id") else ""
+            return await ctx.send(f"✅ Ready crafting projects: **{opts[0]}**{where}.")
+
+        if sub == "ready":
+            if not getattr(ctx.author.guild_permissions, "manage_guild", False):
+                return await ctx.send("❌ GM only.")
+            rows = _projects.ready()
+            if not rows:
+                return await ctx.send("⏳ No crafting projects are ready.")
+            lines = []
+            for pid, e in rows:
+                flag = " • ⚠️ last resolve kept it" if e.get("status") == "error" else ""
+                lines.append(f"`{pid}` • {e.get('item', '?')} • {e.get('owner_char', '?')} (<@{e.get('user')}>) • ready <t:{int(e.get('ready_ts', 0))}:R>{flag}")
+            await self._send_large(ctx, [f"**Ready crafting projects ({len(rows)}):**"] + lines)
+            return
+
         if sub == "resolve":
             # Player-facing convenience:
             #   • `!craft resolve`            -> resolve ALL *ready* projects for yourself (no GM needed)
@@ -1605,165 +1921,31 @@ class Crafting(commands.Cog):
             is_gm = getattr(ctx.author.guild_permissions, "manage_guild", False)
 
             def _is_ready(proj: dict) -> bool:
-                try:
-                    started_ts = int(proj.get("started_ts") or 0)
-                    days = int(proj.get("days") or 0)
-                except Exception:
-                    started_ts, days = 0, 0
-                eta_ts = started_ts + max(0, days) * 86400
-                return int(time.time()) >= eta_ts
-
-            def _ensure_recipe(item_key: str) -> dict:
-                rec = self.recipes.get(item_key) if self.recipes else None
-                if rec:
-                    return rec or {}
-                dyn = (
-                    self._build_dynamic_weapon_or_armor_recipe(item_key)
-                    or self._build_dynamic_staff_recipe(item_key)
-                    or self._build_dynamic_scroll_recipe(item_key)
-                )
-                if dyn is not None:
-                    try:
-                        self.recipes[item_key] = dyn
-                    except Exception:
-                        pass
-                    return dyn or {}
-                return {}
-
-            async def _resolve_one(pid: str, proj: dict, *, show_roll: bool, actor_uid: str = "") -> tuple[bool, str]:
-                """
-                Returns (consumed, summary_line)
-                consumed=False means "didn't resolve (kept project)"
-                """
-                # Owner-safety: if this project points at a character file owned by someone else, skip (unless GM).
-                if actor_uid and (not is_gm):
-                    try:
-                        cfg_chk = read_cfg(proj.get("char_file", ""))
-                        owner_id = (get_compat(cfg_chk, "info", "owner_id", fallback="") or "").strip()
-                        if owner_id and owner_id != str(actor_uid):
-                            return (False, f"⏭️ `{pid}` • {proj.get('item','?')} — skipped (character not owned by you).")
-                    except Exception:
-                        pass
-
-                roll = random.randint(1, 100)
-                chance = int(proj.get("final_chance", 0) or 0)
-                success = (roll <= chance)
+                return int(time.time()) >= ready_ts(proj)
 
-                roll_txt = f" • roll {roll}" if show_roll else ""
-                head = f"`{pid}` • {proj.get('item','?')} • chance {chance}%{roll_txt} → " + ("✅ SUCCESS" if success else "❌ FAIL")
-
-                if not success:
-                    return (True, head)
-
-                # SUCCESS: grant the result
-                try:
-                    ptype = (proj.get("type") or "").strip().lower()
-                    item_key = proj.get("item", "")
-                    char_file = proj.get("char_file", "")
-                    owner_char = proj.get("owner_char", "character")
-                    qty = int(proj.get("doses", 1) or 1)
-
-                    if ptype == "spell_scroll":
-                        rec = _ensure_recipe(item_key)
-                        effects = rec.get("effects", []) or []
-                        spells = [e.get("spell") for e in effects if e.get("spell")] or [item_key]
-
-                        stored = (proj.get("scroll_class") or "").strip()
-                        rec_cls_raw = ((effects[0].get("class") if effects else "") or "").strip()
-
-                        if stored and stored.lower() not in {"arcane", "divine"}:
-                            scroll_class = self._canon_class_name(stored)
-                        elif rec_cls_raw and rec_cls_raw.lower() not in {"arcane", "divine"}:
-                            scroll_class = self._canon_class_name(rec_cls_raw)
-                        else:
-                            scroll_class, _L = self._pick_scroll_class_for_spell(
-                                spells[0], read_cfg(char_file), override=(stored or None)
-                            )
-
-                        token = self._create_spell_scroll_instance(
-                            char_file, scroll_class, spells, label=f"Crafted {item_key}", carry=False
-                        )
-                        return (True, head + f" • added **{token}** to **{owner_char}** ({', '.join(spells)}; class: {scroll_class})")
-
-                    # Non-scrolls
-                    item_token = self._result_item_token(item_key)
-                    looks_charged = str(item_token).lower().startswith(("wandof", "staffof"))
-
-                    rec = _ensure_recipe(item_key)
-                    recipe_charges_max = None
-                    try:
-                        recipe_charges_max = int((rec.get("charges") or {}).get("max") or 0) or None
-                    except Exception:
-                        recipe_charges_max = None
-
-                    spells_cog = self.bot.get_cog("Spells")
-                    if spells_cog:
-                        canon, it = spells_cog._item_lookup(item_token)
-                        is_charged = spells_cog._item_has_charges(canon, it) or looks_charged
-
-                        if is_charged:
-                            cfg2 = read_cfg(char_file)
-                            made = []
-                            for _ in range(max(1, qty)):
-                                tok = spells_cog._add_charged_item_instance(cfg2, char_file, canon, it)
-                                if recipe_charges_max is not None:
-                                    ch_key = spells_cog._charges_key(tok, it)
-                                    spells_cog._set_item_charges(cfg2, char_file, ch_key, recipe_charges_max, recipe_charges_max)
-                                made.append(tok)
-                            return (True, head + f" • added **{len(made)}× {canon}** to **{owner_char}** (charges tracked)")
-                        else:
-                            _add_inventory_items(char_file, canon or item_token, max(1, qty))
-                            return (True, head + f" • added **{max(1, qty)}× {canon or item_token}** to **{owner_char}**")
-
-                    # No Spells cog fallback
-                    if looks_charged:
-                        made = []
-                        for _ in range(max(1, qty)):
-                            tok = self._add_charged_instance_local(char_file, item_token, charges_max=recipe_charges_max)
-                            made.append(tok)
-                        return (True, head + f" • added **{len(made)}× {item_token}** to **{owner_char}** (charges tracked)")
-                    else:
-                        _add_inventory_items(char_file, item_token, max(1, qty))
-                        return (True, head + f" • added **{max(1, qty)}× {item_token}** to **{owner_char}**")
-
-                except Exception as e:
-                    # Keep the project so it can be re-tried after fixing data.
-                    return (False, head + f" • ⚠️ error granting item: `{type(e).__name__}: {e}`")
 
             # --- GM path: resolve a specific project id from any user file ---
             if is_gm and args:
                 pid = args[0]
 
-                if not os.path.isdir(CRAFT_DATA_DIR):
-                    await ctx.send("❌ No crafting data directory found.")
-                    return
-
-                found = None
-                for fn in os.listdir(CRAFT_DATA_DIR):
-                    if not fn.endswith(".json"):
-                        continue
-                    fp = os.path.join(CRAFT_DATA_DIR, fn)
-                    data = _load_json(fp)
-                    if pid in data:
-                        found = (fp, data)
-                        break
+                found = _projects.find(pid)
                 if not found:
                     await ctx.send("❌ Project not found.")
                     return
 
-                fp, data = found
+                owner_uid, fp, data = found
                 proj = data.get(pid) or {}
 
-                consumed, line = await _resolve_one(pid, proj, show_roll=True, actor_uid=str(ctx.author.id))
+                consumed, line = await self._resolve_project(pid, proj, show_roll=True, actor_uid=str(ctx.author.id), is_gm=is_gm)
                 await ctx.send(line)
 
-                if consumed:
-                    # Only delete if the attempt actually ran (success/fail); keep if we hit an item-grant error.
-                    try:
+                # Only delete if the attempt actually ran (success/fail); keep if we hit an item-grant error.
+                try:
+                    if consumed:
                         del data[pid]
-                        _save_json(fp, data)
-                    except Exception:
-                        pass
+                    await _asave_projects(owner_uid, fp, data, errors=() if consumed else (pid,))
+                except Exception:
+                    pass
                 return
 
             # --- Player path: resolve all READY projects for yourself (or one pid in your file) ---
@@ -1790,14 +1972,14 @@ class Crafting(commands.Cog):
                     await ctx.send(f"⏳ Project `{want_pid}` isn’t ready yet. Ready ~ **{when_str}** ({rel}).")
                     return
 
-                consumed, line = await _resolve_one(want_pid, proj, show_roll=False, actor_uid=str(ctx.author.id))
+                consumed, line = await self._resolve_project(want_pid, proj, show_roll=False, actor_uid=str(ctx.author.id), is_gm=is_gm)
                 await ctx.send(line)
-                if consumed:
-                    try:
+                try:
+                    if consumed:
                         del projects[want_pid]
-                        _save_json(ufile, projects)
-                    except Exception:
-                        pass
+                    await _asave_projects(ctx.author.id, ufile, projects, errors=() if consumed else (want_pid,))
+                except Exception:
+                    pass
                 return
 
             # Bulk: all ready projects
@@ -1827,12 +2009,12 @@ class Crafting(commands.Cog):
 
             results = []
             consumed_ids = []
+            failed_ids = []
             for pid in ready_ids:
                 proj = projects.get(pid) or {}
-                consumed, line = await _resolve_one(pid, proj, show_roll=False, actor_uid=str(ctx.author.id))
+                consumed, line = await self._resolve_project(pid, proj, show_roll=False, actor_uid=str(ctx.author.id), is_gm=is_gm)
                 results.append(line)
-                if consumed:
-                    consumed_ids.append(pid)
+                (consumed_ids if consumed else failed_ids).append(pid)
 
             # Save once (faster) after we’ve processed everything.
             for pid in consumed_ids:
@@ -1840,7 +2022,7 @@ class Crafting(commands.Cog):
                     del projects[pid]
                 except Exception:
                     pass
-            _save_json(ufile, projects)
+            await _asave_projects(ctx.author.id, ufile, projects, errors=failed_ids)
 
             embed = self._embed_lines(
                 "🧪 Crafting results",
@@ -1856,25 +2038,16 @@ class Crafting(commands.Cog):
                 return await ctx.send("Usage: `!craft due <project_id> <finish-note>`  (ex: `!craft due 1760717145 Month 3, Day 12`)")
             pid, finish_note = args[0], " ".join(args[1:])
 
-            found = None
-            for fn in os.listdir(CRAFT_DATA_DIR):
-                if not fn.endswith(".json"):
-                    continue
-                fp = os.path.join(CRAFT_DATA_DIR, fn)
-                data = _load_json(fp)
-                if pid in data:
-                    found = (fp, data, fn)
-                    break
+            found = _projects.find(pid)
             if not found:
                 return await ctx.send("❌ Project not found.")
 
-            fp, data, fn = found
-            owner_uid = fn[:-5]
+            owner_uid, fp, data = found
             if str(ctx.author.id) != owner_uid and not getattr(ctx.author.guild_permissions, "manage_guild", False):
                 return await ctx.send("❌ Only the project owner or GM may set the finish note.")
 
             data[pid]["finish"] = finish_note.strip()
-            _save_json(fp, data)
+            await _asave_projects(owner_uid, fp, data)
             return await ctx.send(f"📅 Project `{pid}` finish set to: **{finish_note.strip()}**")
 
         if sub == "cancel":
@@ -1888,7 +2061,7 @@ class Crafting(commands.Cog):
                 await ctx.send("❌ Unknown project id.")
                 return
             proj = projects.pop(pid)
-            _save_json(ufile, projects)
+            await _asave_projects(ctx.author.id, ufile, projects)
             await ctx.send(f"🗑️ Canceled project `{pid}` (**{proj['item']}**). *Costs are not refunded.*")
             return
 
@@ -2217,7 +2390,17 @@ class Crafting(commands.Cog):
         return token
 
     def _weapon_power_levels(self) -> dict:
-
+        """Power keyword -> spell level; re-read only when weapon_powers.json changes."""
+        try:
+            mtime = os.path.getmtime(WEAPON_POWER_FILE)
+        except OSError:
+            mtime = None
+        hit = self._power_levels
+        if hit is None or hit[0] != mtime:
+            hit = self._power_levels = (mtime, self._read_weapon_power_levels())
+        return hit[1]
+
+    def _read_weapon_power_levels(self) -> dict:
         defaults = {"light":1, "charmperson":1, "locateobject":2, "flame":2, "drain":7, "wish":7}
         user = _load_json(WEAPON_POWER_FILE)
         if not isinstance(user, dict):
@@ -2317,7 +2500,24 @@ class Crafting(commands.Cog):
         return page, out
 
 
+    def _catalog(self) -> RecipeCatalog:
+        # Scroll rows need the Spells cog's class lists: a catalog built
+        # without it is rebuilt once the cog shows up.
+        if self._cat is None or (not self._cat_spells and self._spells()):
+            self._cat_spells = bool(self._spells())
+            self._cat = RecipeCatalog(self._build_catalog_rows(), self.recipes or {})
+        return self._cat
+
+    def _add_recipe(self, key: str, rec: dict) -> None:
+        """Register a dynamic recipe, indexing it into the catalog if one is built."""
+        self.recipes[key] = rec
+        if self._cat is not None:
+            self._cat.add(key, self._catalog_row(key, rec))
+
     def _recipes_catalog(self) -> list[dict]:
+        return self._catalog().rows
+
+    def _build_catalog_rows(self) -> list[dict]:
         """
         Normalize recipes.json into a simple list we can filter & sort.
         Each row looks like:
@@ -2325,62 +2525,67 @@ class Crafting(commands.Cog):
            "effective":float|0.0, "rec": <original recipe dict>}
         """
         cat = []
-        recs = self.recipes or {}
-        for name, rec in recs.items():
-            if not isinstance(rec, dict):
-                continue
-            t = (rec.get("type") or "").strip().lower()
-            row = {"name": name, "type": t, "rec": rec, "spell_level": 0, "spell_class": "", "effective": 0.0}
+        for name, rec in (self.recipes or {}).items():
+            row = self._catalog_row(name, rec)
+            if row is not None:
+                cat.append(row)
+        return cat
 
-            if t == "spell_scroll":
-                effs = rec.get("effects") or []
+    def _catalog_row(self, name: str, rec) -> dict | None:
+        """One _build_catalog_rows() row for recipe `name`, or None if it is not a recipe dict."""
+        if not isinstance(rec, dict):
+            return None
+        t = (rec.get("type") or "").strip().lower()
+        row = {"name": name, "type": t, "rec": rec, "spell_level": 0, "spell_class": "", "effective": 0.0}
+
+        if t == "spell_scroll":
+            effs = rec.get("effects") or []
 
-                spell_nm = ""
-                if effs and effs[0].get("spell"):
-                    spell_nm = str(effs[0]["spell"]).strip()
-                elif name.lower().startswith("scroll"):
+            spell_nm = ""
+            if effs and effs[0].get("spell"):
+                spell_nm = str(effs[0]["spell"]).strip()
+            elif name.lower().startswith("scroll"):
 
-                    parts = name.split(":", 1)
-                    if len(parts) == 2:
-                        spell_nm = parts[1].strip()
+                parts = name.split(":", 1)
+                if len(parts) == 2:
+                    spell_nm = parts[1].strip()
 
 
-                pairs = self._classes_and_levels_for_spell(spell_nm) if spell_nm else []
+            pairs = self._classes_and_levels_for_spell(spell_nm) if spell_nm else []
 
-                if not pairs:
+            if not pairs:
+                lvl = 0
+                try:
+                    lvl = max(int(e.get("level") or 0) for e in effs) if effs else 0
+                except Exception:
                     lvl = 0
-                    try:
-                        lvl = max(int(e.get("level") or 0) for e in effs) if effs else 0
-                    except Exception:
-                        lvl = 0
-                    cls_raw = (effs[0].get("class", "") if effs else "") or ""
-                    row["spell_level"]  = int(lvl)
-                    row["spell_class"]  = str(cls_raw).strip().lower() or ""
-                    row["display_class"] = self._canon_class_name(cls_raw) if cls_raw else ""
-                    row["class_levels"] = []
-                else:
+                cls_raw = (effs[0].get("class", "") if effs else "") or ""
+                row["spell_level"]  = int(lvl)
+                row["spell_class"]  = str(cls_raw).strip().lower() or ""
+                row["display_class"] = self._canon_class_name(cls_raw) if cls_raw else ""
+                row["class_levels"] = []
+            else:
 
-                    order = {"Magic-User":0,"Illusionist":1,"Necromancer":2,"Spellcrafter":3,
-                             "Cleric":4,"Druid":5,"Paladin":6}
-                    pairs.sort(key=lambda t2: (int(t2[1]), order.get(self._canon_class_name(t2[0]), 99)))
-                    disp_cls, disp_lvl = pairs[0]
-                    row["display_class"] = self._canon_class_name(disp_cls)
-                    row["spell_level"]   = int(disp_lvl)
-                    row["spell_class"]   = "divine" if self._class_side(disp_cls) == "divine" else "arcane"
-                    row["class_levels"]  = [(self._canon_class_name(c), int(L)) for (c, L) in pairs]
-
-
-            elif t in {"weapon", "armor"}:
-                wm = rec.get("weapon_meta") or {}
-                def _ival(v):
-                    try: return int(str(v).strip())
-                    except Exception: return 0
-                base = _ival(wm.get("base_plus"))
-                vs   = _ival(wm.get("vs_plus"))
-                row["effective"] = float(base + (vs/2.0 if vs > 0 else 0.0))
-
-            cat.append(row)
-        return cat
+                order = {"Magic-User":0,"Illusionist":1,"Necromancer":2,"Spellcrafter":3,
+                         "Cleric":4,"Druid":5,"Paladin":6}
+                pairs.sort(key=lambda t2: (int(t2[1]), order.get(self._canon_class_name(t2[0]), 99)))
+                disp_cls, disp_lvl = pairs[0]
+                row["display_class"] = self._canon_class_name(disp_cls)
+                row["spell_level"]   = int(disp_lvl)
+                row["spell_class"]   = "divine" if self._class_side(disp_cls) == "divine" else "arcane"
+                row["class_levels"]  = [(self._canon_class_name(c), int(L)) for (c, L) in pairs]
+
+
+        elif t in {"weapon", "armor"}:
+            wm = rec.get("weapon_meta") or {}
+            def _ival(v):
+                try: return int(str(v).strip())
+                except Exception: return 0
+            base = _ival(wm.get("base_plus"))
+            vs   = _ival(wm.get("vs_plus"))
+            row["effective"] = float(base + (vs/2.0 if vs > 0 else 0.0))
+
+        return row
 
 
     def _embed_add_block(self, embed, header: str, lines: list[str]) -> None:
@@ -2592,14 +2797,15 @@ class Crafting(commands.Cog):
         return "arcane"
 
     def _classes_and_levels_for_spell(self, spell_name: str) -> list[tuple[str,int]]:
-        rows = []
-        index = self._all_spells_index() or {}
-        want = self._norm(spell_name)
-        for clsname, pairs in index.items():
-            for nm, L in pairs:
-                if self._norm(nm) == want:
-                    rows.append((clsname, int(L)))
-        return rows
+        if self._spell_classes is None:
+            if not self._spells():
+                return []   # Spells cog not loaded yet; don't cache the empty index
+            by_spell = {}
+            for clsname, pairs in (self._all_spells_index() or {}).items():
+                for nm, L in pairs:
+                    by_spell.setdefault(self._norm(nm), []).append((clsname, int(L)))
+            self._spell_classes = by_spell
+        return list(self._spell_classes.get(self._norm(spell_name), ()))
 
     def _pick_scroll_class_for_spell(self, spell_name: str, caster_cfg, override: str | None = None) -> tuple[str,int]:
         cand = self._classes_and_levels_for_spell(spell_name)
@@ -0,0 +1,90 @@
+import os
+import time
+
+from nextcord.ext import commands, tasks
+
+from utils.monsters import monster_catalog
+from utils.static_data import reload_static, notify_static_reload, save_snapshot
+from utils.storage import run_io
+
+# How often (seconds) item/class/spell/race .lst files and monster templates
+# are re-stat'ed for edits. 0 turns the watcher off; !datareload still works.
+POLL_S = float(os.getenv("SEER_DATA_POLL_S", "5") or 0)
+HISTORY = 10
+
+
+def _poll():
+    """Re-parse changed sources on the storage pool; cogs are rebound afterwards on the loop."""
+    files = reload_static()
+    monsters = monster_catalog().refresh()
+    return files, monsters
+
+
+class GameData(commands.Cog):
+    """Hot reload of the static game data files."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._history = []  # (unix ts, [files], [monster names], [failed listeners])
+        if POLL_S > 0:
+            self.watch.start()
+
+    def cog_unload(self):
+        self.watch.cancel()
+
+    async def _check(self):
+        files, monsters = await run_io(_poll)
+        if not (files or monsters):
+            return None
+        failed = notify_static_reload(files) if files else []
+        entry = (int(time.time()), [os.path.basename(p) for p in files], monsters, failed)
+        self._history = (self._history + [entry])[-HISTORY:]
+        print(f"[gamedata] reloaded files={entry[1]} monsters={len(monsters)} failed={failed}")
+        try:
+            await run_io(save_snapshot)
+        except Exception as e:
+            print(f"[gamedata] snapshot not saved: {e}")
+        return entry
+
+    @tasks.loop(seconds=POLL_S or 5)
+    async def watch(self):
+        try:
+            await self._check()
+        except Exception as e:
+            print(f"[gamedata] watcher error: {e}")
+
+    @watch.before_loop
+    async def _before_watch(self):
+        await self.bot.wait_until_ready()
+
+    @commands.command(name="datareload")
+    @commands.has_permissions(manage_guild=True)
+    async def datareload(self, ctx):
+        """
+        Admin/GM: check item/class/spell/race .lst and monster templates for
+        edits now, reload whatever changed, and show recent reloads.
+        """
+        entry = await self._check()
+        if entry is None:
+            lines = ["✅ Game data is up to date."]
+        else:
+            lines = ["🔄 **Reloaded now.**"]
+        watcher = f"every {POLL_S:g}s" if POLL_S > 0 else "off"
+        lines.append(f"Watcher: {watcher} • Monster templates: **{len(monster_catalog().names())}**")
+        if self._history:
+            lines.append("**Recent reloads:**")
+            for ts, files, monsters, failed in reversed(self._history):
+                parts = []
+                if files:
+                    parts.append(", ".join(files))
+                if monsters:
+                    shown = ", ".join(monsters[:5]) + (f" (+{len(monsters) - 5})" if len(monsters) > 5 else "")
+                    parts.append(f"monsters: {shown}")
+                if failed:
+                    parts.append(f"⚠️ failed: {', '.join(failed)}")
+                lines.append(f"• <t:{ts}:R> — " + "; ".join(parts))
+        await ctx.send("\n".join(lines))
+
+
+def setup(bot):
+    bot.add_cog(GameData(bot))
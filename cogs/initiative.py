@@ -4,6 +4,7 @@ import random
 import re
 import configparser
 import math
+import heapq
 import nextcord
 import json
 import sys
@@ -12,15 +13,36 @@ import copy
 from nextcord.ext import commands
 from typing import Dict, List, Tuple, Optional
 from utils.players import get_active, set_active, add_char
-from utils.ini import read_cfg, get_compat, getint_compat, write_cfg
+from utils.ini import read_cfg, get_compat, getint_compat, write_cfg, remove_cfg
+from utils.names import ci_matches, coe_exists, cwd_listing
+from utils.battle import load_battles, save_battles, abegin_session, aend_session, effect_index, on_battle_write
+from utils.storage import HOT_COMMANDS, prefetch_active_char, defer_char_writes, achar_writes_done, awrite_cfg
+from utils.tracker import tracker_for, discard_tracker, post_tracker
+from utils.effect_clock import channel_clock, start_clock, drop_clock, clock_channels
+from utils.battle_model import battle_view
+from utils.monsters import (
+    monster_catalog, instance_cfg, instance_state, add_instance, pending_names, discard_channel,
+    build_monster_coe, combatant_cfg,
+)
 from pathlib import Path
 
 HEXCRAWL_FILE = "hexcrawl_state.lst"
 
+_HX_CACHE: dict = {}  # "sig" -> (mtime_ns, size), "cfg" -> last parse of HEXCRAWL_FILE
+
 def _hx_tracker_weather(chan_id: str):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(HEXCRAWL_FILE)
+    # Called on every tracker render; only re-read when the file changes.
+    try:
+        st = os.stat(HEXCRAWL_FILE)
+        sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        sig = None
+    if _HX_CACHE.get("sig") != sig or "cfg" not in _HX_CACHE:
+        cfg = configparser.ConfigParser()
+        cfg.optionxform = str
+        cfg.read(HEXCRAWL_FILE)
+        _HX_CACHE.update(sig=sig, cfg=cfg)
+    cfg = _HX_CACHE["cfg"]
     if not cfg.has_section(chan_id):
         return None, 0
     desc = cfg.get(chan_id, "weather_desc", fallback="").strip()
@@ -406,19 +428,30 @@ def _parse_spells_from_cfg_any(cfg) -> list[tuple[str, int]]:
 def _ci_find_file(basename_with_ext: str) -> str | None:
     """Case-insensitive file find in CWD."""
     want = basename_with_ext.lower()
-    for fn in os.listdir("."):
+    for fn in ci_matches(want):
         if fn.lower() == want:
             return fn
     return None
 
 def _ci_find_monster_ini(monster_type: str) -> str | None:
-    """Case-insensitive find in MONSTER_DIR."""
-    if not os.path.isdir(MONSTER_DIR):
-        return None
-    want = f"{monster_type}.ini".lower()
-    for fn in os.listdir(MONSTER_DIR):
-        if fn.lower() == want:
-            return os.path.join(MONSTER_DIR, fn)
+    """Case-insensitive find in MONSTER_DIR (via the preloaded catalog)."""
+    return monster_catalog().path_for(monster_type)
+
+def _monster_base_cfg(mtype: str, loose_first: bool = True):
+    """
+    Parsed template for `mtype` (read-only). Loose <mtype>.ini / mon/<mtype>.ini
+    files override monsters/ when `loose_first`; monsters/ comes from the catalog.
+    """
+    loose = (f"{mtype}.ini", os.path.join("mon", f"{mtype}.ini"))
+    if loose_first:
+        for cand in loose:
+            if os.path.exists(cand):
+                return read_cfg(cand)
+    tpl = monster_catalog().get(mtype)
+    if tpl is not None:
+        return tpl.cfg
+    if not loose_first and os.path.exists(loose[0]):
+        return read_cfg(loose[0])
     return None
 
 def _monster_source_files(name: str) -> tuple[str | None, str | None, str | None]:
@@ -509,21 +542,19 @@ def _monster_profile(name: str) -> dict:
         except Exception:
             pass
 
-    if base_ini:
+    tpl = monster_catalog().get(os.path.basename(base_ini)[:-4]) if base_ini else None
+    if tpl is not None:
         try:
-            mcfg = read_cfg(base_ini)
             if out["attacks_per_turn"] is None:
-                out["attacks_per_turn"] = getint_compat(mcfg, "base", "attacks", fallback=None)
-            base_pairs = _parse_attacks_from_cfg_any(mcfg, "base", prefix="")
+                out["attacks_per_turn"] = tpl.attacks_per_turn
             if not out["attacks"]:
-                out["attacks"] = base_pairs or []
-            sp = (get_compat(mcfg, "base", "special", fallback="") or "").strip()
-            out["special"] = sp if sp else None
-            out["ac"] = getint_compat(mcfg, "base", "ac", fallback=None)
-            out["move"] = getint_compat(mcfg, "base", "move", fallback=None)
+                out["attacks"] = list(tpl.attacks)
+            out["special"] = tpl.special or None
+            out["ac"] = tpl.ac
+            out["move"] = tpl.move
 
             if not out["spells"]:
-                base_spells = _parse_spells_from_cfg_any(mcfg)
+                base_spells = _parse_spells_from_cfg_any(tpl.cfg)
                 if base_spells:
                     out["spells"] = base_spells
             out["source"] += (" | " if out["source"] else "") + os.path.basename(base_ini)
@@ -537,20 +568,12 @@ def _monster_profile(name: str) -> dict:
 
 def _list_monster_templates() -> list[str]:
     """Return all monster template basenames from MONSTER_DIR (without .ini)."""
-    if not os.path.isdir(MONSTER_DIR):
-        return []
-
-    out: list[str] = []
-    for fn in os.listdir(MONSTER_DIR):
-        if fn.lower().endswith(".ini"):
-            out.append(fn[:-4])
-
-    return sorted(out, key=lambda s: s.lower())
+    return monster_catalog().names()
 
 
 def _resolve_monster_template_name(token: str) -> tuple[str | None, list[str]]:
     """Resolve a monster template by exact/prefix/substring match."""
-    return _find_ci_or_partial_name(_list_monster_templates(), token)
+    return monster_catalog().resolve(token)
     
 async def _maybe_dm_monster_attacks(self, ctx, cfg, chan_id: str, who: str):
     """
@@ -704,7 +727,6 @@ def _ss_normalize(bcfg, chan, slot):
                     bcfg.remove_option(chan, opt)
 
 
-BATTLE_FILE = "battle.lst"
 
 def normalize_name(s) -> str:
     if not isinstance(s, str):
@@ -844,20 +866,16 @@ def _apply_mitigation(raw, weapon_name="", weapon_type="", t_cfg=None, is_magica
         mtype = (get_compat(t_cfg, "info", "monster_type", fallback="")
                  or get_compat(t_cfg, "info", "type", fallback="")).strip().lower()
         if mtype:
-            for cand in (f"{mtype}.ini",
-                         os.path.join("mon", f"{mtype}.ini"),
-                         os.path.join("monsters", f"{mtype}.ini")):
-                if os.path.exists(cand):
-                    base_cfg = read_cfg(cand)
-                    imm   |= _merge_keys(base_cfg,"base","immune","immunity","immune_types")   | _merge_keys(base_cfg,"stats","immune","immunity","immune_types")
-                    res   |= _merge_keys(base_cfg,"base","resist","resistance","resist_types") | _merge_keys(base_cfg,"stats","resist","resistance","resist_types")
-                    weak  |= (_merge_keys(base_cfg,"base","weak","weakness","weak_types","vulnerable","vulnerability","vuln")
-                           |  _merge_keys(base_cfg,"stats","weak","weakness","weak_types","vulnerable","vulnerability","vuln")
-                           |  _merge_keys(base_cfg,"info","weak","weakness","weak_types","vulnerable","vulnerability","vuln"))
-                    absorb |= (_merge_keys(base_cfg,"base","absorb","absorb_types")
-                            |   _merge_keys(base_cfg,"stats","absorb","absorb_types")
-                            |   _merge_keys(base_cfg,"info","absorb","absorb_types"))
-                    break
+            base_cfg = _monster_base_cfg(mtype)
+            if base_cfg is not None:
+                imm   |= _merge_keys(base_cfg,"base","immune","immunity","immune_types")   | _merge_keys(base_cfg,"stats","immune","immunity","immune_types")
+                res   |= _merge_keys(base_cfg,"base","resist","resistance","resist_types") | _merge_keys(base_cfg,"stats","resist","resistance","resist_types")
+                weak  |= (_merge_keys(base_cfg,"base","weak","weakness","weak_types","vulnerable","vulnerability","vuln")
+                       |  _merge_keys(base_cfg,"stats","weak","weakness","weak_types","vulnerable","vulnerability","vuln")
+                       |  _merge_keys(base_cfg,"info","weak","weakness","weak_types","vulnerable","vulnerability","vuln"))
+                absorb |= (_merge_keys(base_cfg,"base","absorb","absorb_types")
+                        |   _merge_keys(base_cfg,"stats","absorb","absorb_types")
+                        |   _merge_keys(base_cfg,"info","absorb","absorb_types"))
     except Exception:
         pass
 
@@ -1128,7 +1146,17 @@ def _roll_one_lair_preview(code: str) -> list[str]:
 
     return lines if len(lines) > 1 else [f"🏴 Lair **{code}** (preview): nothing this time."]
 
-def _choose_slot_for_effects(cfg, chan_id, name):
+def _choose_slot_for_effects(cfg, chan_id, name, by_slot=None):
+    memo = None
+    if by_slot is None:
+        view = battle_view(cfg, chan_id)
+        by_slot = view.by_slot if view is not None else {}
+        if view is not None:
+            memo = view.memo
+            hit = memo.get(("effect_slot", name))
+            if hit is not None:
+                return hit
+
     cands = []
     try:
         cands.append(_slot(name))
@@ -1145,15 +1173,24 @@ def _choose_slot_for_effects(cfg, chan_id, name):
                        "magwep","ghh","sph","shl","hyp","cl","cn","db","inw","pnm","x_", "pet",
                        "cc_blind_pending","cs_blind_pending","sp_blind_pending","sp_cnf_pending",
                        "x_heatmetal","x_chillmetal")
-    section_items = list(cfg.items(chan_id))
+    chosen = cands[0]
     for s in cands:
-        for opt, _ in section_items:
-            if not opt.startswith(f"{s}."):
-                continue
-            suf = opt.split(".", 1)[1]
-            if any(suf.startswith(p) for p in prefer_prefixes):
-                return s
-    return cands[0]
+        if any(opt.startswith(f"{s}.") and opt.split(".", 1)[1].startswith(prefer_prefixes)
+               for opt, _ in by_slot.get(s, ())):
+            chosen = s
+            break
+    if memo is not None:
+        memo[("effect_slot", name)] = chosen
+    return chosen
+
+def _battle_keys_by_slot(cfg, chan_id) -> dict:
+    """
+    {slot prefix: [(option, raw value), ...]} for the channel section, from
+    its battle_view (read-only). An option is filed under every prefix that
+    ends at one of its dots, so names containing '.' still find their keys.
+    """
+    view = battle_view(cfg, chan_id)
+    return view.by_slot if view is not None else {}
 
 def _cleanup_bad_disease_disp(bcfg, chan_id):
     try:
@@ -1198,13 +1235,11 @@ def _collect_absorb_types(t_cfg) -> set[str]:
         mtype = (get_compat(t_cfg, "info", "monster_type", fallback="")
                  or get_compat(t_cfg, "info", "type", fallback="")).strip().lower()
         if mtype:
-            for cand in (f"{mtype}.ini", os.path.join("mon", f"{mtype}.ini"), os.path.join("monsters", f"{mtype}.ini")):
-                if os.path.exists(cand):
-                    base_cfg = read_cfg(cand)
-                    absorb |= (_merge_keys(base_cfg,"base","absorb","absorb_types")
-                            |   _merge_keys(base_cfg,"stats","absorb","absorb_types")
-                            |   _merge_keys(base_cfg,"info","absorb","absorb_types"))
-                    break
+            base_cfg = _monster_base_cfg(mtype)
+            if base_cfg is not None:
+                absorb |= (_merge_keys(base_cfg,"base","absorb","absorb_types")
+                        |   _merge_keys(base_cfg,"stats","absorb","absorb_types")
+                        |   _merge_keys(base_cfg,"info","absorb","absorb_types"))
     except Exception:
         pass
 
@@ -1233,9 +1268,126 @@ def _add_misc(cfg, chan_id, *, gems=0, jewelry=0, magic_any=0, magic_wa=0, magic
     if potions:   _inc(cfg, chan_id, "tre_potions", potions);     _inc(cfg, chan_id, "new_potions", potions)
     if scrolls:   _inc(cfg, chan_id, "tre_scrolls", scrolls);     _inc(cfg, chan_id, "new_scrolls", scrolls)
 
+# Timed effects !nt counts down, in sweep order: (key, pretty, extra keys cleared on expiry, emoji).
+_TIMED_EFFECTS = (
+    ("magwep",    "Magic Weapon",      ("magwep_name","magwep_disp"), "🕯️"),
+    ("ghh",       "Ghoulish Hands",    (),                             "🧟‍♂️"),
+    ("shield",    "Shield",            (),                             "🛡️"),
+    ("magearmor", "Mage Armor",        ("magearmor_by",),              "🧱"),
+    ("boneskin",  "Boneskin",          ("boneskin_by",),               "🦴"),
+    ("sph",       "Spiritual Hammer",  ("sph_bonus",),                 "🔨"),
+    ("shl",       "Shillelagh",        ("shl_hit","shl_dmg","shl_die"),"🪵"),
+    ("light",     "Light",             ("light_by","light_level"),     "🌟"),
+    ("darkness",  "Darkness",          ("dark_by","dark_level"),       "🌑"),
+    ("blind",     "Blind",             ("blind_src","blind_by","blind_level"), "🙈"),
+    ("paralyzed", "Unconscious/Paralyzed", (),                         "😴"),
+    ("cc",        "Color Cloud",       ("cc_by","cc_level"),           "🌫️"),
+    ("ck",        "Cloudkill",         ("ck_by","ck_level"),           "☣️"),
+    ("hyp",       "Hypnotic Pattern",  ("hyp_by",),                    "🌀"),
+    ("cl",        "Call Lightning",    ("cl_by","cl_die","cl_bolts","cl_last_round"), "⚡"),
+    ("cn",        "Confusion",         ("cn_by","cn_last","cn_tar","cn_tar_by"),      "😵‍💫"),
+    ("db",        "Drainblade",        ("db_by",),                     "🩸"),
+    ("inw",       "Immunity to Normal Weapons", ("inw_by",),           "💎"),
+    ("pnm",       "Protection from Normal Missiles", ("pnm_by",),      "🚀"),
+    ("fear",      "Fear",              ("fear_by","fear_src"),         "😱"),
+    ("inv",       "Invisibility",      ("inv_by",),                    "🫥"),
+    ("mi",        "Mirror Image",      ("mi_images","mi_by"),          "🪞"),
+    ("gas",       "Gaseous Form",      ("gas_by","gas_ac_hint"),       "☁️"),
+    ("ps",        "Polymorph (Self)",  ("ps_form","ps_by"),            "🦎"),
+    ("stone",     "Stoneskin",         ("stone_by"),                   "🪨"),
+    ("swd", "Sword",           (),              "🗡️"),
+    ("sc", "Stinking Cloud", ("sc_by","sc_level"), "🤢"),
+    ("chl", "Chill (follow-up)", ("chl_charges",), "🥶"),
+    ("cr", "Chill Ray", (), "❄️"),
+    ("gcr", "Greater Chill Ray", (), "🧊"),
+    ("stench", "Stench", (), "🤢"),
+)
+_TIMED_KEYS = {k for (k, _, _, _) in _TIMED_EFFECTS}
+_X_META = ("_label", "_emoji", "_code", "_by", "_dice", "_die", "_src", "_level", "_name")
+
+def _timed_key(key: str) -> bool:
+    """True for the <slot>.<key> counters the channel clock schedules."""
+    if key.startswith("x_"):
+        return not key.endswith(_X_META)
+    return key in _TIMED_KEYS
+
+def _effect_clock(cfg, chan_id: str):
+    """
+    The channel's game clock, kept at its `round`. The first call of a battle
+    (or after the round went backwards) schedules every live counter once;
+    from then on _set_timer/_cancel_timer keep the queue current.
+    """
+    now = cfg.getint(chan_id, "round", fallback=0)
+    clock = channel_clock(chan_id)
+    if clock is not None and now >= clock.now:
+        clock.now = now
+        return clock
+    clock = start_clock(chan_id, now)
+    for opt_key, val in cfg.items(chan_id):
+        if "." not in opt_key:
+            continue
+        s, key = opt_key.split(".", 1)
+        if not _timed_key(key):
+            continue
+        try:
+            clock.register(s, key, int((val or "0").strip()))
+        except ValueError:
+            continue
+    return clock
+
+def _sync_clock(cfg, chan_id: str) -> None:
+    """
+    Schedule the timer counters `cfg` touched in `chan_id` since it was
+    loaded, so writes that bypass _set_timer still reach the queue. Drops
+    the clock (to be seeded again) when the journal cannot tell.
+    """
+    clock = channel_clock(chan_id)
+    if clock is None or clock.busy:
+        return
+    touched = getattr(cfg, "touched", None)
+    keys = touched(chan_id) if touched is not None and cfg.has_section(chan_id) else None
+    if keys is None or cfg.getint(chan_id, "round", fallback=0) < clock.now:
+        drop_clock(chan_id)
+        return
+    clock.now = cfg.getint(chan_id, "round", fallback=0)
+    for opt_key in keys:
+        if "." not in opt_key:
+            continue
+        s, key = opt_key.split(".", 1)
+        if not _timed_key(key):
+            continue
+        try:
+            left = int((cfg.get(chan_id, opt_key, fallback="0") or "0").strip())
+        except ValueError:
+            left = 0
+        clock.register(s, key, left)
+
+def _sync_clocks(cfg) -> None:
+    """Battle-write listener: _sync_clock() every channel with a running clock."""
+    for chan_id in clock_channels():
+        _sync_clock(cfg, chan_id)
+
+def _set_timer(cfg, chan_id: str, slot: str, key: str, rounds) -> None:
+    """Set the <slot>.<key> counter to `rounds` and (re)schedule it on the channel clock."""
+    cfg.set(chan_id, f"{slot}.{key}", str(rounds))
+    if not _timed_key(key):
+        return
+    try:
+        left = int(str(rounds).strip())
+    except ValueError:
+        return
+    _effect_clock(cfg, chan_id).register(slot, key, left)
+
+def _cancel_timer(chan_id: str, slot: str, key: str) -> None:
+    """Drop <slot>.<key> from the channel clock (the caller clears the option)."""
+    clock = channel_clock(chan_id)
+    if clock is not None:
+        clock.cancel(slot, key)
+
 def _clear_x_effect(cfg, chan_id: str, slot: str, base_key: str):
     """Remove a custom x_* effect key and its metadata (label/emoji/code/by)."""
     key = f"{slot}.{base_key}"
+    _cancel_timer(chan_id, slot, base_key)
     if cfg.has_option(chan_id, key):
         cfg.remove_option(chan_id, key)
     for suf in ("_label","_emoji","_code","_by"):
@@ -1243,6 +1395,20 @@ def _clear_x_effect(cfg, chan_id: str, slot: str, base_key: str):
         if cfg.has_option(chan_id, mkey):
             cfg.remove_option(chan_id, mkey)
 
+def _set_x_effect(cfg, chan_id: str, slot: str, tag: str, rounds: int, *,
+                  label: str, code: str, emoji: str | None = None, by: str | None = None) -> None:
+    """
+    Start (or restart) a custom x_<tag> timer of `rounds` rounds on `slot`.
+    Combat turns and !nt count it down; expiry clears it with its metadata.
+    """
+    _set_timer(cfg, chan_id, slot, f"x_{tag}", int(rounds))
+    cfg.set(chan_id, f"{slot}.x_{tag}_label", label)
+    cfg.set(chan_id, f"{slot}.x_{tag}_code", code)
+    if emoji:
+        cfg.set(chan_id, f"{slot}.x_{tag}_emoji", emoji)
+    if by is not None:
+        cfg.set(chan_id, f"{slot}.x_{tag}_by", by)
+
 def _advance_exploration_x_effects(cfg, chan_id: str, rounds: int = 60) -> dict[str, list[str]]:
     """
     Decrement custom x_* effects by `rounds`. When any hits 0 or below, remove the key and metadata.
@@ -1250,29 +1416,59 @@ def _advance_exploration_x_effects(cfg, chan_id: str, rounds: int = 60) -> dict[
     """
     expired: dict[str, list[str]] = {}
     names, _ = _parse_combatants(cfg, chan_id)
-    for name in names:
-        slot = _choose_slot_for_effects(cfg, chan_id, name)
+    for name, slot, base_key in _x_effect_keys(cfg, chan_id, names):
+        opt_key = f"{slot}.{base_key}"
+        if not cfg.has_option(chan_id, opt_key):
+            continue
+        left = cfg.getint(chan_id, opt_key, fallback=0)
+        if left <= 0:
+            continue
+        new_left = max(0, left - rounds)
+        if new_left <= 0:
+
+            label = cfg.get(chan_id, f"{slot}.{base_key}_label",
+                            fallback=base_key[2:].replace("_", " ").title())
+            expired.setdefault(name, []).append(label)
+            _clear_x_effect(cfg, chan_id, slot, base_key)
+        else:
+            _set_timer(cfg, chan_id, slot, base_key, new_left)
+    _save_battles(cfg)
+    return expired
+
+def _x_effect_keys(cfg, chan_id: str, names, within: int | None = None) -> list:
+    """
+    [(name, slot, x_key)] for the x_* counters (not their _label/_emoji/...
+    metadata) on each listed combatant's effect slot. With the SQLite
+    backend these come from its timer index (only counters <= `within`
+    unless None); otherwise the section is scanned and `within` is ignored.
+    """
+    idx = effect_index(cfg, chan_id) if not any("." in n for n in names) else None
+    if idx is not None:
+        by_slot: dict[str, list[str]] = {}
+        for slot, effect, _left in idx.timers(within):
+            by_slot.setdefault(slot, []).append(effect)
+        out = []
+        for name in names:
+            base = _slot(name)
+            disp = cfg.get(chan_id, f"{base}.disp", fallback="") if by_slot else ""
+            if base not in by_slot and not (disp and disp.replace(" ", "_") in by_slot):
+                continue
+            slot = _choose_slot_for_effects(cfg, chan_id, name, idx)
+            out.extend((name, slot, effect) for effect in by_slot.get(slot, ()))
+        return out
 
-        for opt_key, _ in list(cfg.items(chan_id)):
+    out = []
+    by_slot = _battle_keys_by_slot(cfg, chan_id)
+    for name in names:
+        slot = _choose_slot_for_effects(cfg, chan_id, name, by_slot)
+        for opt_key, _ in by_slot.get(slot, ()):
             if not opt_key.startswith(f"{slot}.x_"):
                 continue
             base_key = opt_key.split(".", 1)[1]
             if any(base_key.endswith(suf) for suf in ("_label","_emoji","_code","_by")):
                 continue
-            left = cfg.getint(chan_id, opt_key, fallback=0)
-            if left <= 0:
-                continue
-            new_left = max(0, left - rounds)
-            if new_left <= 0:
-
-                label = cfg.get(chan_id, f"{slot}.{base_key}_label",
-                                fallback=base_key[2:].replace("_", " ").title())
-                expired.setdefault(name, []).append(label)
-                _clear_x_effect(cfg, chan_id, slot, base_key)
-            else:
-                cfg.set(chan_id, opt_key, str(new_left))
-    _save_battles(cfg)
-    return expired
+            out.append((name, slot, base_key))
+    return out
 
 def _perm_codes_for_slot(cfg, chan_id: str, slot: str) -> set[str]:
     codes = set()
@@ -1381,11 +1577,9 @@ def _move_rates_for_char(char_name: str) -> tuple[int, int]:
     Return (base_move, turn_move) for a character name.
     Falls back to 30' base if not found. Turn move = base * 3.
     """
-    path = f"{char_name.replace(' ', '_')}.coe"
+    cfg = combatant_cfg(char_name)
     base = 30
-    if os.path.exists(path):
-        cfg = read_cfg(path)
-
+    if cfg is not None:
         try:
             base = getint_compat(cfg, "stats", "move", fallback=None)
             if base is None:
@@ -1812,7 +2006,6 @@ def _monster_has_regen(att_cfg, att_path):
     """
     True if monster lists 'regen' / 'regeneration' in special (instance or template).
     """
-    import os
     try:
         s1 = " ".join([
             (get_compat(att_cfg, "base", "special", fallback="") or ""),
@@ -1822,15 +2015,14 @@ def _monster_has_regen(att_cfg, att_path):
             return True
 
         mtype = (get_compat(att_cfg, "info", "monster_type", fallback="") or "").strip().lower()
-        for p in (f"monsters/{mtype}.ini", f"{mtype}.ini"):
-            if os.path.exists(p):
-                mcfg = read_cfg(p)
-                s2 = " ".join([
-                    (get_compat(mcfg, "base", "special", fallback="") or ""),
-                    (get_compat(mcfg, "info", "special", fallback="") or "")
-                ]).lower()
-                if ("regen" in s2) or ("regeneration" in s2):
-                    return True
+        mcfg = _monster_base_cfg(mtype, loose_first=False) if mtype else None
+        if mcfg is not None:
+            s2 = " ".join([
+                (get_compat(mcfg, "base", "special", fallback="") or ""),
+                (get_compat(mcfg, "info", "special", fallback="") or "")
+            ]).lower()
+            if ("regen" in s2) or ("regeneration" in s2):
+                return True
     except Exception:
         pass
     return False
@@ -2071,14 +2263,10 @@ def _roll_lair_once(code: str) -> dict:
     return out
 
 def _load_battles():
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(BATTLE_FILE)
-    return cfg
+    return load_battles()
 
 def _save_battles(cfg):
-    with open(BATTLE_FILE, "w", encoding="utf-8") as f:
-        cfg.write(f)
+    save_battles(cfg)
 
 def _section_id(channel):
     return str(channel.id)
@@ -2214,6 +2402,7 @@ def _tick_paralyze_on_turn(cfg, chan_id: str, name_key: str) -> tuple[bool, str
     n = max(0, n - 1)
 
     if n <= 0:
+        _cancel_timer(chan_id, slot, "paralyzed")
         cfg.remove_option(chan_id, opt)
         by_opt = f"{slot}.paralyzed_by"
         if cfg.has_option(chan_id, by_opt):
@@ -2243,7 +2432,7 @@ def _tick_paralyze_on_turn(cfg, chan_id: str, name_key: str) -> tuple[bool, str
 
         return (False, msg)
     else:
-        cfg.set(chan_id, opt, str(n))
+        _set_timer(cfg, chan_id, slot, "paralyzed", n)
         _save_battles(cfg)
         return (True, f"{name_key} is **PARALYZED** ({n} rds remain).")
 
@@ -2264,9 +2453,10 @@ def _tick_stoneskin_on_turn(cfg, chan_id: str, name_key: str) -> tuple[bool, str
 
     if dur > 0:
         dur = max(0, dur - 1)
-        cfg.set(chan_id, dur_key, str(dur))
+        _set_timer(cfg, chan_id, slot, "stone", dur)
 
     if dur <= 0 or hp <= 0:
+        _cancel_timer(chan_id, slot, "stone")
         if cfg.has_option(chan_id, dur_key): cfg.remove_option(chan_id, dur_key)
         if cfg.has_option(chan_id, hp_key):  cfg.remove_option(chan_id, hp_key)
 
@@ -2295,6 +2485,7 @@ def _tick_mirror_on_turn(cfg, chan_id: str, name_key: str) -> tuple[bool, str |
     n = cfg.getint(chan_id, key, fallback=0)
     n = max(0, n - 1)
     if n <= 0:
+        _cancel_timer(chan_id, slot, "mi")
         cfg.remove_option(chan_id, key)
         cleared = cfg.getint(chan_id, imgs_key, fallback=0)
         if cfg.has_option(chan_id, imgs_key):
@@ -2308,17 +2499,16 @@ def _tick_mirror_on_turn(cfg, chan_id: str, name_key: str) -> tuple[bool, str |
             msg += f" ({cleared} remaining figment{'s' if cleared != 1 else ''} disperse.)"
         return (False, msg)
     else:
-        cfg.set(chan_id, key, str(n))
+        _set_timer(cfg, chan_id, slot, "mi", n)
         _save_battles(cfg)
         imgs = cfg.getint(chan_id, imgs_key, fallback=0)
         return (True, f"{name_key} — **Mirror Image** ({n} rds remain; images: {imgs}).")
 
 def _char_snapshot(name):
     """Return (hp, mhp, ac, owner_id) from <name>.coe, with safe fallbacks."""
-    path = f"{name.replace(' ', '_')}.coe"
-    if not os.path.exists(path):
+    cfg = combatant_cfg(name)
+    if cfg is None:
         return (None, None, 11, None)
-    cfg = read_cfg(path)
     hp  = getint_compat(cfg, "cur", "hp", fallback=None)
     mhp = getint_compat(cfg, "max", "hp", fallback=None)
 
@@ -2331,10 +2521,9 @@ def _char_snapshot(name):
     return (hp, mhp, ac, owner)
 
 def _dex_mod_from_char(char_name: str) -> int:
-    path = f"{char_name.replace(' ', '_')}.coe"
-    if not os.path.exists(path):
+    cfg = combatant_cfg(char_name)
+    if cfg is None:
         return 0
-    cfg = read_cfg(path)
     try:
         if cfg.has_option("stats", "dex_modifier"):
             return int(cfg.get("stats", "dex_modifier"))
@@ -2395,21 +2584,15 @@ def _purge_zero_x_effects(cfg, chan_id: str):
     except Exception:
         names = []
 
-    for nm in names:
-        slot = _choose_slot_for_effects(cfg, chan_id, nm)
-
-        for opt_key, _ in list(cfg.items(chan_id)):
-            if not opt_key.startswith(f"{slot}.x_"):
-                continue
-            base_key = opt_key.split(".", 1)[1]
-
-            if any(base_key.endswith(suf) for suf in ("_label","_emoji","_code","_by")):
-                continue
-            left = max(0, cfg.getint(chan_id, opt_key, fallback=0))
-            if left <= 0:
+    for _nm, slot, base_key in _x_effect_keys(cfg, chan_id, names, within=0):
+        opt_key = f"{slot}.{base_key}"
+        if not cfg.has_option(chan_id, opt_key):
+            continue
+        left = max(0, cfg.getint(chan_id, opt_key, fallback=0))
+        if left <= 0:
 
-                _clear_x_effect(cfg, chan_id, slot, base_key)
-                changed = True
+            _clear_x_effect(cfg, chan_id, slot, base_key)
+            changed = True
     if changed:
         _save_battles(cfg)
 
@@ -2463,6 +2646,7 @@ def _tick_status_counter(cfg, chan_id: str, name_key: str, key: str, label: str)
     n = cfg.getint(chan_id, opt, fallback=0)
     n = max(0, n - 1)
     if n <= 0:
+        _cancel_timer(chan_id, slot, key)
         cfg.remove_option(chan_id, opt)
         by_opt = f"{slot}.{key}_by"
         if cfg.has_option(chan_id, by_opt):
@@ -2476,7 +2660,7 @@ def _tick_status_counter(cfg, chan_id: str, name_key: str, key: str, label: str)
         _save_battles(cfg)
         return (False, f"{name_key}’s **{label}** has ended.")
     else:
-        cfg.set(chan_id, opt, str(n))
+        _set_timer(cfg, chan_id, slot, key, n)
         _save_battles(cfg)
         return (True, None)
 
@@ -2544,18 +2728,22 @@ def _life_bar(cur: int | None, mx: int | None, width: int = 10, style: str = "bl
 
 def _is_monster(char_name: str) -> bool:
     """True if the .coe marks this as a Monster."""
-    path = f"{char_name.replace(' ', '_')}.coe"
-    if not os.path.exists(path):
+    cfg = combatant_cfg(char_name)
+    if cfg is None:
         return False
-    cfg = read_cfg(path)
     cls = get_compat(cfg, "info", "class", fallback="").strip().lower()
     return cls == "monster"
 
 def _load_monster_template(mon_name: str) -> dict | None:
     """Read monsters/<name>.ini or <name>.ini [base] block -> dict of strings/ints."""
-    fn = None
     lc = re.sub(r"\s+", "", mon_name).lower()
-    for d in MONSTER_DIRS:
+    tpl = monster_catalog().get(lc)
+    if tpl is not None:
+        return tpl.typed_base()
+
+    # monsters/ is served by the catalog; only loose <name>.ini files remain.
+    fn = None
+    for d in MONSTER_DIRS[1:]:
         cand = os.path.join(d, f"{lc}.ini")
         if os.path.exists(cand):
             fn = cand
@@ -2789,11 +2977,41 @@ def _g_clear_state(cfg, chan_id: str) -> None:
             pass
 
 
+def _tracker_coe(nm: str) -> str | None:
+    """Find '<name>.coe' case-insensitively."""
+    base = (nm or "").replace(" ", "_").lower()
+    target = f"{base}.coe"
+    for fn in ci_matches(target):
+        if fn.lower() == target:
+            return fn
+    return None
+
+def _tracker_sheet_source(disp: str, name: str):
+    """
+    (kind, key, signature) of the sheet a tracker line reads: a pending
+    monster instance or a .coe with its (mtime, size); (None, None, None).
+    """
+    for nm in (disp, name):
+        st = instance_state(nm)
+        if st is not None:
+            return "inst", nm, st
+    path = _tracker_coe(disp) or _tracker_coe(name)
+    if path:
+        try:
+            st = os.stat(path)
+            return "file", path, (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+    return None, None, None
+
+# Rendered tracker lines: {chan_id: {name: (inputs, line)}}. A line is reused
+# while its inputs are unchanged: the combatant's battle keys, its sheet's
+# signature, and the cursor/round state it shows.
+_TRACKER_LINES: dict = {}
+
 def _format_tracker_block(cfg, chan_id: str):
     if not cfg.has_section(chan_id):
         return "Initiative: — (round 0)\n(no combatants yet)"
-    ents = _sorted_entries(cfg, chan_id)
-    lines = []
     entries   = _sorted_entries(cfg, chan_id)
     round_no  = cfg.getint(chan_id, "round", fallback=0)
     turn_name = cfg.get(chan_id, "turn", fallback="")
@@ -2831,33 +3049,23 @@ def _format_tracker_block(cfg, chan_id: str):
         else:
             header += " [GROUP]"
 
-        
-    def _find_file_ci(nm: str) -> str | None:
-        """Find '<name>.coe' case-insensitively."""
-        base = (nm or "").replace(" ", "_").lower()
-        target = f"{base}.coe"
-        for fn in os.listdir("."):
-            if fn.lower() == target:
-                return fn
-        return None
 
     gi_on = _group_init_enabled(cfg, chan_id)
-    party_owner_ids = set(_party_owner_ids_from_initiative(cfg, chan_id))
     lines = [header]
     wx_desc, wx_vis = _hx_tracker_weather(chan_id)
     if wx_desc:
         lines.append(f"Weather: {wx_desc} • vis {wx_vis:+d}")
+    by_slot = _battle_keys_by_slot(cfg, chan_id)
+    prev_lines = _TRACKER_LINES.get(chan_id, {})
+    cur_lines = {}
     for ent in entries:
         name = ent["name"]
         init_val = ent.get("init", ent.get("score", "-"))
 
-        slot = _choose_slot_for_effects(cfg, chan_id, name)
-        perm_codes = _perm_codes_for_slot(cfg, chan_id, slot)
+        slot = _choose_slot_for_effects(cfg, chan_id, name, by_slot)
+        _ss_normalize(cfg, chan_id, slot)
         disp = cfg.get(chan_id, f"{slot}.disp", fallback=name)
 
-        if cfg.has_option(chan_id, f"{slot}.acpen"):
-            disp = f"{disp} (–2 AC)"
-
         # Markers (cosmetic). In group-initiative, hide the "current turn" marker.
         if (not gi_on) and name == active_turn:
             prefix = "> "
@@ -2866,19 +3074,34 @@ def _format_tracker_block(cfg, chan_id: str):
         else:
             prefix = "  "
 
-        path = _find_file_ci(disp) or _find_file_ci(name)
+        base = _slot(name)
+        alt = (cfg.get(chan_id, f"{base}.disp", fallback="") or "").replace(" ", "_")
+        source = _tracker_sheet_source(disp, name)
+        inputs = (init_val, prefix, slot, disp, name == turn_name, round_no, source,
+                  [by_slot.get(s) for s in (base, slot, alt)])
+        hit = prev_lines.get(name)
+        if hit is not None and hit[0] == inputs:
+            cur_lines[name] = hit
+            lines.append(hit[1])
+            continue
+
+        perm_codes = _perm_codes_for_slot(cfg, chan_id, slot)
+        if cfg.has_option(chan_id, f"{slot}.acpen"):
+            disp = f"{disp} (–2 AC)"
 
+        kind, src, _sig = source
         pcfg = None
-        if path:
-            try:
-                pcfg = read_cfg(path)
-            except Exception:
-                pcfg = None
+        try:
+            if kind == "inst":
+                pcfg = instance_cfg(src)
+            elif kind == "file":
+                pcfg = read_cfg(src)
+        except Exception:
+            pcfg = None
 
         tail = ""
-        if path:
+        if pcfg is not None:
             try:
-                pcfg = read_cfg(path)
                 cls = (get_compat(pcfg, "info", "class", fallback="") or "").strip().lower()
                 cur_hp = getint_compat(pcfg, "cur", "hp", fallback=None)
                 max_hp = getint_compat(pcfg, "max", "hp", fallback=cur_hp)
@@ -3213,7 +3436,6 @@ def _format_tracker_block(cfg, chan_id: str):
             else:
                 tail += f" • [CL {cl_left}/{cl_bolts}]"
 
-        _ss_normalize(cfg, chan_id, slot)
         ss_dur, ss_hp = _ss_state(cfg, chan_id, slot)
         if ss_hp > 0:
             tail += f" • [SS {ss_hp}]"
@@ -3247,8 +3469,8 @@ def _format_tracker_block(cfg, chan_id: str):
         tail += _rotgrubs_badge(cfg, chan_id, slot)
 
         try:
-            for opt_key, _val in list(cfg.items(chan_id)):
-                if not opt_key.startswith(f"{slot}.x_"):
+            for opt_key, _val in by_slot.get(slot, ()):
+                if not opt_key.startswith(f"{slot}.x_") or not cfg.has_option(chan_id, opt_key):
                     continue
                 base_key = opt_key.split(".", 1)[1]
                 if any(base_key.endswith(suf) for suf in ("_label","_emoji","_code","_by","_perm")):
@@ -3317,8 +3539,11 @@ def _format_tracker_block(cfg, chan_id: str):
             if controller_name and not hostile:
                 tail += f" • [ALLY {controller_name}]"
                     
-        lines.append(f"{prefix}{str(init_val):>2}: {disp}{tail}")
+        line = f"{prefix}{str(init_val):>2}: {disp}{tail}"
+        cur_lines[name] = (inputs, line)
+        lines.append(line)
 
+    _TRACKER_LINES[chan_id] = cur_lines
     return "\n".join(lines)
 
 def _add_oil_burn(cfg, chan_id: str, name_key: str, stacks: int = 1):
@@ -3338,7 +3563,7 @@ def _add_oil_burn(cfg, chan_id: str, name_key: str, stacks: int = 1):
 def _resolve_char_ci_local(name: str):
     base = name.replace(" ", "_")
     want = f"{base}.coe".lower()
-    for fn in os.listdir("."):
+    for fn in ci_matches(want):
         if fn.lower() == want:
             path = fn
             try:
@@ -3433,6 +3658,20 @@ def _resist_protection_tags(cfg, chan_id: str, slot: str) -> str:
 class Initiative(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        monster_catalog().names()  # parse monsters/*.ini at load, not on the first !mon
+        on_battle_write("initiative", _sync_clocks)
+
+    async def cog_before_invoke(self, ctx):
+        # One battle.lst load/save per command, both done on the storage pool;
+        # helpers share the parsed state in between.
+        ctx.battle_session = await abegin_session()
+        if ctx.command and ctx.command.qualified_name in HOT_COMMANDS:
+            await prefetch_active_char(ctx.author.id)
+            defer_char_writes(ctx)
+
+    async def cog_after_invoke(self, ctx):
+        await achar_writes_done(ctx)
+        await aend_session(getattr(ctx, "battle_session", None))
 
     async def _update_tracker_message(self, ctx, cfg=None, chan_id=None):
         """
@@ -3442,6 +3681,9 @@ class Initiative(commands.Cog):
           • If message_id is valid → edit only (never pin).
           • If message_id is invalid → try to find a pinned tracker and edit it, normalize message_id.
           • Only if none found → create + pin one tracker and unpin other duplicate trackers.
+
+        Edits of a known tracker go through its TrackerUpdater (utils.tracker):
+        unchanged content is skipped and a burst of calls becomes one edit.
         """
         try:
             if cfg is None:
@@ -3458,68 +3700,83 @@ class Initiative(commands.Cog):
             block = _format_tracker_block(cfg, chan_id)
             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
 
+            tracker = tracker_for(chan_id)
             msg_id = cfg.getint(chan_id, "message_id", fallback=0)
 
-            if msg_id:
+            async def _replace(latest):
+                # The bound message was deleted; locate or re-create it with fresh state.
+                bcfg = _load_battles()
+                if bcfg.has_section(chan_id):
+                    await self._locate_tracker(ctx, bcfg, chan_id, latest)
+
+            if msg_id and not tracker.bound_to(msg_id):
                 try:
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
-                    return
+                    tracker.bind(await ctx.channel.fetch_message(msg_id))
                 except Exception:
-
                     pass
 
-            try:
-                pins = await ctx.channel.pins()
-                candidate = None
-                for pm in pins:
+            if msg_id and tracker.bound_to(msg_id):
+                tracker.submit(content, on_missing=_replace)
+                return
 
-                    if _is_tracker_message(pm):
-                        candidate = pm
-                        break
+            await self._locate_tracker(ctx, cfg, chan_id, content)
 
-                if candidate:
-                    await candidate.edit(content=content)
-                    cfg.set(chan_id, "message_id", str(candidate.id))
-                    _save_battles(cfg)
+        except Exception:
 
-                    try:
-                        for other in pins:
-                            if other.id != candidate.id and _is_tracker_message(other):
-                                try:
-                                    await other.unpin(reason="Duplicate initiative tracker")
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
+            pass
 
-                    return
-            except Exception:
+    async def _locate_tracker(self, ctx, cfg, chan_id: str, content: str):
+        """Edit a pinned tracker (or create + pin one) to show `content`, and record its id."""
+        tracker = tracker_for(chan_id)
+        try:
+            pins = await ctx.channel.pins()
+            candidate = None
+            for pm in pins:
 
-                pass
+                if _is_tracker_message(pm):
+                    candidate = pm
+                    break
 
-            new_msg = await ctx.send(content)
-            try:
-                await new_msg.pin(reason="Initiative tracker")
-            except Exception:
-                pass
+            if candidate:
+                await candidate.edit(content=content)
+                tracker.bind(candidate, content)
+                cfg.set(chan_id, "message_id", str(candidate.id))
+                _save_battles(cfg)
 
-            cfg.set(chan_id, "message_id", str(new_msg.id))
-            _save_battles(cfg)
+                try:
+                    for other in pins:
+                        if other.id != candidate.id and _is_tracker_message(other):
+                            try:
+                                await other.unpin(reason="Duplicate initiative tracker")
+                            except Exception:
+                                pass
+                except Exception:
+                    pass
 
-            try:
-                pins = await ctx.channel.pins()
-                for pm in pins:
-                    if pm.id != new_msg.id and _is_tracker_message(pm):
-                        try:
-                            await pm.unpin(reason="Replacing duplicate tracker")
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+                return
+        except Exception:
+
+            pass
 
+        new_msg = await ctx.send(content)
+        tracker.bind(new_msg, content)
+        try:
+            await new_msg.pin(reason="Initiative tracker")
         except Exception:
+            pass
+
+        cfg.set(chan_id, "message_id", str(new_msg.id))
+        _save_battles(cfg)
 
+        try:
+            pins = await ctx.channel.pins()
+            for pm in pins:
+                if pm.id != new_msg.id and _is_tracker_message(pm):
+                    try:
+                        await pm.unpin(reason="Replacing duplicate tracker")
+                    except Exception:
+                        pass
+        except Exception:
             pass
 
     def _chan_id(ctx):
@@ -3595,7 +3852,7 @@ class Initiative(commands.Cog):
                 left = cfg.getint(chan_id, key_base, fallback=0)
                 if left > 0:
                     left = max(0, left - 1)
-                    cfg.set(chan_id, key_base, str(left))
+                    _set_timer(cfg, chan_id, slot, base, left)
                     changed = True
                     if left == 0:
                         for opt in extra_clear:
@@ -3652,14 +3909,9 @@ class Initiative(commands.Cog):
                     new_left = left - 1
                     changed = True
                     if new_left <= 0:
-                        if cfg.has_option(chan_id, opt_key):
-                            cfg.remove_option(chan_id, opt_key)
-                        for suf in ("_label","_emoji","_code","_by"):
-                            mkey = f"{slot}.{base_key}{suf}"
-                            if cfg.has_option(chan_id, mkey):
-                                cfg.remove_option(chan_id, mkey)
+                        _clear_x_effect(cfg, chan_id, slot, base_key)
                     else:
-                        cfg.set(chan_id, opt_key, str(new_left))
+                        _set_timer(cfg, chan_id, slot, base_key, new_left)
 
             except Exception:
                 pass
@@ -3671,13 +3923,13 @@ class Initiative(commands.Cog):
                     if hyp_left > 0:
                         newv = hyp_left - 1
                         if newv <= 0:
-
+                            _cancel_timer(chan_id, slot, "hyp")
                             cfg.remove_option(chan_id, hyp_key)
                             if cfg.has_option(chan_id, f"{slot}.hyp_by"):
                                 cfg.remove_option(chan_id, f"{slot}.hyp_by")
                             changed = True
                         else:
-                            cfg.set(chan_id, hyp_key, str(newv))
+                            _set_timer(cfg, chan_id, slot, "hyp", newv)
                             changed = True
 
             except Exception:
@@ -3736,7 +3988,7 @@ class Initiative(commands.Cog):
             sph_val = 0
         if sph_val > 0:
             newv = sph_val - 1
-            cfg.set(chan_id, f"{slot}.sph", str(newv))
+            _set_timer(cfg, chan_id, slot, "sph", str(newv))
             if newv <= 0:
                 for k in ("sph", "sph_bonus"):
                     opt = f"{slot}.{k}"
@@ -3754,7 +4006,7 @@ class Initiative(commands.Cog):
 
             disp = cfg.get(chan_id, f"{slot}.disp", fallback=turn_name)
             _, path = _resolve_char_ci_local(turn_name)
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 await ctx.send(f"🔥 {disp}: start-of-turn oil could not find a character file.")
             else:
                 t_cfg = read_cfg(path)
@@ -3825,7 +4077,7 @@ class Initiative(commands.Cog):
                                 if cfg.has_option(chan_id, opt):
                                     cfg.remove_option(chan_id, opt)
                             _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                        try: os.remove(os.path.abspath(path))
+                        try: remove_cfg(path)
                         except Exception: pass
                     except Exception:
                         pass
@@ -3852,7 +4104,7 @@ class Initiative(commands.Cog):
                 elif stage == 6:
                     dice = "1d4"
 
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"{emoji} {disp}: {label.lower()} tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -3934,7 +4186,7 @@ class Initiative(commands.Cog):
                                         if cfg.has_option(chan_id, opt):
                                             cfg.remove_option(chan_id, opt)
                                     _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                                try: os.remove(os.path.abspath(path))
+                                try: remove_cfg(path)
                                 except Exception: pass
                             except Exception:
                                 pass
@@ -3972,7 +4224,7 @@ class Initiative(commands.Cog):
             _, path = _resolve_char_ci_local(turn_name)
 
             die = (cfg.get(chan_id, f"{slot}.x_dissolve_dice", fallback="1d6") or "1d6").strip()
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 await ctx.send(f"🧪 {disp}: acid tick but no character file was found.")
             else:
                 t_cfg = read_cfg(path)
@@ -4023,7 +4275,7 @@ class Initiative(commands.Cog):
                                 if cfg.has_option(chan_id, opt):
                                     cfg.remove_option(chan_id, opt)
                             _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                        try: os.remove(os.path.abspath(path))
+                        try: remove_cfg(path)
                         except Exception: pass
                     except Exception:
                         pass
@@ -4035,7 +4287,7 @@ class Initiative(commands.Cog):
                 if isinstance(rounds_left, int) and rounds_left >= 0:
                     rem = max(0, rounds_left - 1)
                     if rem > 0:
-                        cfg.set(chan_id, f"{slot}.x_dissolve", str(rem))
+                        _set_timer(cfg, chan_id, slot, "x_dissolve", str(rem))
                     else:
                         for suf in ("", "_dice", "_label", "_emoji", "_code", "_by"):
                             opt = f"{slot}.x_dissolve{suf}"
@@ -4053,7 +4305,7 @@ class Initiative(commands.Cog):
             _, path = _resolve_char_ci_local(turn_name)
             die = (cfg.get(chan_id, f"{slot}.x_fastvenom_dice", fallback="1d6") or "1d6").strip()
 
-            if self._poison_immune(read_cfg(path)) if path and os.path.exists(path) else False or               "undead" in (get_compat(read_cfg(path), "info", "type", fallback="").lower() if path and os.path.exists(path) else ""):
+            if self._poison_immune(read_cfg(path)) if path and coe_exists(path) else False or               "undead" in (get_compat(read_cfg(path), "info", "type", fallback="").lower() if path and coe_exists(path) else ""):
                 for suf in ("", "_dice", "_label"):
                     opt = f"{slot}.x_fastvenom{suf}"
                     if cfg.has_option(chan_id, opt): cfg.remove_option(chan_id, opt)
@@ -4064,7 +4316,7 @@ class Initiative(commands.Cog):
                     color=random.randint(0, 0xFFFFFF)
                 ))
             else:
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🧪 {disp}: venom tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4088,7 +4340,7 @@ class Initiative(commands.Cog):
 
                     rem = max(0, fv - 1)
                     if rem > 0:
-                        cfg.set(chan_id, f"{slot}.x_fastvenom", str(rem))
+                        _set_timer(cfg, chan_id, slot, "x_fastvenom", str(rem))
                     else:
                         for suf in ("", "_dice", "_label"):
                             opt = f"{slot}.x_fastvenom{suf}"
@@ -4114,7 +4366,7 @@ class Initiative(commands.Cog):
                                     opt = f"{s_dead}{suf}"
                                     if cfg.has_option(chan_id, opt): cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4131,7 +4383,7 @@ class Initiative(commands.Cog):
 
             die = (cfg.get(chan_id, f"{slot}.x_spore_dice", fallback="1d8") or "1d8").strip()
 
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 await ctx.send(f"☣️ {disp}: spores tick but no character file was found.")
             else:
                 t_cfg = read_cfg(path)
@@ -4165,7 +4417,7 @@ class Initiative(commands.Cog):
 
                     rem = max(0, sp_left - 1)
                     if rem > 0:
-                        cfg.set(chan_id, f"{slot}.x_spore", str(rem))
+                        _set_timer(cfg, chan_id, slot, "x_spore", str(rem))
                     else:
                         for suf in ("", "_dice", "_label", "_emoji", "_code", "_by"):
                             opt = f"{slot}.x_spore{suf}"
@@ -4210,7 +4462,7 @@ class Initiative(commands.Cog):
                                     if cfg.has_option(chan_id, opt):
                                         cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4230,7 +4482,7 @@ class Initiative(commands.Cog):
 
             rem = max(0, dance_left - 1)
             if rem > 0:
-                cfg.set(chan_id, f"{slot}.x_dance", str(rem))
+                _set_timer(cfg, chan_id, slot, "x_dance", str(rem))
             else:
 
                 for suf in ("", "_label", "_code", "_kind"):
@@ -4241,7 +4493,7 @@ class Initiative(commands.Cog):
             _save_battles(cfg)
 
             if kind == "primary":
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🕷️ {disp}: dance poison tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4300,7 +4552,7 @@ class Initiative(commands.Cog):
                                         if cfg.has_option(chan_id, opt):
                                             cfg.remove_option(chan_id, opt)
                                     _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                                try: os.remove(os.path.abspath(path))
+                                try: remove_cfg(path)
                                 except Exception: pass
                             except Exception:
                                 pass
@@ -4333,7 +4585,7 @@ class Initiative(commands.Cog):
             else:
 
                 die = (cfg.get(chan_id, f"{slot}.x_constrict_dice", fallback="2d4") or "2d4").strip()
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🐍 {disp}: constriction tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4393,7 +4645,7 @@ class Initiative(commands.Cog):
                             except Exception:
                                 pass
 
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4417,7 +4669,7 @@ class Initiative(commands.Cog):
                 _save_battles(cfg)
             else:
                 die = (cfg.get(chan_id, f"{slot}.x_holdbite_dice", fallback="1d4") or "1d4").strip()
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🐕 {disp}: hold tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4469,7 +4721,7 @@ class Initiative(commands.Cog):
                                 _write_combatants(cfg, chan_id, names, scores)
                                 _save_battles(cfg)
 
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
 
                             try:
@@ -4501,7 +4753,7 @@ class Initiative(commands.Cog):
                 _save_battles(cfg)
             else:
                 die = (cfg.get(chan_id, f"{slot}.x_leech_dice", fallback="1d6") or "1d6").strip()
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🩸 {disp}: leech drain tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4553,7 +4805,7 @@ class Initiative(commands.Cog):
                                         cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores)
                                 _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4578,7 +4830,7 @@ class Initiative(commands.Cog):
             else:
 
                 die = (cfg.get(chan_id, f"{slot}.x_entangle_dice", fallback="1d8") or "1d8").strip()
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🪢 {disp}: entangle tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4642,7 +4894,7 @@ class Initiative(commands.Cog):
                             except Exception:
                                 pass
 
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4668,7 +4920,7 @@ class Initiative(commands.Cog):
 
             else:
                 die = (cfg.get(chan_id, f"{slot}.x_swallow_dice", fallback="1d8") or "1d8").strip()
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🫗 {disp}: swallowed tick but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4722,7 +4974,7 @@ class Initiative(commands.Cog):
                                         cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores)
                                 _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4762,7 +5014,7 @@ class Initiative(commands.Cog):
 
             else:
 
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🪱 {disp}: maggots could not find a character file.")
                 else:
                     t_cfg = read_cfg(path)
@@ -4783,7 +5035,7 @@ class Initiative(commands.Cog):
                     rem = max(0, mg - 1)
                     if use_x:
                         if rem > 0:
-                            cfg.set(chan_id, f"{slot}.x_maggots", str(rem))
+                            _set_timer(cfg, chan_id, slot, "x_maggots", str(rem))
                         else:
                             for suf in ("", "_dmg", "_label", "_emoji", "_code", "_by"):
                                 opt = f"{slot}.x_maggots{suf}"
@@ -4835,7 +5087,7 @@ class Initiative(commands.Cog):
                                 _write_combatants(cfg, chan_id, names, scores)
                                 _save_battles(cfg)
                             try:
-                                os.remove(os.path.abspath(path))
+                                remove_cfg(path)
                             except Exception:
                                 pass
                         except Exception:
@@ -4864,7 +5116,7 @@ class Initiative(commands.Cog):
 
             if rem <= 0:
 
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
 
                     await ctx.send(embed=nextcord.Embed(
                         title=f"🪱 Rot Grubs: {disp}",
@@ -4904,7 +5156,7 @@ class Initiative(commands.Cog):
                                     if cfg.has_option(chan_id, opt):
                                         cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -4917,9 +5169,9 @@ class Initiative(commands.Cog):
 
             else:
 
-                cfg.set(chan_id, f"{slot}.x_rotgrub", str(rem))
+                _set_timer(cfg, chan_id, slot, "x_rotgrub", str(rem))
                 if rg_burn > 0:
-                    cfg.set(chan_id, f"{slot}.x_rotgrub_burn", str(rg_burn))
+                    _set_timer(cfg, chan_id, slot, "x_rotgrub_burn", str(rg_burn))
                 else:
                     if cfg.has_option(chan_id, f"{slot}.x_rotgrub_burn"):
                         cfg.remove_option(chan_id, f"{slot}.x_rotgrub_burn")
@@ -4942,7 +5194,7 @@ class Initiative(commands.Cog):
             any_effect_applied = True
             disp = cfg.get(chan_id, f"{slot}.disp", fallback=turn_name)
             _, path = _resolve_char_ci_local(turn_name)
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 await ctx.send(f"🕯️ {disp}: torch ward tick but no character file found.")
             else:
                 t_cfg = read_cfg(path)
@@ -4986,7 +5238,7 @@ class Initiative(commands.Cog):
                                     cfg.remove_option(chan_id, opt)
                             _write_combatants(cfg, chan_id, names, scores)
                             _save_battles(cfg)
-                        try: os.remove(os.path.abspath(path))
+                        try: remove_cfg(path)
                         except Exception: pass
                     except Exception:
                         pass
@@ -5000,7 +5252,7 @@ class Initiative(commands.Cog):
             rem = max(0, dur_left - 1)
             disp = cfg.get(chan_id, f"{slot}.disp", fallback=turn_name)
             if rem > 0:
-                cfg.set(chan_id, f"{slot}.x_swarm", str(rem)); _save_battles(cfg)
+                _set_timer(cfg, chan_id, slot, "x_swarm", str(rem)); _save_battles(cfg)
                 await ctx.send(embed=nextcord.Embed(
                     title=f"🪰 Insect Swarm: {disp}",
                     description=f"**{rem}** round{'s' if rem!=1 else ''} remaining.",
@@ -5033,7 +5285,7 @@ class Initiative(commands.Cog):
                         _write_combatants(cfg, chan_id, names, scores); _save_battles(cfg)
                     try:
                         _, path = _resolve_char_ci_local(turn_name)
-                        if path and os.path.exists(path): os.remove(os.path.abspath(path))
+                        if path and coe_exists(path): remove_cfg(path)
                     except Exception:
                         pass
                 except Exception:
@@ -5050,7 +5302,7 @@ class Initiative(commands.Cog):
 
             rem = max(0, bt_left - 1)
             if rem > 0:
-                cfg.set(chan_id, f"{slot}.x_tentacles", str(rem))
+                _set_timer(cfg, chan_id, slot, "x_tentacles", str(rem))
             else:
 
                 for suf in ("", "_dmg", "_label", "_emoji", "_code", "_by"):
@@ -5070,7 +5322,7 @@ class Initiative(commands.Cog):
                 ))
             else:
 
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🐙 {disp}: tentacles constrict but no character file was found.")
                 else:
                     t_cfg = read_cfg(path)
@@ -5124,7 +5376,7 @@ class Initiative(commands.Cog):
                                         cfg.remove_option(chan_id, opt)
                                 _write_combatants(cfg, chan_id, names, scores)
                                 _save_battles(cfg)
-                            try: os.remove(os.path.abspath(path))
+                            try: remove_cfg(path)
                             except Exception: pass
                         except Exception:
                             pass
@@ -5132,7 +5384,7 @@ class Initiative(commands.Cog):
         try:
             disp = cfg.get(chan_id, f"{slot}.disp", fallback=turn_name)
             _, path = _resolve_char_ci_local(turn_name)
-            if path and os.path.exists(path):
+            if path and coe_exists(path):
                 t_cfg = read_cfg(path)
                 is_mon = (get_compat(t_cfg, "info", "class", fallback="").strip().lower() == "monster")
                 if is_mon and _monster_has_regen(t_cfg, path):
@@ -5149,7 +5401,7 @@ class Initiative(commands.Cog):
 
                         if suppress > 0:
                             if suppress > 1:
-                                cfg.set(chan_id, f"{slot}.x_regen_block", str(suppress - 1))
+                                _set_timer(cfg, chan_id, slot, "x_regen_block", str(suppress - 1))
                             else:
                                 if cfg.has_option(chan_id, f"{slot}.x_regen_block"):
                                     cfg.remove_option(chan_id, f"{slot}.x_regen_block")
@@ -5193,7 +5445,7 @@ class Initiative(commands.Cog):
                     if (suppress > 0) or fire_hit or acid_hit:
                         if suppress > 0:
                             if suppress > 1:
-                                cfg.set(chan_id, f"{slot}.x_regen_block", str(suppress - 1))
+                                _set_timer(cfg, chan_id, slot, "x_regen_block", str(suppress - 1))
                             else:
                                 if cfg.has_option(chan_id, f"{slot}.x_regen_block"):
                                     cfg.remove_option(chan_id, f"{slot}.x_regen_block")
@@ -5223,8 +5475,7 @@ class Initiative(commands.Cog):
                 if msg_id:
                     block = _format_tracker_block(cfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -5657,7 +5908,7 @@ class Initiative(commands.Cog):
             summoner_name = (cfg.get(chan_id, f"{slot}.minion_by", fallback="") or "").strip()
             if summoner_name:
                 _disp, summ_path = _resolve_char_ci_local(summoner_name)
-                if summ_path and os.path.exists(summ_path):
+                if summ_path and coe_exists(summ_path):
                     pcfg = read_cfg(summ_path)
                     controller_id = _extract_owner_id(pcfg)
         except Exception:
@@ -5667,7 +5918,7 @@ class Initiative(commands.Cog):
         if not controller_id:
             try:
                 coe, _base_ini, _mtype = _monster_source_files(resolved)
-                if coe and os.path.exists(coe):
+                if coe and coe_exists(coe):
                     icfg = read_cfg(coe)
                     controller_id = _extract_owner_id(icfg)
             except Exception:
@@ -5751,10 +6002,7 @@ class Initiative(commands.Cog):
 
         query = " ".join(toks).strip()
 
-        names = _list_monster_templates()
-        if query:
-            q = query.lower().replace("_", " ")
-            names = [n for n in names if q in n.lower().replace("_", " ")]
+        names = monster_catalog().search(query)
 
         if not names:
             suffix = f" matching `{query}`" if query else ""
@@ -5809,12 +6057,12 @@ class Initiative(commands.Cog):
             await ctx.send(f"❌ Monster template '{who}' not found. Use `!monsters`.")
             return
 
-        path = _ci_find_monster_ini(resolved)
-        if not path or not os.path.exists(path):
+        tpl = monster_catalog().get(resolved)
+        if tpl is None:
             await ctx.send(f"❌ Could not open template for **{resolved}**.")
             return
 
-        cfg = read_cfg(path)
+        cfg, path = tpl.cfg, tpl.path
         prof = _monster_profile(resolved)
 
         def _b(key: str, default: str = "—") -> str:
@@ -6035,7 +6283,7 @@ class Initiative(commands.Cog):
 
         coe = f"{join_name.replace(' ', '_')}.coe"
         is_halfling = False
-        if os.path.exists(coe):
+        if coe_exists(coe):
             config = read_cfg(coe)
             owner_id = get_compat(config, "info", "owner_id", fallback="")
             if owner_id and owner_id != str(ctx.author.id):
@@ -6147,7 +6395,7 @@ class Initiative(commands.Cog):
 
             is_halfling = False
             coe = f"{nm.replace(' ', '_')}.coe"
-            if os.path.exists(coe):
+            if coe_exists(coe):
                 try:
                     c = read_cfg(coe)
                     race_raw = get_compat(c, "info", "race", fallback="")
@@ -6395,7 +6643,7 @@ class Initiative(commands.Cog):
         def _find_file_ci(nm: str) -> str | None:
             base = (nm or "").replace(" ", "_").lower()
             want = f"{base}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(want):
                 if fn.lower() == want:
                     return fn
             return None
@@ -7554,9 +7802,14 @@ class Initiative(commands.Cog):
             return
 
         msg_id = cfg.getint(chan_id, "message_id", fallback=0)
+        tracker = discard_tracker(chan_id)
+        _TRACKER_LINES.pop(chan_id, None)
         if msg_id:
             try:
-                msg = await ctx.channel.fetch_message(msg_id)
+                if tracker is not None and tracker.bound_to(msg_id):
+                    msg = tracker.message
+                else:
+                    msg = await ctx.channel.fetch_message(msg_id)
                 await msg.unpin(reason="End battle")
             except Exception:
                 pass
@@ -7565,7 +7818,7 @@ class Initiative(commands.Cog):
         listed_monsters = set(n for n in names if _is_monster(n))
 
         tagged_monsters = set()
-        for fn in os.listdir("."):
+        for fn in cwd_listing():
             if not fn.lower().endswith(".coe"):
                 continue
             try:
@@ -7582,10 +7835,11 @@ class Initiative(commands.Cog):
         to_delete_names = listed_monsters | tagged_monsters
 
         cfg.remove_section(chan_id)
+        deleted = discard_channel(cfg, chan_id)
+        drop_clock(chan_id)
         _save_battles(cfg)
 
-        deleted = []
-        for name in sorted(to_delete_names):
+        for name in sorted(to_delete_names - set(deleted)):
             path = f"{name.replace(' ', '_')}.coe"
             if os.path.exists(path):
                 try:
@@ -7631,7 +7885,7 @@ class Initiative(commands.Cog):
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     path = fn
                     try:
@@ -7647,7 +7901,7 @@ class Initiative(commands.Cog):
         except Exception:
             disp_name, path = who, None
 
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             await ctx.send(f"❌ Character '{who}' does not exist.")
             return
 
@@ -7709,7 +7963,7 @@ class Initiative(commands.Cog):
             return
 
         file_name = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(file_name):
+        if not coe_exists(file_name):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -7813,7 +8067,7 @@ class Initiative(commands.Cog):
         if not cfg.has_section("cur"):
             cfg.add_section("cur")
         cfg["cur"]["hp"] = str(new_hp)
-        write_cfg(file_name, cfg)
+        await awrite_cfg(file_name, cfg)
 
         arrow = "→"
         await ctx.send(f"❤️ **{char_name}** HP {cur_hp} {arrow} **{new_hp}** / {max_hp}{note}")
@@ -7826,7 +8080,8 @@ class Initiative(commands.Cog):
     @commands.command(name="mon")
     async def spawn_monsters(self, ctx, mon_name: str, *args):
         """
-        DM: Spawn N monsters from <name>.ini, create .coe files, add to initiative (1d6 each).
+        DM: Spawn N monsters from <name>.ini, add to initiative (1d6 each). Each
+        instance lives in the battle store until a command needs its .coe.
         Usage:
           !mon <name> [count] [flags...]
 
@@ -7911,7 +8166,7 @@ class Initiative(commands.Cog):
             except Exception:
                 disp, path = (None, None)
 
-            if path and os.path.exists(path):
+            if path and coe_exists(path):
                 pcfg = read_cfg(path)
                 owner_id = (get_compat(pcfg, "info", "owner_id", fallback="") or "").strip()
                 if not owner_id:
@@ -7940,8 +8195,6 @@ class Initiative(commands.Cog):
             await ctx.send(f"❌ Monster template not found for '{mon_name}'. Put '{mon_name.lower()}.ini' in ./monsters or root.")
             return
 
-        ac     = int(tpl.get("ac", 10))
-
         def _parse_hd_value(raw) -> float:
             from fractions import Fraction
             s = str(raw).strip().lower().replace(" ", "")
@@ -7962,12 +8215,7 @@ class Initiative(commands.Cog):
         hd_val = _parse_hd_value(hd_raw)
 
         hpmod  = int(tpl.get("hpmod", 0))
-        damage = str(tpl.get("damage", "1d6"))
-        move   = int(tpl.get("move", 30))
         saveas = str(tpl.get("saveas", "Fighter 1"))
-        resist  = str(tpl.get("resist",  "")).strip()
-        reduce1 = str(tpl.get("reduce1", "")).strip()
-        immune  = str(tpl.get("immune",  "")).strip()
         init_bonus = _parse_init_bonus_from_tpl(tpl)
         skills_str = _parse_skills_from_tpl(tpl)
 
@@ -7998,9 +8246,14 @@ class Initiative(commands.Cog):
             saves_out = {k: str(_class_save_target(save_class, save_level, k)) for k in SAVE_KEYS}
 
         prefix = re.sub(r"[^A-Za-z]", "", mon_name).upper()[:2] or "MO"
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
+        existing.update(n.replace(" ", "_") for n in pending_names())
         created = []
 
+        # Catalog templates spawn as overlays in the battle store; loose
+        # <name>.ini templates still get a .coe written up front.
+        as_overlay = monster_catalog().get(re.sub(r"\s+", "", mon_name).lower()) is not None
+
         names, scores = _parse_combatants(cfg, chan_id)
         join_seq = cfg.getint(chan_id, "join_seq", fallback=0)
 
@@ -8068,112 +8321,28 @@ class Initiative(commands.Cog):
 
             hp = _roll_hp_from_hd(hd_val, hpmod)
 
-            coe = configparser.ConfigParser()
-            coe.optionxform = str
-            coe["version"] = {"current": "08082018"}
-
             owner_id_val = str(dm_id)
             if owner_id_override:
                 owner_id_val = str(owner_id_override)
 
-            coe["info"] = {
-                "race": "Monster", "class": "Monster", "sex": "",
-                "name": mon, "owner_id": owner_id_val,
-                "monster_type": mon_name, "battle_chan": chan_id,
+            fields = {
+                "type": mon_name,
+                "owner": owner_id_val,
+                "hp": str(1 if spawn_at_1hp else hp),
+                "maxhp": str(hp),
+                "hd": str(hd_val),
+                "saves": " ".join(f"{k}={v}" for k, v in saves_out.items()),
             }
             if skills_str:
-                coe["info"]["skills"] = skills_str
+                fields["skills"] = skills_str
             if controller_name:
                 # Mark who is actually controlling this monster (e.g., Lok)
-                coe["info"]["controller"] = controller_name
-
-            coe["max"] = {"hp": str(hp)}
-            coe["cur"] = {
-                "hp": str(1 if spawn_at_1hp else hp),
-                "level": str(max(1, int(hd_val))),
-                "xp": "0", "gp": "0", "pp": "0", "ep": "0", "sp": "0", "turn": ""
-            }
-
-            stats = {
-                "ac": str(ac),
-                "ab": "",
-                "move": str(move),
-                "type": str(tpl.get("type", "")).strip(),
-                "resist": resist,
-                "reduce1": reduce1,
-                "immune": immune,
-                "hd": str(hd_val),
-            }
+                fields["controller"] = controller_name
 
-            attacknames_raw = str(tpl.get("attacknames", "")).strip().lower()
-            atk_pref_list = sorted(k[4:] for k in tpl.keys() if k.lower().startswith("atk_"))
-            attack_list = [a for a in re.split(r"\s+", attacknames_raw) if a] if attacknames_raw else atk_pref_list
-            if attack_list:
-                stats["attacknames"] = " ".join(attack_list)
-                first_spec = None
-                for an in attack_list:
-                    spec = (str(tpl.get(f"atk_{an}") or tpl.get(an) or
-                                tpl.get(f"dmg_{an}") or tpl.get(f"{an}_dmg") or "")).strip()
-                    if spec:
-                        stats[f"atk_{an}"] = spec
-                        if first_spec is None:
-                            first_spec = spec
-                    for key in (f"effect_{an}", f"{an}_effect", f"type_{an}"):
-                        v = str(tpl.get(key, "")).strip()
-                        if v:
-                            stats[key] = v
-                stats["damage"] = first_spec or damage or "1d6"
+            if as_overlay:
+                add_instance(cfg, chan_id, mon, fields)
             else:
-                stats["damage"] = damage or "1d6"
-
-            coe["stats"] = stats
-            coe["base"]  = dict(stats)
-            coe["saves"] = saves_out
-            coe["thief_mods"] = {}
-            coe["banned_weapons"] = {"list": ""}
-            coe["skills"] = {"list": skills_str}
-
-            def _alias_key(s: str) -> str:
-                return "".join(ch.lower() for ch in str(s) if ch.isalnum())
-
-            spells_line = str(tpl.get("spells", "")).strip()
-            if spells_line:
-                mon_magic = {}
-                mon_left  = {}
-                listed = []
-
-                for tok in re.split(r"\s+", spells_line):
-                    if not tok:
-                        continue
-                    key = _alias_key(tok)
-
-                    raw_ct = (tpl.get(tok, None) or
-                              tpl.get(tok.lower(), None) or
-                              tpl.get(key, None))
-                    try:
-                        count_tok = int(str(raw_ct).strip()) if raw_ct is not None else 1
-                    except Exception:
-                        count_tok = 1
-
-                    listed.append(key)
-                    mon_magic[f"{key}_total"] = str(max(0, count_tok))
-                    mon_left[f"{key}_left"]   = str(max(0, count_tok))
-
-                cl_raw = tpl.get("casterlevel", None) or tpl.get("cl", None)
-                try:
-                    caster_level = int(str(cl_raw).strip()) if cl_raw is not None else int(hd_val)
-                except Exception:
-                    caster_level = int(hd_val)
-
-                mon_magic["list"] = " ".join(listed)
-                mon_magic["caster_level"] = str(caster_level)
-                mon_magic["source"] = str(tpl.get("name", mon_name)).strip() or mon_name
-
-                coe["mon_spells"] = mon_magic
-                coe["mon_left"]   = mon_left
-
-            with open(f"{mon}.coe", "w", encoding="utf-8") as f:
-                coe.write(f)
+                await awrite_cfg(f"{mon}.coe", build_monster_coe(tpl, mon, dict(fields, chan=chan_id)))
 
             d6 = random.randint(1, 6)
             ini_total = d6 + init_bonus
@@ -8815,7 +8984,7 @@ class Initiative(commands.Cog):
         for raw in names:
             disp, path = _resolve_char_ci_local(raw)
             pretty = disp or raw
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 lines.append(f"{pretty}: *(not found)*")
                 continue
 
@@ -8916,7 +9085,7 @@ class Initiative(commands.Cog):
             remaining combatant in initiative order (round number unchanged).
           - -delete / -d will delete .coe files only for Monsters.
         """
-        import re, os
+        import re
 
         cfg = _load_battles()
         chan_id = _section_id(ctx.channel)
@@ -9014,13 +9183,13 @@ class Initiative(commands.Cog):
 
             if want_delete:
                 disp, path = _resolve_char_ci_local(key)
-                if path and os.path.exists(path):
+                if path and coe_exists(path):
                     try:
                         pcfg = read_cfg(path)
                         cls = (get_compat(pcfg, "info", "class", fallback="") or "").strip().lower()
                         if cls == "monster":
                             try:
-                                os.remove(os.path.abspath(path))
+                                remove_cfg(path)
                                 deleted_files.append(disp or key)
                             except Exception:
                                 pass
@@ -9116,7 +9285,7 @@ class Initiative(commands.Cog):
             return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(coe)
@@ -9157,7 +9326,7 @@ class Initiative(commands.Cog):
         prev_disp   = bcfg.get(chan_id,  f"{slot_me}.magwep_disp", fallback="")
         prev_name   = bcfg.get(chan_id,  f"{slot_me}.magwep_name", fallback="")
 
-        bcfg.set(chan_id, f"{slot_me}.magwep", "60")
+        _set_timer(bcfg, chan_id, slot_me, "magwep", "60")
         bcfg.set(chan_id, f"{slot_me}.magwep_name", key)
         bcfg.set(chan_id, f"{slot_me}.magwep_disp", equipped_norm[key])
         _save_battles(bcfg)
@@ -9192,8 +9361,7 @@ class Initiative(commands.Cog):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -9229,7 +9397,7 @@ class Initiative(commands.Cog):
             return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(coe)
@@ -9407,8 +9575,7 @@ class Initiative(commands.Cog):
                 msg_id = bcfg2.getint(_section_id(ctx.channel), "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg2, _section_id(ctx.channel))
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -9420,7 +9587,6 @@ class Initiative(commands.Cog):
         Applies queued BLIND after PARALYZED ends.
         GM-only. Do NOT use during combat round-wraps (that's already accounted for).
         """
-        import os
         import random
         import nextcord
 
@@ -9455,61 +9621,17 @@ class Initiative(commands.Cog):
         except Exception:
             gi_on = False
 
-        EFFECTS = [
-            ("magwep",    "Magic Weapon",      ("magwep_name","magwep_disp"), "🕯️"),
-            ("ghh",       "Ghoulish Hands",    (),                             "🧟‍♂️"),
-            ("shield",    "Shield",            (),                             "🛡️"),
-            ("magearmor", "Mage Armor",        ("magearmor_by",),              "🧱"),
-            ("boneskin",  "Boneskin",          ("boneskin_by",),               "🦴"),
-            ("sph",       "Spiritual Hammer",  ("sph_bonus",),                 "🔨"),
-            ("shl",       "Shillelagh",        ("shl_hit","shl_dmg","shl_die"),"🪵"),
-            ("light",     "Light",             ("light_by","light_level"),     "🌟"),
-            ("darkness",  "Darkness",          ("dark_by","dark_level"),       "🌑"),
-            ("blind",     "Blind",             ("blind_src","blind_by","blind_level"), "🙈"),
-            ("paralyzed", "Unconscious/Paralyzed", (),                         "😴"),
-            ("cc",        "Color Cloud",       ("cc_by","cc_level"),           "🌫️"),
-            ("ck",        "Cloudkill",         ("ck_by","ck_level"),           "☣️"),
-            ("hyp",       "Hypnotic Pattern",  ("hyp_by",),                    "🌀"),
-            ("cl",        "Call Lightning",    ("cl_by","cl_die","cl_bolts","cl_last_round"), "⚡"),
-            ("cn",        "Confusion",         ("cn_by","cn_last","cn_tar","cn_tar_by"),      "😵‍💫"),
-            ("db",        "Drainblade",        ("db_by",),                     "🩸"),
-            ("inw",       "Immunity to Normal Weapons", ("inw_by",),           "💎"),
-            ("pnm",       "Protection from Normal Missiles", ("pnm_by",),      "🚀"),
-            ("fear",      "Fear",              ("fear_by","fear_src"),         "😱"),
-            ("inv",       "Invisibility",      ("inv_by",),                    "🫥"),
-            ("mi",        "Mirror Image",      ("mi_images","mi_by"),          "🪞"),
-            ("gas",       "Gaseous Form",      ("gas_by","gas_ac_hint"),       "☁️"),
-            ("ps",        "Polymorph (Self)",  ("ps_form","ps_by"),            "🦎"),
-            ("stone",     "Stoneskin",         ("stone_by"),                   "🪨"),
-            ("swd", "Sword",           (),              "🗡️"),
-            ("sc", "Stinking Cloud", ("sc_by","sc_level"), "🤢"),
-            ("chl", "Chill (follow-up)", ("chl_charges",), "🥶"),
-            ("cr", "Chill Ray", (), "❄️"),
-            ("gcr", "Greater Chill Ray", (), "🧊"),
-            ("stench", "Stench", (), "🤢"),
-        ]
-        EFFECT_KEYS = {k for (k, _, _, _) in EFFECTS}
+        EFFECTS = _TIMED_EFFECTS
         PERM_FLAG = {"light": "light_perm", "darkness": "darkness_perm", "blind": "blind_perm"}
 
-        slots_to_tick = set()
         slot_label = {}
 
-        for opt_key, _val in cfg.items(chan_id):
-            if "." not in opt_key:
-                continue
-            s, tail = opt_key.split(".", 1)
-            if tail in EFFECT_KEYS or tail.startswith("x_"):
-                slots_to_tick.add(s)
+        def _show(s):
+            if s not in slot_label:
+                slot_label[s] = cfg.get(chan_id, f"{s}.disp", fallback=s.replace("_", " "))
+            return slot_label[s]
 
         names, _scores = _parse_combatants(cfg, chan_id)
-        for nm in names:
-            try:
-                slots_to_tick.add(_slot(nm))
-            except Exception:
-                slots_to_tick.add(nm.replace(" ", "_"))
-
-        for s in slots_to_tick:
-            slot_label[s] = cfg.get(chan_id, f"{s}.disp", fallback=s.replace("_", " "))
 
         expired_by_label: dict[str, set[str]] = {}
         changed = False
@@ -9518,102 +9640,183 @@ class Initiative(commands.Cog):
         cfg.set(chan_id, "expl_clock", str(expl_clock))
         cfg.set(chan_id, "etime_rounds", str(expl_clock))
 
+        # Timers live on the channel's game clock; the turns only pop what runs
+        # out, in the order a per-turn sweep would (slots in name order, EFFECTS
+        # in list order, then x_* effects).
+        _sync_clock(cfg, chan_id)
+        clock = _effect_clock(cfg, chan_id)
+        queue = clock.queue
+        start, end = clock.now, clock.now + TOTAL_ROUNDS
+
         # Keep the main 'round' counter aligned with exploration time
         _inc_cfg_int(cfg, chan_id, "round", TOTAL_ROUNDS)
         changed = True
 
-        for _ in range(turns):
-            for s in sorted(slots_to_tick):
-                show = slot_label.get(s, s.replace("_", " "))
-                par_ended_now = False
-
-                for base_key, pretty, extra_suffixes, emoji in EFFECTS:
-                    opt = f"{s}.{base_key}"
-                    left = cfg.getint(chan_id, opt, fallback=0)
-                    if left <= 0:
-                        continue
-
-                    perm = PERM_FLAG.get(base_key)
-                    if perm and cfg.getint(chan_id, f"{s}.{perm}", fallback=0) > 0:
-                        continue
+        EFFECT_ORDER = {k: i for i, (k, _, _, _) in enumerate(EFFECTS)}
+        EFFECT_INFO = {k: (pretty, extra, emoji) for (k, pretty, extra, emoji) in EFFECTS}
+        PAR_END = len(EFFECTS)
 
-                    new_left = max(0, left - ROUNDS_PER_TURN)
-                    if new_left != left:
-                        cfg.set(chan_id, opt, str(new_left))
-                        changed = True
+        def _pos(s, key):
+            return (0, s, EFFECT_ORDER[key]) if key in EFFECT_ORDER else (1, s, 0)
 
-                    if base_key == "paralyzed" and left > 0 and new_left == 0:
-                        par_ended_now = True
+        def _step(exp):
+            # exploration turn whose sweep takes a timer running out on round `exp` to 0
+            return max(1, -(-(exp - start) // ROUNDS_PER_TURN))
 
-                    if new_left == 0:
-                        for suf in extra_suffixes:
-                            eopt = f"{s}.{suf}"
-                            if cfg.has_option(chan_id, eopt):
-                                cfg.remove_option(chan_id, eopt)
-                        expired_by_label.setdefault(show, set()).add(f"{emoji} {pretty}")
+        def _counter(s, base_key):
+            # rounds left on a counter the sweep ticks, else None
+            perm = PERM_FLAG.get(base_key)
+            if perm and cfg.getint(chan_id, f"{s}.{perm}", fallback=0) > 0:
+                return None
+            try:
+                left = int((cfg.get(chan_id, f"{s}.{base_key}", fallback="0") or "0").strip())
+            except ValueError:
+                return None
+            return left if left > 0 else None
 
-                    if base_key == "blind" and left > 0 and new_left == 0:
-                        applied, note_cnf = _apply_queued_confusion_after_blind(cfg, chan_id, slot_label.get(s, s.replace("_", " ")))
-                        if applied > 0:
-                            changed = True
-                            expired_by_label.setdefault(slot_label.get(s, s.replace("_"," ")), set()).add(
-                                f"😵‍💫 Confusion {applied} (from Scintillating Pattern)"
-                            )
+        due = []       # (step, pos, key) popped for this advance
+        due_at = {}    # key -> (step, pos, expires_at) of its live `due` entry
 
-                if par_ended_now:
+        def _pull():
+            while True:
+                ev = queue.pop(end)
+                if ev is None:
+                    return
+                exp, s, base_key = ev
+                key = (s, base_key)
+                due_at[key] = (_step(exp), _pos(s, base_key), exp)
+                heapq.heappush(due, (*due_at[key][:2], key))
+
+        def _expires(key):
+            exp = queue.expires_at(*key)
+            if exp is None and key in due_at:
+                exp = due_at[key][2]
+            return exp
+
+        def _sync(key, step, at_pos):
+            # Write a queued counter as a sweep would have left it at `at_pos`.
+            exp = _expires(key)
+            if exp is not None:
+                done = step if _pos(*key) < at_pos else step - 1
+                cfg.set(chan_id, f"{key[0]}.{key[1]}", str(max(0, exp - start - ROUNDS_PER_TURN * done)))
+
+        def _requeue(key, step, at_pos):
+            # A chained effect rewrote `key`; keep counting from its new value.
+            due_at.pop(key, None)
+            left = _counter(*key)
+            if left is None:
+                queue.cancel(*key)
+                return
+            done = step if _pos(*key) < at_pos else step - 1
+            queue.register(key[0], key[1], start + ROUNDS_PER_TURN * done + left)
+
+        clock.busy = True
+        try:
+            # The section holds the counters: re-time entries it disagrees with.
+            venom_slots = []
+            for s, base_key in queue.keys():
+                if base_key == "x_slowvenom":
+                    queue.cancel(s, base_key)   # ticks with its saves below
+                    if (_counter(s, base_key) or 0) > 0:
+                        venom_slots.append(s)
+                    continue
+                left = _counter(s, base_key)
+                if left is None:
+                    queue.cancel(s, base_key)
+                elif queue.expires_at(s, base_key) != start + left:
+                    queue.register(s, base_key, start + left)
+            venom_slots.sort()
+
+            while True:
+                _pull()
+                if not due:
+                    break
+                step, at, (s, base_key) = heapq.heappop(due)
+                if due_at.get((s, base_key), (None, None))[:2] != (step, at):
+                    continue    # requeued since it was popped
+                del due_at[(s, base_key)]
+                show = _show(s)
+
+                if base_key == "~par_end":
+                    at_pos = (0, s, PAR_END)
+                    _sync((s, "blind"), step, at_pos)
                     applied, src, _by = _apply_queued_blind_after_paralysis(cfg, chan_id, s)
                     if applied > 0:
-                        changed = True
+                        _requeue((s, "blind"), step, at_pos)
                         label_src = "Color Cloud" if src == "colorcloud" else "Color Spray"
                         expired_by_label.setdefault(show, set()).add(f"🙈 Blind {applied} (from {label_src})")
+                    continue
 
-            # tick custom x_ effects
-            for s in sorted(slots_to_tick):
-                show = slot_label.get(s, s.replace("_", " "))
-                for opt_key, _val in list(cfg.items(chan_id)):
-                    if not opt_key.startswith(f"{s}.x_"):
-                        continue
-
-                    base_key = opt_key.split(".", 1)[1]
-
-                    if any(base_key.endswith(suf) for suf in (
-                        "_label", "_emoji", "_code", "_by", "_dice", "_die", "_src", "_level", "_name"
-                    )):
-                        continue
-
-                    val = (cfg.get(chan_id, opt_key, fallback="0") or "0").strip()
-                    try:
-                        left = int(val)
-                    except ValueError:
-                        continue
-
-                    if left < 0 or left <= 0:
-                        continue
+                cfg.set(chan_id, f"{s}.{base_key}", "0")
+
+                if base_key in EFFECT_INFO:
+                    pretty, extra_suffixes, emoji = EFFECT_INFO[base_key]
+                    for suf in extra_suffixes:
+                        eopt = f"{s}.{suf}"
+                        if cfg.has_option(chan_id, eopt):
+                            cfg.remove_option(chan_id, eopt)
+                    expired_by_label.setdefault(show, set()).add(f"{emoji} {pretty}")
+
+                    if base_key == "paralyzed":
+                        # queued blind lands after the rest of this slot's effects tick
+                        due_at[(s, "~par_end")] = (step, (0, s, PAR_END), None)
+                        heapq.heappush(due, (step, (0, s, PAR_END), (s, "~par_end")))
+
+                    if base_key == "blind":
+                        at_pos = _pos(s, "blind")
+                        c_slot = _choose_slot_for_effects(cfg, chan_id, show)
+                        _sync((c_slot, "blind"), step, at_pos)
+                        _sync((c_slot, "cn"), step, at_pos)
+                        applied, note_cnf = _apply_queued_confusion_after_blind(cfg, chan_id, show)
+                        if applied > 0:
+                            _requeue((c_slot, "cn"), step, at_pos)
+                            expired_by_label.setdefault(show, set()).add(
+                                f"😵‍💫 Confusion {applied} (from Scintillating Pattern)"
+                            )
+                    continue
 
-                    new_left = max(0, left - ROUNDS_PER_TURN)
-                    if new_left != left:
-                        cfg.set(chan_id, opt_key, str(new_left))
-                        changed = True
+                label = cfg.get(chan_id, f"{s}.{base_key}_label", fallback=base_key[2:].capitalize())
+                emoji = cfg.get(chan_id, f"{s}.{base_key}_emoji", fallback="⏱️")
+                for suf in ("_label","_emoji","_code","_by"):
+                    mkey = f"{s}.{base_key}{suf}"
+                    if cfg.has_option(chan_id, mkey):
+                        cfg.remove_option(chan_id, mkey)
+                expired_by_label.setdefault(show, set()).add(f"{emoji} {label}")
+
+            clock.now = end
+            for s, base_key in queue.keys():
+                cfg.set(chan_id, f"{s}.{base_key}", str(clock.left(s, base_key)))
+        finally:
+            clock.busy = False
 
-                    if new_left == 0:
-                        label = cfg.get(chan_id, f"{s}.{base_key}_label", fallback=base_key[2:].capitalize())
-                        emoji = cfg.get(chan_id, f"{s}.{base_key}_emoji", fallback="⏱️")
-                        for suf in ("_label","_emoji","_code","_by"):
-                            mkey = f"{s}.{base_key}{suf}"
-                            if cfg.has_option(chan_id, mkey):
-                                cfg.remove_option(chan_id, mkey)
-                        expired_by_label.setdefault(show, set()).add(f"{emoji} {label}")
+        for _ in range(turns):
+            # x_slowvenom counts down like any x_* effect, then rolls its save
+            for s in venom_slots:
+                left = cfg.getint(chan_id, f"{s}.x_slowvenom", fallback=0)
+                if left <= 0:
+                    continue
+                new_left = max(0, left - ROUNDS_PER_TURN)
+                cfg.set(chan_id, f"{s}.x_slowvenom", str(new_left))
+                if new_left == 0:
+                    show = _show(s)
+                    label = cfg.get(chan_id, f"{s}.x_slowvenom_label", fallback="Slowvenom")
+                    emoji = cfg.get(chan_id, f"{s}.x_slowvenom_emoji", fallback="⏱️")
+                    for suf in ("_label","_emoji","_code","_by"):
+                        mkey = f"{s}.x_slowvenom{suf}"
+                        if cfg.has_option(chan_id, mkey):
+                            cfg.remove_option(chan_id, mkey)
+                    expired_by_label.setdefault(show, set()).add(f"{emoji} {label}")
 
             # slow venom (special)
-            for s in sorted(slots_to_tick):
+            for s in venom_slots:
                 left_r = cfg.getint(chan_id, f"{s}.x_slowvenom", fallback=0)
                 if left_r <= 0:
                     continue
 
-                show = slot_label.get(s, s.replace("_", " "))
+                show = _show(s)
                 die  = (cfg.get(chan_id, f"{s}.x_slowvenom_dice", fallback="1d6") or "1d6").strip()
                 _, path = _resolve_char_ci_local(show)
-                if not path or not os.path.exists(path):
+                if not path or not coe_exists(path):
                     await ctx.send(f"🧪 {show}: slow venom tick but no character file was found.")
                     continue
 
@@ -9711,12 +9914,15 @@ class Initiative(commands.Cog):
                             _write_combatants(cfg, chan_id, names2, scores2)
                             _save_battles(cfg)
                         try:
-                            os.remove(os.path.abspath(path))
+                            remove_cfg(path)
                         except Exception:
                             pass
                     except Exception:
                         pass
 
+        for s in venom_slots:
+            clock.register(s, "x_slowvenom", cfg.getint(chan_id, f"{s}.x_slowvenom", fallback=0))
+
         if changed:
             _save_battles(cfg)
 
@@ -9854,7 +10060,7 @@ class Initiative(commands.Cog):
             legacy = cfg.getint(chan_id, f"{s}.cnf", fallback=0)
             if legacy > 0:
                 left = legacy
-                cfg.set(chan_id, f"{s}.cn", str(legacy))
+                _set_timer(cfg, chan_id, s, "cn", str(legacy))
                 cfg.remove_option(chan_id, f"{s}.cnf")
                 _save_battles(cfg)
 
@@ -9869,7 +10075,7 @@ class Initiative(commands.Cog):
             return (False, None)
 
         if is_perm and left <= 0:
-            cfg.set(chan_id, f"{s}.cn", "1")
+            _set_timer(cfg, chan_id, s, "cn", "1")
             _save_battles(cfg)
             left = 1
 
@@ -9879,7 +10085,7 @@ class Initiative(commands.Cog):
                 cfg.remove_option(chan_id, f"{s}.cn")
                 if cfg.has_option(chan_id, f"{s}.cn_by"): cfg.remove_option(chan_id, f"{s}.cn_by")
             else:
-                cfg.set(chan_id, f"{s}.cn", str(left))
+                _set_timer(cfg, chan_id, s, "cn", str(left))
 
         ret_by = (cfg.get(chan_id, f"{s}.cn_retaliate_by", fallback="") or "").strip()
         ret_rd = cfg.getint(chan_id, f"{s}.cn_retaliate_round", fallback=-1)
@@ -10447,7 +10653,7 @@ class Initiative(commands.Cog):
         lines = []
         for name in names:
             disp, path = _resolve_char_ci_local(name)
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 continue
             cfg = read_cfg(path)
             if getint_compat(cfg, "cur", "disease", fallback=0) <= 0:
@@ -10597,7 +10803,7 @@ class Initiative(commands.Cog):
           !track torch 1h
           !track detectinvisible 600
         """
-        import re, os
+        import re
 
         if not expr or not expr.strip():
             await ctx.send("Usage: `!track <name> [target] <dur>` — e.g., `!track detectinvisible go1 1t/lvl` or `!track torch 1h`")
@@ -10647,7 +10853,7 @@ class Initiative(commands.Cog):
             return
 
         char_path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(char_path):
+        if not coe_exists(char_path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         ccfg = read_cfg(char_path)
@@ -10702,11 +10908,8 @@ class Initiative(commands.Cog):
             "detectmagic": "🔍",
         }.get(tag, "⏱️")
 
-        bcfg.set(chan_id, f"{slot}.x_{tag}", str(rounds))
-        bcfg.set(chan_id, f"{slot}.x_{tag}_label", label)
-        bcfg.set(chan_id, f"{slot}.x_{tag}_code", code)
-        bcfg.set(chan_id, f"{slot}.x_{tag}_emoji", default_emoji)
-        bcfg.set(chan_id, f"{slot}.x_{tag}_by", char_name)
+        _set_x_effect(bcfg, chan_id, slot, tag, rounds,
+                      label=label, code=code, emoji=default_emoji, by=char_name)
         _save_battles(bcfg)
 
         try:
@@ -11514,7 +11717,7 @@ class Initiative(commands.Cog):
                     disp, path = _resolve_char_ci(nm)
                 except Exception:
                     path = None
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 continue
 
             pcfg = read_cfg(path)
@@ -11683,7 +11886,7 @@ class Initiative(commands.Cog):
             except Exception:
                 path = f"{char_disp.replace(' ', '_')}.coe"
 
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found: `{path}`")
             return
 
@@ -1,4 +1,4 @@
-import os, re, json
+import os, re
 import datetime
 import random
 try:
@@ -12,6 +12,8 @@ from pathlib import Path
 import nextcord
 from nextcord.ext import commands
 from utils.players import (
+    registry,
+    put_entry,
     list_chars,
     set_active,
     link_existing,
@@ -78,20 +80,9 @@ def _ensure_parent_dir(p: Path):
     p.parent.mkdir(parents=True, exist_ok=True)
     
 def _load_players_registry() -> dict:
-    try:
-        with open(PLAYERS_JSON, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
-
-def _atomic_write_json(path: str, data: dict):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    os.replace(tmp, path)
+    # A copy of the in-memory registry; write changes back with put_entry()
+    # so they go through its write-behind instead of racing it on disk.
+    return registry()
 
 
 def _norm_token(s: str) -> str:
@@ -539,7 +530,7 @@ class Players(commands.Cog):
         reg[owner_id] = entry
 
         try:
-            _atomic_write_json(PLAYERS_JSON, reg)
+            put_entry(owner_id, entry)
         except Exception as e:
             await ctx.send(f"❌ Deleted file(s) but failed to update registry: {type(e).__name__}: {e}")
             return
@@ -620,8 +611,7 @@ class Players(commands.Cog):
         reg = _load_players_registry()
         entry = reg.get(str(ctx.author.id), {})
         entry["birthday_md"] = md
-        reg[str(ctx.author.id)] = entry
-        _atomic_write_json(PLAYERS_JSON, reg)
+        put_entry(ctx.author.id, entry)
         await ctx.send(f"✅ Birthday set to **{md}**. I’ll DM you a reminder on the day.")
 
     @bday.command(name="clear")
@@ -629,8 +619,7 @@ class Players(commands.Cog):
         reg = _load_players_registry()
         entry = reg.get(str(ctx.author.id), {})
         entry.pop("birthday_md", None)
-        reg[str(ctx.author.id)] = entry
-        _atomic_write_json(PLAYERS_JSON, reg)
+        put_entry(ctx.author.id, entry)
         await ctx.send("🧹 Cleared your birthday setting.")
 
     @bday.command(name="claim")
@@ -699,8 +688,7 @@ class Players(commands.Cog):
         write_cfg(path, cfg)
 
         entry["bday_last_claim_year"] = year
-        reg[str(ctx.author.id)] = entry
-        _atomic_write_json(PLAYERS_JSON, reg)
+        put_entry(ctx.author.id, entry)
 
         lines = [f"🎲 d100 → **{roll:02d}**", f"👤 **{char_name}**"]
         if gp:
@@ -1,31 +1,20 @@
-import os, json, re, datetime, random, configparser
-from pathlib import Path
+import re, datetime, random
 import nextcord
 from nextcord.ext import commands
 from decimal import Decimal, ROUND_HALF_UP
 from utils.ini import read_cfg, write_cfg, get_compat, getint_compat
 from utils.players import get_active
+from utils.names import coe_exists
+from utils.static_data import static_cfg, class_xp_table, on_static_reload
+from utils import xp_ledger
+from utils.storage import run_io
 
-DATA_DIR = Path("data/xp")
-DATA_DIR.mkdir(parents=True, exist_ok=True)
+xp_ledger.DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 
 def _load_class_xp(path: str = "class.lst"):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-    xp_cache = {}
-    for section in cfg.sections():
-        table = {}
-        for k, v in cfg.items(section):
-            m = re.fullmatch(r"xp(\d+)", k, flags=re.I)
-            if m and v.strip().lstrip("-").isdigit():
-                lvl = int(m.group(1))
-                table[lvl] = int(v.strip())
-        if table:
-            xp_cache[section] = dict(sorted(table.items())) 
-    return xp_cache
+    return class_xp_table(path)
 
 _CLASS_XP = _load_class_xp()
 
@@ -47,25 +36,10 @@ def _max_level_for_xp(char_class: str, xp_total: int) -> int:
             break
     return level
 
-def _xp_log_path(char_name: str) -> Path:
-    slug = char_name.replace(" ", "_")
-    return DATA_DIR / f"{slug}.json"
-
-def _read_xp_log(char_name: str) -> list[dict]:
-    p = _xp_log_path(char_name)
-    if not p.exists():
-        return []
-    try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        return []
-
 def _append_xp_log(char_name: str, *, when: datetime.datetime, amount: int,
                    who_id: int, reason: str, before_xp: int, after_xp: int,
                    before_lvl: int, after_lvl: int):
-    p = _xp_log_path(char_name)
-    log = _read_xp_log(char_name)
-    log.append({
+    xp_ledger.append(char_name, {
         "ts": when.isoformat(timespec="seconds") + "Z",
         "amount": amount,
         "by": str(who_id),
@@ -75,13 +49,24 @@ def _append_xp_log(char_name: str, *, when: datetime.datetime, amount: int,
         "before_lvl": before_lvl,
         "after_lvl": after_lvl,
     })
-    p.write_text(json.dumps(log, indent=2), encoding="utf-8")
+
+XP_PAGE = 10
 
 
 
 class ProgressionCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        on_static_reload("progression", self._on_static_reload)
+
+    def _on_static_reload(self, changed):
+        """Rebind the XP and class/race tables after utils.static_data reloaded a file."""
+        global _CLASS_XP
+        _CLASS_XP = _load_class_xp()
+        if hasattr(self, "_class_cp"):
+            self._class_cp = static_cfg("class.lst")
+        if hasattr(self, "_race_cp"):
+            self._race_cp = static_cfg("race.lst")
 
     
     def _get_char_race_class(self, cfg):
@@ -204,9 +189,7 @@ class ProgressionCog(commands.Cog):
             if hasattr(self, "_race_cp"):
                 rp = self._race_cp
             else:
-                rp = configparser.ConfigParser()
-                rp.optionxform = str
-                rp.read("race.lst")
+                rp = static_cfg("race.lst")
                 self._race_cp = rp
 
             sec = None
@@ -237,9 +220,7 @@ class ProgressionCog(commands.Cog):
 
     def _ensure_class_cp(self):
         if not hasattr(self, "_class_cp"):
-            cp = configparser.ConfigParser()
-            cp.optionxform = str
-            cp.read("class.lst")
+            cp = static_cfg("class.lst")
             self._class_cp = cp
         return self._class_cp
 
@@ -365,9 +346,14 @@ class ProgressionCog(commands.Cog):
           • !xp               -> show summary + recent log
           • !xp +350 Goblin camp   -> add 350 XP (racial/human bonus applies)
           • !xp -200 Cursed drain  -> subtract 200 XP (NO racial/human bonus)
+          • !xp log 2              -> older XP events, 10 per page
         """
         s = (arg or "").strip()
+        page = 1
         if s:
+            m = re.match(r"^(?:log|history)(?:\s+(\d+))?$", s, re.I)
+            if m:
+                page = max(1, int(m.group(1) or 1))
             m = re.match(r"^([+-])\s*(\d+)(?:\s+(.*))?$", s)
             if m:
                 sign, num, rsn = m.group(1), int(m.group(2)), (m.group(3) or "").strip()
@@ -383,7 +369,7 @@ class ProgressionCog(commands.Cog):
             return
 
         file_name = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(file_name):
+        if not coe_exists(file_name):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -410,18 +396,22 @@ class ProgressionCog(commands.Cog):
         else:
             embed.add_field(name="Next Level At", value="(max table reached)", inline=True)
 
-        log = _read_xp_log(char_name)
+        log = xp_ledger.tail(char_name, XP_PAGE, skip=(page - 1) * XP_PAGE)
+        summ = xp_ledger.summary(char_name)
         if log:
-            last = log[-10:]
             lines = []
-            for e in reversed(last):
+            for e in log:
                 ts   = e.get("ts", "?").replace("T", " ")
                 amt  = e.get("amount", 0)
                 rsn  = e.get("reason", "")
                 lines.append(f"{ts} • {amt:+} XP" + (f" • {rsn}" if rsn else ""))
-            embed.add_field(name="Recent XP Events", value="\n".join(lines), inline=False)
+            pages = max(1, -(-summ.get("lines", 0) // XP_PAGE))
+            title = "Recent XP Events" if page == 1 else f"XP Events (page {page}/{pages})"
+            embed.add_field(name=title, value="\n".join(lines), inline=False)
+            if pages > page:
+                embed.set_footer(text=f"{summ.get('entries', 0)} events logged • !xp log {page + 1} for older")
         else:
-            embed.add_field(name="Recent XP Events", value="(no entries yet)", inline=False)
+            embed.add_field(name="Recent XP Events", value="(no entries yet)" if page == 1 else f"(no page {page})", inline=False)
 
         await ctx.send(embed=embed)
 
@@ -440,7 +430,7 @@ class ProgressionCog(commands.Cog):
             return
 
         file_name = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(file_name):
+        if not coe_exists(file_name):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -537,6 +527,32 @@ class ProgressionCog(commands.Cog):
         """Add XP to your ACTIVE character (no auto-level)."""
         await self._apply_xp_delta(ctx, amount, reason=reason, apply_racial_bonus=True)
 
+    @commands.command(name="xpcompact")
+    @commands.has_permissions(manage_guild=True)
+    async def xpcompact(self, ctx, *, char_name: str = ""):
+        """
+        Fold old XP log entries into one carry-forward line, keeping the newest
+        ones (totals are unchanged). `!xpcompact all` does every character.
+        """
+        name = char_name.strip() or get_active(ctx.author.id)
+        if not name:
+            await ctx.send("❌ Usage: `!xpcompact <character>` or `!xpcompact all`.")
+            return
+        names = xp_ledger.characters() if name.lower() == "all" else [name]
+
+        def _run():
+            return {n: xp_ledger.compact(n) for n in names}
+
+        folded = await run_io(_run)
+        done = {n: k for n, k in folded.items() if k}
+        if not done:
+            await ctx.send(f"Nothing to compact (each log keeps its newest {xp_ledger.COMPACT_KEEP} entries).")
+            return
+        lines = [f"• {n.replace('_', ' ')}: {k} entries folded" for n, k in sorted(done.items())[:20]]
+        if len(done) > 20:
+            lines.append(f"… and {len(done) - 20} more")
+        await ctx.send("🗜️ Compacted XP logs:\n" + "\n".join(lines))
+
 def setup(bot):
     bot.add_cog(ProgressionCog(bot))
 
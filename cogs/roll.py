@@ -2,29 +2,23 @@ import os
 import random
 from nextcord.ext import commands
 from utils.players import get_active
+from utils.monsters import monster_catalog
+from utils.names import coe_exists
+from utils.static_data import static_cfg, derived
 import nextcord
 import re
 import configparser
 
+def _lower_key_sections(config):
+    # Same shape a default (key-lowercasing) ConfigParser would give.
+    return {section: {key.lower(): value for key, value in config.items(section)}
+            for section in config.sections()}
+
 def load_class_list(filename):
-    config = configparser.ConfigParser()
-    config.read(filename)
-    result = {}
-    for section in config.sections():
-        result[section] = {}
-        for key in config[section]:
-            result[section][key] = config[section][key]
-    return result
+    return derived(filename, "lower_keys", _lower_key_sections)
 
 def load_race_list(filename):
-    config = configparser.ConfigParser()
-    config.read(filename)
-    result = {}
-    for section in config.sections():
-        result[section] = {}
-        for key in config[section]:
-            result[section][key] = config[section][key]
-    return result
+    return derived(filename, "lower_keys", _lower_key_sections)
 
 def read_cfg(filename):
     config = configparser.ConfigParser()
@@ -180,6 +174,9 @@ def _resolve_char_ci(name: str):
 
     target_key = norm(name)
 
+    tpl = monster_catalog().get(target_key) if target_key else None
+    if tpl is not None and norm(tpl.name) == target_key:
+        return tpl.name.replace("_", " "), os.path.abspath(tpl.path)
 
     def display_from_path(p: str):
         try:
@@ -243,6 +240,14 @@ def _resolve_char_ci(name: str):
     return None, None
 
 
+def _creature_cfg(path: str):
+    """Parsed creature file; monsters/ templates come from the preloaded catalog."""
+    tpl = monster_catalog().get(os.path.splitext(os.path.basename(path))[0])
+    if tpl is not None and os.path.abspath(tpl.path) == path:
+        return tpl.cfg
+    return read_cfg(path)
+
+
 def _read_appearing_from_cfg(cfg):
 
     for sec in ("base", "info", "stats"):
@@ -1406,7 +1411,7 @@ class Dice(commands.Cog):
                 return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -1420,9 +1425,7 @@ class Dice(commands.Cog):
         race       = (get_compat(config, "info", "race", fallback="") or "").strip()
         level      = max(1, int(getint_compat(config, "cur", "level", fallback=1)))
 
-        cp = configparser.ConfigParser()
-        cp.optionxform = str
-        cp.read("class.lst")
+        cp = static_cfg("class.lst")
 
         class_sec = None
         for sec in cp.sections():
@@ -1453,9 +1456,7 @@ class Dice(commands.Cog):
 
         race_bonus = 0
         if race:
-            rp = configparser.ConfigParser()
-            rp.optionxform = str
-            rp.read("race.lst")
+            rp = static_cfg("race.lst")
             race_sec = None
             for sec in rp.sections():
                 if sec.lower() == race.lower():
@@ -1682,7 +1683,7 @@ class Dice(commands.Cog):
             race_lc = ""
             if char_name:
                 coe = f"{char_name.replace(' ', '_')}.coe"
-                if os.path.exists(coe):
+                if coe_exists(coe):
                     cfg = read_cfg(coe)
                     char_class_lc = (get_compat(cfg, "info", "class", fallback="") or "").strip().lower()
                     race_lc       = (get_compat(cfg, "info", "race",  fallback="") or "").strip().lower()
@@ -1792,7 +1793,7 @@ class Dice(commands.Cog):
                 return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -1884,7 +1885,7 @@ class Dice(commands.Cog):
             return
 
 
-        cp = configparser.ConfigParser(); cp.optionxform = str; cp.read("class.lst")
+        cp = static_cfg("class.lst")
 
         class_sec = None
         for sec in cp.sections():
@@ -1918,7 +1919,7 @@ class Dice(commands.Cog):
 
         bonus = 0
         if race:
-            rp = configparser.ConfigParser(); rp.optionxform = str; rp.read("race.lst")
+            rp = static_cfg("race.lst")
             race_sec = None
             for sec in rp.sections():
                 if sec.lower() == race.lower():
@@ -2084,7 +2085,7 @@ class Dice(commands.Cog):
                 return
 
         coe = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(coe):
+        if not coe_exists(coe):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -2209,7 +2210,7 @@ class Dice(commands.Cog):
             embed.description = "❌ Monster not found."
             await self._enc_send(ctx, embed=embed, public=public); return
 
-        cfg = read_cfg(path)
+        cfg = _creature_cfg(path)
         spec = _read_appearing_from_cfg(cfg) or "1"
         if str(spec).strip() == "0":
             embed.add_field(name="Appearing", value="0 → **Never appears randomly** (summoned/placed only).", inline=False)
@@ -2259,7 +2260,7 @@ class Dice(commands.Cog):
                     count_text = f"**1 {disp or chosen}**"
                     shown_monster = disp or chosen
                     break
-                cfg = read_cfg(path)
+                cfg = _creature_cfg(path)
                 spec = _read_appearing_from_cfg(cfg) or "1"
                 if str(spec).strip() == "0":
                     d12, r12, f12 = roll_dice("1d12")
@@ -2330,7 +2331,7 @@ class Dice(commands.Cog):
             embed.add_field(name="Result", value=f"👉 **1 {disp or picked}**", inline=False)
             await self._enc_send(ctx, embed=embed, public=public); return
 
-        cfg = read_cfg(path)
+        cfg = _creature_cfg(path)
         spec = _read_appearing_from_cfg(cfg) or "1"
         if str(spec).strip() == "0":
             embed.add_field(
@@ -2483,7 +2484,7 @@ class Dice(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(path)  
@@ -2595,7 +2596,7 @@ class Dice(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
         cfg = read_cfg(path)
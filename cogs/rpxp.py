@@ -1,4 +1,4 @@
-import json, os, re, time, datetime
+import asyncio, atexit, heapq, json, os, re, tempfile, threading, time, datetime
 import copy
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -7,8 +7,16 @@ import nextcord
 from nextcord.ext import commands
 from utils.ini import read_cfg, get_compat
 from utils.players import get_active
+from utils.storage import run_io
 
+# One JSON file per guild under DATA_DIR. A legacy single DATA_PATH file is
+# split into it on first load and renamed to rpxp.json.migrated.
 DATA_PATH = Path("data/rpxp.json")
+DATA_DIR = Path("data/rpxp")
+
+# Chat-driven changes are written at most this often (seconds), plus on
+# unload / exit. 0 writes on every change.
+FLUSH_S = float(os.getenv("SEER_RPXP_FLUSH_S", "5") or 0)
 
 def _iter_coe_files() -> list[Path]:
     paths: list[Path] = []
@@ -31,11 +39,55 @@ def _iter_coe_files() -> list[Path]:
 
 
 
-def _atomic_write_json(path: Path, data: dict):
+def _atomic_write_text(path: Path, text: str):
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    os.replace(tmp, path)
+    fd, tmp = tempfile.mkstemp(prefix="." + path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _guild_path(gid: str) -> Path:
+    return DATA_DIR / f"{gid}.json"
+
+
+# Settings added after guilds were first created; filled in by _g().
+_LATE_SETTINGS = {
+    "staff_window_sec": 172800,   # staff can approve / bonus a post for 2 days
+    "msg_state_max": 0,           # optional cap on tracked posts per guild (0 = no limit)
+}
+
+
+class _MsgWindow:
+    """
+    Expiry index over one guild's msg_state: a heap of (ts, message id), so
+    dropping posts past the staff window (or over the cap) pops only those.
+    """
+
+    def __init__(self, state: dict):
+        self.state = state
+        self.heap = [(int(v.get("ts", 0) or 0), k) for k, v in state.items()]
+        heapq.heapify(self.heap)
+
+    def add(self, msg_id: str, entry: dict):
+        self.state[msg_id] = entry
+        heapq.heappush(self.heap, (int(entry.get("ts", 0) or 0), msg_id))
+
+    def prune(self, before: int, cap: int):
+        """Drop entries older than `before`, then the oldest beyond `cap`."""
+        heap, state = self.heap, self.state
+        while heap and (heap[0][0] < before or len(state) > cap):
+            ts, k = heapq.heappop(heap)
+            e = state.get(k)
+            if e is not None and int(e.get("ts", 0) or 0) == ts:
+                del state[k]
 
 
 def _now_ts() -> int:
@@ -73,21 +125,115 @@ class RPXPCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        self._touched = set()   # guild ids handed out by _g() since the last flush
+        self._written = {}      # guild id -> JSON text last written
+        self._write_lock = threading.Lock()  # background and immediate flushes
+        self._dump_seq = 0
+        self._written_seq = {}  # guild id -> _dump_seq of the text on disk
+        self._task = None
+        self._legacy = False
+        self._msg_windows = {}  # id(guild dict) -> _MsgWindow
         self.data = self._load()
+        atexit.register(self._flush)
+
+    def cog_unload(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._flush()
 
     # ---------- storage ----------
     def _load(self) -> dict:
-        if DATA_PATH.exists():
+        guilds = {}
+        for p in sorted(DATA_DIR.glob("*.json")) if DATA_DIR.exists() else ():
+            try:
+                text = p.read_text(encoding="utf-8")
+                guilds[p.stem] = json.loads(text)
+                self._written[p.stem] = text
+            except Exception:
+                pass
+        if not guilds and DATA_PATH.exists():
             try:
-                return json.loads(DATA_PATH.read_text(encoding="utf-8"))
+                guilds = json.loads(DATA_PATH.read_text(encoding="utf-8")).get("guilds") or {}
+                self._legacy = True
+                self._touched.update(guilds)
             except Exception:
                 pass
-        return {"guilds": {}}
+        # Older archives carried full per-message state; keep only aggregates.
+        for gid, g in guilds.items():
+            for entry in (g.get("history") or {}).values():
+                if isinstance(entry, dict) and ("msg_state" in entry or "chan_state" in entry):
+                    entry["messages"] = len(entry.pop("msg_state", None) or {})
+                    entry.pop("chan_state", None)
+                    self._touched.add(gid)
+        return {"guilds": guilds}
+
+    def _dump_changed(self) -> list:
+        """(gid, text, seq) for touched guilds whose JSON differs from what is on disk."""
+        out = []
+        touched, self._touched = self._touched, set()
+        self._dump_seq += 1
+        for gid in touched:
+            g = self.data["guilds"].get(gid)
+            if g is None:
+                continue
+            text = json.dumps(g, indent=2, ensure_ascii=False)
+            if self._written.get(gid) != text:
+                out.append((gid, text, self._dump_seq))
+        return out
+
+    def _write(self, dumped: list):
+        # One writer at a time; a snapshot older than the one already on
+        # disk (a background flush overtaken by a payout) is dropped.
+        with self._write_lock:
+            for gid, text, seq in dumped:
+                if self._written_seq.get(gid, 0) > seq:
+                    continue
+                _atomic_write_text(_guild_path(gid), text)
+                self._written[gid] = text
+                self._written_seq[gid] = seq
+            if self._legacy:
+                os.replace(DATA_PATH, DATA_PATH.with_suffix(DATA_PATH.suffix + ".migrated"))
+                self._legacy = False
+
+    def _flush(self):
+        """Write every changed guild now."""
+        dumped = self._dump_changed()
+        try:
+            self._write(dumped)
+        except Exception as e:
+            self._touched.update(gid for gid, _, _ in dumped)
+            print(f"[rpxp] save failed: {e}")
 
-    def _save(self):
-        _atomic_write_json(DATA_PATH, self.data)
+    async def _flush_later(self):
+        try:
+            await asyncio.sleep(FLUSH_S)
+        finally:
+            self._task = None
+        # Serialize here, on the loop, so handlers can keep mutating while the write runs.
+        dumped = self._dump_changed()
+        try:
+            await run_io(self._write, dumped)
+        except Exception as e:
+            self._touched.update(gid for gid, _, _ in dumped)
+            print(f"[rpxp] save failed: {e}")
+
+    def _save(self, now: bool = False):
+        """
+        Persist changes made through _g(). Batched into one write per
+        FLUSH_S; `now` writes before returning (payouts, clears).
+        """
+        if now or FLUSH_S <= 0:
+            self._flush()
+            return
+        if self._task is None:
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._flush_later())
+            except RuntimeError:
+                self._flush()
 
     def _g(self, guild_id: int) -> dict:
+        self._touched.add(str(guild_id))
         g = self.data["guilds"].setdefault(str(guild_id), {})
         g.setdefault("channels", [])  # flagged channels (ints)
         g.setdefault("week_id", _week_id_chicago())
@@ -127,6 +273,8 @@ class RPXPCog(commands.Cog):
             "staff_emojis": ["🔥", "⭐"],
             "staff_role_ids": [],             # roles allowed to approve
         })
+        for k, v in _LATE_SETTINGS.items():
+            g["settings"].setdefault(k, v)
 
         # auto-week rollover (archive outgoing week before clearing)
         cur_week = _week_id_chicago()
@@ -143,10 +291,32 @@ class RPXPCog(commands.Cog):
             g["msg_state"] = {}
 
             g["pending_rollover"] = {"old_week": old_week, "ts": _now_ts(), "notified": False}
-            self._save()
+            self._save(now=True)
 
         return g
 
+    def _msgs(self, g: dict) -> _MsgWindow:
+        w = self._msg_windows.get(id(g))
+        if w is None or w.state is not g["msg_state"]:
+            w = self._msg_windows[id(g)] = _MsgWindow(g["msg_state"])
+        return w
+
+    def _prune_msgs(self, g: dict, now: int | None = None) -> _MsgWindow:
+        """Drop posts past staff_window_sec and beyond msg_state_max (0 = no limit)."""
+        s = g["settings"]
+        w = self._msgs(g)
+        window = int(s.get("staff_window_sec", 0) or 0)
+        cap = int(s.get("msg_state_max", 0) or 0)
+        now = _now_ts() if now is None else now
+        w.prune(now - window if window > 0 else 0, cap if cap > 0 else len(w.state))
+        return w
+
+    def _remember_msg(self, g: dict, msg_id: int, entry: dict):
+        """Track a post for staff reactions until the approval window closes."""
+        w = self._msgs(g)
+        w.add(str(msg_id), entry)
+        self._prune_msgs(g)
+
     # ---------- archiving/notifications ----------
     def _prune_history(self, g: dict):
         hist = g.get("history", {})
@@ -180,16 +350,17 @@ class RPXPCog(commands.Cog):
         if not users and not msg_state:
             return  # nothing to archive
 
+        # Aggregates only: per-user totals and the scalar settings they were
+        # scored under. The live users/msg_state dicts are replaced after this.
         hist = g.setdefault("history", {})
         entry = {
             "week_id": week_id,
             "archived_ts": _now_ts(),
             "reason": reason or "",
             "actor_id": int(actor_id) if actor_id is not None else 0,
-            "users": copy.deepcopy(users),
-            "chan_state": copy.deepcopy(g.get("chan_state") or {}),
-            "msg_state": copy.deepcopy(msg_state),
-            "settings_snapshot": copy.deepcopy(g.get("settings") or {}),
+            "users": {uid: dict(u) for uid, u in users.items()},
+            "messages": len(msg_state),
+            "settings_snapshot": {k: v for k, v in (g.get("settings") or {}).items() if not isinstance(v, (list, dict))},
         }
         if payout is not None:
             entry["payout"] = payout
@@ -401,11 +572,11 @@ class RPXPCog(commands.Cog):
             u["last_scored_ts"] = int(created_ts)
 
             # Track message so staff reactions can optionally grant bonus (or gate)
-            g["msg_state"][str(msg_id)] = {
+            self._remember_msg(g, msg_id, {
                 "user_id": int(user_id),
                 "staff_bonus_applied": False,
                 "ts": int(created_ts),
-            }
+            })
 
         return (True, "ok", added)
 
@@ -431,12 +602,12 @@ class RPXPCog(commands.Cog):
         if bool(settings.get("staff_required", False)):
             # Still record msg_state so approval can process later
             created_ts = int(message.created_at.timestamp())
-            g["msg_state"][str(message.id)] = {
+            self._remember_msg(g, message.id, {
                 "user_id": int(message.author.id),
                 "staff_bonus_applied": False,
                 "ts": int(created_ts),
                 "pending_only": True,
-            }
+            })
             self._save()
             return
 
@@ -510,8 +681,8 @@ class RPXPCog(commands.Cog):
             if not any(r.id in role_ids for r in getattr(member, "roles", [])):
                 return
 
-        # check msg_state
-        ms = g["msg_state"].get(str(payload.message_id))
+        # check msg_state (posts past the staff window are gone)
+        ms = self._prune_msgs(g).state.get(str(payload.message_id))
         if not ms:
             return
         if ms.get("staff_bonus_applied"):
@@ -665,7 +836,7 @@ class RPXPCog(commands.Cog):
         g["users"] = {}
         g["chan_state"] = {}
         g["msg_state"] = {}
-        self._save()
+        self._save(now=True)
         await ctx.send(f"🧹 Archived + cleared RP tracking for week **{g['week_id']}**. (See: `!rpxp prev`)")
 
     @rpxp.command(name="top")
@@ -714,6 +885,8 @@ class RPXPCog(commands.Cog):
           !rpxp set weekly_xp_cap 1000
           !rpxp set staff_bonus_enabled true
           !rpxp set staff_required false
+          !rpxp set staff_window_sec 172800
+          !rpxp set msg_state_max 0        (cap on tracked posts; 0 = no limit)
         """
         g = self._g(ctx.guild.id)
         await self._maybe_send_rollover_notice(ctx.guild, g)
@@ -832,7 +1005,7 @@ class RPXPCog(commands.Cog):
         g["users"] = {}
         g["chan_state"] = {}
         g["msg_state"] = {}
-        self._save()
+        self._save(now=True)
 
         # report
         lines = []
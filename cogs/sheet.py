@@ -8,6 +8,9 @@ import glob
 from nextcord.ext import commands
 from pathlib import Path
 from utils.ini import read_cfg, write_cfg, get_compat, getint_compat
+from utils.static_data import class_table, item_table, race_table, static_cfg, derived, on_static_reload
+from utils.items import item_search
+from utils.names import ci_matches, coe_exists
 from utils.players import add_char, set_active, get_active
 from utils.players import remove_char, find_owner_by_char
 
@@ -158,7 +161,7 @@ def _resolve_char_ci(name: str):
         return None, None
 
     target = f"{base}.coe".lower()
-    for fn in os.listdir("."):
+    for fn in ci_matches(target):
         if fn.lower() == target:
             path = fn  
             try:
@@ -196,18 +199,9 @@ def _load_item_index(path: str = "item.lst"):
     Return (items, index) where:
       items: { "Longsword": {"price":"10","weight":"4", ...}, ... }
       index: { "longsword": "Longsword", "long sword": "Longsword", ... }
-    Uses optional 'aliases=' in item.lst.
+    Uses optional 'aliases=' in item.lst. Shared via utils.static_data; do not modify.
     """
-    cfg = configparser.ConfigParser(); cfg.optionxform = str; cfg.read(path)
-    items, index = {}, {}
-    for section in cfg.sections():
-        data = dict(cfg.items(section))
-        items[section] = data
-        index[_normalize_name(section)] = section
-        aliases = re.split(r"[,\s]+", data.get("aliases", "").strip())
-        for a in filter(None, aliases):
-            index[_normalize_name(a)] = section
-    return items, index
+    return item_table(path)
 
 
 STARTER_KIT = [
@@ -236,32 +230,14 @@ CLASS_EXTRA_GEAR: dict[str, list[tuple[str, int]]] = {
 
 
 def load_races(file_path):
-    cfg = configparser.ConfigParser(); cfg.optionxform = str; cfg.read(file_path)
-    races = {}
-    for section in cfg.sections():
-        data = {}
-        for key, value in cfg.items(section):
-            val = value.strip()
-            tokens = [t for t in re.split(r"[,\s]+", val) if t]
-            if key in ALWAYS_LIST:
-                data[key] = tokens
-                continue
-            if len(tokens) > 1:
-                try:
-                    data[key] = [int(t) for t in tokens]
-                except ValueError:
-                    data[key] = tokens
-            else:
-                try:
-                    data[key] = int(val)
-                except ValueError:
-                    data[key] = val
-        races[section] = data
-    return races
+    return race_table(file_path)
 
 
 def load_classes(file_path):
-    config = configparser.ConfigParser(); config.optionxform = str; config.read(file_path)
+    return derived(file_path, "sheet_classes", _build_classes)
+
+
+def _build_classes(config):
     classes = {}
     for section in config.sections():
         classes[section] = {}
@@ -356,24 +332,7 @@ def roll_dice(spec: str):
 
 
 def _load_class_cache(path: str = "class.lst"):
-    cfg = configparser.ConfigParser(); cfg.optionxform = str; cfg.read(path)
-    cache = {}
-    for section in cfg.sections():
-        cache[section] = {}
-        for k, v in cfg.items(section):
-            v = v.strip()
-            if v and " " in v:
-                parts = v.split()
-                if all(p.lstrip("-").isdigit() for p in parts):
-                    cache[section][k] = [int(p) for p in parts]
-                else:
-                    cache[section][k] = v
-            else:
-                if v.lstrip("-").isdigit():
-                    cache[section][k] = int(v)
-                else:
-                    cache[section][k] = v
-    return cache
+    return class_table(path)
 
 _CLASS_CACHE = _load_class_cache()
 
@@ -429,6 +388,14 @@ class SheetCog(commands.Cog):
         self.bot = bot
         self.races_cfg = load_races("race.lst")
         self.items, self.item_index = _load_item_index("item.lst")
+        on_static_reload("sheet", self._on_static_reload)
+
+    def _on_static_reload(self, changed):
+        """Rebind the race/class/item tables after utils.static_data reloaded a file."""
+        global _CLASS_CACHE
+        _CLASS_CACHE = _load_class_cache()
+        self.races_cfg = load_races("race.lst")
+        self.items, self.item_index = _load_item_index("item.lst")
 
 
     def _canon(self, name: str) -> str:
@@ -489,6 +456,13 @@ class SheetCog(commands.Cog):
         canon = self._canon(name)
         return canon, (self.items.get(canon, {}) or {})
 
+    def find_item(self, query: str):
+        """(canon, item_dict), or (None, [ranked suggestions]) when the name is unknown."""
+        canon, item = item_search().lookup(query)
+        if canon is not None:
+            return canon, item
+        return None, item_search().suggest(query)
+
 
     def _recompute_ac(self, cfg, channel=None) -> int:
         a1 = get_compat(cfg, "eq", "armor1", fallback="").strip()
@@ -890,7 +864,7 @@ class SheetCog(commands.Cog):
         armor2 = load.get("armor2", "") or ""
         weapons = [w for w in load.get("weapons", []) if w]
 
-        items_cfg = configparser.ConfigParser(); items_cfg.optionxform = str; items_cfg.read("item.lst")
+        items_cfg = static_cfg("item.lst")
         def _item_get(name, key, fallback=None):
             if not name or not items_cfg.has_section(name):
                 return fallback
@@ -1594,7 +1568,7 @@ class SheetCog(commands.Cog):
             pass
         if not file_path:
             target = f"{char_name.replace(' ', '_').lower()}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     file_path = fn
                     try:
@@ -1773,12 +1747,14 @@ class SheetCog(commands.Cog):
         if not it:
             canon_lookup, it = _resolve_item(item_name)
 
-        # handle occasional list-return
+        # handle occasional list-return (find_item's suggestions)
+        suggestions = it if isinstance(it, list) else []
         if isinstance(it, list):
             it = it[0] if it else None
 
         if not it or not canon_lookup:
-            await ctx.send(f"❌ Unknown item **{item_name}**.")
+            hint = f" Did you mean: {', '.join(suggestions[:8])}?" if suggestions else ""
+            await ctx.send(f"❌ Unknown item **{item_name}**.{hint}")
             return
 
         canon = canon_lookup
@@ -1860,7 +1836,7 @@ class SheetCog(commands.Cog):
             return
         disp, path = _resolve_char_ci(target)
         pretty = disp or target
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             await ctx.send(f"❌ Target **{pretty}** not found.")
             return
         try:
@@ -5148,7 +5124,7 @@ Zundrin"""
         Pagination:
           -p N, -page N, -page=N
         """
-        import os, math, re, textwrap, nextcord
+        import math, re, textwrap, nextcord
 
         # --- Helper: find active character & config ---
         char_name = get_active(ctx.author.id)
@@ -5157,7 +5133,7 @@ Zundrin"""
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -15,15 +15,23 @@ import datetime
 from functools import partial
 from typing import Dict, List, Tuple, Optional
 from nextcord.ext import commands
-from utils.ini import read_cfg, write_cfg, get_compat, getint_compat
+from utils.ini import read_cfg, write_cfg, get_compat, getint_compat, remove_cfg, copy_cfg
+from utils.names import ci_matches, coe_exists, cwd_listing
 from utils.players import get_active
+from utils.battle import abegin_session, aend_session
+from utils.storage import HOT_COMMANDS, prefetch_active_char, defer_char_writes, achar_writes_done
+from utils.monsters import combatant_cfg, instance_cfg, monster_catalog, pending_names
+from utils.static_data import class_table, item_table, spell_lists, static_cfg, on_static_reload, reload_static, notify_static_reload
+from utils.items import item_search
+from utils.battle_model import battle_view
+from utils.tracker import post_tracker
 from pathlib import Path
 
 from cogs.initiative import (
     _load_battles, _parse_combatants, _write_combatants,
     _sorted_entries, _format_tracker_block, _life_bar, _slot, _save_battles,
     _find_ci_name, _load_monster_template, _choose_slot_for_effects,
-    _find_ci_or_partial_name,
+    _find_ci_or_partial_name, _set_x_effect, _set_timer, _cancel_timer,
 )
 
 from cogs.combat import roll_dice, _apply_mitigation, _is_monster_file, _is_undead_cfg, _parse_combatants
@@ -549,42 +557,8 @@ def _slot_safe(name: str) -> str:
 
 
 def _load_spell_list(path: str = "spell.lst"):
+    return spell_lists(path)
 
-    raw = ""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = f.read()
-    except FileNotFoundError:
-        pass
-
-    first = raw.find("[")
-    trimmed = raw[first:] if first != -1 else ""
-
-    cp = configparser.ConfigParser()
-    cp.optionxform = str
-    if trimmed:
-        cp.read_string(trimmed)
-    else:
-        cp.read(path)
-
-
-    by_class: dict[str, dict[int, list[str]]] = {}
-    for sec in cp.sections():
-        if sec.startswith("["):
-            continue
-        level_map = {}
-        has_levels = False
-        for k, v in cp.items(sec):
-            m = re.fullmatch(r"l(\d+)", k.strip(), flags=re.I)
-            if m:
-                lvl = int(m.group(1))
-                toks = [t for t in v.split() if t]
-                level_map[lvl] = toks
-                has_levels = True
-        if has_levels:
-            by_class[sec] = level_map
-
-    return by_class, cp
 
 def _resolve_effect_slot(cfg, chan_id: str, name_like: str) -> str:
     """
@@ -592,6 +566,12 @@ def _resolve_effect_slot(cfg, chan_id: str, name_like: str) -> str:
     will use for `name_like` (matching canonical name, display name, etc.).
     """
     name_like = (name_like or "").strip()
+    view = battle_view(cfg, chan_id)
+    if view is None:
+        raise configparser.NoSectionError(chan_id)
+    hit = view.memo.get(("resolve_slot", name_like))
+    if hit is not None:
+        return hit
     try:
         s1 = _slot(name_like)
     except Exception:
@@ -601,11 +581,8 @@ def _resolve_effect_slot(cfg, chan_id: str, name_like: str) -> str:
     cands = [s1]
 
 
-    try:
-        names, _ = _parse_combatants(cfg, chan_id)
-    except Exception:
-        names = []
-    ci = _find_ci_name(names, name_like)
+    names = view.names
+    ci = view.lookup(name_like)
     if ci:
         try:
             cands.insert(0, _slot(ci))
@@ -619,30 +596,28 @@ def _resolve_effect_slot(cfg, chan_id: str, name_like: str) -> str:
 
 
     for nm in names:
-        s = nm.replace(" ", "_")
-        d = cfg.get(chan_id, f"{s}.disp", fallback="")
+        c = view.combatants[nm]
+        d = c.get("disp", "")
         if d and d.strip().lower() == name_like.lower():
-            cands.insert(0, s)
+            cands.insert(0, c.slot)
             break
 
 
     prefer = ("dex","join","paralyzed","blind","cc","ck","light","darkness","mi",
               "magwep","ghh","sph","shl","hyp","cl","cn","db","inw","pnm","x_")
-    section_items = list(cfg.items(chan_id))
+    chosen = cands[0]
     for s in cands:
-        for opt, _ in section_items:
-            if opt.startswith(f"{s}."):
-                suf = opt.split(".", 1)[1]
-                if any(suf.startswith(p) for p in prefer):
-                    return s
-    return cands[0]
+        if any(opt.startswith(f"{s}.") and opt.split(".", 1)[1].startswith(prefer)
+               for opt, _ in view.slot_keys(s)):
+            chosen = s
+            break
+    view.memo[("resolve_slot", name_like)] = chosen
+    return chosen
 
 
 def _load_slots_table(path: str = "class.lst"):
-    cp = configparser.ConfigParser()
-    cp.optionxform = str
-    cp.read(path)
-    return cp
+    return static_cfg(path)
+
 
 def _slots_for_class_level(class_cp: configparser.ConfigParser, class_section: str, level: int) -> dict[int, int]:
     """
@@ -852,8 +827,7 @@ async def _refresh_tracker_message(ctx, bcfg=None, chan_id: str | None = None) -
         if not msg_id:
             return
         block = _format_tracker_block(bcfg, chan_id)
-        msg = await ctx.channel.fetch_message(msg_id)
-        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
     except Exception:
         pass
 
@@ -982,24 +956,8 @@ def _poly_clear_overlay(tcfg):
         tcfg.remove_section("poly")
 
 def _load_class_cache(path: str = "class.lst"):
-    cfg = configparser.ConfigParser(); cfg.optionxform = str; cfg.read(path)
-    cache = {}
-    for section in cfg.sections():
-        cache[section] = {}
-        for k, v in cfg.items(section):
-            v = v.strip()
-            if v and " " in v:
-                parts = v.split()
-                if all(p.lstrip("-").isdigit() for p in parts):
-                    cache[section][k] = [int(p) for p in parts]
-                else:
-                    cache[section][k] = v
-            else:
-                if v.lstrip("-").isdigit():
-                    cache[section][k] = int(v)
-                else:
-                    cache[section][k] = v
-    return cache
+    return class_table(path)
+
 
 _CLASS_CACHE = _load_class_cache()
 
@@ -1009,20 +967,11 @@ def _load_monster_form(form: str):
     if not base:
         return (None, None)
 
-    path = os.path.join("monsters", f"{base}.ini")
-    if os.path.exists(path):
-        cfg = read_cfg(path)
-        pretty = get_compat(cfg, "base", "name", fallback=form) or form
-        return (pretty, cfg)
-
-
-    want = f"{base}.ini"
-    for fn in os.listdir("monsters"):
-        if fn.lower() == want:
-            cfg = read_cfg(os.path.join("monsters", fn))
-            pretty = get_compat(cfg, "base", "name", fallback=form) or form
-            return (pretty, cfg)
-    return (None, None)
+    cfg = monster_catalog().cfg_copy(base)
+    if cfg is None:
+        return (None, None)
+    pretty = get_compat(cfg, "base", "name", fallback=form) or form
+    return (pretty, cfg)
 
 def _poly_kind(cfg): return cfg.get("poly", "kind", fallback="")
 
@@ -1452,15 +1401,11 @@ def _find_monster_ini(monster_type: str) -> str | None:
     """Case-insensitive lookup for monsters/<type>.ini."""
     if not monster_type:
         return None
-    want = f"{monster_type}.ini".lower()
-    for root in ("monsters", "./monsters", "."):
-        try:
-            for fn in os.listdir(root):
-                if fn.lower() == want:
-                    return os.path.join(root, fn)
-        except Exception:
-            pass
-    return None
+    hit = monster_catalog().path_for(monster_type)
+    if hit:
+        return hit
+    hits = ci_matches(f"{monster_type}.ini")
+    return hits[0] if hits else None
 
 
 def _monster_hd_from_type(monster_type: str) -> int | None:
@@ -1469,7 +1414,8 @@ def _monster_hd_from_type(monster_type: str) -> int | None:
     if not path:
         return None
     try:
-        mcfg = read_cfg(path)
+        tpl = monster_catalog().get(monster_type)
+        mcfg = tpl.cfg if tpl is not None else read_cfg(path)
         raw = get_compat(mcfg, "base", "hd", fallback=None)
         if raw is None:
             raw = get_compat(mcfg, "stats", "hd", fallback=None)
@@ -1480,10 +1426,6 @@ def _monster_hd_from_type(monster_type: str) -> int | None:
 
 
 
-def _name_tokens(s: str) -> list[str]:
-
-    return sorted(re.findall(r"[A-Za-z0-9]+", str(s).lower()))
-
 def _lookup_item_special(self, item_name: str) -> str:
     """
     Return the item's 'special' string from your item DB (if present), else "".
@@ -1501,21 +1443,19 @@ def _lookup_item_special(self, item_name: str) -> str:
         if cp.has_section(item_name):
             return cp.get(item_name, "special", fallback="").strip()
 
+        # 2) and 3) come from the prebuilt item index instead of scanning sections.
+        index = item_search()
+        sec = index.section(item_name)
+        if sec and cp.has_section(sec):
+            return cp.get(sec, "special", fallback="").strip()
 
-        want_norm   = _norm_alias(item_name)
-        want_tokens = _name_tokens(item_name)
-
-        for sec in cp.sections():
-            if _norm_alias(sec) == want_norm:
-                return cp.get(sec, "special", fallback="").strip()
 
-
-        for sec in cp.sections():
-            sec_tokens = _name_tokens(sec)
-            if sec_tokens == want_tokens or set(want_tokens).issubset(sec_tokens):
-                val = cp.get(sec, "special", fallback="").strip()
-                if val:
-                    return val
+        for sec in index.with_words(item_name):
+            if not cp.has_section(sec):
+                continue
+            val = cp.get(sec, "special", fallback="").strip()
+            if val:
+                return val
     except Exception:
         pass
     return ""
@@ -1639,28 +1579,9 @@ def load_items(file_path: str):
     """
     Load item.lst and return (items_by_canon, index_by_normalized).
     Optional 'aliases' key per item may contain comma/space-separated synonyms.
+    Shared with the other cogs via utils.static_data; do not modify.
     """
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(file_path)
-
-    items = {}
-    index = {}
-
-    for section in cfg.sections():
-        data = dict(cfg.items(section))
-
-        items[section] = data
-
-
-        index[normalize_name(section)] = section
-
-
-        aliases = re.split(r'[,\s]+', data.get("aliases", "").strip())
-        for alias in filter(None, aliases):
-            index[normalize_name(alias)] = section
-
-    return items, index
+    return item_table(file_path)
 
 
 
@@ -1872,41 +1793,12 @@ class SpellsCog(commands.Cog, name="Spells"):
         self.items, self.item_index = load_items("item.lst")
         self._index = dict(self.item_index)
         try:
-            self._item_cp = read_cfg("item.lst")
+            self._item_cp = static_cfg("item.lst")
         except Exception:
             self._item_cp = None
 
 
-        self.spell_levels = {}
-        for cls, lvmap in (self._spells_by_class or {}).items():
-            table = {}
-            for key, names in (lvmap or {}).items():
-                m = re.match(r"l(\d+)", str(key), re.I)
-                if not m:
-                    continue
-                L = int(m.group(1))
-
-
-                if isinstance(names, (list, tuple, set)):
-                    raw_names = [str(x) for x in names]
-                elif isinstance(names, str):
-                    s = names.strip()
-
-                    if s.startswith("[") and s.endswith("]"):
-                        s = s[1:-1]
-                    raw_names = re.split(r"[\s,|]+", s)
-                else:
-
-                    continue
-
-                for nm in raw_names:
-                    nm = nm.strip().strip("'").strip('"').strip()
-                    if not nm:
-                        continue
-
-                    k = self._norm(nm)
-                    table[k] = min(L, table.get(k, L))
-            self.spell_levels[self._norm(cls)] = table
+        self.spell_levels = self._build_spell_levels()
 
 
         combat_src = next((c for c in bot.cogs.values() if hasattr(c, "classes")), None)
@@ -2117,6 +2009,69 @@ class SpellsCog(commands.Cog, name="Spells"):
             "protectionfromlightning": self._effect_protectionfromlightning,
 
         }
+        on_static_reload("spells", self._on_static_reload)
+
+    def _build_spell_levels(self) -> dict:
+        """{normalized class: {normalized spell: lowest level}} from spell.lst."""
+        spell_levels = {}
+        for cls, lvmap in (self._spells_by_class or {}).items():
+            table = {}
+            for key, names in (lvmap or {}).items():
+                m = re.match(r"l(\d+)", str(key), re.I)
+                if not m:
+                    continue
+                L = int(m.group(1))
+
+
+                if isinstance(names, (list, tuple, set)):
+                    raw_names = [str(x) for x in names]
+                elif isinstance(names, str):
+                    s = names.strip()
+
+                    if s.startswith("[") and s.endswith("]"):
+                        s = s[1:-1]
+                    raw_names = re.split(r"[\s,|]+", s)
+                else:
+
+                    continue
+
+                for nm in raw_names:
+                    nm = nm.strip().strip("'").strip('"').strip()
+                    if not nm:
+                        continue
+
+                    k = self._norm(nm)
+                    table[k] = min(L, table.get(k, L))
+            spell_levels[self._norm(cls)] = table
+        return spell_levels
+
+    def _on_static_reload(self, changed):
+        """Rebind the spell/class/item tables after utils.static_data reloaded a file."""
+        global _CLASS_CACHE
+        _CLASS_CACHE = _load_class_cache()
+        self._spells_by_class, self._spell_cp = _load_spell_list()
+        self._class_cp = _load_slots_table()
+        self.items, self.item_index = load_items("item.lst")
+        self._index = dict(self.item_index)
+        self._item_cp = static_cfg("item.lst")
+        if hasattr(self, "_race_cp"):
+            self._race_cp = static_cfg("race.lst")
+        self.spell_levels = self._build_spell_levels()
+        combat_src = next((c for c in self.bot.cogs.values() if c is not self and hasattr(c, "classes")), None)
+        if combat_src is not None:
+            self.classes = combat_src.classes
+
+    async def cog_before_invoke(self, ctx):
+        # One battle.lst load/save per command, both done on the storage pool;
+        # helpers share the parsed state in between.
+        ctx.battle_session = await abegin_session()
+        if ctx.command and ctx.command.qualified_name in HOT_COMMANDS:
+            await prefetch_active_char(ctx.author.id)
+            defer_char_writes(ctx)
+
+    async def cog_after_invoke(self, ctx):
+        await achar_writes_done(ctx)
+        await aend_session(getattr(ctx, "battle_session", None))
 
 
 
@@ -2594,7 +2549,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return None, None
         base = name.replace(" ", "_")
         target = f"{base}.coe".lower()
-        for fn in os.listdir("."):
+        for fn in ci_matches(target):
             if fn.lower() == target:
                 path = fn
                 try:
@@ -2678,7 +2633,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         char_class = (get_compat(t_cfg, "info", "class", fallback="") or "").strip()
         level = getint_compat(t_cfg, "cur", "level", fallback=1)
 
-        cp = configparser.ConfigParser(); cp.optionxform = str; cp.read("class.lst")
+        cp = static_cfg("class.lst")
 
         sec = None
         for s in cp.sections():
@@ -2717,7 +2672,18 @@ class SpellsCog(commands.Cog, name="Spells"):
         if not oid or not ctl:
             return []
         out = []
-        for fn in os.listdir("."):
+        # Spawned monsters not written out yet are checked in memory; only
+        # the ones that match get a real file (callers may edit it).
+        files = list(cwd_listing())
+        for nm in pending_names():
+            icfg = instance_cfg(nm)
+            if (icfg is not None
+                    and str(get_compat(icfg, "info", "owner_id", fallback="")).strip() == oid
+                    and str(get_compat(icfg, "info", "controller", fallback="")).strip().lower() == ctl):
+                fn = f"{nm.replace(' ', '_')}.coe"
+                if coe_exists(fn) and fn not in files:
+                    files.append(fn)
+        for fn in files:
             if not fn.lower().endswith(".coe"):
                 continue
             try:
@@ -2803,7 +2769,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                         _save_battles(bcfg)
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
         except Exception:
@@ -2916,7 +2882,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _scores = _parse_combatants(bcfg, chan_id)
             key_name = _find_ci_name(names, pretty_name) or pretty_name
             s = _slot(key_name)
-            bcfg.set(chan_id, f"{s}.{key}", str(max(0, int(rounds))))
+            _set_timer(bcfg, chan_id, s, key, str(max(0, int(rounds))))
             if by:
                 bcfg.set(chan_id, f"{s}.{key}_by", by)
             _save_battles(bcfg)
@@ -3055,7 +3021,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         _save_battles(bcfg)
                 except Exception:
                     pass
-                try: os.remove(os.path.abspath(who_path))
+                try: remove_cfg(who_path)
                 except Exception: pass
 
 
@@ -3063,8 +3029,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -3113,8 +3078,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -3198,7 +3162,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -3788,20 +3752,14 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         if not hasattr(self, "_class_cp"):
-            cp = configparser.ConfigParser()
-            cp.optionxform = str
-            cp.read("class.lst")
+            cp = static_cfg("class.lst")
             self._class_cp = cp
         if not hasattr(self, "_race_cp"):
-            rp = configparser.ConfigParser()
-            rp.optionxform = str
-            rp.read("race.lst")
+            rp = static_cfg("race.lst")
             self._race_cp = rp
 
         if not hasattr(self, "_item_cp"):
-            ip = configparser.ConfigParser()
-            ip.optionxform = str
-            ip.read("item.lst")
+            ip = static_cfg("item.lst")
             self._item_cp = ip
 
         class_cp = self._class_cp
@@ -4396,7 +4354,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4527,7 +4485,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4590,7 +4548,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4842,7 +4800,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -4934,6 +4892,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         """
 
         by_class, cp = _load_spell_list()
+        cp = copy_cfg(cp)  # the parsed spell.lst is shared; edit a private copy
         class_to_abbr = self._class_to_abbr()
 
 
@@ -4985,7 +4944,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             cp.write(f)
 
 
-        self._spells_by_class, self._spell_cp = _load_spell_list()
+        notify_static_reload(reload_static("spell.lst"))
 
 
         processed_txt = ", ".join(classes_processed) if classes_processed else "—"
@@ -5234,6 +5193,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if left > 0:
             left -= 1
             if left <= 0:
+                _cancel_timer(chan_id, slot, key)
 
                 if cfg_b.has_option(chan_id, f"{slot}.{key}"):
                     cfg_b.remove_option(chan_id, f"{slot}.{key}")
@@ -5242,7 +5202,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if cfg_b.has_option(chan_id, f"{slot}.{k}"):
                         cfg_b.remove_option(chan_id, f"{slot}.{k}")
             else:
-                cfg_b.set(chan_id, f"{slot}.{key}", str(left))
+                _set_timer(cfg_b, chan_id, slot, key, str(left))
 
     @staticmethod
     def _two_letter_code_from_name(name: str, alias_key: str) -> str:
@@ -5421,7 +5381,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             await ctx.send("❌ No active character. Use `!char <name>` first.")
             return
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -5726,8 +5686,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -5849,7 +5808,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             display_names = []
                             for tgt in tlist:
                                 slotT = _resolve_effect_slot(bcfgA, chanA, tgt)
-                                bcfgA.set(chanA, f"{slotT}.{base_key}",          str(int(rounds_auto)))
+                                _set_timer(bcfgA, chanA, slotT, base_key, str(int(rounds_auto)))
                                 bcfgA.set(chanA, f"{slotT}.{base_key}_code",     code)
                                 bcfgA.set(chanA, f"{slotT}.{base_key}_label",    canon)
                                 bcfgA.set(chanA, f"{slotT}.{base_key}_emoji",    em)
@@ -5941,7 +5900,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 if inv_left > 0 or inv_perm > 0:
                     def _clear_inv(slot: str):
-                        bcfg2.set(chan2, f"{slot}.inv", "0")
+                        _set_timer(bcfg2, chan2, slot, "inv", "0")
                         for suf in ("inv_by", "inv_type", "inv_gid", "inv_leader", "inv_perm"):
                             opt = f"{slot}.{suf}"
                             if bcfg2.has_option(chan2, opt):
@@ -5953,17 +5912,9 @@ class SpellsCog(commands.Cog, name="Spells"):
                         gid = bcfg2.get(chan2, f"{s_self}.inv_gid", fallback="")
                         is_leader = bcfg2.getint(chan2, f"{s_self}.inv_leader", fallback=0) > 0
                         if is_leader and gid:
-                            names_all, _ = _parse_combatants(bcfg2, chan2)
-                            for nm in names_all:
-                                try:
-                                    s = _slot(nm)
-                                except Exception:
-                                    s = nm.replace(" ", "_")
-                                same_gid = (bcfg2.get(chan2, f"{s}.inv_gid", fallback="") == gid)
-                                has_invis = (bcfg2.getint(chan2, f"{s}.inv", fallback=0) > 0 or
-                                             bcfg2.getint(chan2, f"{s}.inv_perm", fallback=0) > 0)
-                                if same_gid and has_invis:
-                                    _clear_inv(s)
+                            for c in battle_view(bcfg2, chan2).inv_group(gid):
+                                if c.inv > 0 or c.getint("inv_perm") > 0:
+                                    _clear_inv(c.slot)
                             invis_broke = True
                             invis_broke_note = "Casting a spell ends **Invisible10** for the **entire group**."
                         else:
@@ -6097,7 +6048,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         names, _scores = _parse_combatants(bcfg, chan_id)
         key = _find_ci_name(names, mon_name) or mon_name
         path = f"{key.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Combatant file not found for **{key}**.")
             return
 
@@ -6214,8 +6165,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
                 except Exception:
                     pass
         except Exception:
@@ -6291,7 +6241,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         or ("perm" if inv_perm > 0 else "norm"))
             if inv_left > 0 or inv_perm > 0:
                 def _clear_inv(slot: str):
-                    bcfg.set(chan_id, f"{slot}.inv", "0")
+                    _set_timer(bcfg, chan_id, slot, "inv", "0")
                     for suf in ("inv_by","inv_type","inv_gid","inv_leader","inv_perm"):
                         opt = f"{slot}.{suf}"
                         if bcfg.has_option(chan_id, opt):
@@ -6301,15 +6251,9 @@ class SpellsCog(commands.Cog, name="Spells"):
                         gid = bcfg.get(chan_id, f"{s_self}.inv_gid", fallback="")
                         is_leader = bcfg.getint(chan_id, f"{s_self}.inv_leader", fallback=0) > 0
                         if is_leader and gid:
-                            for nm in names:
-                                try:
-                                    s = _slot(nm)
-                                except Exception:
-                                    s = nm.replace(" ", "_")
-                                if bcfg.get(chan_id, f"{s}.inv_gid", fallback="") == gid and (
-                                   bcfg.getint(chan_id, f"{s}.inv", fallback=0) > 0 or
-                                   bcfg.getint(chan_id, f"{s}.inv_perm", fallback=0) > 0):
-                                    _clear_inv(s)
+                            for c in battle_view(bcfg, chan_id).inv_group(gid):
+                                if c.inv > 0 or c.getint("inv_perm") > 0:
+                                    _clear_inv(c.slot)
                             invis_broke_note = "Casting a spell ends **Invisible10** for the **entire group**."
                         else:
                             _clear_inv(s_self)
@@ -6436,7 +6380,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         names, _scores = _parse_combatants(bcfg, chan_id)
         key = _find_ci_name(names, mon_name) or mon_name
         path = f"{key.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Combatant file not found for **{key}**.")
             return
 
@@ -6586,7 +6530,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -6689,7 +6633,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
         if any_hp_changes:
@@ -6700,8 +6644,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -6734,7 +6677,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -6853,7 +6796,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -6866,8 +6809,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -6946,7 +6888,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -7044,8 +6986,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -7073,8 +7014,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -7379,7 +7319,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -7493,7 +7433,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     slot = _slot(key) if _slot else key.replace(" ", "_")
 
 
-                    bcfg.set(chan_id, f"{slot}.shield", str(duration_rds))
+                    _set_timer(bcfg, chan_id, slot, "shield", str(duration_rds))
 
                     bcfg.set(chan_id, f"{slot}.shield_by", caster_name)
                     _save_battles(bcfg)
@@ -7504,8 +7444,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -7541,7 +7480,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -7685,7 +7624,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -7698,8 +7637,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -7734,7 +7672,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -7832,7 +7770,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(path))
+                remove_cfg(path)
             except Exception:
                 pass
 
@@ -7844,8 +7782,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -7876,7 +7813,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -7948,8 +7885,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = b2.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(b2, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -7992,7 +7928,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8130,7 +8066,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -8140,8 +8076,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -8174,7 +8109,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             key = _find_ci_name(names, caster_name) or caster_name
             s = _slot(key)
-            bcfg.set(chan_id, f"{s}.sph", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "sph", str(rounds_total))
             bcfg.set(chan_id, f"{s}.sph_bonus", str(dmg_bonus))
             _save_battles(bcfg)
 
@@ -8192,8 +8127,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
             return head + "\n*(Tip: `!a spiritualhammer go1`)*"
@@ -8204,7 +8138,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8260,7 +8194,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8396,7 +8330,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -8406,8 +8340,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -8431,7 +8364,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8512,8 +8445,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -8549,8 +8481,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -8593,7 +8524,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8707,7 +8638,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -8720,8 +8651,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -8747,7 +8677,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8795,8 +8725,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -8871,8 +8800,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -8897,7 +8825,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -8945,8 +8873,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -9021,8 +8948,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -9047,7 +8973,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9093,8 +9019,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -9168,8 +9093,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -9196,7 +9120,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             try: return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9271,7 +9195,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
         if any_hp_changes:
@@ -9282,8 +9206,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -9315,7 +9238,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9413,7 +9336,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -9426,8 +9349,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -9535,8 +9457,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
                 content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content=content)
+                await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -9559,7 +9480,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9678,7 +9599,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -9688,8 +9609,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -9716,7 +9636,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9779,7 +9699,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             rec_key = _find_ci_name(names, rec_disp) or rec_disp
             s = _slot(rec_key)
-            bcfg.set(chan_id, f"{s}.ghh", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "ghh", str(rounds_total))
 
 
             if random.randint(1, 100) == 1:
@@ -9793,8 +9713,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -9823,7 +9742,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     names, _ = _parse_combatants(bcfg, chan_id)
                     key = _find_ci_name(names, caster_name) or caster_name
                     slot = _slot(key) if _slot else key.replace(" ", "_")
-                    bcfg.set(chan_id, f"{slot}.magearmor", str(duration_rds))
+                    _set_timer(bcfg, chan_id, slot, "magearmor", str(duration_rds))
                     bcfg.set(chan_id, f"{slot}.magearmor_by", caster_name)
                     _save_battles(bcfg)
 
@@ -9833,8 +9752,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -9864,7 +9782,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     names, _ = _parse_combatants(bcfg, chan_id)
                     key = _find_ci_name(names, caster_name) or caster_name
                     slot = _slot(key) if _slot else key.replace(" ", "_")
-                    bcfg.set(chan_id, f"{slot}.boneskin", str(duration_rds))
+                    _set_timer(bcfg, chan_id, slot, "boneskin", str(duration_rds))
                     bcfg.set(chan_id, f"{slot}.boneskin_by", caster_name)
                     _save_battles(bcfg)
 
@@ -9874,8 +9792,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -9902,7 +9819,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -9971,8 +9888,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception: pass
 
             return head + "\n" + line
@@ -10000,8 +9916,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception: pass
 
         if _is_monster_file(path):
@@ -10027,7 +9942,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -10067,8 +9982,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception: pass
 
             if _is_monster_file(path):
@@ -10123,8 +10037,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception: pass
 
         return head + "\n" + line
@@ -10159,7 +10072,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             key = _find_ci_name(names, caster_name) or caster_name
             s = _slot(key)
-            bcfg.set(chan_id, f"{s}.shl",      str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "shl", str(rounds_total))
             bcfg.set(chan_id, f"{s}.shl_hit",  str(hit_bonus))
             bcfg.set(chan_id, f"{s}.shl_dmg",  str(dmg_bonus))
             bcfg.set(chan_id, f"{s}.shl_die",  die_code)
@@ -10179,8 +10092,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
             return head + "\n*(Tip: `!a shillelagh go1`)*"
@@ -10191,7 +10103,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -10272,7 +10184,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         bcfg.remove_option(chan_id, k)
 
 
-                bcfg.set(chan_id, f"{s_self}.{key}",        str(rounds))
+                _set_timer(bcfg, chan_id, s_self, key, str(rounds))
                 bcfg.set(chan_id, f"{s_self}.{key}_by",     caster_name)
                 bcfg.set(chan_id, f"{s_self}.{key}_level",  str(int(caster_level)))
                 _save_battles(bcfg)
@@ -10294,7 +10206,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = tokens[0], None
             base = tgt_disp.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
@@ -10355,7 +10267,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 s_tgt = key_ci.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{s_tgt}.blind",       str(rounds))
+            _set_timer(bcfg, chan_id, s_tgt, "blind", str(rounds))
             bcfg.set(chan_id, f"{s_tgt}.blind_src",   ("darkness" if is_dark else "light"))
             bcfg.set(chan_id, f"{s_tgt}.blind_by",    caster_name)
             bcfg.set(chan_id, f"{s_tgt}.blind_level", str(int(caster_level)))
@@ -10412,7 +10324,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -10444,7 +10356,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             bcfg.remove_option(chan_id, k)
 
 
-                bcfg.set(chan_id, f"{s_self}.{aura_key}", str(PERM_ROUNDS))
+                _set_timer(bcfg, chan_id, s_self, aura_key, str(PERM_ROUNDS))
                 bcfg.set(chan_id, f"{s_self}.{aura_key}_perm", "1")
                 bcfg.set(chan_id, f"{s_self}.{aura_key}_by", caster_name)
                 bcfg.set(chan_id, f"{s_self}.{aura_key}_level", str(int(caster_level)))
@@ -10514,7 +10426,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 s_tgt = key.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{s_tgt}.blind",       str(PERM_ROUNDS))
+            _set_timer(bcfg, chan_id, s_tgt, "blind", str(PERM_ROUNDS))
             bcfg.set(chan_id, f"{s_tgt}.blind_perm",  "1")
             bcfg.set(chan_id, f"{s_tgt}.blind_src",   blind_src)
             bcfg.set(chan_id, f"{s_tgt}.blind_by",    caster_name)
@@ -10569,7 +10481,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -10688,7 +10600,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     prev_par = bcfg.getint(chan_id, f"{slot}.paralyzed", fallback=0)
                     new_par = max(prev_par, u_rounds)
                     if new_par > 0:
-                        bcfg.set(chan_id, f"{slot}.paralyzed", str(new_par))
+                        _set_timer(bcfg, chan_id, slot, "paralyzed", str(new_par))
                     if b_rounds > 0:
                         bcfg.set(chan_id, f"{slot}.cs_blind_pending", str(b_rounds))
                         bcfg.set(chan_id, f"{slot}.cs_blind_by", caster_name)
@@ -10713,7 +10625,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     prev_bl = bcfg.getint(chan_id, f"{slot}.blind", fallback=0)
                     new_bl = max(prev_bl, b_rounds)
                     if new_bl > 0:
-                        bcfg.set(chan_id, f"{slot}.blind", str(new_bl))
+                        _set_timer(bcfg, chan_id, slot, "blind", str(new_bl))
                         bcfg.set(chan_id, f"{slot}.blind_src", "colorspray")
                         bcfg.set(chan_id, f"{slot}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -10730,7 +10642,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if bcfg and bcfg.has_section(chan_id):
                     prev_bl = bcfg.getint(chan_id, f"{slot}.blind", fallback=0)
                     new_bl = max(prev_bl, 1)
-                    bcfg.set(chan_id, f"{slot}.blind", str(new_bl))
+                    _set_timer(bcfg, chan_id, slot, "blind", str(new_bl))
                     bcfg.set(chan_id, f"{slot}.blind_src", "colorspray")
                     bcfg.set(chan_id, f"{slot}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -10776,7 +10688,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -10905,7 +10817,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 prev_par   = bcfg.getint(chan_id, f"{slot}.paralyzed", fallback=0)
                 new_val = max(prev_sleep, rounds_total)
                 bcfg.set(chan_id, f"{slot}.sleep", str(new_val))
-                bcfg.set(chan_id, f"{slot}.paralyzed", str(max(prev_par, new_val)))
+                _set_timer(bcfg, chan_id, slot, "paralyzed", str(max(prev_par, new_val)))
                 bcfg.set(chan_id, f"{slot}.sleep_by", caster_name)
                 _save_battles(bcfg)
                 lines.append(f"• **{tgt_disp}** (HD {hd}): 😴 **ASLEEP** for **{rounds_total} rounds**.")
@@ -10933,7 +10845,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             me_key = _find_ci_name(names, caster_name) or caster_name
             s_me   = self._effect_slot_for(bcfg, chan_id, me_key)
 
-            bcfg.set(chan_id, f"{s_me}.cc",       str(cloud_rounds))
+            _set_timer(bcfg, chan_id, s_me, "cc", str(cloud_rounds))
             bcfg.set(chan_id, f"{s_me}.cc_by",    caster_name)
             bcfg.set(chan_id, f"{s_me}.cc_level", str(int(caster_level)))
             _save_battles(bcfg)
@@ -11022,7 +10934,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     prev = bcfg.getint(chan_id, f"{s_tgt}.paralyzed", fallback=0)
                     newv = max(prev, u_rounds)
                     if newv > 0:
-                        bcfg.set(chan_id, f"{s_tgt}.paralyzed", str(newv))
+                        _set_timer(bcfg, chan_id, s_tgt, "paralyzed", str(newv))
                         bcfg.set(chan_id, f"{s_tgt}.paralyzed_by", "colorcloud")
                     if b_rounds > 0:
                         bcfg.set(chan_id, f"{s_tgt}.cc_blind_pending", str(b_rounds))
@@ -11041,7 +10953,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if bcfg and bcfg.has_section(chan_id) and s_tgt and b_rounds > 0:
                     prev_bl = bcfg.getint(chan_id, f"{s_tgt}.blind", fallback=0)
                     new_bl  = max(prev_bl, b_rounds)
-                    bcfg.set(chan_id, f"{s_tgt}.blind", str(new_bl))
+                    _set_timer(bcfg, chan_id, s_tgt, "blind", str(new_bl))
                     bcfg.set(chan_id, f"{s_tgt}.blind_src", "colorcloud")
                     bcfg.set(chan_id, f"{s_tgt}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -11055,7 +10967,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if bcfg and bcfg.has_section(chan_id) and s_tgt:
                     prev_bl = bcfg.getint(chan_id, f"{s_tgt}.blind", fallback=0)
                     new_bl  = max(prev_bl, 1)
-                    bcfg.set(chan_id, f"{s_tgt}.blind", str(new_bl))
+                    _set_timer(bcfg, chan_id, s_tgt, "blind", str(new_bl))
                     bcfg.set(chan_id, f"{s_tgt}.blind_src", "colorcloud")
                     bcfg.set(chan_id, f"{s_tgt}.blind_by", caster_name)
                     _save_battles(bcfg)
@@ -11076,7 +10988,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         base = (name or "").replace(" ", "_")
         want = {f"{base}.coe".lower(), f"{base}.ini".lower()}
-        for fn in os.listdir("."):
+        for fn in ci_matches(*want):
             if fn.lower() in want:
                 path = fn
                 try:
@@ -11127,7 +11039,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             s_me   = self._effect_slot_for(bcfg, chan_id, me_key)
 
 
-            bcfg.set(chan_id, f"{s_me}.ck",       str(cloud_rounds))
+            _set_timer(bcfg, chan_id, s_me, "ck", str(cloud_rounds))
             bcfg.set(chan_id, f"{s_me}.ck_by",    caster_name)
             bcfg.set(chan_id, f"{s_me}.ck_level", str(int(caster_level)))
             _save_battles(bcfg)
@@ -11261,7 +11173,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                     try:
                         
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
 
@@ -11332,7 +11244,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -11420,7 +11332,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             if bcfg and bcfg.has_section(chan_id) and s_tgt:
 
-                bcfg.set(chan_id, f"{s_tgt}.hyp", "0")
+                _set_timer(bcfg, chan_id, s_tgt, "hyp", "0")
                 bcfg.set(chan_id, f"{s_tgt}.hyp_by", caster_name)
                 _save_battles(bcfg)
 
@@ -11631,7 +11543,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if by and by.lower() == caster_name.lower():
                     cur = bcfg.getint(chan_id, f"{s}.hyp", fallback=0)
                     newv = max(2, cur if cur > 0 else 2)
-                    bcfg.set(chan_id, f"{s}.hyp", str(newv))
+                    _set_timer(bcfg, chan_id, s, "hyp", str(newv))
                     affected_hyp.append(nm)
 
             for opt in (f"{s_me}.hyp_conc", f"{s_me}.hyp_conc_by", f"{s_me}.hyp_conc_src"):
@@ -11647,7 +11559,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             cur = bcfg.getint(chan_id, f"{s_me}.x_mislead", fallback=-1)
             by  = bcfg.get(chan_id,   f"{s_me}.x_mislead_by", fallback="")
             if cur >= 0 and by and by.lower() == caster_name.lower():
-                bcfg.set(chan_id, f"{s_me}.x_mislead", "3")
+                _set_timer(bcfg, chan_id, s_me, "x_mislead", "3")
                 pretty_me = bcfg.get(chan_id, f"{s_me}.disp", fallback=caster_name)
                 ended_msl.append(pretty_me)
 
@@ -11739,13 +11651,13 @@ class SpellsCog(commands.Cog, name="Spells"):
                 try:
 
                     path = f"{nm}.coe"
-                    if os.path.exists(path):
+                    if coe_exists(path):
                         ecfg = read_cfg(path)
                     else:
 
                         disp, pth = self._resolve_char_ci(nm)
                         path = pth
-                        ecfg = read_cfg(path) if pth and os.path.exists(pth) else None
+                        ecfg = read_cfg(path) if pth and coe_exists(pth) else None
                     if ecfg:
                         if not ecfg.has_section("info"):
                             ecfg.add_section("info")
@@ -11810,8 +11722,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -11893,7 +11804,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -12017,7 +11928,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             me_key = _find_ci_name(names, caster_name) or caster_name
             s_me   = self._effect_slot_for(bcfg, chan_id, me_key)
 
-            bcfg.set(chan_id, f"{s_me}.cl",            str(rounds))
+            _set_timer(bcfg, chan_id, s_me, "cl", str(rounds))
             bcfg.set(chan_id, f"{s_me}.cl_bolts",      str(bolts))
             bcfg.set(chan_id, f"{s_me}.cl_die",        die_spec)
             bcfg.set(chan_id, f"{s_me}.cl_by",         caster_name)
@@ -12180,7 +12091,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -12416,7 +12327,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         prev = bcfg.getint(chan_id, f"{s}.cn", fallback=0)
                     except Exception:
                         prev = 0
-                    bcfg.set(chan_id, f"{s}.cn", str(max(prev, dur_rounds)))
+                    _set_timer(bcfg, chan_id, s, "cn", str(max(prev, dur_rounds)))
                     bcfg.set(chan_id, f"{s}.cn_by", caster_name)
                     _save_battles(bcfg)
 
@@ -12481,7 +12392,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -12510,7 +12421,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 slot = key.replace(" ", "_")
             cur = bcfg.getint(ch, f"{slot}.db", fallback=0)
-            bcfg.set(ch, f"{slot}.db", str(max(cur, rounds)))
+            _set_timer(bcfg, ch, slot, "db", str(max(cur, rounds)))
             bcfg.set(ch, f"{slot}.db_by", caster_name)
             _save_battles(bcfg)
             lines.append(f"• **{pretty}** is now under **Drainblade** for **{rounds} rounds**.")
@@ -12542,7 +12453,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -12567,7 +12478,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             key = _find_ci_name(names, tgt_disp or target_name_tok) or (tgt_disp or target_name_tok)
             s = _slot(key)
-            bcfg.set(chan_id, f"{s}.inw", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "inw", str(rounds_total))
             bcfg.set(chan_id, f"{s}.inw_ench", "1")
             _save_battles(bcfg)
 
@@ -12577,8 +12488,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -12613,7 +12523,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -12638,7 +12548,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             key = _find_ci_name(names, tgt_disp or target_name) or (tgt_disp or target_name)
             s = _slot(key)
-            bcfg.set(chan_id, f"{s}.pnm", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "pnm", str(rounds_total))
             _save_battles(bcfg)
 
 
@@ -12647,8 +12557,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -12890,11 +12799,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
         t_cfg = read_cfg(tgt_path)
@@ -12931,7 +12840,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 slot = key.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{slot}.fear", str(rounds))
+            _set_timer(bcfg, chan_id, slot, "fear", str(rounds))
             bcfg.set(chan_id, f"{slot}.fear_src", "causefear")
             bcfg.set(chan_id, f"{slot}.fear_by", caster_name)
             _save_battles(bcfg)
@@ -12963,11 +12872,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
         t_cfg = read_cfg(tgt_path)
@@ -12994,7 +12903,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 slot = key.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{slot}.inv", str(ROUNDS))
+            _set_timer(bcfg, chan_id, slot, "inv", str(ROUNDS))
             bcfg.set(chan_id, f"{slot}.inv_by", caster_name)
             _save_battles(bcfg)
 
@@ -13038,12 +12947,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         """
         cfg = _load_battles()
         code = self._default_code(label)
-        cfg.set(chan_id, f"{slot}.x_{tag}", str(int(rounds)))
-        cfg.set(chan_id, f"{slot}.x_{tag}_label", label)
-        cfg.set(chan_id, f"{slot}.x_{tag}_code", code)
-        if emoji:
-            cfg.set(chan_id, f"{slot}.x_{tag}_emoji", emoji)
-        cfg.set(chan_id, f"{slot}.x_{tag}_by", by)
+        _set_x_effect(cfg, chan_id, slot, tag, rounds, label=label, code=code, emoji=emoji, by=by)
         _save_battles(cfg)
         return code
 
@@ -13201,7 +13105,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -13285,7 +13189,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             if bcfg and bcfg.has_section(chan_id) and s_tgt:
 
-                bcfg.set(chan_id, f"{s_tgt}.hyp", "0")
+                _set_timer(bcfg, chan_id, s_tgt, "hyp", "0")
                 bcfg.set(chan_id, f"{s_tgt}.hyp_by", caster_name)
                 _save_battles(bcfg)
 
@@ -13339,11 +13243,11 @@ class SpellsCog(commands.Cog, name="Spells"):
             slot = _resolve_effect_slot(bcfg, chan, tgt)
 
 
-            bcfg.set(chan, f"{slot}.gas",    str(rounds))
+            _set_timer(bcfg, chan, slot, "gas", str(rounds))
             bcfg.set(chan, f"{slot}.gas_by", caster_name)
 
 
-            bcfg.set(chan, f"{slot}.inw",    str(rounds))
+            _set_timer(bcfg, chan, slot, "inw", str(rounds))
             bcfg.set(chan, f"{slot}.inw_by", "GaseousForm")
 
 
@@ -13439,7 +13343,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if bcfg.has_option(chan_id, k):
                         bcfg.remove_option(chan_id, k)
 
-                bcfg.set(chan_id, f"{s_self}.ps", str(rounds))
+                _set_timer(bcfg, chan_id, s_self, "ps", str(rounds))
                 bcfg.set(chan_id, f"{s_self}.ps_by", caster_name)
                 bcfg.set(chan_id, f"{s_self}.ps_form", form_pretty)
                 bcfg.set(chan_id, f"{s_self}.poly", form_pretty)
@@ -13545,7 +13449,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -13708,7 +13612,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -13832,11 +13736,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             lead_disp, lead_path = str(leader_in), None
             base = f"{str(leader_in).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     lead_path = fn
                     break
-        if not lead_path or not os.path.exists(lead_path):
+        if not lead_path or not coe_exists(lead_path):
             return [f"❌ Target **{leader_in}** not found."]
 
 
@@ -13873,7 +13777,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         leader_key = _find_ci_name(names, lead_disp) or lead_disp
         s_lead = _slot_ci(leader_key)
-        bcfg.set(chan_id, f"{s_lead}.inv", str(ROUNDS))
+        _set_timer(bcfg, chan_id, s_lead, "inv", str(ROUNDS))
         bcfg.set(chan_id, f"{s_lead}.inv_by", caster_name)
         bcfg.set(chan_id, f"{s_lead}.inv_type", "group")
         bcfg.set(chan_id, f"{s_lead}.inv_gid", leader_key)
@@ -13889,16 +13793,16 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 disp, path = str(raw), None
                 base = f"{str(raw).replace(' ', '_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn
                         break
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 missed.append(str(raw))
                 continue
 
             s = _slot_ci(disp)
-            bcfg.set(chan_id, f"{s}.inv", str(ROUNDS))
+            _set_timer(bcfg, chan_id, s, "inv", str(ROUNDS))
             bcfg.set(chan_id, f"{s}.inv_by", caster_name)
             bcfg.set(chan_id, f"{s}.inv_type", "group")
             bcfg.set(chan_id, f"{s}.inv_gid", leader_key)
@@ -13947,11 +13851,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
 
@@ -13974,7 +13878,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 slot = key.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{slot}.inv", str(ROUNDS))
+            _set_timer(bcfg, chan_id, slot, "inv", str(ROUNDS))
             bcfg.set(chan_id, f"{slot}.inv_by", caster_name)
             bcfg.set(chan_id, f"{slot}.inv_type", "imp")
             _save_battles(bcfg)
@@ -14013,11 +13917,11 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 disp, path = str(name), None
                 base = f"{str(name).replace(' ', '_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn
                         break
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 missed.append(str(name))
             else:
                 ok_targets.append(disp)
@@ -14050,7 +13954,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for disp in ok_targets:
             s = _slot_ci(disp)
 
-            bcfg.set(chan_id, f"{s}.inv", "0")
+            _set_timer(bcfg, chan_id, s, "inv", "0")
             bcfg.set(chan_id, f"{s}.inv_perm", "1")
             bcfg.set(chan_id, f"{s}.inv_by", caster_name)
             bcfg.set(chan_id, f"{s}.inv_type", "mass")
@@ -14171,10 +14075,9 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             total = 0
             for n in names:
-                fn = f"{n}.coe"
-                if not os.path.exists(fn):
+                rc = combatant_cfg(n)
+                if rc is None:
                     continue
-                rc = read_cfg(fn)
                 if str(get_compat(rc, "info", "owner_id", fallback="")) != str(owner_id):
                     continue
                 if str(get_compat(rc, "info", "controller", fallback="")).strip().lower() != caster_name.strip().lower():
@@ -14217,7 +14120,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = re.sub(r"[^A-Za-z]", "", mon_name).upper()[:2] or "MO"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             created = []
 
             for _ in range(count):
@@ -14413,10 +14316,9 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             total = 0
             for n in names:
-                fn = f"{n}.coe"
-                if not os.path.exists(fn):
+                rc = combatant_cfg(n)
+                if rc is None:
                     continue
-                rc = read_cfg(fn)
                 if str(get_compat(rc, "info", "owner_id", fallback="")) != str(owner_id):
                     continue
                 if str(get_compat(rc, "info", "controller", fallback="")).strip().lower() != caster_name.strip().lower():
@@ -14459,7 +14361,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = re.sub(r"[^A-Za-z]", "", mon_name).upper()[:2] or "MO"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             created = []
 
             for _ in range(count):
@@ -14606,15 +14508,15 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         def _resolve_file_ci(nm: str):
             base = f"{nm}.coe"
-            if os.path.exists(base): return nm, base
+            if coe_exists(base): return nm, base
             want = nm.lower() + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(want):
                 if fn.lower() == want:
                     return fn[:-4], fn
             return nm, None
 
         mon_name, path = _resolve_file_ci(name)
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             await ctx.send(f"❌ Monster **{name}** not found.")
             return
 
@@ -14647,7 +14549,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             if controller:
                 try:
                     ctrl_disp, ctrl_path = self._resolve_char_ci(controller)
-                    if ctrl_path and os.path.exists(ctrl_path):
+                    if ctrl_path and coe_exists(ctrl_path):
                         ctrl_cfg = read_cfg(ctrl_path)
                         ctrl_level = getint_compat(ctrl_cfg, "cur", "level", fallback=None)
                 except Exception:
@@ -14657,7 +14559,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 active = get_active(ctx.author.id)
                 if active:
                     apath = f"{active.replace(' ', '_')}.coe"
-                    if os.path.exists(apath):
+                    if coe_exists(apath):
                         acfg = read_cfg(apath)
                         ctrl_level = getint_compat(acfg, "cur", "level", fallback=None)
             if ctrl_level is None:
@@ -14668,10 +14570,9 @@ class SpellsCog(commands.Cog, name="Spells"):
                 names, _ = _parse_combatants(bcfg, chan_id)
                 total = 0
                 for n in names:
-                    fn = f"{n}.coe"
-                    if not os.path.exists(fn):
+                    xc = combatant_cfg(n)
+                    if xc is None:
                         continue
-                    xc = read_cfg(fn)
                     if str(get_compat(xc, "info", "owner_id", fallback="")) != str(owner_id): continue
                     if str(get_compat(xc, "info", "controller", fallback="")).strip().lower() != controller_name.strip().lower(): continue
                     if str(get_compat(xc, "stats", "type", fallback="")).strip().lower() != "undead": continue
@@ -14760,7 +14661,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return
 
         caster_path = f"{caster_name.replace(' ', '_')}.coe"
-        caster_cfg = read_cfg(caster_path) if os.path.exists(caster_path) else None
+        caster_cfg = read_cfg(caster_path) if coe_exists(caster_path) else None
         caster_owner_id = (get_compat(caster_cfg, "info", "owner_id", fallback=str(ctx.author.id)) if caster_cfg else str(ctx.author.id)) or str(ctx.author.id)
         caster_level = getint_compat(caster_cfg, "cur", "level", fallback=1) if caster_cfg else 1
 
@@ -14931,7 +14832,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         removed_from_battles += 1
 
                 try:
-                    os.remove(os.path.abspath(path))
+                    remove_cfg(path)
                     changed += 1
                     results.append(f"• **{nm}**: deleted. {(_chan_mention(battle_chan) + ' ') if battle_chan else ''}".rstrip())
                 except Exception:
@@ -15092,7 +14993,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         prefix_map = {"air":"AI","fire":"FI","earth":"EA","water":"WA","wood":"WO","metal":"ME","ice":"IC","lightning":"LI"}
         prefix = prefix_map.get(want, "EL")
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"{prefix}{i}" in existing:
             i += 1
@@ -15217,7 +15118,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -15357,7 +15258,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -15695,7 +15596,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -15819,7 +15720,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -15875,7 +15776,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -15936,8 +15837,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -15989,7 +15889,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -16094,8 +15994,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                            await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -16120,7 +16019,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -16263,7 +16162,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
 
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"IN{i}" in existing:
             i += 1
@@ -16406,7 +16305,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
 
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"SH{i}" in existing:
             i += 1
@@ -16528,7 +16427,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         return self._resolve_char_ci(name)
                     except Exception:
                         base = name.replace(" ", "_").lower() + ".coe"
-                        for fn in os.listdir("."):
+                        for fn in ci_matches(base):
                             if fn.lower() == base:
                                 path = fn
                                 try:
@@ -16739,8 +16638,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, _section_id(ctx.channel))
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -16933,7 +16831,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -17074,8 +16972,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -17103,7 +17000,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -17229,7 +17126,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 for _, p in dead_monsters:
                     try:
-                        os.remove(os.path.abspath(p))
+                        remove_cfg(p)
                     except Exception:
                         pass
 
@@ -17242,8 +17139,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg2, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                 except Exception:
                     pass
 
@@ -17263,7 +17159,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             s_me   = self._effect_slot_for(bcfg, chan_id, me_key)
 
 
-            bcfg.set(chan_id, f"{s_me}.x_dbf", "-1")
+            _set_timer(bcfg, chan_id, s_me, "x_dbf", "-1")
             bcfg.set(chan_id, f"{s_me}.x_dbf_label", "DBF")
             bcfg.set(chan_id, f"{s_me}.x_dbf_emoji", "💣")
             bcfg.set(chan_id, f"{s_me}.x_dbf_code",  "perm")
@@ -17394,7 +17290,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             ci = _find_ci_name(names, caster_name) or caster_name
             s  = self._effect_slot_for(bcfg, chan_id, ci)
-            bcfg.set(chan_id, f"{s}.swd", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "swd", str(rounds_total))
             bcfg.set(chan_id, f"{s}.swd_last_round", "0")
             bcfg.set(chan_id, f"{s}.swd_by", caster_name)
             _save_battles(bcfg)
@@ -17412,8 +17308,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
             return head + "\n*(Tip: `!a sword go1`)*"
@@ -17428,7 +17323,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
 
             base = tokens[0].replace(" ", "_").lower() + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base:
                     tgt_path = fn
                     try:
@@ -17471,7 +17366,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     slot = key.replace(" ", "_")
 
 
-                bcfg.set(chan_id, f"{slot}.x_gazereflection", str(rounds))
+                _set_timer(bcfg, chan_id, slot, "x_gazereflection", str(rounds))
                 bcfg.set(chan_id, f"{slot}.x_gazereflection_code", "GR")
                 bcfg.set(chan_id, f"{slot}.x_gazereflection_label", "Gaze Reflection")
                 bcfg.set(chan_id, f"{slot}.x_gazereflection_by", caster_name)
@@ -17482,8 +17377,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception:
                     pass
 
@@ -17520,7 +17414,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -17610,8 +17504,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                            await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                     except Exception:
                         pass
 
@@ -17812,7 +17705,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     bcfg.remove_option(chan_id, k)
 
 
-            bcfg.set(chan_id, f"{s_self}.ps", str(rounds))
+            _set_timer(bcfg, chan_id, s_self, "ps", str(rounds))
             bcfg.set(chan_id, f"{s_self}.ps_by", caster_name)
             bcfg.set(chan_id, f"{s_self}.ps_form", form_pretty)
             bcfg.set(chan_id, f"{s_self}.poly", form_pretty)
@@ -17856,11 +17749,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
 
@@ -17884,7 +17777,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 slot = key.replace(" ", "_")
 
 
-            bcfg.set(chan_id, f"{slot}.x_blur", str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_blur", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_blur_code", "BL")
             bcfg.set(chan_id, f"{slot}.x_blur_label", "Blur")
             bcfg.set(chan_id, f"{slot}.x_blur_by", caster_name)
@@ -17921,11 +17814,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
 
@@ -17949,7 +17842,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 slot = key.replace(" ", "_")
 
 
-            bcfg.set(chan_id, f"{slot}.x_displacement", str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_displacement", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_displacement_code", "DP")
             bcfg.set(chan_id, f"{slot}.x_displacement_label", "Displacement")
             bcfg.set(chan_id, f"{slot}.x_displacement_by", caster_name)
@@ -17985,7 +17878,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             s_me   = self._effect_slot_for(bcfg, chan_id, me_key)
 
 
-            bcfg.set(chan_id, f"{s_me}.sc",       str(sc_rounds))
+            _set_timer(bcfg, chan_id, s_me, "sc", str(sc_rounds))
             bcfg.set(chan_id, f"{s_me}.sc_by",    caster_name)
             bcfg.set(chan_id, f"{s_me}.sc_level", str(int(caster_level)))
             _save_battles(bcfg)
@@ -18154,7 +18047,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -18223,7 +18116,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -18365,7 +18258,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         dur_rounds = max(1, int(caster_level)) * 360
 
-        bcfg.set(chan_id, f"{slot}.x_suggestion", str(dur_rounds))
+        _set_timer(bcfg, chan_id, slot, "x_suggestion", str(dur_rounds))
         bcfg.set(chan_id, f"{slot}.x_suggestion_code", "SU")
         bcfg.set(chan_id, f"{slot}.x_suggestion_label", "Suggestion")
         bcfg.set(chan_id, f"{slot}.x_suggestion_by", caster_name)
@@ -18431,7 +18324,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         ROUNDS = max(1, int(caster_level or 1))
-        bcfg.set(chan_id, f"{s_me}.inv", str(ROUNDS))
+        _set_timer(bcfg, chan_id, s_me, "inv", str(ROUNDS))
         bcfg.set(chan_id, f"{s_me}.inv_by", caster_name)
         bcfg.set(chan_id, f"{s_me}.inv_type", "imp")
 
@@ -18439,7 +18332,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                      f"(attacking/casting **does not** end it).")
 
 
-        bcfg.set(chan_id, f"{s_me}.x_mislead", "0")
+        _set_timer(bcfg, chan_id, s_me, "x_mislead", "0")
         bcfg.set(chan_id, f"{s_me}.x_mislead_code", "MSLD")
         bcfg.set(chan_id, f"{s_me}.x_mislead_label", "Mislead (Double)")
         bcfg.set(chan_id, f"{s_me}.x_mislead_by", caster_name)
@@ -18477,7 +18370,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -18509,7 +18402,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw in names:
             disp, path = _resolve_char_ci(raw)
             pretty = disp or raw
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -18532,7 +18425,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 if bcfg and bcfg.has_section(chan_id):
                     slot = self._effect_slot_for(bcfg, chan_id, pretty)
-                    bcfg.set(chan_id, f"{slot}.x_shk", "1")
+                    _set_timer(bcfg, chan_id, slot, "x_shk", "1")
                     bcfg.set(chan_id, f"{slot}.x_shk_label", "Shaken")
                     bcfg.set(chan_id, f"{slot}.x_shk_code",  "SHK")
                     bcfg.set(chan_id, f"{slot}.x_shk_by",    caster_name)
@@ -18548,7 +18441,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 slot = self._effect_slot_for(bcfg, chan_id, pretty)
 
 
-                bcfg.set(chan_id, f"{slot}.fear",     str(rounds))
+                _set_timer(bcfg, chan_id, slot, "fear", str(rounds))
                 bcfg.set(chan_id, f"{slot}.fear_src", "greaterfear")
                 bcfg.set(chan_id, f"{slot}.fear_by",  caster_name)
 
@@ -18635,7 +18528,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             tgt_disp, tgt_path = self._resolve_char_ci_local(raw_target)
             pretty = tgt_disp or raw_target
-            if not tgt_path or not os.path.exists(tgt_path):
+            if not tgt_path or not coe_exists(tgt_path):
                 lines.append(f"• **{pretty}**: ⚠️ *(creature not found — no effect)*")
                 continue
 
@@ -18686,7 +18579,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 continue
 
             slot = self._effect_slot_for(bcfg, chan_id, pretty)
-            bcfg.set(chan_id, f"{slot}.x_suggestion",        str(dur_rounds))
+            _set_timer(bcfg, chan_id, slot, "x_suggestion", str(dur_rounds))
             bcfg.set(chan_id, f"{slot}.x_suggestion_code",   "SU")
             bcfg.set(chan_id, f"{slot}.x_suggestion_label",  "Mass Suggestion")
             bcfg.set(chan_id, f"{slot}.x_suggestion_by",     caster_name)
@@ -18731,11 +18624,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
 
@@ -18755,7 +18648,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 slot = key.replace(" ", "_")
 
-            bcfg.set(chan_id, f"{slot}.x_truesight",        str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_truesight", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_truesight_code",   "TS")
             bcfg.set(chan_id, f"{slot}.x_truesight_label",  "True Seeing")
             bcfg.set(chan_id, f"{slot}.x_truesight_by",     caster_name)
@@ -18872,7 +18765,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -18885,7 +18778,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         tgt_name, tgt_path = _resolve_char_ci(target)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"❌ Target '{target}' not found."
         tgt_cfg = read_cfg(tgt_path)
 
@@ -18968,7 +18861,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             tgt_disp, tgt_path = self._resolve_char_ci_local(raw_target)
         except Exception:
             tgt_disp, tgt_path = self._resolve_char_ci(raw_target)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             lines.append(f"• **{raw_target}**: ⚠️ *(creature not found — no effect)*")
             return lines
         t_cfg = read_cfg(tgt_path)
@@ -19037,7 +18930,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         dur_rounds = max(1, int(caster_level)) * 8640
         days = max(1, int(caster_level))
 
-        bcfg.set(chan_id, f"{slot}.x_demand",        str(dur_rounds))
+        _set_timer(bcfg, chan_id, slot, "x_demand", str(dur_rounds))
         bcfg.set(chan_id, f"{slot}.x_demand_code",   "SU")
         bcfg.set(chan_id, f"{slot}.x_demand_label",  "Demand")
         bcfg.set(chan_id, f"{slot}.x_demand_by",     caster_name)
@@ -19083,7 +18976,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             tgt_disp, tgt_path = self._resolve_char_ci_local(raw_target)
         except Exception:
             tgt_disp, tgt_path = self._resolve_char_ci(raw_target)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             lines.append(f"• **{raw_target}**: ⚠️ *(creature not found — no effect)*")
             return lines
 
@@ -19131,7 +19024,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 key = _find_ci_name(names, tgt_disp) or tgt_disp
                 s = self._effect_slot_for(bcfg, chan_id, key)
                 prev = bcfg.getint(chan_id, f"{s}.cn", fallback=0)
-                bcfg.set(chan_id, f"{s}.cn", str(max(prev, dur_rounds)))
+                _set_timer(bcfg, chan_id, s, "cn", str(max(prev, dur_rounds)))
                 bcfg.set(chan_id, f"{s}.cn_by", caster_name)
                 _save_battles(bcfg)
                 lines.append(f"→ **Confused** for **{dur_rounds} rounds**.")
@@ -19151,7 +19044,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         bcfg.set(chan_id, f"{s}.cn_perm", "1")
         if bcfg.getint(chan_id, f"{s}.cn", fallback=0) <= 0:
-            bcfg.set(chan_id, f"{s}.cn", "1")
+            _set_timer(bcfg, chan_id, s, "cn", "1")
         bcfg.set(chan_id, f"{s}.cn_by", caster_name)
         _save_battles(bcfg)
 
@@ -19238,7 +19131,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw in tokens:
             disp, path = _res(raw)
             pretty = disp or raw
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -19267,7 +19160,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         slot = key.replace(" ", "_")
                     s, rolls_b, flat_b = roll_dice("2d4")
                     rounds_blind = max(1, s + flat_b)
-                    bcfg.set(chan_id, f"{slot}.blind",       str(rounds_blind))
+                    _set_timer(bcfg, chan_id, slot, "blind", str(rounds_blind))
                     bcfg.set(chan_id, f"{slot}.blind_src",   "prismatic")
                     bcfg.set(chan_id, f"{slot}.blind_by",    caster_name)
                     bcfg.set(chan_id, f"{slot}.blind_level", str(int(caster_level)))
@@ -19385,7 +19278,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if bcfg and bcfg.has_section(chan_id) and slot:
                             bcfg.set(chan_id, f"{slot}.cn_perm", "1")
                             if bcfg.getint(chan_id, f"{slot}.cn", fallback=0) <= 0:
-                                bcfg.set(chan_id, f"{slot}.cn", "1")
+                                _set_timer(bcfg, chan_id, slot, "cn", "1")
                             bcfg.set(chan_id, f"{slot}.cn_by", caster_name)
                             _save_battles(bcfg)
                         lines.append(f"    🟣 Indigo — Save vs Spells {roll}{f' - {pen}' if pen else ''} vs {dc} → 😵‍💫 **INSANITY** (permanent Confusion)")
@@ -19458,7 +19351,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -19470,8 +19363,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -19511,7 +19403,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw in tokens:
             tgt_disp, tgt_path = self._resolve_char_ci_local(raw)
             pretty = tgt_disp or raw
-            if not tgt_path or not os.path.exists(tgt_path):
+            if not tgt_path or not coe_exists(tgt_path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -19588,7 +19480,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 prev_par = bcfg.getint(chan_id, f"{slot}.paralyzed", fallback=0)
                 if u_rd > 0:
-                    bcfg.set(chan_id, f"{slot}.paralyzed", str(max(prev_par, u_rd)))
+                    _set_timer(bcfg, chan_id, slot, "paralyzed", str(max(prev_par, u_rd)))
                     bcfg.set(chan_id, f"{slot}.paralyzed_by", "Scintillating Pattern")
                 _queue_blind_after_paralysis(b_rd)
                 _queue_confusion_after_blind(c_rd)
@@ -19607,7 +19499,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 prev_bl = bcfg.getint(chan_id, f"{slot}.blind", fallback=0)
                 if b_rd > 0:
-                    bcfg.set(chan_id, f"{slot}.blind", str(max(prev_bl, b_rd)))
+                    _set_timer(bcfg, chan_id, slot, "blind", str(max(prev_bl, b_rd)))
                     bcfg.set(chan_id, f"{slot}.blind_src", "scintillating")
                     bcfg.set(chan_id, f"{slot}.blind_by", caster_name)
                 _queue_confusion_after_blind(c_rd)
@@ -19620,12 +19512,12 @@ class SpellsCog(commands.Cog, name="Spells"):
             else:
 
                 prev_bl = bcfg.getint(chan_id, f"{slot}.blind", fallback=0)
-                bcfg.set(chan_id, f"{slot}.blind", str(max(prev_bl, 1)))
+                _set_timer(bcfg, chan_id, slot, "blind", str(max(prev_bl, 1)))
                 bcfg.set(chan_id, f"{slot}.blind_src", "scintillating")
                 bcfg.set(chan_id, f"{slot}.blind_by",  caster_name)
 
                 prev_cn = bcfg.getint(chan_id, f"{slot}.cn", fallback=0)
-                bcfg.set(chan_id, f"{slot}.cn", str(max(prev_cn, 1)))
+                _set_timer(bcfg, chan_id, slot, "cn", str(max(prev_cn, 1)))
                 bcfg.set(chan_id, f"{slot}.cn_by", caster_name)
                 _save_battles(bcfg)
 
@@ -19706,7 +19598,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -19915,7 +19807,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     slotT = _choose_slot_for_effects(bcfg, chan_id, tgt_disp)
                 except Exception:
                     slotT = tgt_disp.replace(" ", "_")
-                bcfg.set(chan_id, f"{slotT}.x_chilldebuff",           str(rounds))
+                _set_timer(bcfg, chan_id, slotT, "x_chilldebuff", str(rounds))
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_code",      "CH")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_label",     "Chilled (melee -1)")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_emoji",     "🥶")
@@ -19930,7 +19822,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 ci = _find_ci_name(names, caster_name) or caster_name
                 s = _choose_slot_for_effects(bcfg, chan_id, ci) if '_choose_slot_for_effects' in globals() else _slot(ci)
 
-                bcfg.set(chan_id, f"{s}.chl", "2")
+                _set_timer(bcfg, chan_id, s, "chl", "2")
                 bcfg.set(chan_id, f"{s}.chl_charges", "1")
                 _save_battles(bcfg)
         except Exception:
@@ -19974,7 +19866,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 s  = _choose_slot_for_effects(bcfg, chan_id, ci) if '_choose_slot_for_effects' in globals() else _slot(ci)
             except Exception:
                 s = caster_name.replace(" ", "_")
-            bcfg.set(chan_id, f"{s}.cr", str(rounds_total))
+            _set_timer(bcfg, chan_id, s, "cr", str(rounds_total))
             _save_battles(bcfg)
 
         head = f"❄️ **Chill Ray** conjured — duration **{rounds_total} rounds**. Use `!a chillray <target>` once each round."
@@ -19992,8 +19884,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -20050,7 +19941,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     slotT = _choose_slot_for_effects(bcfg, chan_id, tgt_disp) if '_choose_slot_for_effects' in globals() else _slot(tgt_disp)
                 except Exception:
                     slotT = tgt_disp.replace(" ", "_")
-                bcfg.set(chan_id, f"{slotT}.x_chilldebuff",       str(rounds))
+                _set_timer(bcfg, chan_id, slotT, "x_chilldebuff", str(rounds))
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_code",  "CH")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_label", "Chilled (melee -1)")
                 bcfg.set(chan_id, f"{slotT}.x_chilldebuff_emoji", "🥶")
@@ -20094,7 +19985,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -20259,7 +20150,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             ents = _sorted_entries(bcfg, chan_id)
                             bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                         _save_battles(bcfg)
-                    try: os.remove(os.path.abspath(path))
+                    try: remove_cfg(path)
                     except Exception: pass
                 except Exception:
                     pass
@@ -20281,7 +20172,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         res = _resolve_effect_slot(bcfg, chan_id, target_disp)
         slotT = res[0] if isinstance(res, (tuple, list)) else res
         p = int(penalty)
-        bcfg.set(chan_id, f"{slotT}.stench",       str(max(0, int(rounds))))
+        _set_timer(bcfg, chan_id, slotT, "stench", str(max(0, int(rounds))))
         bcfg.set(chan_id, f"{slotT}.stench_pen",   str(p))
         shown = abs(p) if p < 0 else p
         bcfg.set(chan_id, f"{slotT}.stench_label", f"Sickened (−{shown} to attack)")
@@ -20291,7 +20182,7 @@ class SpellsCog(commands.Cog, name="Spells"):
     def _start_maggots(self, bcfg, chan_id, target_disp: str, by: str, rounds: int, dmg_spec: str = "1d4"):
         res = _resolve_effect_slot(bcfg, chan_id, target_disp)
         slotT = res[0] if isinstance(res, (tuple, list)) else res
-        bcfg.set(chan_id, f"{slotT}.x_maggots",       str(max(0, int(rounds))))
+        _set_timer(bcfg, chan_id, slotT, "x_maggots", str(max(0, int(rounds))))
         bcfg.set(chan_id, f"{slotT}.x_maggots_code",  "MS")
         bcfg.set(chan_id, f"{slotT}.x_maggots_label", "Maggots (1d4/rd)")
         bcfg.set(chan_id, f"{slotT}.x_maggots_emoji", "🪱")
@@ -20438,7 +20329,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         caster_owner_id = get_compat(cfg, "info", "owner_id", fallback=str(ctx.author.id)) or str(ctx.author.id)
         cname_lc = (caster_name or "").strip().lower()
-        for fn in os.listdir("."):
+        for fn in cwd_listing():
             if not fn.lower().endswith(".coe"):
                 continue
             try:
@@ -20464,7 +20355,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -20477,7 +20368,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         caster_disp, caster_path = _resolve_char_ci_local(caster_name)
-        caster_cfg = read_cfg(caster_path) if caster_path and os.path.exists(caster_path) else None
+        caster_cfg = read_cfg(caster_path) if caster_path and coe_exists(caster_path) else None
         caster_max_hp = getint_compat(caster_cfg, "max", "hp",
                           fallback=getint_compat(caster_cfg, "cur", "hp", fallback=1)) if caster_cfg else 1
         skull_hp = max(1, int(caster_max_hp // 4))
@@ -20503,7 +20394,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
 
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"FI{i}" in existing:
             i += 1
@@ -20567,7 +20458,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         rounds = max(1, int(caster_level)) * 360
-        bcfg.set(chan_id, f"{slot}.x_fs",        str(rounds))
+        _set_timer(bcfg, chan_id, slot, "x_fs", str(rounds))
         bcfg.set(chan_id, f"{slot}.x_fs_label",  "Fireskull")
         bcfg.set(chan_id, f"{slot}.x_fs_code",  "FS")
         bcfg.set(chan_id, f"{slot}.x_fs_emoji",  "💀")
@@ -20737,7 +20628,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = re.sub(r"[^A-Za-z]", "", mon_name).upper()[:2] or "MO"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             created = []
 
             for _ in range(count):
@@ -20921,7 +20812,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
-            for fnm in os.listdir("."):
+            for fnm in ci_matches(base):
                 if fnm.lower() == base:
                     path = fnm
                     try:
@@ -20959,10 +20850,9 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             total = 0
             for n in names:
-                fn = f"{n}.coe"
-                if not os.path.exists(fn):
+                rc = combatant_cfg(n)
+                if rc is None:
                     continue
-                rc = read_cfg(fn)
                 if str(get_compat(rc, "info", "owner_id", fallback="")) != str(owner_id):
                     continue
                 if str(get_compat(rc, "info", "controller", fallback="")).strip().lower() != caster_name.strip().lower():
@@ -21133,7 +21023,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -21300,7 +21190,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -21433,7 +21323,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -21552,7 +21442,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 rounds = 6 * max(1, int(caster_level or 1))
 
                 base_key = "x_rayexhaustion"
-                bcfg.set(chan_id, f"{slot}.{base_key}",          str(int(rounds)))
+                _set_timer(bcfg, chan_id, slot, base_key, str(int(rounds)))
                 bcfg.set(chan_id, f"{slot}.{base_key}_code",     "RE")
                 bcfg.set(chan_id, f"{slot}.{base_key}_label",    "Ray of Exhaustion")
                 bcfg.set(chan_id, f"{slot}.{base_key}_emoji",    "😵‍💫")
@@ -21604,7 +21494,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 name_safe = (name or "")
                 base = name_safe.replace(" ", "_").lower() + (".ini" if name_safe.lower().endswith(".ini") else ".coe")
-                files = os.listdir(".")
+                files = cwd_listing()
                 for fn in files:
                     if fn.lower() == base:
                         path = fn
@@ -21804,7 +21694,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(path))
+                    remove_cfg(path)
                 except Exception:
                     pass
 
@@ -21819,8 +21709,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -21945,7 +21834,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
             prefix = {"wraith": "WR", "spectre": "SP", "ghost": "GH"}.get(mon_name, re.sub(r"[^A-Za-z]", "", mon_name).upper()[:2] or "MO")
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             made = []
 
             for _ in range(count):
@@ -22130,7 +22019,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return "plant" in fields
 
 
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
 
             return f"🌿 **Blight**\n{tgt_disp}: **Withers and dies** (non-creature plant; no save)." + extra_note
 
@@ -22202,7 +22091,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -22215,8 +22104,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg2, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -22251,7 +22139,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         extras = [t for t in toks[1:]]
         extra_note = (f"\n*(Single-target; ignoring: {', '.join(extras)})*" if extras else "")
 
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"🩸 **Vampiric Touch**\n{tgt_raw}: *(not found)*{extra_note}"
 
 
@@ -22418,7 +22306,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             try:
-                os.remove(os.path.abspath(tgt_path))
+                remove_cfg(tgt_path)
             except Exception:
                 pass
 
@@ -22570,7 +22458,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw, pretty, path in resolved:
             name_show = pretty or raw
 
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 out_lines.append(f"{name_show}: *(not found)*")
                 continue
 
@@ -22621,7 +22509,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{s_def}.heldby", f"{caster_name} (Tentacles)")
 
 
-                bcfg.set(chan_id, f"{s_def}.x_tentacles",        str(rounds_on_victim))
+                _set_timer(bcfg, chan_id, s_def, "x_tentacles", str(rounds_on_victim))
                 bcfg.set(chan_id, f"{s_def}.x_tentacles_dmg",    "1d6")
                 bcfg.set(chan_id, f"{s_def}.x_tentacles_label",  "Black Tentacles")
                 bcfg.set(chan_id, f"{s_def}.x_tentacles_emoji",  "🐙")
@@ -22683,7 +22571,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             tgt_disp, tgt_path = self._resolve_char_ci(tgt_raw)
         except Exception:
             tgt_disp, tgt_path = tgt_raw, None
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"🧪 **Cause Disease**\n{tgt_raw}: *(not found)*{extra_note}"
 
 
@@ -22774,7 +22662,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             bcfg.set(chan_id, f"{slot}.sick_pen", "-2")
 
 
-            bcfg.set(chan_id, f"{slot}.x_sick",         str(total_rounds))
+            _set_timer(bcfg, chan_id, slot, "x_sick", str(total_rounds))
             bcfg.set(chan_id, f"{slot}.x_sick_code",    "SI")
             bcfg.set(chan_id, f"{slot}.x_sick_label",   "Sickened (Disease)")
             bcfg.set(chan_id, f"{slot}.x_sick_emoji",   "🤢")
@@ -22819,7 +22707,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             tgt_disp, tgt_path = self._resolve_char_ci(tgt_raw)
         except Exception:
             tgt_disp, tgt_path = tgt_raw, None
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"✨ **Cure Disease**\n{tgt_raw}: *(not found)*"
 
 
@@ -22916,7 +22804,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             tgt_disp, tgt_path = self._resolve_char_ci(tgt_raw)
         except Exception:
             tgt_disp, tgt_path = tgt_raw, None
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"☠️ **Enervation**\n{tgt_raw}: *(not found)*{extra_note}"
 
         
@@ -23151,7 +23039,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             _save_battles(bcfg)
                     try:
                         if _is_monster_file(tgt_path):
-                            os.remove(os.path.abspath(tgt_path))
+                            remove_cfg(tgt_path)
                     except Exception:
                         pass
                 except Exception:
@@ -23176,7 +23064,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         except Exception:
                             slot_t = str(tgt_disp).replace(" ", "_")
                     base_key = "x_enervfade"
-                    bcfg.set(chan_id, f"{slot_t}.{base_key}",          str(int(rounds)))
+                    _set_timer(bcfg, chan_id, slot_t, base_key, str(int(rounds)))
                     bcfg.set(chan_id, f"{slot_t}.{base_key}_code",     "EN")
                     bcfg.set(chan_id, f"{slot_t}.{base_key}_label",    "Enervation: NL fade")
                     bcfg.set(chan_id, f"{slot_t}.{base_key}_emoji",    "🕯️")
@@ -23269,7 +23157,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             attack_list = [a for a in re.split(r"[,\s]+", attacknames_raw) if a] if attacknames_raw else atk_pref_list
 
             prefix = "MU"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             made = []
 
             for _ in range(count):
@@ -23425,7 +23313,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             bcfg.set(chan_id, f"{s_me}.x_sp_code",  "SP")
             bcfg.set(chan_id, f"{s_me}.x_sp_label", "Symbol of Pain")
             bcfg.set(chan_id, f"{s_me}.x_sp_emoji", "🪡")
-            bcfg.set(chan_id, f"{s_me}.x_sp_n",     str(active_rounds))
+            _set_timer(bcfg, chan_id, s_me, "x_sp_n", str(active_rounds))
 
             _save_battles(bcfg)
 
@@ -23485,7 +23373,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
                 cur_tail = bcfg.getint(chan_id, f"{s_tgt}.x_pain_n", fallback=0)
-                bcfg.set(chan_id, f"{s_tgt}.x_pain_n", str(max(cur_tail, tail_rounds)))
+                _set_timer(bcfg, chan_id, s_tgt, "x_pain_n", str(max(cur_tail, tail_rounds)))
                 bcfg.set(chan_id, f"{s_tgt}.x_pain_by", caster_name)
 
                 _save_battles(bcfg)
@@ -23546,7 +23434,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{s_me}.x_sf_code",  "SF")
                 bcfg.set(chan_id, f"{s_me}.x_sf_label", "Symbol of Fear")
                 bcfg.set(chan_id, f"{s_me}.x_sf_emoji", "😱")
-                bcfg.set(chan_id, f"{s_me}.x_sf_n",     str(active_rounds))
+                _set_timer(bcfg, chan_id, s_me, "x_sf_n", str(active_rounds))
                 _save_battles(bcfg)
 
                 lines.append(f"**Triggered now** — duration: **{active_rounds} rounds**.")
@@ -23592,7 +23480,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
                 slot = self._effect_slot_for(bcfg, chan_id, pretty)
 
-                bcfg.set(chan_id, f"{slot}.x_shk_n",     "1")
+                _set_timer(bcfg, chan_id, slot, "x_shk_n", "1")
                 bcfg.set(chan_id, f"{slot}.x_shk_code",  "SHK")
                 bcfg.set(chan_id, f"{slot}.x_shk_label", "Shaken")
                 bcfg.set(chan_id, f"{slot}.x_shk_by",    caster_name)
@@ -23605,12 +23493,12 @@ class SpellsCog(commands.Cog, name="Spells"):
             slot = self._effect_slot_for(bcfg, chan_id, pretty)
 
 
-            bcfg.set(chan_id, f"{slot}.fear",     str(rounds))
+            _set_timer(bcfg, chan_id, slot, "fear", str(rounds))
             bcfg.set(chan_id, f"{slot}.fear_src", "symboloffear")
             bcfg.set(chan_id, f"{slot}.fear_by",  caster_name)
 
 
-            bcfg.set(chan_id, f"{slot}.x_pnc_n",     str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_pnc_n", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_pnc_code",  "PNC")
             bcfg.set(chan_id, f"{slot}.x_pnc_label", "Panic")
             bcfg.set(chan_id, f"{slot}.x_pnc_by",    caster_name)
@@ -23667,7 +23555,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{s_me}.x_sd_code",  "SD")
                 bcfg.set(chan_id, f"{s_me}.x_sd_label", "Symbol of Death")
                 bcfg.set(chan_id, f"{s_me}.x_sd_emoji", "💀")
-                bcfg.set(chan_id, f"{s_me}.x_sd_n",     str(active_rounds))
+                _set_timer(bcfg, chan_id, s_me, "x_sd_n", str(active_rounds))
                 _save_battles(bcfg)
 
                 lines.append(f"**Triggered now** — duration: **{active_rounds} rounds**.")
@@ -23736,7 +23624,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 
                 s_tgt = self._effect_slot_for(bcfg, chan_id, pretty)
                 if sod_left > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.x_sdok_n",     str(sod_left))
+                    _set_timer(bcfg, chan_id, s_tgt, "x_sdok_n", str(sod_left))
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_code",  "SDOK")
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_label", "Saved vs Symbol (Death)")
                     bcfg.set(chan_id, f"{s_tgt}.x_sdok_by",    caster_name)
@@ -23750,7 +23638,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 try:
                     s_tgt = self._effect_slot_for(bcfg, chan_id, pretty)
                     if sod_left > 0:
-                        bcfg.set(chan_id, f"{s_tgt}.x_sdok_n",     str(sod_left))
+                        _set_timer(bcfg, chan_id, s_tgt, "x_sdok_n", str(sod_left))
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_code",  "SDOK")
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_label", "Saved vs Symbol (Death)")
                         bcfg.set(chan_id, f"{s_tgt}.x_sdok_by",    caster_name)
@@ -23812,7 +23700,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     except Exception:
                         pass
                     try:
-                        os.remove(os.path.abspath(tgt_path))
+                        remove_cfg(tgt_path)
                     except Exception:
                         pass
 
@@ -23903,7 +23791,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = "IN"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
 
             for _ in range(n):
                 i = 1
@@ -23984,7 +23872,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
                 rounds = max(1, int(caster_level or 1))
-                bcfg.set(chan_id, f"{s}.x_swarm", str(rounds))
+                _set_timer(bcfg, chan_id, s, "x_swarm", str(rounds))
                 bcfg.set(chan_id, f"{s}.x_swarm_code", "SWARM")
                 bcfg.set(chan_id, f"{s}.x_swarm_label", "Insect Swarm")
                 bcfg.set(chan_id, f"{s}.x_swarm_emoji", "🪰")
@@ -24079,7 +23967,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
-            for fnm in os.listdir("."):
+            for fnm in ci_matches(base):
                 if fnm.lower() == base:
                     path = fnm
                     try:
@@ -24117,10 +24005,9 @@ class SpellsCog(commands.Cog, name="Spells"):
             names, _ = _parse_combatants(bcfg, chan_id)
             total = 0
             for n in names:
-                fn = f"{n}.coe"
-                if not os.path.exists(fn):
+                rc = combatant_cfg(n)
+                if rc is None:
                     continue
-                rc = read_cfg(fn)
                 if str(get_compat(rc, "info", "owner_id", fallback="")) != str(owner_id):
                     continue
                 if str(get_compat(rc, "info", "controller", fallback="")).strip().lower() != caster_name.strip().lower():
@@ -24238,7 +24125,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{slot}.minion_type", "controlundead_temp")
 
 
-                bcfg.set(chan_id, f"{slot}.x_ctrlu", str(rounds_ctrl))
+                _set_timer(bcfg, chan_id, slot, "x_ctrlu", str(rounds_ctrl))
                 bcfg.set(chan_id, f"{slot}.x_ctrlu_code", "CTRLU")
                 bcfg.set(chan_id, f"{slot}.x_ctrlu_label", "Control Undead")
                 bcfg.set(chan_id, f"{slot}.x_ctrlu_emoji", "🕯️")
@@ -24351,7 +24238,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -24384,7 +24271,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw in tokens or []:
             tgt_disp, tgt_path = _resolve_char_ci_local(raw)
             pretty = tgt_disp or raw
-            if not tgt_path or not os.path.exists(tgt_path):
+            if not tgt_path or not coe_exists(tgt_path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -24447,7 +24334,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 prev = bcfg.getint(chan_id, f"{s_tgt}.paralyzed", fallback=0)
                 newv = max(prev, int(coma_rounds))
                 if newv > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.paralyzed", str(newv))
+                    _set_timer(bcfg, chan_id, s_tgt, "paralyzed", str(newv))
                     bcfg.set(chan_id, f"{s_tgt}.paralyzed_by", "eyebite")
 
                 self._clear_code_badges(bcfg, chan_id, s_tgt, "COMA")
@@ -24463,7 +24350,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 s, rolls, _ = roll_dice("1d4")
                 fr = max(0, int(s))
                 if fr > 0:
-                    bcfg.set(chan_id, f"{s_tgt}.fear",     str(fr))
+                    _set_timer(bcfg, chan_id, s_tgt, "fear", str(fr))
                     bcfg.set(chan_id, f"{s_tgt}.fear_src", "eyebite")
                     bcfg.set(chan_id, f"{s_tgt}.fear_by",  caster_name)
                     notes.append(f"😱 **PANICKED** for **{fr} rounds** ({', '.join(str(r) for r in rolls)}).")
@@ -24541,7 +24428,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -25153,7 +25040,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -25263,7 +25150,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
 
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"HE{i}" in existing:
             i += 1
@@ -25500,7 +25387,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -25567,7 +25454,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -25942,7 +25829,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return
 
         char_disp, char_path = self._resolve_char_ci(char_name)
-        if not char_path or not os.path.exists(char_path):
+        if not char_path or not coe_exists(char_path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -26251,7 +26138,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         if key == "gaseousform":
             if in_initiative:
-                bcfg.set(chan_id, f"{imb_slot}.gas", str(dur_rounds))
+                _set_timer(bcfg, chan_id, imb_slot, "gas", str(dur_rounds))
                 bcfg.set(chan_id, f"{imb_slot}.gas_by", char_disp)
                 _save_battles(bcfg)
                 timer_started_note = f"[GAS {dur_rounds}] on **{imb_disp}**"
@@ -26263,7 +26150,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         if key == "invisibility":
             if in_initiative:
-                bcfg.set(chan_id, f"{imb_slot}.inv", str(dur_rounds))
+                _set_timer(bcfg, chan_id, imb_slot, "inv", str(dur_rounds))
                 bcfg.set(chan_id, f"{imb_slot}.inv_type", "norm")
                 bcfg.set(chan_id, f"{imb_slot}.inv_by", char_disp)
                 _save_battles(bcfg)
@@ -26287,7 +26174,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return
             if in_initiative:
                 try:
-                    bcfg.set(chan_id, f"{imb_slot}.ps", str(dur_rounds))
+                    _set_timer(bcfg, chan_id, imb_slot, "ps", str(dur_rounds))
                     bcfg.set(chan_id, f"{imb_slot}.ps_by", char_disp)
                     _save_battles(bcfg)
                     timer_started_note = f"[PS {dur_rounds}] on **{imb_disp}**"
@@ -26501,25 +26388,14 @@ class SpellsCog(commands.Cog, name="Spells"):
         Return (canon_name, item_dict) or (None, None).
         Tries exact, case-insensitive, and normalized lookups.
         """
-        if not key:
-            return None, None
-        k = key.strip()
-
-        if k in self.items:
-            return k, self.items[k]
-        for nm in self.items.keys():
-            if nm.lower() == k.lower():
-                return nm, self.items[nm]
-
-        norm = self._norm(k)
-        canon = self._index.get(k) or self._index.get(k.lower()) or self._index.get(norm)
-        if canon and canon in self.items:
-            return canon, self.items[canon]
-
-        for nm in self.items.keys():
-            if self._norm(nm) == norm:
-                return nm, self.items[nm]
-        return None, None
+        return item_search().lookup(key)
+
+    def find_item(self, query: str):
+        """(canon, item_dict), or (None, [ranked suggestions]) when the name is unknown."""
+        canon, item = item_search().lookup(query)
+        if canon is not None:
+            return canon, item
+        return None, item_search().suggest(query)
 
     def _item_ac(self, item: dict) -> int | None:
         v = item.get("AC") if "AC" in item else item.get("ac")
@@ -26595,7 +26471,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return
 
         char_disp, char_path = self._resolve_char_ci(char_name)
-        if not char_path or not os.path.exists(char_path):
+        if not char_path or not coe_exists(char_path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -27105,7 +26981,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -27241,7 +27117,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -27857,7 +27733,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if not who:
             return await ctx.send("❌ No active character. Use `!char <name>` or pass a name.")
         name, path = self._resolve_char_ci(who)
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             return await ctx.send(f"❌ Character '{who}' not found.")
         cfg = read_cfg(path)
 
@@ -27897,7 +27773,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     path = fn
                     try:
@@ -27913,7 +27789,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if not src_name:
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
         src_path = f"{src_name.replace(' ', '_')}.coe"
-        if not os.path.exists(src_path):
+        if not coe_exists(src_path):
             return await ctx.send(f"❌ Character file not found for **{src_name}**.")
 
         dst_name, dst_path = _resolve_char_ci(who)
@@ -28285,7 +28161,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             cas_disp, cas_path = self._resolve_char_ci(caster_name)
         except Exception:
             cas_disp, cas_path = None, None
-        if not cas_path or not os.path.exists(cas_path):
+        if not cas_path or not coe_exists(cas_path):
             await ctx.send(f"❌ Character file for **{caster_name}** not found.")
             return
         cfg = read_cfg(cas_path)
@@ -28641,7 +28517,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if not char_name:
             return None, None, None, "❌ No active character. Use `!char <name>` first."
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             return None, None, None, f"❌ Character file not found for **{char_name}**."
         cfg = read_cfg(path)
         caster_level = getint_compat(cfg, "cur", "level", fallback=getint_compat(cfg, "base", "level", fallback=1))
@@ -28701,7 +28577,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -28774,7 +28650,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
 
@@ -28801,7 +28677,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -28944,7 +28820,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             for _, p in dead_monsters:
                 try:
-                    os.remove(os.path.abspath(p))
+                    remove_cfg(p)
                 except Exception:
                     pass
 
@@ -28956,8 +28832,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -29298,7 +29173,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             disp, path = _res(tgt)
             pretty = disp or tgt
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 embed = _build_item_embed(
                     f"{caster_name} invokes **Staff of Healing** — Cure Light Wounds!",
                     header_line="No roll.",
@@ -29365,8 +29240,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg2.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -29760,7 +29634,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -29868,7 +29742,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception: pass
 
         if any_hp_changes:
@@ -29879,8 +29753,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -29935,7 +29808,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -30021,7 +29894,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             for _, p in dead_monsters:
-                try: os.remove(os.path.abspath(p))
+                try: remove_cfg(p)
                 except Exception:
                     pass
 
@@ -30033,8 +29906,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -30053,7 +29925,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         slot = _resolve_effect_slot(bcfg, chan_id, key) if '_resolve_effect_slot' in globals() else _slot(key)
 
         base_key = f"x_{alias_key}"
-        bcfg.set(chan_id, f"{slot}.{base_key}",       str(int(rounds)))
+        _set_timer(bcfg, chan_id, slot, base_key, str(int(rounds)))
         bcfg.set(chan_id, f"{slot}.{base_key}_code",  code)
         bcfg.set(chan_id, f"{slot}.{base_key}_label", label)
         bcfg.set(chan_id, f"{slot}.{base_key}_emoji", emoji)
@@ -30623,11 +30495,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = target_in, None
             base = f"{target_in.replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_in}** not found."]
 
         t_cfg = read_cfg(tgt_path)
@@ -30672,7 +30544,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         rounds = 60
         try:
-            bcfg.set(chan_id, f"{slot}.x_weakenarmor", str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_weakenarmor", str(rounds))
             bcfg.set(chan_id, f"{slot}.weakarmor",     str(rounds))
             _save_battles(bcfg)
         except Exception:
@@ -30756,11 +30628,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = target_in, None
             base = f"{target_in.replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_in}** not found."]
 
         t_cfg = read_cfg(tgt_path)
@@ -30808,7 +30680,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if bcfg.has_option(chan_id, f"{slot}.weakwep_name"):
             bcfg.remove_option(chan_id, f"{slot}.weakwep_name")
 
-        bcfg.set(chan_id, f"{slot}.x_weakenweapon", str(rounds))
+        _set_timer(bcfg, chan_id, slot, "x_weakenweapon", str(rounds))
         _save_battles(bcfg)
 
 
@@ -30840,7 +30712,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -30867,7 +30739,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             key_in_init = _find_ci_name(names, pretty) or _find_ci_name(names, target_raw) or pretty
             slot = _slot(key_in_init)
 
-            bcfg.set(chan_id, f"{slot}.x_heatmetal", "1")
+            _set_timer(bcfg, chan_id, slot, "x_heatmetal", "1")
             _save_battles(bcfg)
         except Exception:
             pass
@@ -30894,8 +30766,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -30914,7 +30785,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -30938,7 +30809,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             key_in_init = _find_ci_name(names, pretty) or _find_ci_name(names, target_raw) or pretty
             slot = _slot(key_in_init)
 
-            bcfg.set(chan_id, f"{slot}.x_chillmetal", "1")
+            _set_timer(bcfg, chan_id, slot, "x_chillmetal", "1")
             _save_battles(bcfg)
         except Exception:
             pass
@@ -30963,8 +30834,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
                     content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content=content)
+                    await post_tracker(ctx.channel, msg_id, content)
         except Exception:
             pass
 
@@ -31066,7 +30936,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         if not who:
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
         name, path = self._resolve_char_ci(who)
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             return await ctx.send(f"❌ Character '{who}' not found.")
         cfg = read_cfg(path)
 
@@ -31131,7 +31001,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -31177,8 +31047,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -31206,7 +31075,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -31250,8 +31119,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -31391,7 +31259,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -31500,7 +31368,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -31532,7 +31400,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         for raw in names:
             disp, path = _resolve_char_ci(raw)
             pretty = disp or raw
-            if not path or not os.path.exists(path):
+            if not path or not coe_exists(path):
                 lines.append(f"• **{pretty}**: ❌ *(not found)*")
                 continue
 
@@ -31581,7 +31449,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 slot = self._effect_slot_for(bcfg, chan_id, pretty)
 
 
-                bcfg.set(chan_id, f"{slot}.x_slw",        str(rounds))
+                _set_timer(bcfg, chan_id, slot, "x_slw", str(rounds))
                 bcfg.set(chan_id, f"{slot}.x_slw_label",  "Slow")
                 bcfg.set(chan_id, f"{slot}.x_slw_code",   "SLO")
                 bcfg.set(chan_id, f"{slot}.x_slw_by",     caster_name)
@@ -31653,7 +31521,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -31921,7 +31789,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 cur = bcfg.getint(chan_id, f"{slot}.x_starlight", fallback=0)
                 if cur <= 0:
                     rounds = max(1, int(caster_level))
-                    bcfg.set(chan_id, f"{slot}.x_starlight",        str(rounds))
+                    _set_timer(bcfg, chan_id, slot, "x_starlight", str(rounds))
                     bcfg.set(chan_id, f"{slot}.x_starlight_code",   "SB")
                     bcfg.set(chan_id, f"{slot}.x_starlight_label",  "StarlightBlade")
                     bcfg.set(chan_id, f"{slot}.x_starlight_emoji",  "✨")
@@ -31989,7 +31857,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -32025,8 +31893,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
                 except Exception: pass
                 return head + "\nControl **released**."
             else:
@@ -32103,8 +31970,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -32138,7 +32004,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -32232,8 +32098,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -32411,7 +32276,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 prev = bcfg.getint(chan_id, f"{slot}.x_slow", fallback=0) if slot else 0
                 newv = max(prev, rounds)
                 if slot:
-                    bcfg.set(chan_id, f"{slot}.x_slow", str(newv))
+                    _set_timer(bcfg, chan_id, slot, "x_slow", str(newv))
                     bcfg.set(chan_id, f"{slot}.x_slow_code", "SL")
                     bcfg.set(chan_id, f"{slot}.x_slow_by", caster_name)
                     _save_battles(bcfg)
@@ -32424,7 +32289,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 prev = bcfg.getint(chan_id, f"{slot}.x_halfatk", fallback=0) if slot else 0
                 newv = max(prev, rounds)
                 if slot:
-                    bcfg.set(chan_id, f"{slot}.x_halfatk", str(newv))
+                    _set_timer(bcfg, chan_id, slot, "x_halfatk", str(newv))
                     bcfg.set(chan_id, f"{slot}.x_halfatk_code", "HA")
                     bcfg.set(chan_id, f"{slot}.x_halfatk_by", caster_name)
                     _save_battles(bcfg)
@@ -32586,7 +32451,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
             prev = bcfg.getint(chan_id, f"{slot}.x_command", fallback=0)
             newv = max(prev, rounds)
-            bcfg.set(chan_id, f"{slot}.x_command", str(newv))
+            _set_timer(bcfg, chan_id, slot, "x_command", str(newv))
             bcfg.set(chan_id, f"{slot}.x_command_code", "CM")
             bcfg.set(chan_id, f"{slot}.x_command_by", caster_name)
             _save_battles(bcfg)
@@ -32626,7 +32491,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 disp, path = str(name), None
                 base = f"{str(name).replace(' ', '_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn; break
             (ok if path else miss).append(disp)
@@ -32700,7 +32565,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 disp, path = str(name), None
                 base = f"{str(name).replace(' ', '_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn; break
             (ok if path else miss).append(disp)
@@ -32804,7 +32669,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     pass
             base = name.replace(" ", "_").lower() + ".coe"
             try:
-                for fnm in os.listdir("."):
+                for fnm in ci_matches(base):
                     if fnm.lower() == base:
                         path = fnm
                         try:
@@ -32919,7 +32784,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         slot = key.replace(" ", "_")
 
                     base_key = "x_charmanimal"
-                    bcfg.set(chan_id, f"{slot}.{base_key}",          str(int(rounds)))
+                    _set_timer(bcfg, chan_id, slot, base_key, str(int(rounds)))
                     bcfg.set(chan_id, f"{slot}.{base_key}_code",     "CA")
                     bcfg.set(chan_id, f"{slot}.{base_key}_label",    "Charm Animal")
                     bcfg.set(chan_id, f"{slot}.{base_key}_emoji",    "🐾")
@@ -32989,7 +32854,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -33066,7 +32931,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 if bcfg.has_option(chan_id, opt):
                     bcfg.remove_option(chan_id, opt)
 
-            bcfg.set(chan_id, f"{slot}.blind",      str(PERM_ROUNDS))
+            _set_timer(bcfg, chan_id, slot, "blind", str(PERM_ROUNDS))
             bcfg.set(chan_id, f"{slot}.blind_perm", "1")
             bcfg.set(chan_id, f"{slot}.blind_src",  "causeblindness")
             bcfg.set(chan_id, f"{slot}.blind_by",   caster_name)
@@ -33104,7 +32969,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 pass
             base_coe = name.replace(" ", "_") + ".coe"
             base_ini = name.replace(" ", "_") + ".ini"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base_coe, base_ini):
                 if fn.lower() in {base_coe.lower(), base_ini.lower()}:
                     path = fn
                     try:
@@ -33219,7 +33084,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = raw_target, None
             base = (raw_target or "").replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn; break
         if not tgt_path:
@@ -33263,7 +33128,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
             prev = bcfg.getint(chan_id, f"{slot}.x_growanimal", fallback=0)
-            bcfg.set(chan_id, f"{slot}.x_growanimal", str(max(prev, rounds)))
+            _set_timer(bcfg, chan_id, slot, "x_growanimal", str(max(prev, rounds)))
             bcfg.set(chan_id, f"{slot}.x_growanimal_code", "GA")
             bcfg.set(chan_id, f"{slot}.growanimal_by", caster_name)
             bcfg.set(chan_id, f"{slot}.growanimal_level", str(int(caster_level)))
@@ -33309,11 +33174,11 @@ class SpellsCog(commands.Cog, name="Spells"):
         except Exception:
             tgt_disp, tgt_path = str(target_name), None
             base = f"{str(target_name).replace(' ', '_')}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     tgt_path = fn
                     break
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"❌ Target **{target_name}** not found."]
 
 
@@ -33482,7 +33347,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     path = fn
                     try:
@@ -33495,7 +33360,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         tgt_disp, tgt_path = _resolve_ci(target_raw)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return [f"• **{target_raw}**: ❌ *(not found)*"]
 
         t_cfg = read_cfg(tgt_path)
@@ -33604,7 +33469,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 except Exception:
                     pass
                 try:
-                    os.remove(os.path.abspath(tgt_path))
+                    remove_cfg(tgt_path)
                 except Exception:
                     pass
 
@@ -33845,7 +33710,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = PREFIX.get(kind, re.sub(r"[^A-Za-z]", "", kind).upper()[:2] or "SN")
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             made = []
 
             for _ in range(count):
@@ -34091,7 +33956,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -34230,8 +34095,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -34286,7 +34150,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -34403,8 +34267,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -34427,7 +34290,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -34543,8 +34406,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -34575,7 +34437,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -34586,7 +34448,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return name, None
 
         tgt_disp, tgt_path = _resolve_ci(tgt_raw)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"{head}\n• **{tgt_raw}**: ❌ not found."
 
         tcfg = read_cfg(tgt_path)
@@ -34817,7 +34679,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 pass
             base = name.replace(" ", "_") + ".coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(base):
                 if fn.lower() == base.lower():
                     try:
                         cfg = read_cfg(fn)
@@ -34828,7 +34690,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return name, None
 
         tgt_disp, tgt_path = _resolve_ci(tgt_raw)
-        if not tgt_path or not os.path.exists(tgt_path):
+        if not tgt_path or not coe_exists(tgt_path):
             return f"{head}\n• **{tgt_raw}**: ❌ not found."
 
         tcfg = read_cfg(tgt_path)
@@ -34966,7 +34828,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -35038,8 +34900,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -35073,8 +34934,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -35105,7 +34965,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -35254,8 +35114,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                     if msg_id:
                         block = _format_tracker_block(bcfg, chan_id)
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                        await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
 
@@ -35333,8 +35192,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -35376,7 +35234,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -35479,7 +35337,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             for _, p in to_delete:
                 try:
                     if _is_monster_file(p):
-                        os.remove(os.path.abspath(p))
+                        remove_cfg(p)
                 except Exception:
                     pass
 
@@ -35492,8 +35350,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg2, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -35535,7 +35392,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -35632,7 +35489,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             if bcfg.has_option(chan_id, opt):
                                 bcfg.remove_option(chan_id, opt)
 
-                        bcfg.set(chan_id, f"{slot}.blind",       str(PERM_ROUNDS))
+                        _set_timer(bcfg, chan_id, slot, "blind", str(PERM_ROUNDS))
                         bcfg.set(chan_id, f"{slot}.blind_perm",  "1")
                         bcfg.set(chan_id, f"{slot}.blind_src",   "holyword")
                         bcfg.set(chan_id, f"{slot}.blind_by",    caster_name)
@@ -35690,7 +35547,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             for _, p in dead_monsters:
                 try:
                     if _is_monster_file(p):
-                        os.remove(os.path.abspath(p))
+                        remove_cfg(p)
                 except Exception:
                     pass
 
@@ -35703,8 +35560,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     if msg_id:
                         block = _format_tracker_block(bcfg3, chan_id)
                         content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                        msg = await ctx.channel.fetch_message(msg_id)
-                        await msg.edit(content=content)
+                        await post_tracker(ctx.channel, msg_id, content)
             except Exception:
                 pass
 
@@ -35778,11 +35634,11 @@ class SpellsCog(commands.Cog, name="Spells"):
             slot = _resolve_effect_slot(bcfg, chan, tgt)
 
 
-            bcfg.set(chan, f"{slot}.gas",    str(rounds))
+            _set_timer(bcfg, chan, slot, "gas", str(rounds))
             bcfg.set(chan, f"{slot}.gas_by", caster_name)
 
 
-            bcfg.set(chan, f"{slot}.inw",    str(rounds))
+            _set_timer(bcfg, chan, slot, "inw", str(rounds))
             bcfg.set(chan, f"{slot}.inw_by", "WindWalk")
 
 
@@ -35927,7 +35783,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -36097,8 +35953,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -36159,7 +36014,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -36219,7 +36074,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     bcfg.remove_option(chan_id, k)
 
 
-            bcfg.set(chan_id, f"{slot}.x_ff", str(rounds))
+            _set_timer(bcfg, chan_id, slot, "x_ff", str(rounds))
             bcfg.set(chan_id, f"{slot}.x_ff_code", "FF")
             bcfg.set(chan_id, f"{slot}.x_ff_label", "Faerie Fire")
             bcfg.set(chan_id, f"{slot}.x_ff_emoji", "✨")
@@ -36240,8 +36095,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -36337,7 +36191,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
 
-        bcfg.set(chan_id, f"{s_me}.x_pfc",        str(rounds_total))
+        _set_timer(bcfg, chan_id, s_me, "x_pfc", str(rounds_total))
         bcfg.set(chan_id, f"{s_me}.x_pfc_code",   "PF" if want == "fire" else "PC")
         bcfg.set(chan_id, f"{s_me}.x_pfc_label",  "Produce Flame" if want == "fire" else "Produce Cold")
         bcfg.set(chan_id, f"{s_me}.x_pfc_emoji",  "🔥" if want == "fire" else "❄️")
@@ -36352,8 +36206,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
             if msg_id:
                 block = _format_tracker_block(bcfg, chan_id)
-                msg = await ctx.channel.fetch_message(msg_id)
-                await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -36389,7 +36242,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     bcfg.set(chan_id, f"{slot}.barkskin_by", caster_name)
 
 
-                    bcfg.set(chan_id, f"{slot}.x_barkskin",       str(duration_rds))
+                    _set_timer(bcfg, chan_id, slot, "x_barkskin", str(duration_rds))
                     bcfg.set(chan_id, f"{slot}.x_barkskin_code",  "BK")
                     bcfg.set(chan_id, f"{slot}.x_barkskin_label", "Barkskin")
                     bcfg.set(chan_id, f"{slot}.x_barkskin_by",    caster_name)
@@ -36402,8 +36255,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -36445,8 +36297,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                         if msg_id:
                             block = _format_tracker_block(bcfg, chan_id)
                             content = "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```"
-                            msg = await ctx.channel.fetch_message(msg_id)
-                            await msg.edit(content=content)
+                            await post_tracker(ctx.channel, msg_id, content)
                     except Exception:
                         pass
         except Exception:
@@ -36619,7 +36470,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{s_me}.aaf_backup_stats_{k}", v)
 
 
-            bcfg.set(chan_id, f"{s_me}.x_aaf", str(rounds))
+            _set_timer(bcfg, chan_id, s_me, "x_aaf", str(rounds))
             bcfg.set(chan_id, f"{s_me}.x_aaf_label", "Animal Form")
             bcfg.set(chan_id, f"{s_me}.x_aaf_code", "ANML")
             bcfg.set(chan_id, f"{s_me}.x_aaf_by", caster_name)
@@ -36661,7 +36512,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
 
         disp, path = self._resolve_char_ci(key)
-        if not path or not os.path.exists(path):
+        if not path or not coe_exists(path):
             return
 
         cfg = read_cfg(path)
@@ -36857,7 +36708,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -36984,8 +36835,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
         except Exception:
             pass
 
@@ -37092,7 +36942,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = PREFIX.get(kind, re.sub(r"[^A-Za-z]", "", kind).upper()[:2] or "MO")
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
             created = []
 
             for _ in range(count):
@@ -37230,7 +37080,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         base_key = "x_callwoodlandbeings"
         code = self._two_letter_code_from_name("Call Woodland Beings", "callwoodlandbeings") or "CW"
 
-        bcfg.set(chan_id, f"{slot_self}.{base_key}",          str(rounds))
+        _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds))
         bcfg.set(chan_id, f"{slot_self}.{base_key}_label",    "Call Woodland Beings")
         bcfg.set(chan_id, f"{slot_self}.{base_key}_code",     code)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",    "🌲")
@@ -37389,7 +37239,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         label    = "Summon Animals I"
         code     = self._two_letter_code_from_name(label, base_key) or "SA"
 
-        bcfg.set(chan_id, f"{slot_self}.{base_key}",         str(rounds_total))
+        _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds_total))
         bcfg.set(chan_id, f"{slot_self}.{base_key}_label",   label)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_code",    code)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",   "🦌")
@@ -37495,7 +37345,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         label    = "Summon Animals II"
         code     = self._two_letter_code_from_name(label, base_key) or "SA"
 
-        bcfg.set(chan_id, f"{slot_self}.{base_key}",         str(rounds_total))
+        _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds_total))
         bcfg.set(chan_id, f"{slot_self}.{base_key}_label",   label)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_code",    code)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",   "🦌")
@@ -37602,7 +37452,7 @@ class SpellsCog(commands.Cog, name="Spells"):
         label    = "Summon Animals III"
         code     = self._two_letter_code_from_name(label, base_key) or "SA"
 
-        bcfg.set(chan_id, f"{slot_self}.{base_key}",         str(rounds_total))
+        _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds_total))
         bcfg.set(chan_id, f"{slot_self}.{base_key}_label",   label)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_code",    code)
         bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",   "🦌")
@@ -37661,7 +37511,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
         prefix = _prefix_from_kind(kind)
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         created = []
 
         for _ in range(max(0, int(count))):
@@ -37841,7 +37691,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
             prefix = "CD"
-            existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+            existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
 
             for _ in range(n):
                 i = 1
@@ -37920,7 +37770,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 bcfg.set(chan_id, f"{s}.disp", mon)
 
 
-                bcfg.set(chan_id, f"{s}.x_swarm",        str(rounds_total))
+                _set_timer(bcfg, chan_id, s, "x_swarm", str(rounds_total))
                 bcfg.set(chan_id, f"{s}.x_swarm_code",   "CD")
                 bcfg.set(chan_id, f"{s}.x_swarm_label",  "Centipede Swarm")
                 bcfg.set(chan_id, f"{s}.x_swarm_emoji",  "🐛")
@@ -37943,7 +37793,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             base_key  = "x_creepingdoom"
             label     = "Creeping Doom"
             code      = self._two_letter_code_from_name(label, base_key) or "CD"
-            bcfg.set(chan_id, f"{slot_self}.{base_key}",         str(rounds_total))
+            _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds_total))
             bcfg.set(chan_id, f"{slot_self}.{base_key}_label",   label)
             bcfg.set(chan_id, f"{slot_self}.{base_key}_code",    code)
             bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",   "🐛")
@@ -38012,7 +37862,7 @@ class SpellsCog(commands.Cog, name="Spells"):
              for k in ("poi", "wand", "para", "breath", "spell")}
 
 
-        existing = {fn[:-4] for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        existing = {fn[:-4] for fn in cwd_listing() if fn.lower().endswith(".coe")}
         i = 1
         while f"CS{i}" in existing:
             i += 1
@@ -38115,7 +37965,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             slot_self = _resolve_effect_slot(bcfg, chan_id, caster_name)
             base_key  = "x_changestaff"
             code      = self._two_letter_code_from_name("Change Staff", "changestaff") or "CS"
-            bcfg.set(chan_id, f"{slot_self}.{base_key}",         str(rounds_total))
+            _set_timer(bcfg, chan_id, slot_self, base_key, str(rounds_total))
             bcfg.set(chan_id, f"{slot_self}.{base_key}_label",   "Change Staff")
             bcfg.set(chan_id, f"{slot_self}.{base_key}_code",    code)
             bcfg.set(chan_id, f"{slot_self}.{base_key}_emoji",   "🌳")
@@ -38192,7 +38042,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 disp, path = raw, None
                 base = f"{str(raw).replace(' ','_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         path = fn
                         break
@@ -38253,7 +38103,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                             bcfg.set(chan_id, "turn", ents[0]["name"] if ents else "")
                         _save_battles(bcfg)
                     try:
-                        os.remove(os.path.abspath(path))  
+                        remove_cfg(path)  
                     except Exception:
                         pass
                 except Exception:
@@ -38268,7 +38118,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     rounds = 1 if ("Save vs Death" in save_line and "RESIST" in save_line) else 60
                     base = "x_deaf"; label = "Deafened"
                     code = self._two_letter_code_from_name(label, base) or "DF"
-                    bcfg.set(chan_id, f"{s_tgt}.{base}",       str(rounds))
+                    _set_timer(bcfg, chan_id, s_tgt, base, str(rounds))
                     bcfg.set(chan_id, f"{s_tgt}.{base}_label", label)
                     bcfg.set(chan_id, f"{s_tgt}.{base}_code",  "DEAF")
                     bcfg.set(chan_id, f"{s_tgt}.{base}_emoji", "🔇")
@@ -38385,7 +38235,7 @@ class SpellsCog(commands.Cog, name="Spells"):
     async def _item_speed(self, ctx, caster_cfg, caster_name, caster_level, tokens, owned_item: str | None = None):
         char_name = get_active(ctx.author.id)
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -38415,7 +38265,7 @@ class SpellsCog(commands.Cog, name="Spells"):
     async def _item_trueseeing(self, ctx, caster_cfg, caster_name, caster_level, tokens, owned_item: str | None = None):
         char_name = get_active(ctx.author.id)
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -38687,14 +38537,14 @@ class SpellsCog(commands.Cog, name="Spells"):
             except Exception:
                 tgt_disp, tgt_path = str(raw), None
                 base = f"{str(raw).replace(' ', '_')}.coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base.lower():
                         tgt_path = fn
                         break
 
             pretty = tgt_disp or raw
 
-            if not tgt_path or not os.path.exists(tgt_path):
+            if not tgt_path or not coe_exists(tgt_path):
                 lines.append(
                     f"• **{pretty}** — normal **plants animate** (MV 10'); obey commands. "
                     "If attacking: +0 to hit, **1d4** damage (GM places tokens)."
@@ -38725,7 +38575,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                     except Exception:
                         s_tgt = key.replace(" ", "_")
 
-                    bcfg.set(chan_id, f"{s_tgt}.x_controlplant", str(rounds))
+                    _set_timer(bcfg, chan_id, s_tgt, "x_controlplant", str(rounds))
                     bcfg.set(chan_id, f"{s_tgt}.x_controlplant_label", "Controlled (Plant)")
                     bcfg.set(chan_id, f"{s_tgt}.x_controlplant_code", "CP")
                     bcfg.set(chan_id, f"{s_tgt}.x_controlplant_emoji", "🧿")
@@ -38799,7 +38649,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             """Normalize any existing legacy tags for this owner to 'doom|<owner_id>'."""
             want_tag = f"doom|{owner_id}"
             try:
-                for fn in os.listdir("."):
+                for fn in cwd_listing():
                     if not fn.lower().endswith(".coe"):
                         continue
                     try:
@@ -38822,7 +38672,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             """Count HD of all undead tagged to this owner under any accepted variant; normalize HD."""
             total = 0
             variants = _doom_variants()
-            for fn in os.listdir("."):
+            for fn in cwd_listing():
                 if not fn.lower().endswith(".coe"):
                     continue
                 try:
@@ -38864,7 +38714,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         def _count_existing_doom_hd(source_key: str) -> int:
             total = 0
-            for fn in os.listdir("."):
+            for fn in cwd_listing():
                 if not fn.lower().endswith(".coe"):
                     continue
                 try:
@@ -38957,7 +38807,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             return embed
 
         
-        pre = {fn for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        pre = {fn for fn in cwd_listing() if fn.lower().endswith(".coe")}
 
         cast_toks = []
         if sk_make: cast_toks.append(f"sk{sk_make}")
@@ -38965,7 +38815,7 @@ class SpellsCog(commands.Cog, name="Spells"):
 
         out = await self._cast_animatedead(ctx, caster_cfg, caster_name, max(caster_level, 99), cast_toks)
 
-        post = {fn for fn in os.listdir(".") if fn.lower().endswith(".coe")}
+        post = {fn for fn in cwd_listing() if fn.lower().endswith(".coe")}
         new_files = sorted(list(post - pre))
 
         src_key = f"doom|{owner_id}"
@@ -39122,7 +38972,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -39158,8 +39008,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
         return f"❄️ **Resist Cold** active on **{tgt_disp or target_name}** — duration **{rounds_total} rounds**.\nImmune to *normal* cold; magical cold is **halved**, or **¼** on a successful save."
@@ -39178,7 +39027,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 return self._resolve_char_ci(name)
             except Exception:
                 base = name.replace(" ", "_").lower() + ".coe"
-                for fn in os.listdir("."):
+                for fn in ci_matches(base):
                     if fn.lower() == base:
                         path = fn
                         try:
@@ -39214,8 +39063,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 msg_id = bcfg.getint(chan_id, "message_id", fallback=0)
                 if msg_id:
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(msg_id)
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, msg_id, "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
         return f"🔥 **Resist Fire** active on **{tgt_disp or target_name}** — duration **{rounds_total} rounds**.\nImmune to *normal* fire; magical fire is **halved**, or **¼** on a successful save."
@@ -39263,7 +39111,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 lines.append(f"• Self mode: **magical fire absorption {pool}**; normal fire **immune**.")
                 tag_code = "PF"
                 emoji = "🔥"
-                bcfg.set(chan_id, f"{slot}.x_protectionfromfire", str(rounds))
+                _set_timer(bcfg, chan_id, slot, "x_protectionfromfire", str(rounds))
                 bcfg.set(chan_id, f"{slot}.x_protectionfromfire_code",  tag_code)
                 bcfg.set(chan_id, f"{slot}.x_protectionfromfire_label", "Protection from Fire")
                 bcfg.set(chan_id, f"{slot}.x_protectionfromfire_emoji", emoji)
@@ -39277,8 +39125,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             try:
                 if bcfg.getint(chan_id, "message_id", fallback=0):
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(bcfg.getint(chan_id, "message_id", fallback=0))
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, bcfg.getint(chan_id, "message_id", fallback=0), "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
         else:
@@ -39328,7 +39175,7 @@ class SpellsCog(commands.Cog, name="Spells"):
                 lines.append(f"• Self mode: **magical lightning absorption {pool}**; normal lightning **immune**.")
                 tag_code = "PL"
                 emoji = "⚡"
-                bcfg.set(chan_id, f"{slot}.x_protectionfromlightning", str(rounds))
+                _set_timer(bcfg, chan_id, slot, "x_protectionfromlightning", str(rounds))
                 bcfg.set(chan_id, f"{slot}.x_protectionfromlightning_code",  tag_code)
                 bcfg.set(chan_id, f"{slot}.x_protectionfromlightning_label", "Protection from Lightning")
                 bcfg.set(chan_id, f"{slot}.x_protectionfromlightning_emoji", emoji)
@@ -39342,8 +39189,7 @@ class SpellsCog(commands.Cog, name="Spells"):
             try:
                 if bcfg.getint(chan_id, "message_id", fallback=0):
                     block = _format_tracker_block(bcfg, chan_id)
-                    msg = await ctx.channel.fetch_message(bcfg.getint(chan_id, "message_id", fallback=0))
-                    await msg.edit(content="**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
+                    await post_tracker(ctx.channel, bcfg.getint(chan_id, "message_id", fallback=0), "**EVERYONE ROLL FOR INITIATIVE!**\n```text\n" + block + "\n```")
             except Exception:
                 pass
         else:
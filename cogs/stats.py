@@ -1,8 +1,6 @@
-import os
 import re
 import random
 import nextcord
-import configparser
 from decimal import Decimal, ROUND_HALF_UP
 from urllib.parse import urlparse
 from nextcord.ext import commands
@@ -10,6 +8,8 @@ from utils.players import get_active
 from utils.ini import (
     read_cfg, write_cfg, get_compat, getint_compat
 )
+from utils.names import ci_matches, coe_exists
+from utils.static_data import class_table, classes_ab, class_xp_table, race_table, on_static_reload
 from cogs.spells import _poly_active
 from cogs.combat import _equipped_protection_bonus
 
@@ -36,20 +36,7 @@ def osr_mod(score: int) -> int:
 LEVELS = list(range(1, 21))
 
 def _load_class_xp(path: str = "class.lst"):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-    xp_cache = {}
-    for section in cfg.sections():
-        table = {}
-        for k, v in cfg.items(section):
-            m = re.fullmatch(r"xp(\d+)", k, flags=re.I)
-            if m and v.strip().lstrip("-").isdigit():
-                lvl = int(m.group(1))
-                table[lvl] = int(v.strip())
-        if table:
-            xp_cache[section] = dict(sorted(table.items()))
-    return xp_cache
+    return class_xp_table(path)
 
 _CLASS_XP = _load_class_xp()
 
@@ -119,55 +106,14 @@ def load_classes_ab(path="class.lst"):
     """
     Returns { 'fighter': {'ab':[...], ... } with AB parsed to list[int].
     """
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-
-    out = {}
-    for section in cfg.sections():
-        sec = section.lower()
-        out[sec] = {}
-        for k, v in cfg.items(section):
-            if k.lower() == "ab":
-                try:
-                    out[sec]["ab"] = [int(x) for x in v.split()]
-                except Exception:
-                    out[sec]["ab"] = []
-            else:
-                out[sec][k.lower()] = v
-    return out
+    return classes_ab(path)
+
 
 ALWAYS_LIST = {'skills', 'banned', 'banned_weapons'}
 
 
 def load_races(file_path):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(file_path)
-
-    races = {}
-    for section in cfg.sections():
-        data = {}
-        for key, value in cfg.items(section):
-            val = value.strip()
-            tokens = [t for t in re.split(r'[\,\s]+', val) if t]
-
-            if key in ALWAYS_LIST:
-                data[key] = tokens
-                continue
-
-            if len(tokens) > 1:
-                try:
-                    data[key] = [int(t) for t in tokens]
-                except ValueError:
-                    data[key] = tokens
-            else:
-                try:
-                    data[key] = int(val)
-                except ValueError:
-                    data[key] = val
-        races[section] = data
-    return races
+    return race_table(file_path)
 
 
 race_data = load_races('race.lst')
@@ -247,29 +193,7 @@ def update_progression(char_class, level, config):
 
 
 def _load_class_cache(path: str = "class.lst"):
-    cfg = configparser.ConfigParser()
-    cfg.optionxform = str
-    cfg.read(path)
-
-    cache = {}
-    for section in cfg.sections():
-        cache[section] = {}
-        for k, v in cfg.items(section):
-            v = v.strip()
-
-            if v and " " in v:
-                parts = v.split()
-                if all(p.lstrip("-").isdigit() for p in parts):
-                    cache[section][k] = [int(p) for p in parts]
-                else:
-                    cache[section][k] = v
-            else:
-
-                if v.lstrip("-").isdigit():
-                    cache[section][k] = int(v)
-                else:
-                    cache[section][k] = v
-    return cache
+    return class_table(path)
 
 _CLASS_CACHE = _load_class_cache()
 
@@ -352,6 +276,14 @@ class StatsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.classes = load_classes_ab("class.lst")
+        on_static_reload("stats", self._on_static_reload)
+
+    def _on_static_reload(self, changed):
+        """Rebind the class tables after utils.static_data reloaded a file."""
+        global _CLASS_CACHE, _CLASS_XP
+        _CLASS_CACHE = _load_class_cache()
+        _CLASS_XP = _load_class_xp()
+        self.classes = load_classes_ab("class.lst")
 
     @commands.command(name="portrait")
     async def portrait(self, ctx, url: str = None):
@@ -369,7 +301,7 @@ class StatsCog(commands.Cog):
             return
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             await ctx.send(f"❌ Character file not found for **{char_name}**.")
             return
 
@@ -446,9 +378,8 @@ class StatsCog(commands.Cog):
 
         if not file_path:
 
-            import os
             target = f"{(char_name or '').replace(' ', '_').lower()}.coe"
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     file_path = fn
 
@@ -488,7 +419,7 @@ class StatsCog(commands.Cog):
 
 
         file_name = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(file_name):
+        if not coe_exists(file_name):
             await ctx.send(f"❌ Character '{char_name}' does not exist.")
             return
 
@@ -997,12 +928,12 @@ class StatsCog(commands.Cog):
           • Normalizes denominations on both source and target
           • Updates [eq].coin_weight for both
         """
-        import os, re
+        import re
 
         def _resolve_char_ci(name: str):
             base = name.replace(" ", "_")
             target = f"{base}.coe".lower()
-            for fn in os.listdir("."):
+            for fn in ci_matches(target):
                 if fn.lower() == target:
                     path = fn
                     try:
@@ -1062,7 +993,7 @@ class StatsCog(commands.Cog):
         if not src_name:
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
         src_path = f"{src_name.replace(' ', '_')}.coe"
-        if not os.path.exists(src_path):
+        if not coe_exists(src_path):
             return await ctx.send(f"❌ Character file not found for **{src_name}**.")
         dst_name, dst_path = _resolve_char_ci(who)
         if not dst_path:
@@ -1420,7 +1351,7 @@ class StatsCog(commands.Cog):
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             return await ctx.send(f"❌ Character file not found for **{char_name}**.")
 
         cfg = read_cfg(path)
@@ -1489,7 +1420,7 @@ class StatsCog(commands.Cog):
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             return await ctx.send(f"❌ Character file not found for **{char_name}**.")
 
         cfg = read_cfg(path)
@@ -1550,7 +1481,7 @@ class StatsCog(commands.Cog):
             return await ctx.send("❌ No active character. Use `!char <name>` first.")
 
         path = f"{char_name.replace(' ', '_')}.coe"
-        if not os.path.exists(path):
+        if not coe_exists(path):
             return await ctx.send(f"❌ Character file not found for **{char_name}**.")
 
         cfg = read_cfg(path)
@@ -0,0 +1,737 @@
+# utils/battle.py
+import atexit
+import configparser
+import contextvars
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import quote, unquote
+
+from utils.ini import atomic_write_text, merge_options, path_write_lock
+
+BATTLE_FILE = "battle.lst"
+BATTLE_SHARD_DIR = "battle.d"
+
+
+class BattleSession:
+    """
+    One command's view of battle.lst.
+
+    The file is parsed once, every helper that calls load_battles() gets the
+    same ConfigParser back, and save_battles() only marks it dirty. The state
+    is written once when the session ends.
+    """
+    __slots__ = ("cfg", "sig", "dirty", "closed")
+
+    def __init__(self):
+        self.cfg = None
+        self.sig = None
+        self.dirty = False
+        self.closed = False
+
+
+_session: contextvars.ContextVar = contextvars.ContextVar("battle_session", default=None)
+_write_listeners: dict = {}  # name -> fn(cfg), see on_battle_write
+
+
+class BattleConfig(configparser.ConfigParser):
+    """
+    ConfigParser that counts changes per section, so structures built from a
+    section (see utils.battle_model) can tell when they are stale.
+
+    It also journals which options were set or removed since the backing
+    store loaded it (touched()), so indexed store reads can be corrected by
+    what changed in memory. A section replaced wholesale is "unknown".
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._revs = {}
+        self._reads = 0
+        self._touched = None    # None until a store marks the parse clean
+        super().__init__(*args, **kwargs)
+
+    def revision(self, section: str):
+        return (self._reads, self._revs.get(section, 0))
+
+    def mark_clean(self) -> None:
+        """The parser now matches its backing store: start a new journal."""
+        self._touched = {}
+
+    def touched(self, section: str):
+        """Options of `section` changed since mark_clean(); None if unknown."""
+        if self._touched is None:
+            return None
+        return self._touched.get(section, set())
+
+    def _note(self, section, option=None) -> None:
+        t = self._touched
+        if t is None:
+            return
+        if option is None:
+            t[section] = None
+            return
+        keys = t.get(section, set())
+        if keys is not None:
+            keys.add(option)
+            t[section] = keys
+
+    def _bump(self, section) -> None:
+        self._revs[section] = self._revs.get(section, 0) + 1
+
+    def _read(self, fp, fpname):
+        self._reads += 1
+        self._touched = None
+        return super()._read(fp, fpname)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._note(key)
+
+    def add_section(self, section):
+        super().add_section(section)
+        self._bump(section)
+
+    def set(self, section, option, value=None):
+        super().set(section, option, value)
+        self._bump(section)
+        self._note(section, self.optionxform(option))
+
+    def remove_option(self, section, option):
+        existed = super().remove_option(section, option)
+        self._bump(section)
+        self._note(section, self.optionxform(option))
+        return existed
+
+    def remove_section(self, section):
+        existed = super().remove_section(section)
+        self._bump(section)
+        self._note(section)
+        return existed
+
+
+def new_battle_cfg() -> configparser.ConfigParser:
+    cfg = BattleConfig()
+    cfg.optionxform = str
+    return cfg
+
+
+def _file_sig(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _shard_key(section: str) -> str:
+    """`1234` and `1234:hr` both belong to channel 1234's shard."""
+    return section.split(":", 1)[0]
+
+
+def _section_text(cfg: configparser.ConfigParser, section: str) -> str:
+    # Same layout as ConfigParser.write(), without re-validating raw values.
+    lines = [f"[{section}]"]
+    for key, value in cfg.items(section, raw=True):
+        lines.append(f"{key} = " + str(value).replace("\n", "\n\t"))
+    return "\n".join(lines) + "\n\n"
+
+
+def _shard_texts(cfg: configparser.ConfigParser) -> dict:
+    parts = {}
+    for sec in cfg.sections():
+        parts.setdefault(_shard_key(sec), []).append(_section_text(cfg, sec))
+    return {k: "".join(v) for k, v in parts.items()}
+
+
+def _section_texts(cfg: configparser.ConfigParser) -> dict:
+    return {sec: _section_text(cfg, sec) for sec in cfg.sections()}
+
+
+def _section_opts(cfg: configparser.ConfigParser) -> dict:
+    return {sec: dict(opts) for sec, opts in cfg._sections.items()}
+
+
+def _put_section(cfg: configparser.ConfigParser, sec: str, opts: dict) -> None:
+    """Replace a section's options wholesale (raw values, no re-validation)."""
+    cfg._sections[sec] = dict(opts)
+    if sec not in cfg._proxies:
+        cfg._proxies[sec] = configparser.SectionProxy(cfg, sec)
+    bump = getattr(cfg, "_bump", None)
+    if bump is not None:
+        bump(sec)
+        cfg._note(sec)
+
+
+def _merge_theirs(cfg: configparser.ConfigParser, base: dict, theirs: dict, shard: str | None = None) -> None:
+    """
+    Fold another writer's sections (`theirs`, saved since `base` was loaded)
+    into `cfg` per option; with `shard`, only that shard's sections.
+    """
+    mine = cfg._sections
+    for sec, opts in theirs.items():
+        if sec in mine:
+            merged = merge_options(base.get(sec) or {}, mine[sec], opts)
+            if merged != mine[sec]:
+                _put_section(cfg, sec, merged)
+        elif sec not in base:
+            _put_section(cfg, sec, opts)
+    for sec in list(mine):
+        if shard is not None and _shard_key(sec) != shard:
+            continue
+        if sec not in theirs and sec in base and mine[sec] == base[sec]:
+            cfg.remove_section(sec)
+
+
+class FileBattleStore:
+    """
+    Everything in one battle.lst. Writes are atomic, and each parser
+    remembers the file revision it was loaded from: if another writer got in
+    first, save() re-reads the file and keeps their version of every option
+    this parser did not change, instead of blindly overwriting it.
+    """
+
+    def __init__(self, path: str = BATTLE_FILE):
+        self.path = path
+
+    def signature(self):
+        return _file_sig(self.path)
+
+    def load(self) -> configparser.ConfigParser:
+        sig = _file_sig(self.path)
+        cfg = new_battle_cfg()
+        cfg.read(self.path)
+        cfg._battle_base = (sig, _section_opts(cfg))
+        cfg.mark_clean()
+        return cfg
+
+    def _merge_disk(self, cfg: configparser.ConfigParser, base: dict) -> None:
+        disk = new_battle_cfg()
+        disk.read(self.path)
+        _merge_theirs(cfg, base, disk._sections)
+
+    def save(self, cfg: configparser.ConfigParser) -> None:
+        with path_write_lock(self.path):
+            loaded = getattr(cfg, "_battle_base", None)
+            if loaded is not None and _file_sig(self.path) != loaded[0]:
+                self._merge_disk(cfg, loaded[1])
+            atomic_write_text(self.path, "".join(_section_texts(cfg).values()))
+            cfg._battle_base = (_file_sig(self.path), _section_opts(cfg))
+
+
+class ShardedBattleStore:
+    """
+    One file per channel under battle.d/ (the channel section plus its
+    `:hr` and other `<chan>:*` sections). Loads still return a single
+    ConfigParser holding every channel, but a save only rewrites the shards
+    whose text changed since that parser was loaded, and only deletes
+    shards that parser actually saw. Two commands in different channels
+    therefore never overwrite each other; if a shard changed on disk since
+    it was loaded, the other writer's options are merged in first.
+    """
+
+    def __init__(self, root: str = BATTLE_SHARD_DIR):
+        self.root = root
+        self._cache = {}  # shard key -> (sig, text)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, quote(key, safe="") + ".lst")
+
+    def _scan(self) -> dict:
+        out = {}
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return out
+        for e in entries:
+            if not e.name.endswith(".lst"):
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            out[unquote(e.name[:-4])] = (st.st_mtime_ns, st.st_size)
+        return out
+
+    def signature(self):
+        return tuple(sorted(self._scan().items()))
+
+    def _shard_text(self, key: str, sig) -> str:
+        hit = self._cache.get(key)
+        if hit and hit[0] == sig:
+            return hit[1]
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            text = ""
+        self._cache[key] = (sig, text)
+        return text
+
+    def load(self) -> configparser.ConfigParser:
+        sigs = self._scan()
+        for key in list(self._cache):
+            if key not in sigs:
+                self._cache.pop(key, None)
+        texts = {key: self._shard_text(key, sig) for key, sig in sorted(sigs.items())}
+        cfg = new_battle_cfg()
+        for key, text in list(texts.items()):
+            try:
+                cfg.read_string(text, source=self._path(key))
+            except configparser.Error as e:
+                # Leave the broken file alone on save rather than deleting it.
+                print(f"[battle] skipping unreadable shard {key}: {e}", file=sys.stderr)
+                texts.pop(key, None)
+        # What this parser was loaded from, so save() can write only the delta.
+        cfg._battle_shards = texts
+        cfg.mark_clean()
+        return cfg
+
+    def save(self, cfg: configparser.ConfigParser) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        loaded = getattr(cfg, "_battle_shards", None) or {}
+        texts = _shard_texts(cfg)
+        for key, text in texts.items():
+            was = loaded.get(key, "")
+            if was == text:
+                continue
+            path = self._path(key)
+            with path_write_lock(path):
+                sig = _file_sig(path)
+                disk = self._shard_text(key, sig) if sig is not None else ""
+                if disk != was:
+                    try:
+                        text = self._merge_shard(cfg, key, was, disk)
+                    except configparser.Error as e:
+                        print(f"[battle] shard {key} changed on disk and did not parse; overwriting: {e}", file=sys.stderr)
+                atomic_write_text(path, text)
+                self._cache[key] = (_file_sig(path), text)
+        for key in loaded:
+            if key in texts:
+                continue
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            self._cache.pop(key, None)
+        cfg._battle_shards = _shard_texts(cfg)
+
+    @staticmethod
+    def _merge_shard(cfg: configparser.ConfigParser, key: str, was: str, disk: str) -> str:
+        base, theirs = new_battle_cfg(), new_battle_cfg()
+        base.read_string(was)
+        theirs.read_string(disk)
+        _merge_theirs(cfg, base._sections, theirs._sections, shard=key)
+        return _shard_texts(cfg).get(key, "")
+
+
+def migrate_to_shards(src: str = BATTLE_FILE, root: str = BATTLE_SHARD_DIR) -> int:
+    """
+    One-shot split of a monolithic battle.lst into per-channel shards.
+    The source is renamed to `<src>.migrated` afterwards. Returns the
+    number of shards written.
+    """
+    if not os.path.exists(src):
+        return 0
+    cfg = FileBattleStore(src).load()
+    store = ShardedBattleStore(root)
+    store.save(cfg)
+    os.replace(src, src + ".migrated")
+    return len(_shard_texts(cfg))
+
+
+# Attributes the backing stores hang on a parser to remember what is on disk.
+_DISK_STATE_ATTRS = ("_battle_base", "_battle_shards", "_battle_rows")
+
+
+def _copy_cfg(src: configparser.ConfigParser) -> configparser.ConfigParser:
+    """Copy a parsed battle cfg without re-parsing (values are immutable str)."""
+    cfg = new_battle_cfg()
+    for sec, opts in src._sections.items():
+        cfg._sections[sec] = opts.copy()
+        cfg._proxies[sec] = configparser.SectionProxy(cfg, sec)
+    return cfg
+
+
+class WriteBehindBattleStore:
+    """
+    Keeps the authoritative battle state in memory in front of a backing
+    store. load() hands out a cheap copy; save() folds the options the
+    caller changed into memory and marks the state dirty; a flusher thread
+    persists it at most once per `delay_ms`. flush() is the barrier, and it
+    also runs at interpreter exit.
+
+    While the bot runs it owns the battle state: hand edits to the backing
+    files are not picked up until restart.
+    """
+
+    def __init__(self, inner, delay_ms: int):
+        self.inner = inner
+        self.delay = max(0, delay_ms) / 1000.0
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._master = None
+        self._rev = 0
+        self._dirty = False
+        self._thread = None
+        # {section: option names (None = unknown)} that differ from the
+        # backing store: not flushed yet, or in the flush now running.
+        self._pending = {}
+        self._inflight = {}
+
+    def _ensure(self) -> configparser.ConfigParser:
+        if self._master is None:
+            self._master = self.inner.load()
+        return self._master
+
+    def signature(self):
+        with self._lock:
+            return ("mem", self._rev)
+
+    def load(self) -> configparser.ConfigParser:
+        with self._lock:
+            m = self._ensure()
+            cfg = _copy_cfg(m)
+            # Master section dicts are replaced, never mutated, so holding
+            # references is a snapshot of what this copy started from.
+            cfg._wb_base = dict(m._sections)
+            cfg._wb_rev = self._rev
+        cfg.mark_clean()
+        return cfg
+
+    def _note_pending(self, sec: str, keys) -> None:
+        have = self._pending.get(sec, set())
+        self._pending[sec] = None if keys is None or have is None else have | keys
+
+    def unflushed(self, cfg, sec: str):
+        """
+        Options of `sec` on which the backing store may disagree with `cfg`
+        (unflushed here, or changed on `cfg` itself). None if that is not
+        known, e.g. another command saved since `cfg` was loaded.
+        """
+        mine = cfg.touched(sec) if hasattr(cfg, "touched") else None
+        if mine is None:
+            return None
+        with self._lock:
+            if getattr(cfg, "_wb_rev", None) != self._rev:
+                return None
+            out = set(mine)
+            for part in (self._pending, self._inflight):
+                keys = part.get(sec, set())
+                if keys is None:
+                    return None
+                out |= keys
+        return out
+
+    def save(self, cfg: configparser.ConfigParser) -> None:
+        base = getattr(cfg, "_wb_base", None)
+        mine = cfg._sections
+        with self._lock:
+            m = self._ensure()
+            current = getattr(cfg, "_wb_rev", None) == self._rev
+            changed = False
+            for sec, opts in list(mine.items()):
+                old = base.get(sec) if base is not None else None
+                if old == opts:
+                    continue
+                cur = m._sections.get(sec)
+                if base is not None and cur is not None and cur is not old:
+                    # Another command saved this section since we loaded it:
+                    # keep its options and apply only ours on top.
+                    opts = merge_options(old or {}, opts, cur)
+                    if opts != mine[sec]:
+                        _put_section(cfg, sec, opts)
+                if cur == opts:
+                    continue
+                m._sections[sec] = dict(opts)
+                if sec not in m._proxies:
+                    m._proxies[sec] = configparser.SectionProxy(m, sec)
+                self._note_pending(sec, cfg.touched(sec) if base is not None and hasattr(cfg, "touched") else None)
+                changed = True
+            gone = base if base is not None else dict(m._sections)
+            for sec in gone:
+                if sec not in mine and m.has_section(sec):
+                    m.remove_section(sec)
+                    self._note_pending(sec, None)
+                    changed = True
+            cfg._wb_base = {sec: m._sections[sec] for sec in mine if sec in m._sections}
+            if changed:
+                self._rev += 1
+                self._dirty = True
+                self._kick()
+            if current:
+                # Nobody else saved in between, so `cfg` still equals memory.
+                cfg._wb_rev = self._rev
+
+    def _kick(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="battle-flush", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+        self._wake.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._wake:
+                while not self._dirty:
+                    self._wake.wait()
+            time.sleep(self.delay)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[battle] write-behind flush failed: {e}", file=sys.stderr)
+                time.sleep(1.0)
+
+    def flush(self) -> bool:
+        """Persist pending changes now. Returns True if anything was written."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty or self._master is None:
+                    return False
+                snap = _copy_cfg(self._master)
+                for attr in _DISK_STATE_ATTRS:
+                    if hasattr(self._master, attr):
+                        setattr(snap, attr, getattr(self._master, attr))
+                self._dirty = False
+                self._inflight, self._pending = self._pending, {}
+            try:
+                self.inner.save(snap)
+            except Exception:
+                with self._lock:
+                    self._dirty = True
+                    for sec, keys in self._inflight.items():
+                        self._note_pending(sec, keys)
+                    self._inflight = {}
+                raise
+            with self._lock:
+                self._inflight = {}
+                for attr in _DISK_STATE_ATTRS:
+                    if hasattr(snap, attr):
+                        setattr(self._master, attr, getattr(snap, attr))
+            return True
+
+
+_store = None
+
+
+def backing_store():
+    """The store that actually touches disk (e.g. for SqliteBattleStore queries)."""
+    store = get_store()
+    return store.inner if isinstance(store, WriteBehindBattleStore) else store
+
+
+def effect_index(cfg: configparser.ConfigParser, chan_id: str):
+    """
+    utils.battle_db.EffectIndex over `chan_id` for `cfg` when battle state is
+    kept in SQLite. None for the file backends, or when the database cannot
+    be reconciled with `cfg`; callers then scan the parsed section.
+    """
+    store = get_store()
+    front = store if isinstance(store, WriteBehindBattleStore) else None
+    inner = backing_store()
+    from utils.battle_db import EffectIndex, SqliteBattleStore
+    if not isinstance(inner, SqliteBattleStore) or not cfg.has_section(chan_id):
+        return None
+    keys = (front or inner).unflushed(cfg, chan_id)
+    if keys is None:
+        return None
+    return EffectIndex(inner, cfg, chan_id, keys)
+
+
+def flush_battles() -> bool:
+    """Barrier: write any battle state still held by the write-behind cache."""
+    store = _store
+    if isinstance(store, WriteBehindBattleStore):
+        return store.flush()
+    return False
+
+
+def get_store():
+    """
+    Backend chosen by SEER_BATTLE_BACKEND: `file` (default, battle.lst),
+    `sharded` (battle.d/) or `sqlite` (battle.db). Switching backends
+    migrates an existing battle.lst on first use.
+
+    SEER_BATTLE_FLUSH_MS (default 250) puts a write-behind cache in front of
+    it; 0 writes through on every save.
+    """
+    global _store
+    if _store is None:
+        backend = (os.getenv("SEER_BATTLE_BACKEND") or "file").strip().lower()
+        if backend in ("sqlite", "db"):
+            from utils.battle_db import BATTLE_DB, SqliteBattleStore, import_battle_file
+            fresh = not os.path.exists(BATTLE_DB)
+            _store = SqliteBattleStore(BATTLE_DB)
+            if fresh and import_battle_file(_store, BATTLE_FILE):
+                os.replace(BATTLE_FILE, BATTLE_FILE + ".migrated")
+        elif backend in ("sharded", "shard", "channel"):
+            if not os.path.isdir(BATTLE_SHARD_DIR) and os.path.exists(BATTLE_FILE):
+                migrate_to_shards()
+            _store = ShardedBattleStore()
+        else:
+            _store = FileBattleStore()
+        try:
+            delay_ms = int(os.getenv("SEER_BATTLE_FLUSH_MS", "250"))
+        except ValueError:
+            delay_ms = 250
+        if delay_ms > 0:
+            _store = WriteBehindBattleStore(_store, delay_ms)
+    return _store
+
+
+def _store_sig():
+    return get_store().signature()
+
+
+def _read_battles() -> configparser.ConfigParser:
+    return get_store().load()
+
+
+def on_battle_write(name: str, fn) -> None:
+    """
+    Register fn(cfg), run after battle state is handed to the store, e.g. to
+    keep per-channel caches in step via cfg.touched(). Registering the same
+    name again replaces the old listener.
+    """
+    _write_listeners[name] = fn
+
+
+def _write_battles(cfg: configparser.ConfigParser) -> None:
+    get_store().save(cfg)
+    for name, fn in list(_write_listeners.items()):
+        try:
+            fn(cfg)
+        except Exception as e:
+            print(f"[battle] write listener {name} failed: {e}", file=sys.stderr)
+
+
+def _active_session():
+    s = _session.get()
+    if s is None or s.closed:
+        return None
+    return s
+
+
+def load_battles() -> configparser.ConfigParser:
+    s = _active_session()
+    if s is None:
+        return _read_battles()
+    if s.cfg is None:
+        s.sig = _store_sig()
+        s.cfg = _read_battles()
+    elif not s.dirty:
+        # Nothing pending from us; pick up writes made by other commands
+        # while this one was awaiting (reaction prompts, wait_for, ...).
+        sig = _store_sig()
+        if sig != s.sig:
+            s.sig = sig
+            s.cfg = _read_battles()
+    return s.cfg
+
+
+def save_battles(cfg: configparser.ConfigParser) -> None:
+    s = _active_session()
+    if s is None:
+        _write_battles(cfg)
+        return
+    s.cfg = cfg
+    s.dirty = True
+
+
+def _flush(s: BattleSession) -> bool:
+    if not s.dirty or s.cfg is None:
+        return False
+    _write_battles(s.cfg)
+    s.sig = _store_sig()
+    s.dirty = False
+    return True
+
+
+def _prime(s: BattleSession) -> None:
+    s.sig = _store_sig()
+    s.cfg = _read_battles()
+
+
+def flush_session() -> bool:
+    """Write the current session's state now if it is dirty. Returns True if written."""
+    s = _active_session()
+    if s is None:
+        return False
+    return _flush(s)
+
+
+def begin_session():
+    """
+    Open a battle session for the running task. Returns a token for
+    end_session(), or None if a session is already open (nested calls
+    share the outer session).
+    """
+    if _active_session() is not None:
+        return None
+    return _session.set(BattleSession())
+
+
+def end_session(token) -> None:
+    """Flush and close the session opened by begin_session()."""
+    if token is None:
+        return
+    s = _session.get()
+    try:
+        if s is not None and not s.closed:
+            flush_session()
+    finally:
+        if s is not None:
+            # Tasks spawned during the command copied this context; make
+            # them fall back to direct file I/O from here on.
+            s.closed = True
+        _session.reset(token)
+
+
+async def abegin_session():
+    """
+    begin_session() for coroutines: the battle state is loaded on the
+    storage pool up front, so the command's own loads are memory hits.
+    """
+    token = begin_session()
+    if token is not None:
+        from utils.storage import path_lock, run_io
+        async with path_lock(BATTLE_FILE):
+            await run_io(_prime, _session.get())
+    return token
+
+
+async def aend_session(token) -> None:
+    """end_session() for coroutines: the single flush runs on the storage pool."""
+    if token is None:
+        return
+    s = _session.get()
+    try:
+        if s is not None and not s.closed and s.dirty:
+            from utils.storage import path_lock, run_io
+            async with path_lock(BATTLE_FILE):
+                await run_io(_flush, s)
+    finally:
+        if s is not None:
+            s.closed = True
+        _session.reset(token)
+
+
+@contextmanager
+def battle_session():
+    """`with battle_session():` — load battle.lst once, write it once on exit."""
+    token = begin_session()
+    try:
+        yield
+    finally:
+        end_session(token)
+
+
+if __name__ == "__main__":
+    # python -m utils.battle migrate
+    if sys.argv[1:2] == ["migrate"]:
+        n = migrate_to_shards()
+        print(f"Migrated {BATTLE_FILE} into {n} shard(s) under {BATTLE_SHARD_DIR}/")
+    else:
+        print("usage: python -m utils.battle migrate")
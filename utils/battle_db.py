@@ -0,0 +1,356 @@
+# utils/battle_db.py
+import configparser
+import os
+import sqlite3
+import threading
+
+BATTLE_DB = "battle.db"
+
+# <slot>.x_foo_label etc. describe an effect; they are not durations.
+_META_SUFFIXES = ("_label", "_emoji", "_code", "_by")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    section TEXT PRIMARY KEY,
+    pos     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    section TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    value   TEXT NOT NULL,
+    PRIMARY KEY (section, key)
+);
+CREATE TABLE IF NOT EXISTS combatants (
+    channel TEXT NOT NULL,
+    slot    TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    init    INTEGER NOT NULL DEFAULT 0,
+    pos     INTEGER NOT NULL,
+    PRIMARY KEY (channel, slot)
+);
+CREATE TABLE IF NOT EXISTS effects (
+    channel TEXT NOT NULL,
+    slot    TEXT NOT NULL,
+    effect  TEXT NOT NULL,
+    value   TEXT NOT NULL,
+    PRIMARY KEY (channel, slot, effect)
+);
+CREATE INDEX IF NOT EXISTS effects_by_name ON effects (channel, effect);
+CREATE TABLE IF NOT EXISTS timers (
+    channel   TEXT NOT NULL,
+    slot      TEXT NOT NULL,
+    effect    TEXT NOT NULL,
+    remaining INTEGER NOT NULL,
+    PRIMARY KEY (channel, slot, effect)
+);
+CREATE INDEX IF NOT EXISTS timers_by_remaining ON timers (channel, remaining);
+"""
+
+
+def _is_timer(effect: str, value: str):
+    """Integer x_* counters are durations; return the count or None."""
+    if not effect.startswith("x_") or effect.endswith(_META_SUFFIXES):
+        return None
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+def _split_key(section: str, key: str):
+    """(slot, effect) for `<slot>.<effect>` keys in a channel section, else None."""
+    if ":" in section or "." not in key:
+        return None
+    slot, effect = key.split(".", 1)
+    if not slot or not effect:
+        return None
+    return slot, effect
+
+
+def _section_text(section: str, items) -> str:
+    # Same layout as ConfigParser.write().
+    lines = [f"[{section}]"]
+    for key, value in items:
+        lines.append(f"{key} = " + str(value).replace("\n", "\n\t"))
+    return "\n".join(lines) + "\n\n"
+
+
+class SqliteBattleStore:
+    """
+    Battle state in SQLite (WAL mode). Channel sections are split into rows:
+    `<slot>.<effect>` keys go to `effects` (plus `timers` for x_* counters),
+    the initiative `list` feeds `combatants`, everything else lives in
+    `settings`. load()/save() speak ConfigParser so the cogs do not change;
+    save() only touches the rows that differ from what was loaded.
+    """
+
+    def __init__(self, path: str = BATTLE_DB):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._rev = 0
+        self._cached = None  # (signature, {section: {key: value}})
+
+    # ---------- ConfigParser adapter ----------
+    def signature(self):
+        with self._lock:
+            ver = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return (ver, self._rev)
+
+    def _read_rows(self) -> dict:
+        rows: dict = {}
+        c = self._conn
+        for (sec,) in c.execute("SELECT section FROM sections ORDER BY pos"):
+            rows[sec] = {}
+        for sec, key, value in c.execute("SELECT section, key, value FROM settings ORDER BY rowid"):
+            rows.setdefault(sec, {})[key] = value
+        for chan, slot, effect, value in c.execute(
+            "SELECT channel, slot, effect, value FROM effects ORDER BY rowid"
+        ):
+            rows.setdefault(chan, {})[f"{slot}.{effect}"] = value
+        return rows
+
+    def load(self) -> configparser.ConfigParser:
+        from utils.battle import new_battle_cfg
+        with self._lock:
+            sig = self.signature()
+            if self._cached is None or self._cached[0] != sig:
+                self._cached = (sig, self._read_rows())
+            rows = self._cached[1]
+        cfg = new_battle_cfg()
+        cfg.read_string("".join(_section_text(s, d.items()) for s, d in rows.items()),
+                        source=self.path)
+        cfg._battle_rows = {s: dict(d) for s, d in rows.items()}
+        cfg._battle_sig = sig
+        cfg.mark_clean()
+        return cfg
+
+    def save(self, cfg: configparser.ConfigParser) -> None:
+        loaded = getattr(cfg, "_battle_rows", None)
+        now = {s: dict(cfg.items(s, raw=True)) for s in cfg.sections()}
+        with self._lock:
+            current = getattr(cfg, "_battle_sig", None) == self.signature()
+            if loaded is None:
+                # Not one of ours: treat it as a full replacement.
+                loaded = self._read_rows()
+            c = self._conn
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                for pos, sec in enumerate(now):
+                    if sec not in loaded:
+                        c.execute(
+                            "INSERT INTO sections (section, pos) VALUES (?, ?) "
+                            "ON CONFLICT(section) DO UPDATE SET pos = excluded.pos",
+                            (sec, pos),
+                        )
+                for sec in loaded:
+                    if sec not in now:
+                        self._drop_section(sec)
+                for sec, items in now.items():
+                    before = loaded.get(sec, {})
+                    if before == items:
+                        continue
+                    for key in before:
+                        if key not in items:
+                            self._delete_key(sec, key)
+                    for key, value in items.items():
+                        if before.get(key) != value:
+                            self._put_key(sec, key, value)
+                    if ":" not in sec and (before.get("list") != items.get("list") or any(
+                        before.get(n) != items.get(n) for n in (items.get("list") or "").split()
+                    )):
+                        self._sync_combatants(sec, items)
+                c.execute("COMMIT")
+            except Exception:
+                c.execute("ROLLBACK")
+                raise
+            self._rev += 1
+            self._cached = (self.signature(), {s: dict(d) for s, d in now.items()})
+        cfg._battle_rows = now
+        if current and hasattr(cfg, "mark_clean"):
+            # Nobody else wrote in between: the database now equals `cfg`.
+            cfg._battle_sig = self._cached[0]
+            cfg.mark_clean()
+
+    def _drop_section(self, sec: str) -> None:
+        c = self._conn
+        c.execute("DELETE FROM sections WHERE section = ?", (sec,))
+        c.execute("DELETE FROM settings WHERE section = ?", (sec,))
+        c.execute("DELETE FROM effects WHERE channel = ?", (sec,))
+        c.execute("DELETE FROM timers WHERE channel = ?", (sec,))
+        c.execute("DELETE FROM combatants WHERE channel = ?", (sec,))
+
+    def _delete_key(self, sec: str, key: str) -> None:
+        c = self._conn
+        parts = _split_key(sec, key)
+        if parts is None:
+            c.execute("DELETE FROM settings WHERE section = ? AND key = ?", (sec, key))
+            return
+        c.execute("DELETE FROM effects WHERE channel = ? AND slot = ? AND effect = ?", (sec, *parts))
+        c.execute("DELETE FROM timers WHERE channel = ? AND slot = ? AND effect = ?", (sec, *parts))
+
+    def _put_key(self, sec: str, key: str, value: str) -> None:
+        c = self._conn
+        parts = _split_key(sec, key)
+        if parts is None:
+            c.execute(
+                "INSERT INTO settings (section, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(section, key) DO UPDATE SET value = excluded.value",
+                (sec, key, value),
+            )
+            return
+        c.execute(
+            "INSERT INTO effects (channel, slot, effect, value) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(channel, slot, effect) DO UPDATE SET value = excluded.value",
+            (sec, *parts, value),
+        )
+        left = _is_timer(parts[1], value)
+        if left is None:
+            c.execute("DELETE FROM timers WHERE channel = ? AND slot = ? AND effect = ?", (sec, *parts))
+        else:
+            c.execute(
+                "INSERT INTO timers (channel, slot, effect, remaining) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(channel, slot, effect) DO UPDATE SET remaining = excluded.remaining",
+                (sec, *parts, left),
+            )
+
+    def _sync_combatants(self, chan: str, items: dict) -> None:
+        c = self._conn
+        c.execute("DELETE FROM combatants WHERE channel = ?", (chan,))
+        for pos, name in enumerate((items.get("list") or "").split()):
+            try:
+                init = int(items.get(name, "0"))
+            except ValueError:
+                init = 0
+            c.execute(
+                "INSERT OR REPLACE INTO combatants (channel, slot, name, init, pos) VALUES (?, ?, ?, ?, ?)",
+                (chan, name.replace(" ", "_"), name, init, pos),
+            )
+
+    # ---------- indexed queries ----------
+    # These read what was last saved. EffectIndex corrects them with the
+    # options a parsed cfg (or the write-behind cache) has not saved yet.
+    def combatants(self, chan_id: str) -> list[tuple[str, int]]:
+        """[(name, init), ...] in initiative-list order."""
+        with self._lock:
+            return list(self._conn.execute(
+                "SELECT name, init FROM combatants WHERE channel = ? ORDER BY pos", (chan_id,)
+            ))
+
+    def effects_for(self, chan_id: str, slot: str, prefix: str = "") -> dict[str, str]:
+        """{effect: value} for one combatant, optionally filtered by name prefix."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT effect, value FROM effects WHERE channel = ? AND slot = ? AND effect >= ? AND effect < ?",
+                (chan_id, slot, prefix, prefix + "\uffff"),
+            )
+            return dict(rows)
+
+    def holders_of(self, chan_id: str, effect: str) -> dict[str, str]:
+        """{slot: value} for every combatant carrying `effect` in this channel."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slot, value FROM effects WHERE channel = ? AND effect = ?", (chan_id, effect)
+            )
+            return dict(rows)
+
+    def expiring(self, chan_id: str, within: int | None = 0) -> list[tuple[str, str, int]]:
+        """[(slot, effect, remaining)] for x_* timers with remaining <= `within` (None: all)."""
+        with self._lock:
+            if within is None:
+                return list(self._conn.execute(
+                    "SELECT slot, effect, remaining FROM timers WHERE channel = ? ORDER BY remaining",
+                    (chan_id,),
+                ))
+            return list(self._conn.execute(
+                "SELECT slot, effect, remaining FROM timers WHERE channel = ? AND remaining <= ? "
+                "ORDER BY remaining",
+                (chan_id, int(within)),
+            ))
+
+    def unflushed(self, cfg, sec: str):
+        """Options of `sec` changed on `cfg` since it matched the database; None if unknown."""
+        touched = getattr(cfg, "touched", None)
+        if touched is None:
+            return None
+        with self._lock:
+            if getattr(cfg, "_battle_sig", None) != self.signature():
+                return None
+        return touched(sec)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def import_battle_file(store: SqliteBattleStore, src: str) -> int:
+    """Copy a monolithic battle.lst into an empty database. Returns sections imported."""
+    if not os.path.exists(src):
+        return 0
+    from utils.battle import FileBattleStore
+    cfg = FileBattleStore(src).load()
+    cfg._battle_rows = {}
+    store.save(cfg)
+    return len(cfg.sections())
+
+
+class EffectIndex:
+    """
+    Indexed reads of one channel's `<slot>.<effect>` options for a parsed
+    battle cfg. Rows come from SQLite; the options that may differ from it
+    (`unflushed`, known when the index is made, plus whatever is changed on
+    the cfg afterwards) are read from the cfg instead, so the answers match
+    the cfg even while it is being edited.
+    """
+
+    def __init__(self, store: SqliteBattleStore, cfg, chan_id: str, unflushed: set):
+        self.store = store
+        self.cfg = cfg
+        self.chan_id = chan_id
+        self._unflushed = set(unflushed)
+
+    def _overlay(self) -> dict:
+        """{slot: {effect: value or None}} for the options memory decides."""
+        sec = self.cfg._sections.get(self.chan_id, {})
+        touched = self.cfg.touched(self.chan_id)
+        keys = self._unflushed | (set(sec) if touched is None else touched)
+        out: dict = {}
+        for key in keys:
+            parts = _split_key(self.chan_id, key)
+            if parts is not None:
+                out.setdefault(parts[0], {})[parts[1]] = sec.get(key)
+        return out
+
+    def get(self, slot: str, default=()):
+        """[(option, value)] filed under `slot`, like battle_view().by_slot.get()."""
+        head, _, rest = slot.partition(".")
+        prefix = rest + "." if rest else ""
+        rows = self.store.effects_for(self.chan_id, head, prefix)
+        for effect, value in self._overlay().get(head, {}).items():
+            if not effect.startswith(prefix):
+                continue
+            if value is None:
+                rows.pop(effect, None)
+            else:
+                rows[effect] = value
+        return [(f"{head}.{e}", v) for e, v in rows.items()] or default
+
+    def timers(self, within: int | None = None) -> list[tuple[str, str, int]]:
+        """[(slot, effect, remaining)] for x_* counters (remaining <= `within` unless None)."""
+        overlay = self._overlay()
+        out = [
+            (slot, effect, left)
+            for slot, effect, left in self.store.expiring(self.chan_id, within)
+            if effect not in overlay.get(slot, {})
+        ]
+        for slot, effects in overlay.items():
+            for effect, value in effects.items():
+                left = _is_timer(effect, value) if value is not None else None
+                if left is not None and (within is None or left <= within):
+                    out.append((slot, effect, left))
+        out.sort(key=lambda r: r[2])
+        return out
+
@@ -0,0 +1,212 @@
+# utils/battle_model.py
+from utils.battle import new_battle_cfg
+
+# Typed, read-mostly view of one channel's battle section. Commands still
+# write through the ConfigParser (the on-disk format is unchanged); the view
+# is rebuilt only after the section changes, so repeated lookups in one
+# command (slot resolution, effect checks) cost attribute access instead of
+# string formatting and re-parsing per check.
+
+_X_META = ("_label", "_emoji", "_code", "_by")
+
+
+def _int(raw, default: int = 0) -> int:
+    try:
+        return int(str(raw).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+class Effect:
+    """A custom x_<tag> timer and its metadata."""
+    __slots__ = ("tag", "left", "label", "code", "emoji", "by")
+
+    def __init__(self, tag, left, label=None, code=None, emoji=None, by=None):
+        self.tag = tag
+        self.left = left
+        self.label = label
+        self.code = code
+        self.emoji = emoji
+        self.by = by
+
+    def __repr__(self):
+        return f"Effect({self.tag!r}, {self.left})"
+
+
+class Combatant:
+    """
+    One initiative entry and the keys stored under its slot. `keys` maps the
+    part after '<slot>.' to the raw value; the common flags are parsed once.
+    """
+    __slots__ = ("name", "slot", "score", "keys", "disp", "acpen", "gas", "inv", "inv_gid", "effects")
+
+    def __init__(self, name: str, slot: str, score: int, keys: dict):
+        self.name = name
+        self.slot = slot
+        self.score = score
+        self.keys = keys
+        self.disp = keys.get("disp", name)
+        self.acpen = _int(keys.get("acpen"))
+        self.gas = _int(keys.get("gas"))
+        self.inv = _int(keys.get("inv"))
+        self.inv_gid = keys.get("inv_gid", "")
+        effects = []
+        for k, v in keys.items():
+            if not k.startswith("x_") or k.endswith(_X_META):
+                continue
+            left = _int(v, None)
+            if left is None:
+                continue
+            effects.append(Effect(k[2:], left, keys.get(f"{k}_label"), keys.get(f"{k}_code"),
+                                  keys.get(f"{k}_emoji"), keys.get(f"{k}_by")))
+        self.effects = tuple(effects)
+
+    def get(self, key: str, default=None):
+        return self.keys.get(key, default)
+
+    def getint(self, key: str, default: int = 0) -> int:
+        return _int(self.keys.get(key), default)
+
+    def has(self, key: str) -> bool:
+        return key in self.keys
+
+    def effect(self, tag: str):
+        for e in self.effects:
+            if e.tag == tag:
+                return e
+        return None
+
+    def to_keys(self) -> dict:
+        """`keys` with changed typed fields and effects written back."""
+        keys = dict(self.keys)
+        if self.disp != keys.get("disp", self.name):
+            keys["disp"] = self.disp
+        for k in ("acpen", "gas", "inv"):
+            v = getattr(self, k)
+            if v != _int(keys.get(k)):
+                keys[k] = str(v)
+        if self.inv_gid != keys.get("inv_gid", ""):
+            keys["inv_gid"] = self.inv_gid
+        for e in self.effects:
+            base = f"x_{e.tag}"
+            if _int(keys.get(base), None) != e.left:
+                keys[base] = str(e.left)
+            for suf, v in (("_label", e.label), ("_code", e.code), ("_emoji", e.emoji), ("_by", e.by)):
+                if v is not None and keys.get(base + suf) != v:
+                    keys[base + suf] = v
+        return keys
+
+    def __repr__(self):
+        return f"Combatant({self.name!r}, score={self.score})"
+
+
+class Battle:
+    """
+    A channel's section: initiative order, Combatant records, everything
+    else in `fields`, and `by_slot` (every option grouped under each prefix
+    ending at a dot, raw values, section order).
+    """
+    __slots__ = ("chan_id", "names", "combatants", "fields", "by_slot", "memo", "_lower")
+
+    def __init__(self, chan_id: str):
+        self.chan_id = chan_id
+        self.names = ()
+        self.combatants = {}
+        self.fields = {}
+        self.by_slot = {}
+        self.memo = {}      # derived lookups, dropped with the view
+        self._lower = {}
+
+    @classmethod
+    def from_cfg(cls, cfg, chan_id: str) -> "Battle":
+        b = cls(chan_id)
+        items = cfg.items(chan_id, raw=True)
+        section = dict(items)
+        for opt, val in items:
+            i = opt.find(".")
+            while i > 0:
+                b.by_slot.setdefault(opt[:i], []).append((opt, val))
+                i = opt.find(".", i + 1)
+        names = [n for n in section.get("list", "").split() if n]
+        b.names = tuple(names)
+        claimed = {"list"}
+        for n in names:
+            slot = n.replace(" ", "_")
+            keys = {}
+            for opt, val in b.by_slot.get(slot, ()):
+                keys[opt[len(slot) + 1:]] = val
+                claimed.add(opt)
+            claimed.add(n)
+            b.combatants[n] = Combatant(n, slot, _int(section.get(n, "0")), keys)
+            b._lower.setdefault(n.lower(), n)
+        b.fields = {k: v for k, v in section.items() if k not in claimed}
+        return b
+
+    def to_cfg(self, cfg=None):
+        """Write this battle back as its section (replacing it); returns the parser."""
+        if cfg is None:
+            cfg = new_battle_cfg()
+        if cfg.has_section(self.chan_id):
+            cfg.remove_section(self.chan_id)
+        cfg.add_section(self.chan_id)
+        for k, v in self.fields.items():
+            cfg.set(self.chan_id, k, v)
+        cfg.set(self.chan_id, "list", " ".join(self.names))
+        for n in self.names:
+            c = self.combatants[n]
+            cfg.set(self.chan_id, n, str(c.score))
+            for k, v in c.to_keys().items():
+                cfg.set(self.chan_id, f"{c.slot}.{k}", v)
+        return cfg
+
+    @property
+    def round(self) -> int:
+        return _int(self.fields.get("round"))
+
+    @property
+    def turn(self) -> str:
+        return self.fields.get("turn", "")
+
+    def lookup(self, name) -> str | None:
+        """
+        The listed name equal to `name` ignoring case, else None. Like the
+        cogs' _find_ci_name, "Goblin_1" falls back to "Goblin 1".
+        """
+        if not name:
+            return None
+        q = str(name).strip().lower()
+        return self._lower.get(q) or self._lower.get(q.replace("_", " "))
+
+    def combatant(self, name):
+        key = self.lookup(name)
+        return self.combatants.get(key) if key else None
+
+    def slot_keys(self, slot: str):
+        return self.by_slot.get(slot, ())
+
+    def inv_group(self, gid: str) -> list:
+        """Combatants sharing the group-invisibility id `gid` (Invisibility 10')."""
+        return [c for c in self if gid and c.inv_gid == gid]
+
+    def __iter__(self):
+        return (self.combatants[n] for n in self.names)
+
+
+def battle_view(cfg, chan_id: str):
+    """
+    Battle for `chan_id`, shared until the section changes (None if there is
+    no such section). Read-only: change state through the parser.
+    """
+    if not cfg.has_section(chan_id):
+        return None
+    revision = getattr(cfg, "revision", None)
+    if revision is None:
+        return Battle.from_cfg(cfg, chan_id)
+    stamp = revision(chan_id)
+    views = cfg.__dict__.setdefault("_battle_views", {})
+    hit = views.get(chan_id)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    view = Battle.from_cfg(cfg, chan_id)
+    views[chan_id] = (stamp, view)
+    return view
@@ -0,0 +1,193 @@
+# utils/craft_index.py
+import heapq
+import json
+import os
+import time
+
+# Crafting projects live in one file per user (data/crafting/<user id>.json).
+# This index maps project id -> owner and ready time so a GM lookup by id,
+# or a "what is ready" query, reads one small file instead of every user's.
+# It sits outside the project directory so directory scans never see it, and
+# it is rebuilt from the user files if it is missing or out of step.
+INDEX_PATH = os.path.join("data", "craft_index.json")
+
+
+def ready_ts(proj: dict) -> int:
+    """When a project's downtime has elapsed (started_ts + days)."""
+    try:
+        return int(proj.get("started_ts") or 0) + max(0, int(proj.get("days") or 0)) * 86400
+    except Exception:
+        return 0
+
+
+class ProjectIndex:
+    """
+    project id -> {user, status, ready_ts, item, owner_char, guild, channel,
+    notified}. status is "active", or "error" once a resolve attempt ran but
+    kept the project (item grant failed, or skipped). Resolved and canceled
+    projects leave the index.
+
+    A min-heap of (ready_ts, pid) backs the scheduler: pop_ready() hands out
+    each project once when its time comes, without scanning the rest.
+    """
+
+    def __init__(self, data_dir: str, path: str = INDEX_PATH):
+        self.data_dir = data_dir
+        self.path = path
+        self._by_pid = None
+        self._by_user = {}
+        self._heap = []
+        self._retry = {}    # pid -> heap time of a retry() entry
+
+    def _user_file(self, uid: str) -> str:
+        return os.path.join(self.data_dir, f"{uid}.json")
+
+    def _load_user(self, uid: str) -> dict:
+        try:
+            with open(self._user_file(uid), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _ensure(self) -> dict:
+        if self._by_pid is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._set(json.load(f).get("projects") or {})
+            except Exception:
+                self.rebuild()
+        return self._by_pid
+
+    def _set(self, by_pid: dict) -> None:
+        self._by_pid = by_pid
+        self._by_user = {}
+        for pid, e in by_pid.items():
+            self._by_user.setdefault(str(e.get("user", "")), set()).add(pid)
+        self._heap = [(int(e.get("ready_ts", 0)), pid) for pid, e in by_pid.items() if not e.get("notified")]
+        heapq.heapify(self._heap)
+        self._retry = {}
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"projects": self._by_pid}, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    async def asave(self) -> None:
+        from utils.storage import asave_json
+        await asave_json(self.path, {"projects": self._by_pid}, indent=1)
+
+    @staticmethod
+    def _entry(uid: str, proj: dict, status: str = "active") -> dict:
+        return {
+            "user": uid,
+            "status": status,
+            "ready_ts": ready_ts(proj),
+            "item": proj.get("item", ""),
+            "owner_char": proj.get("owner_char", ""),
+            "guild": str(proj.get("guild_id") or ""),
+            "channel": str(proj.get("channel_id") or ""),
+            "notified": bool(proj.get("notified")),
+        }
+
+    def rebuild(self) -> int:
+        """Re-index every user file (the slow path). Returns the project count."""
+        by_pid = {}
+        if os.path.isdir(self.data_dir):
+            for fn in os.listdir(self.data_dir):
+                if not fn.endswith(".json"):
+                    continue
+                uid = fn[:-5]
+                for pid, proj in self._load_user(uid).items():
+                    if isinstance(proj, dict):
+                        by_pid[pid] = self._entry(uid, proj)
+        self._set(by_pid)
+        self._save()
+        return len(by_pid)
+
+    def sync_user(self, uid, projects: dict, errors=(), save: bool = True) -> None:
+        """
+        Make the index match a user's project file after it was written.
+        With save=False the caller writes the index itself (asave()).
+        """
+        by_pid = self._ensure()
+        uid = str(uid)
+        old = self._by_user.get(uid, set())
+        new = set(projects)
+        for pid in old - new:
+            by_pid.pop(pid, None)
+        for pid, proj in projects.items():
+            prev = by_pid.get(pid)
+            status = "error" if pid in errors else (prev or {}).get("status", "active")
+            e = by_pid[pid] = self._entry(uid, proj, status)
+            if prev is None or prev.get("ready_ts") != e["ready_ts"]:
+                heapq.heappush(self._heap, (e["ready_ts"], pid))
+        self._by_user[uid] = new
+        if save:
+            self._save()
+
+    def get(self, pid: str):
+        return self._ensure().get(str(pid))
+
+    def find(self, pid: str):
+        """(user id, user file path, projects) holding `pid`, or None."""
+        pid = str(pid)
+        e = self.get(pid)
+        if e is None:
+            return None
+        uid = str(e.get("user", ""))
+        projects = self._load_user(uid)
+        if pid in projects:
+            return uid, self._user_file(uid), projects
+        # Stale (e.g. a hand-edited file): re-index once and retry.
+        self.rebuild()
+        e = self._by_pid.get(pid)
+        if e is None:
+            return None
+        uid = str(e.get("user", ""))
+        return uid, self._user_file(uid), self._load_user(uid)
+
+    def ready(self, now: int | None = None) -> list:
+        """(pid, entry) for every project whose time is up, soonest first."""
+        now = int(time.time()) if now is None else now
+        rows = [(pid, e) for pid, e in self._ensure().items() if int(e.get("ready_ts", 0)) <= now]
+        rows.sort(key=lambda r: (int(r[1].get("ready_ts", 0)), r[0]))
+        return rows
+
+    def pop_ready(self, now: int | None = None) -> list:
+        """(pid, entry) that became ready since the last call, each handed out once."""
+        self._ensure()
+        now = int(time.time()) if now is None else now
+        out = []
+        seen = set()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            ts, pid = heapq.heappop(heap)
+            e = self._by_pid.get(pid)
+            if e is None or e.get("notified") or pid in seen:
+                continue
+            if int(e.get("ready_ts", 0)) == ts or self._retry.get(pid) == ts:
+                self._retry.pop(pid, None)
+                seen.add(pid)
+                out.append((pid, e))
+        return out
+
+    def retry(self, pid: str, at: int) -> None:
+        """Hand `pid` out of pop_ready() again at time `at` (it could not be delivered)."""
+        self._retry[pid] = int(at)
+        heapq.heappush(self._heap, (int(at), pid))
+
+    def requeue_guild(self, guild_id) -> int:
+        """Queue again every ready, un-notified project of a guild. Returns how many."""
+        gid = str(guild_id)
+        now = int(time.time())
+        n = 0
+        for pid, e in self._ensure().items():
+            if e.get("guild") != gid or e.get("notified") or e.get("status") == "error":
+                continue
+            if int(e.get("ready_ts", 0)) <= now:
+                heapq.heappush(self._heap, (int(e.get("ready_ts", 0)), pid))
+                n += 1
+        return n
@@ -0,0 +1,107 @@
+# utils/effect_clock.py
+import heapq
+import threading
+
+
+class ExpiryQueue:
+    """
+    Effect timers keyed by (slot, tag), in a heap ordered by the game-clock
+    round they run out on, so advancing the clock touches only what expires.
+    Re-registering a timer supersedes its old heap entry, which is skipped
+    when reached. Battle-write listeners update it from the storage pool,
+    hence the lock.
+    """
+
+    def __init__(self):
+        self._heap = []     # (expires_at, slot, tag)
+        self._timers = {}   # (slot, tag) -> expires_at
+        self._lock = threading.Lock()
+
+    def register(self, slot, tag, expires_at_round: int) -> None:
+        """`slot.tag` runs out on round `expires_at_round`."""
+        with self._lock:
+            self._timers[(slot, tag)] = expires_at_round
+            heapq.heappush(self._heap, (expires_at_round, slot, tag))
+            if len(self._heap) > 2 * len(self._timers) + 64:
+                self._heap = [(exp, s, t) for (s, t), exp in self._timers.items()]
+                heapq.heapify(self._heap)
+
+    def cancel(self, slot, tag) -> None:
+        with self._lock:
+            self._timers.pop((slot, tag), None)
+
+    def expires_at(self, slot, tag):
+        return self._timers.get((slot, tag))
+
+    def _peek(self):
+        while self._heap:
+            exp, slot, tag = self._heap[0]
+            if self._timers.get((slot, tag)) == exp:
+                return exp
+            heapq.heappop(self._heap)
+        return None
+
+    def peek(self):
+        """Round the next live timer runs out on, else None."""
+        with self._lock:
+            return self._peek()
+
+    def pop(self, until: int):
+        """(expires_at, slot, tag) of the next timer to run out at or before `until`, else None."""
+        with self._lock:
+            exp = self._peek()
+            if exp is None or exp > until:
+                return None
+            exp, slot, tag = heapq.heappop(self._heap)
+            del self._timers[(slot, tag)]
+            return exp, slot, tag
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._timers)
+
+
+class GameClock:
+    """A channel's round counter and the ExpiryQueue of its effect timers."""
+
+    def __init__(self, now: int = 0):
+        self.now = now
+        self.queue = ExpiryQueue()
+        self.busy = False   # set while a caller advances it; write listeners skip it
+
+    def register(self, slot, tag, rounds: int) -> None:
+        """`slot.tag` runs out `rounds` rounds from now; rounds <= 0 stops tracking it."""
+        if rounds > 0:
+            self.queue.register(slot, tag, self.now + rounds)
+        else:
+            self.queue.cancel(slot, tag)
+
+    def cancel(self, slot, tag) -> None:
+        self.queue.cancel(slot, tag)
+
+    def left(self, slot, tag) -> int:
+        """Rounds remaining on `slot.tag` (0 if not tracked)."""
+        exp = self.queue.expires_at(slot, tag)
+        return 0 if exp is None else max(0, exp - self.now)
+
+
+_clocks: dict = {}
+
+
+def channel_clock(chan_id: str):
+    """The running clock of `chan_id`, or None if none was started."""
+    return _clocks.get(str(chan_id))
+
+
+def start_clock(chan_id: str, now: int = 0) -> GameClock:
+    """Start (or restart) the clock of `chan_id` at round `now`, with no timers."""
+    clock = _clocks[str(chan_id)] = GameClock(now)
+    return clock
+
+
+def drop_clock(chan_id: str) -> None:
+    _clocks.pop(str(chan_id), None)
+
+
+def clock_channels() -> list:
+    return list(_clocks)
@@ -1,19 +1,290 @@
 # utils/ini.py
 import configparser
+import contextvars
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+_CACHE_MAX = 512
+# abspath -> ((mtime_ns, size), parsed cfg). The cached parser is never
+# handed out; callers get a private copy they are free to mutate.
+_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+_path_locks: dict = {}
+_path_locks_guard = threading.Lock()
+
+class DeferredWrites:
+    """
+    .coe writes of one command, taken off the event loop. Inside the scope
+    (see utils.storage.defer_char_writes) write_cfg() to an existing .coe
+    only records a snapshot and calls `kick` to have flush() run on the
+    storage pool; read_cfg() of that path returns the pending contents
+    until the write has landed.
+    """
+
+    def __init__(self, kick=None):
+        self.kick = kick
+        self.closed = False
+        self._files = {}  # abspath -> (path, cfg snapshot)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            hit = self._files.get(key)
+        return hit[1] if hit else None
+
+    def put(self, key: str, path: str, cfg) -> None:
+        with self._lock:
+            self._files[key] = (path, cfg)
+        if self.kick is not None:
+            self.kick()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._files.pop(key, None)
+
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._files)
+
+    def flush(self) -> int:
+        """Write every pending file now (any thread). Returns how many were written."""
+        with self._lock:
+            items = list(self._files.items())
+        for key, (path, cfg) in items:
+            _write_cfg(path, cfg)
+            with self._lock:
+                if self._files.get(key, (None, None))[1] is cfg:
+                    del self._files[key]
+        return len(items)
+
+
+_deferred: contextvars.ContextVar = contextvars.ContextVar("ini_deferred", default=None)
+
+
+def _active_deferred():
+    d = _deferred.get()
+    return None if d is None or d.closed else d
+
+
+def begin_deferred(kick=None):
+    """Open a DeferredWrites scope for the running task; (scope, token), or (None, None) if one is open."""
+    if _active_deferred() is not None:
+        return None, None
+    d = DeferredWrites(kick)
+    return d, _deferred.set(d)
+
+
+def end_deferred(d, token) -> None:
+    """Close the scope; later write_cfg() calls from tasks it spawned write directly."""
+    if d is None:
+        return
+    d.closed = True
+    _deferred.reset(token)
+
+
+def path_write_lock(path: str) -> threading.Lock:
+    """Process-wide lock serializing writers of one file (threads included)."""
+    key = os.path.abspath(path)
+    with _path_locks_guard:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = _path_locks[key] = threading.Lock()
+        return lock
+
+def atomic_write_text(path: str, text: str) -> None:
+    """
+    Write via a temp file in the same directory, fsync it, then os.replace()
+    it over the target, so readers and crashes only ever see the old or the
+    new file, never a truncated one.
+    """
+    from utils import names
+    d = os.path.dirname(os.path.abspath(path))
+    dir_rev = names.dir_revision(path)
+    fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=d)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    names.note_written(path, None, dir_rev)
 
 def new_cfg() -> configparser.ConfigParser:
     cfg = configparser.ConfigParser(strict=False)
     cfg.optionxform = str  # preserve key case
     return cfg
 
-def read_cfg(path: str) -> configparser.ConfigParser:
+def _file_sig(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _clone(src: configparser.ConfigParser) -> configparser.ConfigParser:
+    """Copy a parsed cfg without re-parsing (values are immutable str)."""
     cfg = new_cfg()
-    cfg.read(path, encoding="utf-8")
+    cfg._defaults.update(src._defaults)
+    for sec, opts in src._sections.items():
+        cfg._sections[sec] = opts.copy()
+        cfg._proxies[sec] = configparser.SectionProxy(cfg, sec)
     return cfg
 
+def _stamp(cfg: configparser.ConfigParser, key: str, sig, base) -> configparser.ConfigParser:
+    # What this copy was read from, so write_cfg() can spot a concurrent change.
+    cfg._ini_base = (key, sig, base)
+    return cfg
+
+def merge_options(base: dict, mine: dict, theirs: dict) -> dict:
+    """
+    Three-way merge of one section: options this writer changed or removed
+    since `base` win, everything else keeps the other writer's value, so two
+    commands touching different keys of one file both land.
+    """
+    merged = dict(theirs)
+    for k, v in mine.items():
+        if base.get(k) != v:
+            merged[k] = v
+    for k in base:
+        if k not in mine:
+            merged.pop(k, None)
+    return merged
+
+def _merge_disk(key: str, cfg: configparser.ConfigParser, base: configparser.ConfigParser) -> None:
+    """Fold what another writer saved to `key` since `base` into `cfg`."""
+    disk = new_cfg()
+    try:
+        disk.read(key, encoding="utf-8")
+    except configparser.Error:
+        return
+    was, mine = base._sections, cfg._sections
+    for sec, opts in disk._sections.items():
+        if sec in mine:
+            mine[sec] = merge_options(was.get(sec) or {}, mine[sec], opts)
+        elif sec not in was:
+            cfg._sections[sec] = dict(opts)
+            cfg._proxies[sec] = configparser.SectionProxy(cfg, sec)
+    for sec in list(mine):
+        if sec not in disk._sections and sec in was and mine[sec] == was[sec]:
+            cfg.remove_section(sec)
+
+def copy_cfg(cfg: configparser.ConfigParser) -> configparser.ConfigParser:
+    """Independent, mutable copy of a parsed cfg."""
+    return _clone(cfg)
+
+def _cache_put(key: str, sig, cfg: configparser.ConfigParser) -> None:
+    with _cache_lock:
+        _cache[key] = (sig, cfg)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+
+def invalidate_cfg(path: str | None = None) -> None:
+    """Drop one cached file (or all of them) after an out-of-band change."""
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(os.path.abspath(path), None)
+
+def read_cfg(path: str) -> configparser.ConfigParser:
+    """
+    Parse an INI file, reusing the last parse while the file's
+    (mtime_ns, size) is unchanged. Always returns a fresh copy.
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        cfg = new_cfg()
+        cfg.read(path, encoding="utf-8")
+        return cfg
+    key = os.path.abspath(path)
+    d = _active_deferred()
+    if d is not None:
+        pending = d.get(key)
+        if pending is not None:
+            cfg = _clone(pending)
+            cfg._ini_base = getattr(pending, "_ini_base", None)
+            return cfg
+    sig = _file_sig(key)
+    if sig is None and key.lower().endswith(".coe") and os.path.dirname(key) == os.getcwd():
+        from utils import monsters
+        if monsters.is_pending(key) and monsters.materialize(key):
+            sig = _file_sig(key)
+    if sig is None:
+        invalidate_cfg(key)
+        return new_cfg()
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == sig:
+            _cache.move_to_end(key)
+            return _stamp(_clone(hit[1]), key, sig, hit[1])
+    cfg = new_cfg()
+    cfg.read(key, encoding="utf-8")
+    _cache_put(key, sig, cfg)
+    return _stamp(_clone(cfg), key, sig, cfg)
+
 def write_cfg(path: str, cfg: configparser.ConfigParser) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        cfg.write(f)
+    """
+    Atomically replace `path` with `cfg`. If `cfg` came from read_cfg(path)
+    and the file has changed since (another command wrote it while this one
+    was awaiting), the other writer's options are merged in first, keeping
+    this one's changes, instead of being overwritten.
+
+    Inside a DeferredWrites scope, an existing .coe is handed to the scope
+    (written on the storage pool) instead.
+    """
+    key = os.path.abspath(path)
+    d = _active_deferred()
+    if (d is not None and key.lower().endswith(".coe")
+            and isinstance(cfg, configparser.RawConfigParser) and _file_sig(key) is not None):
+        snap = _clone(cfg)
+        snap._ini_base = getattr(cfg, "_ini_base", None)
+        d.put(key, path, snap)
+        return
+    _write_cfg(path, cfg)
+
+def _write_cfg(path: str, cfg: configparser.ConfigParser) -> None:
+    from utils import names
+    key = os.path.abspath(path)
+    base = getattr(cfg, "_ini_base", None)
+    with path_write_lock(key):
+        if base is not None and base[0] == key:
+            sig = _file_sig(key)
+            if sig is not None and sig != base[1]:
+                _merge_disk(key, cfg, base[2])
+        buf = io.StringIO()
+        cfg.write(buf)
+        atomic_write_text(key, buf.getvalue())
+        sig = _file_sig(key)
+    if sig is None or not isinstance(cfg, configparser.RawConfigParser):
+        invalidate_cfg(key)
+    else:
+        snap = _clone(cfg)
+        _cache_put(key, sig, snap)
+        _stamp(cfg, key, sig, snap)
+    names.note_written(path, cfg)
+
+def remove_cfg(path: str) -> None:
+    """os.remove() plus cache/name-index bookkeeping. Raises like os.remove."""
+    from utils import names
+    d = _active_deferred()
+    if d is not None:
+        d.discard(os.path.abspath(path))
+    dir_rev = names.dir_revision(path)
+    try:
+        os.remove(os.path.abspath(path))
+    finally:
+        invalidate_cfg(path)
+        names.note_removed(path, dir_rev)
 
 def resolve_section(cfg: configparser.ConfigParser, section_name: str):
     target = (section_name or "").strip().lower()
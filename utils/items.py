@@ -0,0 +1,141 @@
+# utils/items.py
+import bisect
+import difflib
+import heapq
+import re
+
+from utils.static_data import derived, item_table, normalize_name
+
+ITEM_FILE = "item.lst"
+
+# Trigram overlap picks this many candidates; only those are ranked with
+# difflib, so a typo costs a few dict lookups instead of a full scan.
+_FUZZY_POOL = 12
+_PREFIX_POOL = 64
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _tokens(s) -> set:
+    return set(re.findall(r"[a-z0-9]+", str(s).lower()))
+
+
+class ItemIndex:
+    """
+    Lookup structures over item.lst, built once per parse and shared:
+    exact / case-insensitive / normalized and alias keys, the normalized
+    keys sorted for prefix queries, a trigram index for typos, and a word
+    index for order-insensitive matches.
+    """
+
+    def __init__(self, items: dict, index: dict):
+        self.items = items
+        self.index = index              # normalized name or alias -> canon
+        self._lower = {}                # section.lower() -> first such section
+        self._by_norm = {}              # normalized section -> first such section
+        self._order = {}                # section -> position in item.lst
+        self._by_token = {}             # word -> sections containing it, in file order
+        for i, sec in enumerate(items):
+            self._lower.setdefault(sec.lower(), sec)
+            self._by_norm.setdefault(normalize_name(sec), sec)
+            self._order[sec] = i
+            for t in _tokens(sec):
+                self._by_token.setdefault(t, []).append(sec)
+        self._keys = sorted(index)
+        self._grams = {}
+        self._gram_count = {}
+        for key in self._keys:
+            grams = _trigrams(key)
+            self._gram_count[key] = len(grams)
+            for g in grams:
+                self._grams.setdefault(g, []).append(key)
+
+    def lookup(self, name):
+        """
+        (canon, item) or (None, None). Exact section, then case-insensitive
+        section, then normalized name/alias, then normalized section.
+        """
+        if not name:
+            return None, None
+        k = str(name).strip()
+        if k in self.items:
+            return k, self.items[k]
+        kl = k.lower()
+        canon = self._lower.get(kl)
+        if canon is None:
+            norm = normalize_name(k)
+            canon = self.index.get(k) or self.index.get(kl) or self.index.get(norm)
+            if canon not in self.items:
+                canon = self._by_norm.get(norm)
+        if canon is None:
+            return None, None
+        return canon, self.items[canon]
+
+    def canon(self, name) -> str | None:
+        return self.lookup(name)[0]
+
+    def section(self, name) -> str | None:
+        """First section whose normalized name equals normalize_name(name)."""
+        return self._by_norm.get(normalize_name(name))
+
+    def _prefixed(self, key: str) -> list:
+        i = bisect.bisect_left(self._keys, key)
+        out = []
+        while i < len(self._keys) and self._keys[i].startswith(key) and len(out) < _PREFIX_POOL:
+            out.append(self._keys[i])
+            i += 1
+        return sorted(out, key=lambda k: (len(k), k))
+
+    def _fuzzy(self, key: str, cutoff: float) -> list:
+        grams = _trigrams(key)
+        shared = {}
+        for g in grams:
+            for k in self._grams.get(g, ()):
+                shared[k] = shared.get(k, 0) + 1
+        pool = heapq.nlargest(_FUZZY_POOL, shared, key=lambda k: shared[k] / (len(grams) + self._gram_count[k]))
+        # Same scoring and cutoff as difflib.get_close_matches, on the pool only.
+        sm = difflib.SequenceMatcher()
+        sm.set_seq2(key)
+        scored = []
+        for k in pool:
+            sm.set_seq1(k)
+            if sm.real_quick_ratio() >= cutoff and sm.quick_ratio() >= cutoff:
+                r = sm.ratio()
+                if r >= cutoff:
+                    scored.append((r, k))
+        scored.sort(key=lambda t: (-t[0], t[1]))
+        return [k for _, k in scored]
+
+    def suggest(self, query, limit: int = 5, cutoff: float = 0.6) -> list:
+        """Ranked canon names for an unknown item: prefix hits (shortest first), then close typos."""
+        key = normalize_name(query)
+        if not key:
+            return []
+        out = []
+        for k in self._prefixed(key):
+            if self.index[k] not in out:
+                out.append(self.index[k])
+        if len(out) < limit:
+            for k in self._fuzzy(key, cutoff):
+                if self.index[k] not in out:
+                    out.append(self.index[k])
+        return out[:limit]
+
+    def with_words(self, name) -> list:
+        """Sections whose name contains every word of `name` (any order), in item.lst order."""
+        want = _tokens(name)
+        if not want:
+            return []
+        lists = sorted((self._by_token.get(t, []) for t in want), key=len)
+        hit = set(lists[0])
+        for more in lists[1:]:
+            hit.intersection_update(more)
+        return sorted(hit, key=self._order.__getitem__)
+
+
+def item_search(path: str = ITEM_FILE) -> ItemIndex:
+    """Shared ItemIndex for item.lst; rebuilt when the file is reloaded."""
+    return derived(path, "item_search", lambda cfg: ItemIndex(*item_table(path)))
@@ -0,0 +1,560 @@
+# utils/monsters.py
+import bisect
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+from utils.ini import new_cfg, copy_cfg, read_cfg
+from utils.static_data import cached_load
+
+MONSTER_DIR = "monsters"
+
+# How often (seconds) an accessed catalog re-stats its template files to
+# pick up in-place edits. Adds/removes/renames are caught immediately via
+# the directory mtime.
+_RECHECK_S = 5.0
+
+
+def _norm(s: str) -> str:
+    return (s or "").strip().lower().replace("_", " ")
+
+
+def _to_int(v, default=None):
+    try:
+        return int(str(v).strip())
+    except (TypeError, ValueError):
+        try:
+            return int(float(str(v).strip()))
+        except (TypeError, ValueError):
+            return default
+
+
+def _to_num(v, default=None):
+    try:
+        f = float(str(v).strip())
+    except (TypeError, ValueError):
+        return default
+    return int(f) if f.is_integer() else f
+
+
+@dataclass(frozen=True)
+class MonsterTemplate:
+    """One monsters/<name>.ini, parsed once. `cfg` is shared: treat it as read-only."""
+    name: str                     # file stem, e.g. "GiantRat"
+    path: str
+    sig: tuple
+    cfg: object = field(repr=False, compare=False)
+    base: dict = field(repr=False, compare=False)  # [base] as written (str values)
+    ac: int | None = None
+    hd: float | int | None = None
+    hpmod: int = 0
+    attacks_per_turn: int | None = None
+    attacks: tuple = ()           # ((name, dice), ...)
+    special: str = ""
+    saveas: str = ""
+    treasure: str = ""
+    appearing: str = ""
+    type: str = ""
+    move: int | None = None
+    morale: int | None = None
+    xp: int | None = None
+
+    def typed_base(self) -> dict:
+        """[base] with lower-cased keys and integer-looking values as int."""
+        out = {}
+        for k, v in self.base.items():
+            v = v.strip()
+            out[k.lower()] = int(v) if v.lstrip("-").isdigit() else v
+        return out
+
+
+def _build(name: str, path: str, sig) -> MonsterTemplate | None:
+    # Parsed directly: the catalog holds its own copies, so ~400 templates
+    # do not churn read_cfg's cache of character sheets.
+    cfg = new_cfg()
+    cfg.read(path, encoding="utf-8")
+    if not cfg.has_section("base"):
+        return None
+    base = dict(cfg.items("base", raw=True))
+    low = {k.lower(): v for k, v in base.items()}
+    atk_names = [n for n in re.split(r"[,\s]+", (low.get("attacknames") or "").strip()) if n]
+    attacks = tuple((n, (low.get(n.lower()) or "").strip() or "—") for n in atk_names)
+    return MonsterTemplate(
+        name=name,
+        path=path,
+        sig=sig,
+        cfg=cfg,
+        base=base,
+        ac=_to_int(low.get("ac")),
+        hd=_to_num(low.get("hd")),
+        hpmod=_to_int(low.get("hpmod"), 0),
+        attacks_per_turn=_to_int(low.get("attacks")),
+        attacks=attacks,
+        special=(low.get("special") or "").strip(),
+        saveas=(low.get("saveas") or "").strip(),
+        treasure=(low.get("treasure") or "").strip(),
+        appearing=(low.get("appearing") or "").strip(),
+        type=(low.get("type") or "").strip(),
+        move=_to_int(low.get("move")),
+        morale=_to_int(low.get("morale")),
+        xp=_to_int(low.get("xp")),
+    )
+
+
+def _load_template(path: str) -> MonsterTemplate | None:
+    stem = os.path.basename(path)[:-4]
+    return _build(stem, path, None)
+
+
+class MonsterCatalog:
+    """
+    Every template under monsters/, parsed once, with exact / prefix /
+    substring lookup. Changed files are re-parsed on the next access after
+    the directory changes or every few seconds for in-place edits.
+    """
+
+    def __init__(self, root: str = MONSTER_DIR):
+        self.root = root
+        self._lock = threading.RLock()
+        self._dir_sig = None
+        self._checked = 0.0
+        self._by_key: dict = {}     # lower-case stem -> MonsterTemplate
+        self._names: list = []      # stems sorted case-insensitively
+        self._norms: list = []      # (normalized stem, stem), sorted for bisect
+
+    def _dir_mtime(self):
+        try:
+            return os.stat(self.root).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self) -> list:
+        found = {}
+        try:
+            entries = list(os.scandir(self.root))
+        except OSError:
+            entries = []
+        for e in entries:
+            if not e.name.lower().endswith(".ini") or not e.is_file():
+                continue
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            found[e.name[:-4].lower()] = (e.name[:-4], os.path.join(self.root, e.name),
+                                         (st.st_mtime_ns, st.st_size))
+        by_key = {}
+        for key, (stem, path, sig) in found.items():
+            old = self._by_key.get(key)
+            if old is not None and old.sig == sig and old.path == path:
+                by_key[key] = old
+                continue
+            try:
+                tpl = cached_load(path, _load_template)
+            except Exception:
+                tpl = None
+            if tpl is not None and (tpl.name, tpl.path, tpl.sig) != (stem, path, sig):
+                tpl = replace(tpl, name=stem, path=path, sig=sig)
+            if tpl is not None:
+                by_key[key] = tpl
+        changed = [t.name for k, t in by_key.items() if self._by_key.get(k) is not t]
+        changed += [t.name for k, t in self._by_key.items() if k not in by_key]
+        self._by_key = by_key
+        self._names = sorted((t.name for t in by_key.values()), key=lambda s: s.lower())
+        self._norms = sorted((_norm(n), n) for n in self._names)
+        return changed
+
+    def _fresh(self) -> None:
+        now = time.monotonic()
+        sig = self._dir_mtime()
+        if sig != self._dir_sig or now - self._checked >= _RECHECK_S:
+            self._dir_sig = sig
+            self._checked = now
+            self._scan()
+
+    def refresh(self) -> list:
+        """Force a re-stat of every template (used by hot reload); returns added/changed/removed names."""
+        with self._lock:
+            self._dir_sig = self._dir_mtime()
+            self._checked = time.monotonic()
+            return self._scan()
+
+    # ---------- lookups ----------
+    def names(self) -> list[str]:
+        with self._lock:
+            self._fresh()
+            return list(self._names)
+
+    def get(self, name: str) -> MonsterTemplate | None:
+        """Exact, case-insensitive stem match ('GiantRat', 'giantrat')."""
+        with self._lock:
+            self._fresh()
+            return self._by_key.get(str(name or "").strip().lower())
+
+    def path_for(self, name: str) -> str | None:
+        tpl = self.get(name)
+        return tpl.path if tpl else None
+
+    def cfg_copy(self, name: str):
+        """A private, mutable copy of the template's parsed ini (or None)."""
+        tpl = self.get(name)
+        return copy_cfg(tpl.cfg) if tpl else None
+
+    def search(self, query: str) -> list[str]:
+        """Stems containing `query` (case/underscore-insensitive), sorted."""
+        q = _norm(query)
+        with self._lock:
+            self._fresh()
+            if not q:
+                return list(self._names)
+            return [n for n in self._names if q in _norm(n)]
+
+    def resolve(self, token: str) -> tuple[str | None, list[str]]:
+        """
+        Exact (case-insensitive) match wins; else a unique prefix, then a
+        unique substring. Otherwise (None, candidates).
+        """
+        q = _norm(token)
+        with self._lock:
+            self._fresh()
+            norms = self._norms
+            names = self._names
+        i = bisect.bisect_left(norms, (q, ""))
+        if i < len(norms) and norms[i][0] == q:
+            return norms[i][1], []
+        pref = set()
+        while i < len(norms) and norms[i][0].startswith(q):
+            pref.add(norms[i][1])
+            i += 1
+        pref_l = [n for n in names if n in pref]
+        if len(pref_l) == 1:
+            return pref_l[0], []
+        sub = [n for n in names if q in _norm(n)]
+        if len(sub) == 1:
+            return sub[0], []
+        cand = []
+        seen = set()
+        for n in pref_l + sub:
+            if n not in seen:
+                seen.add(n)
+                cand.append(n)
+        return None, cand
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def monster_catalog() -> MonsterCatalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = MonsterCatalog(MONSTER_DIR)
+        return _catalog
+
+
+# ---------- spawned instances ----------
+# `!mon` used to write a full <Name>.coe per spawned monster. Now a spawn
+# from a catalog template only records its per-instance values (type,
+# owner, rolled HP, saves, ...) in the battle store, under "<chan>:mon" as
+# "<Name>.<field>" keys. The .coe is built from template + overlay on
+# demand and only written out (materialized) once something needs a file.
+
+def instance_section(chan_id: str) -> str:
+    return f"{chan_id}:mon"
+
+
+_pending = None  # "go1" -> (chan_id, "GO1") for instances without a .coe
+_pending_lock = threading.RLock()
+
+
+def _inst_key(name: str) -> str:
+    n = os.path.basename(str(name or "").strip())
+    if n.lower().endswith(".coe"):
+        n = n[:-4]
+    return n.replace(" ", "_").lower()
+
+
+def _index() -> dict:
+    global _pending
+    if _pending is None:
+        from utils.battle import load_battles
+        cfg = load_battles()
+        idx = {}
+        for sec in cfg.sections():
+            if not sec.endswith(":mon"):
+                continue
+            for key in cfg.options(sec):
+                if key.endswith(".type"):
+                    nm = key[:-5]
+                    idx[_inst_key(nm)] = (sec[:-4], nm)
+        _pending = idx
+    return _pending
+
+
+def pending_names(chan_id: str | None = None) -> list[str]:
+    """Names of spawned monsters that have no .coe yet (optionally for one channel)."""
+    with _pending_lock:
+        return [nm for ch, nm in _index().values() if chan_id is None or ch == str(chan_id)]
+
+
+def has_pending(chan_id: str | None = None) -> bool:
+    with _pending_lock:
+        if _pending is not None and not _pending:
+            return False
+        return bool(pending_names(chan_id))
+
+
+def is_pending(name: str) -> bool:
+    with _pending_lock:
+        return _inst_key(name) in _index()
+
+
+def add_instance(cfg, chan_id: str, name: str, fields: dict) -> None:
+    """Record a spawned monster in battle cfg `cfg` (caller saves it)."""
+    sec = instance_section(chan_id)
+    if not cfg.has_section(sec):
+        cfg.add_section(sec)
+    for k, v in fields.items():
+        cfg.set(sec, f"{name}.{k}", str(v))
+    with _pending_lock:
+        _index()[_inst_key(name)] = (str(chan_id), name)
+
+
+def _fields_of(cfg, chan_id: str, name: str) -> dict:
+    sec = instance_section(chan_id)
+    if not cfg.has_section(sec):
+        return {}
+    pre = f"{name}."
+    return {k[len(pre):]: v for k, v in cfg.items(sec, raw=True) if k.startswith(pre)}
+
+
+def _pending_fields(name: str):
+    """(chan_id, Name, fields) for a pending instance, else None."""
+    from utils.battle import load_battles
+    with _pending_lock:
+        hit = _index().get(_inst_key(name))
+        if hit is None:
+            return None
+        chan_id, nm = hit
+        fields = _fields_of(load_battles(), chan_id, nm)
+        if "type" not in fields:
+            # Spawn never got saved (or was cleared elsewhere): forget it.
+            _index().pop(_inst_key(name), None)
+            return None
+        return chan_id, nm, fields
+
+
+def _parse_saves(raw: str) -> dict:
+    out = {}
+    for tok in str(raw or "").split():
+        k, _, v = tok.partition("=")
+        if k:
+            out[k] = v
+    return out
+
+
+def build_monster_coe(tpl: dict, name: str, fields: dict):
+    """
+    Full <Name>.coe for a spawned monster: stats, attacks and spells from the
+    template dict `tpl` (see MonsterTemplate.typed_base), plus per-instance
+    `fields`: type, chan, owner, controller, hp, maxhp, hd, saves, skills.
+    """
+    hd_val = float(fields.get("hd") or 1)
+    skills_str = fields.get("skills", "")
+
+    coe = new_cfg()
+    coe["version"] = {"current": "08082018"}
+    coe["info"] = {
+        "race": "Monster", "class": "Monster", "sex": "",
+        "name": name, "owner_id": fields.get("owner", ""),
+        "monster_type": fields.get("type", ""), "battle_chan": fields.get("chan", ""),
+    }
+    if skills_str:
+        coe["info"]["skills"] = skills_str
+    if fields.get("controller"):
+        coe["info"]["controller"] = fields["controller"]
+
+    coe["max"] = {"hp": str(fields.get("maxhp", "1"))}
+    coe["cur"] = {
+        "hp": str(fields.get("hp", fields.get("maxhp", "1"))),
+        "level": str(max(1, int(hd_val))),
+        "xp": "0", "gp": "0", "pp": "0", "ep": "0", "sp": "0", "turn": ""
+    }
+
+    damage = str(tpl.get("damage", "1d6"))
+    stats = {
+        "ac": str(int(tpl.get("ac", 10))),
+        "ab": "",
+        "move": str(int(tpl.get("move", 30))),
+        "type": str(tpl.get("type", "")).strip(),
+        "resist": str(tpl.get("resist", "")).strip(),
+        "reduce1": str(tpl.get("reduce1", "")).strip(),
+        "immune": str(tpl.get("immune", "")).strip(),
+        "hd": str(hd_val),
+    }
+
+    attacknames_raw = str(tpl.get("attacknames", "")).strip().lower()
+    atk_pref_list = sorted(k[4:] for k in tpl.keys() if k.lower().startswith("atk_"))
+    attack_list = [a for a in re.split(r"\s+", attacknames_raw) if a] if attacknames_raw else atk_pref_list
+    if attack_list:
+        stats["attacknames"] = " ".join(attack_list)
+        first_spec = None
+        for an in attack_list:
+            spec = (str(tpl.get(f"atk_{an}") or tpl.get(an) or
+                        tpl.get(f"dmg_{an}") or tpl.get(f"{an}_dmg") or "")).strip()
+            if spec:
+                stats[f"atk_{an}"] = spec
+                if first_spec is None:
+                    first_spec = spec
+            for key in (f"effect_{an}", f"{an}_effect", f"type_{an}"):
+                v = str(tpl.get(key, "")).strip()
+                if v:
+                    stats[key] = v
+        stats["damage"] = first_spec or damage or "1d6"
+    else:
+        stats["damage"] = damage or "1d6"
+
+    coe["stats"] = stats
+    coe["base"] = dict(stats)
+    coe["saves"] = _parse_saves(fields.get("saves", ""))
+    coe["thief_mods"] = {}
+    coe["banned_weapons"] = {"list": ""}
+    coe["skills"] = {"list": skills_str}
+
+    def _alias_key(s: str) -> str:
+        return "".join(ch.lower() for ch in str(s) if ch.isalnum())
+
+    mon_name = fields.get("type", "")
+    spells_line = str(tpl.get("spells", "")).strip()
+    if spells_line:
+        mon_magic = {}
+        mon_left = {}
+        listed = []
+
+        for tok in re.split(r"\s+", spells_line):
+            if not tok:
+                continue
+            key = _alias_key(tok)
+
+            raw_ct = (tpl.get(tok, None) or
+                      tpl.get(tok.lower(), None) or
+                      tpl.get(key, None))
+            try:
+                count_tok = int(str(raw_ct).strip()) if raw_ct is not None else 1
+            except Exception:
+                count_tok = 1
+
+            listed.append(key)
+            mon_magic[f"{key}_total"] = str(max(0, count_tok))
+            mon_left[f"{key}_left"] = str(max(0, count_tok))
+
+        cl_raw = tpl.get("casterlevel", None) or tpl.get("cl", None)
+        try:
+            caster_level = int(str(cl_raw).strip()) if cl_raw is not None else int(hd_val)
+        except Exception:
+            caster_level = int(hd_val)
+
+        mon_magic["list"] = " ".join(listed)
+        mon_magic["caster_level"] = str(caster_level)
+        mon_magic["source"] = str(tpl.get("name", mon_name)).strip() or mon_name
+
+        coe["mon_spells"] = mon_magic
+        coe["mon_left"] = mon_left
+
+    return coe
+
+
+def _template_for(mon_type: str) -> MonsterTemplate | None:
+    return monster_catalog().get(re.sub(r"\s+", "", mon_type or "").lower())
+
+
+def instance_cfg(name: str):
+    """The .coe a pending instance would have, built in memory; None if `name` is not pending."""
+    got = _pending_fields(name)
+    if got is None:
+        return None
+    chan_id, nm, fields = got
+    tpl = _template_for(fields["type"])
+    if tpl is None:
+        return None
+    return build_monster_coe(tpl.typed_base(), nm, dict(fields, chan=chan_id))
+
+
+def combatant_cfg(name: str):
+    """
+    Parsed <name>.coe, or the in-memory build of a spawned monster that has
+    not been written out yet. None if neither exists.
+    """
+    icfg = instance_cfg(name)
+    if icfg is not None:
+        return icfg
+    path = f"{str(name).replace(' ', '_')}.coe"
+    if not os.path.exists(path):
+        return None
+    return read_cfg(path)
+
+
+def instance_state(name: str):
+    """
+    Hashable summary of everything instance_cfg(name) is built from (overlay
+    fields and template signature); None if `name` is not pending.
+    """
+    got = _pending_fields(name)
+    if got is None:
+        return None
+    chan_id, nm, fields = got
+    tpl = _template_for(fields["type"])
+    return (chan_id, nm, tuple(sorted(fields.items())), tpl.sig if tpl is not None else None)
+
+
+def _write_instances(chan_id: str, names: list) -> list[str]:
+    from utils.battle import load_battles, save_battles
+    from utils.ini import write_cfg
+    cfg = load_battles()
+    sec = instance_section(chan_id)
+    written = []
+    for nm in names:
+        fields = _fields_of(cfg, chan_id, nm)
+        tpl = _template_for(fields.get("type", ""))
+        path = f"{nm.replace(' ', '_')}.coe"
+        if os.path.exists(path):
+            # Already written (a stale overlay came back with a battle save):
+            # the file is newer, keep it.
+            written.append(path)
+        elif tpl is not None:
+            write_cfg(path, build_monster_coe(tpl.typed_base(), nm, dict(fields, chan=chan_id)))
+            written.append(path)
+        if cfg.has_section(sec):
+            for k in list(fields):
+                cfg.remove_option(sec, f"{nm}.{k}")
+    if cfg.has_section(sec) and not cfg.options(sec):
+        cfg.remove_section(sec)
+    save_battles(cfg)
+    for nm in names:
+        _index().pop(_inst_key(nm), None)
+    return written
+
+
+def materialize(name: str) -> str | None:
+    """Write a pending instance out as <Name>.coe and drop its overlay. Returns the path."""
+    with _pending_lock:
+        hit = _index().get(_inst_key(name))
+        if hit is None:
+            return None
+        written = _write_instances(hit[0], [hit[1]])
+        return written[0] if written else None
+
+
+def discard_channel(cfg, chan_id: str) -> list[str]:
+    """Forget a channel's pending instances without writing them (battle over). Caller saves `cfg`."""
+    with _pending_lock:
+        names = pending_names(chan_id)
+        sec = instance_section(chan_id)
+        if cfg.has_section(sec):
+            cfg.remove_section(sec)
+        for nm in names:
+            _index().pop(_inst_key(nm), None)
+        return names
@@ -0,0 +1,196 @@
+# utils/names.py
+import os
+import threading
+
+# Characters and spawned monsters live as <Name>.coe in the bot's working
+# directory. Listing that directory on every lookup gets slower as a
+# campaign accumulates monsters, so keep one index of it instead: built on
+# first use, refreshed when the directory's mtime changes (any create,
+# delete or rename), and patched directly by write_cfg()/remove_cfg().
+
+_ROOT = "."
+_lock = threading.RLock()
+_dir_sig = None
+_listing: tuple = ()
+_by_lower: dict = {}      # "bob.coe" -> ["Bob.coe"]
+_info_names = None        # normalized [info] name -> filename (built lazily)
+
+
+def _norm(name: str) -> str:
+    return str(name or "").replace("_", " ").strip().lower()
+
+
+def _dir_mtime():
+    try:
+        return os.stat(_ROOT).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _rebuild(sig) -> None:
+    global _dir_sig, _listing, _by_lower, _info_names
+    try:
+        names = os.listdir(_ROOT)
+    except OSError:
+        names = []
+    by_lower: dict = {}
+    for fn in names:
+        by_lower.setdefault(fn.lower(), []).append(fn)
+    _listing = tuple(names)
+    _by_lower = by_lower
+    _dir_sig = sig
+    _info_names = None
+
+
+def _fresh() -> None:
+    sig = _dir_mtime()
+    if sig != _dir_sig or sig is None:
+        _rebuild(sig)
+
+
+def cwd_listing() -> tuple:
+    """Snapshot of os.listdir('.') that is only re-read when the directory changes."""
+    with _lock:
+        _fresh()
+        return _listing
+
+
+def _materialize(names) -> None:
+    # A spawned monster may still live only in the battle store; anyone
+    # looking its .coe up by name gets a real file.
+    from utils import monsters
+    for n in names:
+        if str(n).lower().endswith(".coe") and monsters.is_pending(n):
+            monsters.materialize(n)
+
+
+def ci_matches(*names: str) -> list:
+    """Entries of the working directory equal to any of `names`, ignoring case."""
+    _materialize(names)
+    with _lock:
+        _fresh()
+        out = []
+        for n in names:
+            out.extend(_by_lower.get(str(n).lower(), ()))
+        return out
+
+
+def coe_exists(path: str) -> bool:
+    """os.path.exists() for a .coe path, writing out a pending spawned monster first."""
+    _materialize((path,))
+    return os.path.exists(path)
+
+
+def find_file_ci(basename_with_ext: str) -> str | None:
+    """Case-insensitive file find in CWD."""
+    hits = ci_matches(basename_with_ext)
+    return hits[0] if hits else None
+
+
+def find_char_file(name: str) -> str | None:
+    """'<name>.coe' (spaces -> underscores), matched case-insensitively."""
+    return find_file_ci(f"{str(name or '').replace(' ', '_')}.coe")
+
+
+def _info_name_of(path: str) -> str:
+    from utils.ini import read_cfg, get_compat
+    try:
+        return get_compat(read_cfg(path), "info", "name", fallback="") or ""
+    except Exception:
+        return ""
+
+
+def find_by_info_name(name: str) -> str | None:
+    """Path of the .coe whose [info] name matches `name` (case/underscore-insensitive)."""
+    global _info_names
+    with _lock:
+        _fresh()
+        if _info_names is None:
+            idx = {}
+            for fn in _listing:
+                if fn.lower().endswith(".coe"):
+                    real = _info_name_of(fn)
+                    if real:
+                        idx.setdefault(_norm(real), fn)
+            _info_names = idx
+        return _info_names.get(_norm(name))
+
+
+def resolve_char_ci(name: str) -> tuple[str | None, str | None]:
+    """
+    Find '<name>.coe' case-insensitively, returning (canon_name, path), where
+    canon_name is the file's [info] name when it has one.
+    """
+    path = find_char_file(name)
+    if not path:
+        return None, None
+    return (_info_name_of(path) or path[:-4].replace("_", " ")), path
+
+
+def _in_root(path: str) -> bool:
+    return os.path.dirname(os.path.abspath(path)) == os.path.abspath(_ROOT)
+
+
+def dir_revision(path: str):
+    """
+    Directory mtime to pass back to note_written()/note_removed(), taken just
+    before we touch `path`. Lets the index absorb our own creates, deletes
+    and atomic-replace renames without a full rescan.
+    """
+    if not _in_root(path):
+        return None
+    return _dir_mtime()
+
+
+def _adopt(before) -> None:
+    # The index matched the directory right before our change, and we have
+    # applied that change ourselves, so the new mtime is ours too.
+    global _dir_sig
+    if before is not None and before == _dir_sig:
+        _dir_sig = _dir_mtime()
+
+
+def note_written(path: str, cfg=None, before=None) -> None:
+    """Record a file just written by us (keeps the index current within one mtime tick)."""
+    if not _in_root(path):
+        return
+    global _listing
+    fn = os.path.basename(path)
+    with _lock:
+        if _dir_sig is None:
+            return
+        _adopt(before)
+        hits = _by_lower.setdefault(fn.lower(), [])
+        if fn not in hits:
+            hits.append(fn)
+            _listing = _listing + (fn,)
+        if _info_names is not None and cfg is not None and fn.lower().endswith(".coe"):
+            try:
+                real = cfg.get("info", "name", fallback="")
+            except Exception:
+                real = ""
+            for k in [k for k, v in _info_names.items() if v == fn]:
+                _info_names.pop(k, None)
+            if real:
+                _info_names.setdefault(_norm(real), fn)
+
+
+def note_removed(path: str, before=None) -> None:
+    """Forget a file we just deleted."""
+    if not _in_root(path):
+        return
+    global _listing
+    fn = os.path.basename(path)
+    with _lock:
+        if _dir_sig is None:
+            return
+        _adopt(before)
+        hits = _by_lower.get(fn.lower())
+        if hits and fn in hits:
+            hits.remove(fn)
+            if not hits:
+                _by_lower.pop(fn.lower(), None)
+            _listing = tuple(x for x in _listing if x != fn)
+        if _info_names is not None:
+            for k in [k for k, v in _info_names.items() if v == fn]:
+                _info_names.pop(k, None)
@@ -1,10 +1,31 @@
 # utils/players.py
-import json, os, threading
+import atexit, copy, json, os, sys, threading, time
 from utils.ini import read_cfg, write_cfg, get_compat
 
 REG_PATH = "data/players.json"
 os.makedirs("data", exist_ok=True)
+
+# The registry is loaded once and served from memory: get_active() is a dict
+# lookup and find_owner_by_char() goes through a reverse index. Changes mark
+# it dirty and a flusher thread writes it back atomically at most once per
+# SEER_PLAYERS_FLUSH_MS (and at exit); 0 writes through on every change.
+# While the bot runs it owns players.json: hand edits are not picked up
+# until restart.
+try:
+    _FLUSH_DELAY = max(0, int(os.getenv("SEER_PLAYERS_FLUSH_MS", "250"))) / 1000.0
+except ValueError:
+    _FLUSH_DELAY = 0.25
+
 _lock = threading.Lock()
+_wake = threading.Condition(_lock)
+_flush_lock = threading.Lock()
+_data = None
+_owners = {}    # _norm(char) -> user id; the first listed owner wins, as the old scan did
+_dirty = False
+_thread = None
+
+def _norm(name: str) -> str:
+    return str(name or "").replace("_", " ").strip().lower()
 
 def _coe_path(char_name: str) -> str:
     """Map a display name to the actual .coe filename."""
@@ -15,13 +36,85 @@ def _load():
         return {}
     with open(REG_PATH, "r", encoding="utf-8") as f:
         try:
-            return json.load(f)
+            data = json.load(f)
         except Exception:
             return {}
+    return data if isinstance(data, dict) else {}
+
+def _write(text: str) -> None:
+    os.makedirs(os.path.dirname(REG_PATH) or ".", exist_ok=True)
+    tmp = REG_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, REG_PATH)
+
+def _reindex() -> None:
+    _owners.clear()
+    for uid, entry in _data.items():
+        for n in entry.get("characters", []):
+            _owners.setdefault(_norm(n), uid)
+
+def _ensure() -> dict:
+    """The in-memory registry, read from disk on first use. Call with _lock held."""
+    global _data
+    if _data is None:
+        _data = _load()
+        _reindex()
+    return _data
+
+def _save():
+    """Record a change to _data (call with _lock held) and schedule the write."""
+    global _dirty, _thread
+    _reindex()
+    if _FLUSH_DELAY <= 0:
+        _write(json.dumps(_data, indent=2))
+        return
+    _dirty = True
+    if _thread is None:
+        _thread = threading.Thread(target=_run, name="players-flush", daemon=True)
+        _thread.start()
+        atexit.register(flush)
+    _wake.notify()
+
+def _run() -> None:
+    while True:
+        with _wake:
+            while not _dirty:
+                _wake.wait()
+        time.sleep(_FLUSH_DELAY)
+        try:
+            flush()
+        except Exception as e:
+            print(f"[players] write-behind flush failed: {e}", file=sys.stderr)
+            time.sleep(1.0)
+
+def flush() -> bool:
+    """Write pending registry changes now. Returns True if anything was written."""
+    global _dirty
+    with _flush_lock:
+        with _lock:
+            if not _dirty or _data is None:
+                return False
+            text = json.dumps(_data, indent=2)
+            _dirty = False
+        try:
+            _write(text)
+        except Exception:
+            with _lock:
+                _dirty = True
+            raise
+        return True
+
+def registry() -> dict:
+    """A copy of the whole registry (user id -> entry), safe to edit."""
+    with _lock:
+        return copy.deepcopy(_ensure())
 
-def _save(data):
-    with open(REG_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+def put_entry(user_id, entry: dict) -> None:
+    """Replace one user's registry entry (e.g. an edited copy from registry())."""
+    with _lock:
+        _ensure()[str(user_id)] = copy.deepcopy(entry)
+        _save()
 
 def _coe_owner(char_name: str) -> str | None:
     """Return owner_id string from the .coe, or None if missing."""
@@ -42,8 +135,8 @@ def _set_coe_owner(char_name: str, owner_id: int) -> None:
 
 def list_chars(user_id: int):
     with _lock:
-        data = _load()
-        return data.get(str(user_id), {}).get("characters", [])
+        data = _ensure()
+        return list(data.get(str(user_id), {}).get("characters", []))
 
 def add_char(user_id: int, char_name: str):
     """Index char under user, but only if the .coe says they own it."""
@@ -51,32 +144,35 @@ def add_char(user_id: int, char_name: str):
     if owner != str(user_id):
         raise PermissionError("You do not own this character.")
     with _lock:
-        data = _load()
+        data = _ensure()
         u = str(user_id)
-        if u not in data:
-            data[u] = {"characters": [], "active": None}
+        data.setdefault(u, {}).setdefault("characters", [])
+        data[u].setdefault("active", None)
         if char_name not in data[u]["characters"]:
             data[u]["characters"].append(char_name)
         if not data[u]["active"]:
             data[u]["active"] = char_name
-        _save(data)
+        _save()
 
 def set_active(user_id: int, char_name: str) -> bool:
     if _coe_owner(char_name) != str(user_id):
         return False
     with _lock:
-        data = _load()
+        data = _ensure()
         u = str(user_id)
         if u not in data or char_name not in data[u].get("characters", []):
             return False
         data[u]["active"] = char_name
-        _save(data)
+        _save()
         return True
 
 def get_active(user_id: int) -> str | None:
-    with _lock:
-        data = _load()
-        return data.get(str(user_id), {}).get("active")
+    data = _data
+    if data is None:
+        with _lock:
+            data = _ensure()
+    # Plain dict reads; writers only change values in place under _lock.
+    return data.get(str(user_id), {}).get("active")
 
 def owns_char(user_id: int, char_name: str) -> bool:
     return _coe_owner(char_name) == str(user_id)
@@ -103,26 +199,21 @@ def transfer_char(current_owner_id: int, char_name: str, new_owner_id: int) -> b
         return False
     _set_coe_owner(char_name, new_owner_id)
     with _lock:
-        data = _load()
+        data = _ensure()
         cur = str(current_owner_id)
         new = str(new_owner_id)
         if cur in data and char_name in data[cur].get("characters", []):
             data[cur]["characters"].remove(char_name)
             if data[cur].get("active") == char_name:
                 data[cur]["active"] = data[cur]["characters"][0] if data[cur]["characters"] else None
-        if new not in data:
-            data[new] = {"characters": [], "active": None}
+        data.setdefault(new, {}).setdefault("characters", [])
+        data[new].setdefault("active", None)
         if char_name not in data[new]["characters"]:
             data[new]["characters"].append(char_name)
         if not data[new]["active"]:
             data[new]["active"] = char_name
-        _save(data)
+        _save()
     return True
-    
-    
-
-def _norm(name: str) -> str:
-    return str(name or "").replace("_", " ").strip().lower()
 
 def remove_char(user_id, char_id):
     """
@@ -131,7 +222,7 @@ def remove_char(user_id, char_id):
     """
     uid = str(user_id)
     with _lock:
-        data = _load()
+        data = _ensure()
         entry = data.get(uid)
         if not entry:
             return (False, False)
@@ -145,19 +236,14 @@ def remove_char(user_id, char_id):
             entry["active"] = chars[0] if chars else ""
         entry["characters"] = chars
         data[uid] = entry
-        _save(data)
+        _save()
         return (True, was_active)
 
 def find_owner_by_char(char_id):
     """
-    Scan the registry to discover who owns `char_id`. Returns user_id or None.
+    Look up who owns `char_id` in the registry. Returns user_id or None.
     """
     with _lock:
-        data = _load()
-        t = _norm(char_id)
-        for uid, entry in data.items():
-            for n in entry.get("characters", []):
-                if _norm(n) == t:
-                    return uid
-    return None    
+        _ensure()
+        return _owners.get(_norm(char_id))    
 
@@ -0,0 +1,438 @@
+# utils/static_data.py
+import configparser
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+
+# item.lst, class.lst, spell.lst and race.lst never change while the bot
+# runs (short of an explicit reload), yet every cog used to parse its own
+# copy. Each file is parsed once here; structures built from it are
+# memoized per file and shared by all cogs, so treat everything returned
+# from this module as read-only.
+
+_lock = threading.RLock()
+_files: dict = {}     # abspath -> (sig, digest, ConfigParser)
+_derived: dict = {}   # (abspath, key) -> value built from that file
+_builders: dict = {}  # (abspath, key) -> build function, for eager rebuilds
+_listeners: dict = {} # name -> fn(changed_paths), see on_static_reload
+
+# Parsed tables also persist across restarts in a pickled snapshot. Every
+# entry records the blake2 digest of its source file and of the module that
+# built it, so anything whose source or parsing code changed is re-parsed
+# and the rest loads straight from the snapshot.
+SNAPSHOT_FILE = os.getenv("SEER_STATIC_SNAPSHOT", "static.snapshot")
+_SNAPSHOT_VERSION = 1
+_MISS = object()
+_snap: dict | None = None   # entry key -> (digest, code digest, value)
+_changed: dict = {}         # entries (re)built this run, not yet saved
+_code: dict = {}            # module name -> digest of its source
+
+
+def _read(path: str):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _digest(data) -> str | None:
+    if data is None:
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _code_digest(fn) -> str:
+    mod = getattr(fn, "__module__", None) or ""
+    if mod not in _code:
+        src = getattr(sys.modules.get(mod), "__file__", None)
+        _code[mod] = _digest(_read(src) if src else None) or ""
+    return _code[mod]
+
+
+def _snapshot() -> dict:
+    global _snap
+    if _snap is None:
+        try:
+            with open(SNAPSHOT_FILE, "rb") as f:
+                data = pickle.load(f)
+            ok = (data.get("version") == _SNAPSHOT_VERSION
+                  and data.get("python") == tuple(sys.version_info[:2]))
+            _snap = data["entries"] if ok else {}
+        except Exception:
+            _snap = {}
+    return _snap
+
+
+def _lookup(key, digest, code=""):
+    hit = _snapshot().get(key)
+    if hit is not None and hit[0] == digest and hit[1] == code:
+        return hit[2]
+    return _MISS
+
+
+def _store(key, digest, code, value) -> None:
+    _changed[key] = (digest, code, value)
+
+
+def _sig(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _parse(path: str, data) -> configparser.ConfigParser:
+    cp = configparser.ConfigParser(strict=False)
+    cp.optionxform = str
+    if data is None:
+        return cp
+    raw = data.decode("utf-8")
+    # spell.lst carries a free-text preamble before its first section.
+    first = raw.find("[")
+    if first == -1:
+        return cp
+    cp.read_string(raw[first:], source=path)
+    return cp
+
+
+def static_cfg(path: str) -> configparser.ConfigParser:
+    """Shared parse of a static data file (empty if missing). Do not modify it."""
+    key = os.path.abspath(path)
+    with _lock:
+        hit = _files.get(key)
+        if hit is None:
+            sig = _sig(key)
+            data = _read(key)
+            digest = _digest(data)
+            cp = _lookup(("cfg", key), digest)
+            if cp is _MISS:
+                cp = _parse(key, data)
+                _store(("cfg", key), digest, "", cp)
+            hit = _files[key] = (sig, digest, cp)
+        return hit[2]
+
+
+def derived(path: str, name: str, build):
+    """build(static_cfg(path)), computed once per file and shared."""
+    key = (os.path.abspath(path), name)
+    with _lock:
+        if key not in _derived:
+            cp = static_cfg(path)
+            digest = _files[key[0]][1]
+            code = _code_digest(build)
+            value = _lookup(("derived",) + key, digest, code)
+            if value is _MISS:
+                value = build(cp)
+                _store(("derived",) + key, digest, code, value)
+            _derived[key] = value
+            _builders[key] = build
+        return _derived[key]
+
+
+def cached_load(path: str, load):
+    """
+    load(path), taken from the snapshot while neither the file nor the
+    module defining `load` has changed. Not memoized in-process.
+    """
+    key = ("load", os.path.abspath(path), getattr(load, "__qualname__", ""))
+    with _lock:
+        digest = _digest(_read(path))
+        code = _code_digest(load)
+        value = _lookup(key, digest, code)
+        if value is _MISS:
+            value = load(path)
+            _store(key, digest, code, value)
+        return value
+
+
+def _rebuild(key: str, builds: list):
+    """Parse `key` and run `builds` against it without touching the live tables."""
+    sig = _sig(key)
+    data = _read(key)
+    digest = _digest(data)
+    stored = []
+    cp = _lookup(("cfg", key), digest)
+    if cp is _MISS:
+        cp = _parse(key, data)
+        stored.append((("cfg", key), digest, "", cp))
+    values = {}
+    for name, build in builds:
+        code = _code_digest(build)
+        value = _lookup(("derived", key, name), digest, code)
+        if value is _MISS:
+            value = build(cp)
+            stored.append((("derived", key, name), digest, code, value))
+        values[(key, name)] = value
+    return (sig, digest, cp), values, stored
+
+
+def reload_static(path: str | None = None) -> list[str]:
+    """
+    Re-parse files that changed on disk (or `path` unconditionally) and
+    rebuild everything derived from them, then swap each file's new tables
+    in together. The parse runs outside the lock, so lookups keep getting
+    the old tables meanwhile. A file that fails to parse or build keeps its
+    old tables and signature (and is retried on the next call). Returns the
+    reloaded paths.
+    """
+    with _lock:
+        if path is not None:
+            stale = [os.path.abspath(path)]
+        else:
+            stale = [k for k, (sig, _, _) in _files.items() if _sig(k) != sig]
+        builds = {k: [(dk[1], b) for dk, b in _builders.items() if dk[0] == k] for k in stale}
+    done = []
+    for k in stale:
+        try:
+            entry, values, stored = _rebuild(k, builds[k])
+        except Exception as e:
+            print(f"[static] reload of {os.path.basename(k)} failed, keeping the old tables: {e}")
+            continue
+        with _lock:
+            _files[k] = entry
+            for dk in [dk for dk in _derived if dk[0] == k]:
+                del _derived[dk]
+            _derived.update(values)
+            for item in stored:
+                _store(*item)
+        done.append(k)
+    return done
+
+
+def on_static_reload(name: str, fn) -> None:
+    """
+    Register fn(changed_paths) to rebind tables a cog keeps on itself or at
+    module level. Registering the same name again replaces the old listener.
+    """
+    _listeners[name] = fn
+
+
+def notify_static_reload(changed) -> list[str]:
+    """Run the reload listeners (on the event loop); returns the names that failed."""
+    failed = []
+    for name, fn in list(_listeners.items()):
+        try:
+            fn(list(changed))
+        except Exception as e:
+            print(f"[static] reload listener {name} failed: {e}")
+            failed.append(name)
+    return failed
+
+
+# ---------- shared structures ----------
+def normalize_name(s) -> str:
+    """normalize for matching: lowercase & alnum only"""
+    if not isinstance(s, str):
+        return ""
+    return "".join(ch.lower() for ch in s if ch.isalnum())
+
+
+def _build_items(cfg):
+    items = {}
+    index = {}
+    for section in cfg.sections():
+        data = dict(cfg.items(section))
+        items[section] = data
+        index[normalize_name(section)] = section
+        aliases = re.split(r"[,\s]+", data.get("aliases", "").strip())
+        for alias in filter(None, aliases):
+            index[normalize_name(alias)] = section
+    return items, index
+
+
+def item_table(path: str = "item.lst"):
+    """
+    (items_by_canon, index_by_normalized) from item.lst. Optional 'aliases'
+    per item may contain comma/space-separated synonyms.
+    """
+    return derived(path, "items", _build_items)
+
+
+def _build_class_cache(cfg):
+    cache = {}
+    for section in cfg.sections():
+        cache[section] = {}
+        for k, v in cfg.items(section):
+            v = v.strip()
+            if v and " " in v:
+                parts = v.split()
+                if all(p.lstrip("-").isdigit() for p in parts):
+                    cache[section][k] = [int(p) for p in parts]
+                else:
+                    cache[section][k] = v
+            else:
+                if v.lstrip("-").isdigit():
+                    cache[section][k] = int(v)
+                else:
+                    cache[section][k] = v
+    return cache
+
+
+def class_table(path: str = "class.lst") -> dict:
+    """{Section: {key: int | [ints] | str}} for every class.lst section."""
+    return derived(path, "class_cache", _build_class_cache)
+
+
+def _build_classes_ab(cfg):
+    out = {}
+    for section in cfg.sections():
+        sec = section.lower()
+        out[sec] = {}
+        for k, v in cfg.items(section):
+            if k.lower() == "ab":
+                try:
+                    out[sec]["ab"] = [int(x) for x in v.split()]
+                except Exception:
+                    out[sec]["ab"] = []
+            else:
+                out[sec][k.lower()] = v
+    return out
+
+
+def classes_ab(path: str = "class.lst") -> dict:
+    """{'fighter': {'ab': [...], ...}, ...} with AB parsed to list[int]."""
+    return derived(path, "classes_ab", _build_classes_ab)
+
+
+def _build_spell_lists(cp):
+    by_class: dict[str, dict[int, list[str]]] = {}
+    for sec in cp.sections():
+        if sec.startswith("["):
+            continue
+        level_map = {}
+        has_levels = False
+        for k, v in cp.items(sec):
+            m = re.fullmatch(r"l(\d+)", k.strip(), flags=re.I)
+            if m:
+                level_map[int(m.group(1))] = [t for t in v.split() if t]
+                has_levels = True
+        if has_levels:
+            by_class[sec] = level_map
+    return by_class
+
+
+def spell_lists(path: str = "spell.lst"):
+    """({Class: {level: [spell, ...]}}, parsed spell.lst)."""
+    return derived(path, "spell_lists", _build_spell_lists), static_cfg(path)
+
+
+ALWAYS_LIST = {"skills", "banned", "banned_weapons"}
+
+
+def _build_races(cfg):
+    races = {}
+    for section in cfg.sections():
+        data = {}
+        for key, value in cfg.items(section):
+            val = value.strip()
+            tokens = [t for t in re.split(r"[,\s]+", val) if t]
+            if key in ALWAYS_LIST:
+                data[key] = tokens
+                continue
+            if len(tokens) > 1:
+                try:
+                    data[key] = [int(t) for t in tokens]
+                except ValueError:
+                    data[key] = tokens
+            else:
+                try:
+                    data[key] = int(val)
+                except ValueError:
+                    data[key] = val
+        races[section] = data
+    return races
+
+
+def race_table(path: str = "race.lst") -> dict:
+    """{Race: {key: int | [ints] | [tokens] | str}}; skills/banned are always lists."""
+    return derived(path, "races", _build_races)
+
+
+def _build_class_xp(cfg):
+    xp_cache = {}
+    for section in cfg.sections():
+        table = {}
+        for k, v in cfg.items(section):
+            m = re.fullmatch(r"xp(\d+)", k, flags=re.I)
+            if m and v.strip().lstrip("-").isdigit():
+                table[int(m.group(1))] = int(v.strip())
+        if table:
+            xp_cache[section] = dict(sorted(table.items()))
+    return xp_cache
+
+
+def class_xp_table(path: str = "class.lst") -> dict:
+    """{Class: {level: xp_required}} from the xpN keys of class.lst."""
+    return derived(path, "class_xp", _build_class_xp)
+
+
+# ---------- snapshot ----------
+def save_snapshot(force: bool = False) -> bool:
+    """
+    Write the snapshot if anything was re-parsed since it was loaded (or
+    always, with force). Entries whose source file is gone are dropped.
+    """
+    with _lock:
+        if not (_changed or force):
+            return False
+        entries = dict(_snapshot())
+        entries.update(_changed)
+        entries = {k: v for k, v in entries.items() if os.path.exists(k[1])}
+        blob = pickle.dumps(
+            {"version": _SNAPSHOT_VERSION, "python": tuple(sys.version_info[:2]), "entries": entries},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        tmp = SNAPSHOT_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, SNAPSHOT_FILE)
+        global _snap
+        _snap = entries
+        _changed.clear()
+        return True
+
+
+# Cogs whose module-level tables are worth snapshotting; imported on a
+# best-effort basis so `compile` still works without the bot's dependencies.
+_COMPILE_MODULES = ("cogs.combat", "cogs.spells", "cogs.sheet", "cogs.stats",
+                    "cogs.progression", "cogs.roll", "cogs.crafting")
+
+
+def compile_snapshot() -> int:
+    """Re-parse every known static source and write a fresh snapshot."""
+    import importlib
+    global _snap
+    with _lock:
+        _snap = {}
+        _files.clear()
+        _derived.clear()
+        for build in (item_table, class_table, classes_ab, spell_lists, race_table, class_xp_table):
+            build()
+        from utils.monsters import monster_catalog
+        monster_catalog().refresh()
+        for name in _COMPILE_MODULES:
+            try:
+                mod = importlib.import_module(name)
+            except Exception as e:
+                print(f"[static] skipped {name}: {e}")
+                continue
+            if name == "cogs.crafting":
+                cached_load(mod.RECIPES_PATH, mod._load_json)
+        save_snapshot(force=True)
+        return len(_snap)
+
+
+if __name__ == "__main__":
+    # python -m utils.static_data compile
+    # Go through the imported module so the cogs and the catalog share its state.
+    if sys.argv[1:2] == ["compile"]:
+        from utils import static_data
+        n = static_data.compile_snapshot()
+        print(f"Wrote {n} entries to {static_data.SNAPSHOT_FILE}")
+    else:
+        print("usage: python -m utils.static_data compile")
@@ -0,0 +1,124 @@
+# utils/storage.py
+import asyncio
+import json
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from utils.ini import atomic_write_text, begin_deferred, end_deferred, read_cfg, write_cfg
+
+log = logging.getLogger(__name__)
+
+# Disk I/O is pushed onto a small, bounded pool so one slow flush does not
+# stall every guild's commands on the event loop.
+_IO_WORKERS = max(1, int(os.getenv("SEER_IO_WORKERS", "4") or 4))
+_executor = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="seer-io")
+
+# One asyncio.Lock per file so overlapping coroutines touching the same
+# path run in order, while different files proceed in parallel. Held weakly:
+# a lock nobody holds or waits on is dropped with its entry.
+_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def path_lock(path) -> asyncio.Lock:
+    key = os.path.abspath(str(path))
+    lock = _locks.get(key)
+    if lock is None:
+        lock = _locks[key] = asyncio.Lock()
+    return lock
+
+
+async def run_io(fn, *args):
+    """Run a blocking call on the storage pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, fn, *args)
+
+
+async def aread_cfg(path: str):
+    async with path_lock(path):
+        return await run_io(read_cfg, path)
+
+
+async def awrite_cfg(path: str, cfg) -> None:
+    async with path_lock(path):
+        await run_io(write_cfg, path, cfg)
+
+
+def _write_text(path, text: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(str(path), text)
+
+
+async def asave_json(path, data, indent=2) -> None:
+    """
+    Atomic JSON write off the event loop. `data` is serialized here, before
+    handing off, so callers may keep mutating it while the write runs.
+    """
+    text = json.dumps(data, indent=indent, ensure_ascii=False)
+    async with path_lock(path):
+        await run_io(_write_text, path, text)
+
+
+# Commands that run on nearly every combat turn; their author's sheet is
+# read into the read_cfg cache on the pool before the command body starts,
+# and their .coe writes are flushed on the pool (defer_char_writes).
+HOT_COMMANDS = {"a", "cast", "n", "hp", "mon"}
+
+
+def defer_char_writes(ctx) -> None:
+    """
+    For the rest of this command, write_cfg() to an existing .coe records
+    the new contents and returns; a task writes them on the pool as soon as
+    the command yields, and achar_writes_done() waits for the last of them.
+    Reads in the same command see the pending contents.
+    """
+    loop = asyncio.get_running_loop()
+    state = {"task": None}
+
+    async def _flush():
+        try:
+            await run_io(d.flush)
+        except Exception:
+            log.exception("deferred .coe write failed")
+        finally:
+            state["task"] = None
+        if d.pending() and not d.closed:
+            kick()
+
+    def kick():
+        if state["task"] is None:
+            state["task"] = loop.create_task(_flush())
+
+    d, token = begin_deferred(kick)
+    if d is not None:
+        ctx.char_writes = (d, token, state)
+
+
+async def achar_writes_done(ctx) -> None:
+    """Close the scope opened by defer_char_writes() and wait until every write has landed."""
+    hit = getattr(ctx, "char_writes", None)
+    if hit is None:
+        return
+    ctx.char_writes = None
+    d, token, state = hit
+    end_deferred(d, token)
+    task = state["task"]
+    if task is not None:
+        await task
+    if d.pending():
+        await run_io(d.flush)
+
+
+async def prefetch_active_char(user_id) -> None:
+    from utils.players import get_active
+    try:
+        name = get_active(user_id)
+        if not name:
+            return
+        path = f"{name.replace(' ', '_')}.coe"
+        if os.path.exists(path):
+            await aread_cfg(path)
+    except Exception:
+        pass
@@ -0,0 +1,134 @@
+# utils/tracker.py
+import asyncio
+import hashlib
+import os
+import time
+
+import nextcord
+
+# A single command can refresh the pinned tracker several times. Edits are
+# held this long (seconds) and only the newest content is sent, so a burst
+# costs one Discord call. 0 sends each change on the next loop iteration.
+TRACKER_DELAY_S = float(os.getenv("SEER_TRACKER_DELAY_S", "0.5") or 0)
+
+
+def _digest(content: str) -> str:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _retry_after(exc) -> float:
+    """Seconds to wait from a failed request: Retry-After / X-RateLimit-Reset-After, else 1."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    for key in ("Retry-After", "X-RateLimit-Reset-After"):
+        try:
+            return max(0.0, float(headers[key]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return float(getattr(exc, "retry_after", 0) or 1.0)
+
+
+class TrackerUpdater:
+    """
+    The pinned tracker of one channel: keeps its Message, skips edits whose
+    content is already shown, coalesces bursts and waits out rate limits.
+    """
+
+    def __init__(self, chan_id: str):
+        self.chan_id = chan_id
+        self.message = None
+        self.shown = None           # digest of the content on the message
+        self._pending = None        # newest content not yet sent
+        self._task = None
+        self._not_before = 0.0      # monotonic time the next edit may go out
+        self._on_missing = None     # coroutine fn(content) when the message is gone
+
+    def bound_to(self, msg_id: int) -> bool:
+        return self.message is not None and self.message.id == msg_id
+
+    def bind(self, message, content: str | None = None) -> None:
+        """Use `message` from now on; `content` is what it shows, if known."""
+        self.message = message
+        self.shown = _digest(content) if content is not None else None
+
+    def submit(self, content: str, on_missing=None) -> None:
+        """Queue `content` for the bound message."""
+        if on_missing is not None:
+            self._on_missing = on_missing
+        if self._task is None and _digest(content) == self.shown:
+            return
+        self._pending = content
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._flush())
+
+    def cancel(self) -> None:
+        self._pending = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _flush(self) -> None:
+        while True:
+            await asyncio.sleep(max(TRACKER_DELAY_S, self._not_before - time.monotonic()))
+            content, self._pending = self._pending, None
+            if content is None:
+                break
+            digest = _digest(content)
+            if digest == self.shown:
+                if self._pending is None:
+                    break
+                continue
+            try:
+                await self.message.edit(content=content)
+                self.shown = digest
+            except nextcord.NotFound:
+                self.message = self.shown = None
+                self._task = None
+                latest, self._pending = self._pending or content, None
+                if self._on_missing is not None:
+                    try:
+                        await self._on_missing(latest)
+                    except Exception as e:
+                        print(f"[tracker] {self.chan_id}: could not replace tracker: {e}")
+                return
+            except nextcord.HTTPException as e:
+                if e.status != 429:
+                    print(f"[tracker] {self.chan_id}: edit failed: {e}")
+                    break
+                self._not_before = time.monotonic() + _retry_after(e)
+                if self._pending is None:
+                    self._pending = content
+            except Exception as e:
+                print(f"[tracker] {self.chan_id}: edit failed: {e}")
+                break
+            if self._pending is None:
+                break
+        self._task = None
+
+
+_trackers: dict = {}
+
+
+def tracker_for(chan_id: str) -> TrackerUpdater:
+    tr = _trackers.get(chan_id)
+    if tr is None:
+        tr = _trackers[chan_id] = TrackerUpdater(chan_id)
+    return tr
+
+
+def discard_tracker(chan_id: str) -> TrackerUpdater | None:
+    """Forget a channel's tracker (battle ended), dropping any queued edit."""
+    tr = _trackers.pop(chan_id, None)
+    if tr is not None:
+        tr.cancel()
+    return tr
+
+
+async def post_tracker(channel, msg_id: int, content: str) -> None:
+    """
+    Queue `content` for the tracker message `msg_id` in `channel`. The
+    message is fetched once and reused; raises if it cannot be fetched.
+    """
+    tracker = tracker_for(str(channel.id))
+    if not tracker.bound_to(msg_id):
+        tracker.bind(await channel.fetch_message(msg_id))
+    tracker.submit(content)
@@ -0,0 +1,226 @@
+# utils/xp_ledger.py
+import json
+import os
+import threading
+from pathlib import Path
+
+# One append-only JSONL file per character (<slug>.jsonl) plus a small
+# summary (<slug>.summary.json) with the running totals, so an award is one
+# appended line and `!xp` reads only the tail. A legacy <slug>.json list is
+# converted on first use and renamed to <slug>.json.migrated.
+DATA_DIR = Path("data/xp")
+
+# !xpcompact keeps this many recent entries; older ones fold into one line.
+COMPACT_KEEP = 100
+
+_BLOCK = 8192
+
+# Awards append on the event loop while !xpcompact rewrites on the I/O pool;
+# each character's ledger and summary change under its own lock.
+_locks: dict = {}
+_locks_guard = threading.Lock()
+
+
+def _slug(char_name: str) -> str:
+    return char_name.replace(" ", "_")
+
+
+def _char_lock(char_name: str) -> threading.RLock:
+    slug = _slug(char_name)
+    with _locks_guard:
+        lock = _locks.get(slug)
+        if lock is None:
+            lock = _locks[slug] = threading.RLock()
+        return lock
+
+
+def ledger_path(char_name: str) -> Path:
+    return DATA_DIR / f"{_slug(char_name)}.jsonl"
+
+
+def _summary_path(char_name: str) -> Path:
+    return DATA_DIR / f"{_slug(char_name)}.summary.json"
+
+
+def _legacy_path(char_name: str) -> Path:
+    return DATA_DIR / f"{_slug(char_name)}.json"
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _line(entry: dict) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _fold(summary: dict, e: dict) -> dict:
+    """Add one entry to a summary; level changes are seen between entries too (!levelup)."""
+    lvl = summary.get("level")
+    for step in (e.get("before_lvl"), e.get("after_lvl")):
+        if step is None:
+            continue
+        if lvl is not None and step != lvl:
+            summary["level_change"] = {"ts": e.get("ts"), "from": lvl, "to": step}
+        lvl = step
+    summary["level"] = lvl
+    summary["entries"] = summary.get("entries", 0) + int(e.get("compacted", 1) or 1)
+    summary["lines"] = summary.get("lines", 0) + 1
+    summary["net_xp"] = summary.get("net_xp", 0) + int(e.get("amount", 0) or 0)
+    if "after_xp" in e:
+        summary["xp"] = e["after_xp"]
+    summary["last_ts"] = e.get("ts")
+    return summary
+
+
+def _iter_ledger(char_name: str):
+    p = ledger_path(char_name)
+    if not p.exists():
+        return
+    with p.open("r", encoding="utf-8") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                yield json.loads(raw)
+            except ValueError:
+                continue  # torn last line after a crash
+
+
+def _migrate(char_name: str) -> None:
+    legacy = _legacy_path(char_name)
+    if not legacy.exists() or ledger_path(char_name).exists():
+        return
+    try:
+        log = json.loads(legacy.read_text(encoding="utf-8"))
+    except Exception:
+        log = []
+    if isinstance(log, list):
+        _write_text(ledger_path(char_name), "".join(_line(e) for e in log if isinstance(e, dict)))
+    os.replace(legacy, legacy.with_name(legacy.name + ".migrated"))
+
+
+def summary(char_name: str) -> dict:
+    """Running totals: entries, net_xp, xp, level, level_change, last_ts."""
+    with _char_lock(char_name):
+        return _summary(char_name)
+
+
+def _summary(char_name: str) -> dict:
+    _migrate(char_name)
+    p = _summary_path(char_name)
+    try:
+        s = json.loads(p.read_text(encoding="utf-8"))
+        if s.get("lines") is not None:
+            return s
+    except Exception:
+        pass
+    s = {}
+    for e in _iter_ledger(char_name):
+        _fold(s, e)
+    if s:
+        _write_text(p, json.dumps(s, indent=2))
+    return s
+
+
+def append(char_name: str, entry: dict) -> dict:
+    """Append one XP event and update the summary. Returns the summary."""
+    with _char_lock(char_name):
+        s = _summary(char_name)
+        p = ledger_path(char_name)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("a", encoding="utf-8") as f:
+            f.write(_line(entry))
+        _fold(s, entry)
+        _write_text(_summary_path(char_name), json.dumps(s, indent=2))
+        return s
+
+
+def tail(char_name: str, n: int = 10, skip: int = 0) -> list[dict]:
+    """
+    Up to `n` entries, newest first, after skipping the newest `skip`. Reads
+    the file backwards, so the cost follows the page, not the campaign.
+    """
+    with _char_lock(char_name):
+        _migrate(char_name)
+    p = ledger_path(char_name)
+    if n <= 0 or not p.exists():
+        return []
+    want = n + skip
+    out = []
+    with p.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0 and len(out) < want:
+            step = min(_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            lines = buf.split(b"\n")
+            buf = lines[0]  # may be a partial line; finish it on the next block
+            for raw in reversed(lines[1:]):
+                if len(out) >= want:
+                    break
+                raw = raw.strip()
+                if raw:
+                    try:
+                        out.append(json.loads(raw))
+                    except ValueError:
+                        continue
+        if pos == 0 and buf.strip() and len(out) < want:
+            try:
+                out.append(json.loads(buf))
+            except ValueError:
+                pass
+    return out[skip:want]
+
+
+def compact(char_name: str, keep: int = COMPACT_KEEP) -> int:
+    """
+    Fold all but the newest `keep` entries into one carry-forward line (same
+    net XP, first before_xp, last after_xp). Returns how many lines were folded.
+    """
+    with _char_lock(char_name):
+        return _compact(char_name, keep)
+
+
+def _compact(char_name: str, keep: int) -> int:
+    _migrate(char_name)
+    entries = list(_iter_ledger(char_name))
+    if len(entries) <= keep + 1:
+        return 0
+    old, recent = entries[:len(entries) - keep], entries[len(entries) - keep:]
+    carry = {
+        "ts": old[-1].get("ts"),
+        "amount": sum(int(e.get("amount", 0) or 0) for e in old),
+        "by": "",
+        "reason": f"{len(old)} earlier entries (compacted)",
+        "before_xp": old[0].get("before_xp"),
+        "after_xp": old[-1].get("after_xp"),
+        "before_lvl": old[0].get("before_lvl"),
+        "after_lvl": old[-1].get("after_lvl"),
+        "compacted": sum(int(e.get("compacted", 1) or 1) for e in old),
+    }
+    prev = _summary(char_name)
+    _write_text(ledger_path(char_name), "".join(_line(e) for e in [carry] + recent))
+    s = {}
+    for e in [carry] + recent:
+        _fold(s, e)
+    if prev.get("level_change"):
+        s["level_change"] = prev["level_change"]
+    _write_text(_summary_path(char_name), json.dumps(s, indent=2))
+    return len(old)
+
+
+def characters() -> list[str]:
+    """Slugs with an XP ledger (or a legacy log still to convert)."""
+    if not DATA_DIR.exists():
+        return []
+    names = {p.name[:-len(".jsonl")] for p in DATA_DIR.glob("*.jsonl")}
+    names |= {p.stem for p in DATA_DIR.glob("*.json") if not p.name.endswith(".summary.json")}
+    return sorted(names)